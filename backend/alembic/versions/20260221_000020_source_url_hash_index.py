@@ -0,0 +1,31 @@
+"""Add a hash index on the normalized source URL.
+
+Backs ``find_existing_source_urls`` (app/helpers/db_utils.py), which checks a
+whole batch of candidate URLs with ``<expr> = ANY(:urls)`` instead of one
+``WHERE url = :url`` query per source.  The indexed expression must match
+``SOURCE_URL_NORM_SQL`` exactly or the planner will not use it.
+
+Revision ID: 0020_source_url_hash
+Revises: 0019_pipeline_status
+Create Date: 2026-02-21
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0020_source_url_hash"
+down_revision: Union[str, None] = "0019_pipeline_status"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sources_url_norm_hash "
+        "ON sources USING hash ((split_part(rtrim(lower(url), '/'), '#', 1)))"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_sources_url_norm_hash")
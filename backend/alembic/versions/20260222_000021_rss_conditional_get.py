@@ -0,0 +1,52 @@
+"""Persist RSS feed HTTP validators and add feed-polling settings.
+
+``RSSService.check_feeds`` now sends ``If-None-Match`` / ``If-Modified-Since``
+from the previous response so unchanged feeds come back as 304 and are not
+re-downloaded or re-parsed.  Also seeds the admin settings that bound the
+concurrent poll.
+
+Revision ID: 0021_rss_conditional_get
+Revises: 0020_source_url_hash
+Create Date: 2026-02-22
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0021_rss_conditional_get"
+down_revision: Union[str, None] = "0020_source_url_hash"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SETTINGS = [
+    ("rss_fetch_concurrency", "10", "Max RSS feeds fetched concurrently"),
+    ("rss_fetch_per_host_limit", "2", "Max concurrent RSS fetches per host"),
+]
+
+
+def upgrade() -> None:
+    op.add_column("rss_feeds", sa.Column("http_etag", sa.Text(), nullable=True))
+    op.add_column(
+        "rss_feeds", sa.Column("http_last_modified", sa.Text(), nullable=True)
+    )
+
+    conn = op.get_bind()
+    stmt = sa.text(
+        "INSERT INTO system_settings (key, value, description) "
+        "VALUES (:key, CAST(:value AS jsonb), :description) "
+        "ON CONFLICT (key) DO NOTHING"
+    )
+    for key, value, description in SETTINGS:
+        conn.execute(stmt, {"key": key, "value": value, "description": description})
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(
+        sa.text("DELETE FROM system_settings WHERE key = ANY(:keys)"),
+        {"keys": [k for k, _, _ in SETTINGS]},
+    )
+    op.drop_column("rss_feeds", "http_last_modified")
+    op.drop_column("rss_feeds", "http_etag")
@@ -0,0 +1,38 @@
+"""Add (status, sort column, id) indexes for keyset pagination of cards.
+
+``GET /cards`` now pages with ``WHERE (col, id) < (:value, :id)`` ordered by
+``col DESC NULLS LAST, id DESC`` (see app/helpers/card_pagination.py).  These
+indexes let the common sorts walk straight to the cursor position instead of
+sorting the whole filtered set: newest / recently updated first (the
+defaults) and soonest deadline / name A-Z.
+
+Revision ID: 0022_card_keyset_indexes
+Revises: 0021_rss_conditional_get
+Create Date: 2026-02-23
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0022_card_keyset_indexes"
+down_revision: Union[str, None] = "0021_rss_conditional_get"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("idx_cards_keyset_created_at", "status, created_at DESC NULLS LAST, id DESC"),
+    ("idx_cards_keyset_updated_at", "status, updated_at DESC NULLS LAST, id DESC"),
+    ("idx_cards_keyset_deadline", "status, deadline ASC NULLS LAST, id ASC"),
+    ("idx_cards_keyset_name", "status, name ASC NULLS LAST, id ASC"),
+]
+
+
+def upgrade() -> None:
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON cards ({columns})")
+
+
+def downgrade() -> None:
+    for name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,56 @@
+"""Create llm_result_cache for memoized triage / analysis LLM output.
+
+``AIService.triage_source`` and ``analyze_source`` look up
+``(operation, prompt_version, model, content_hash)`` here before calling
+the model (see app/llm_result_cache.py).  ``created_at`` drives TTL expiry
+and ``COALESCE(last_hit_at, created_at)`` the size-based pruning order.
+
+Revision ID: 0023_llm_result_cache
+Revises: 0022_card_keyset_indexes
+Create Date: 2026-02-24
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "0023_llm_result_cache"
+down_revision: Union[str, None] = "0022_card_keyset_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_result_cache",
+        sa.Column("operation", sa.Text(), nullable=False),
+        sa.Column("prompt_version", sa.Text(), nullable=False),
+        sa.Column("model", sa.Text(), nullable=False),
+        sa.Column("content_hash", sa.Text(), nullable=False),
+        sa.Column("result", JSONB(), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("last_hit_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint(
+            "operation", "prompt_version", "model", "content_hash"
+        ),
+    )
+    op.create_index(
+        "idx_llm_result_cache_created_at", "llm_result_cache", ["created_at"]
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_llm_result_cache_recency "
+        "ON llm_result_cache ((COALESCE(last_hit_at, created_at)) DESC)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("llm_result_cache")
@@ -0,0 +1,45 @@
+"""Create search_result_cache for shared external search responses.
+
+Web / news search, Grants.gov, SAM.gov and arXiv responses are cached here
+under ``(provider, cache_key)`` as the persistent tier behind the
+in-process LRU (see app/search_cache.py).  ``fetched_at`` drives freshness
+and pruning.
+
+Revision ID: 0024_search_result_cache
+Revises: 0023_llm_result_cache
+Create Date: 2026-02-25
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "0024_search_result_cache"
+down_revision: Union[str, None] = "0023_llm_result_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "search_result_cache",
+        sa.Column("provider", sa.Text(), nullable=False),
+        sa.Column("cache_key", sa.Text(), nullable=False),
+        sa.Column("payload", JSONB(), nullable=False),
+        sa.Column(
+            "fetched_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("provider", "cache_key"),
+    )
+    op.create_index(
+        "idx_search_result_cache_fetched_at", "search_result_cache", ["fetched_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("search_result_cache")
@@ -0,0 +1,90 @@
+"""Create export_jobs and export_artifacts for background exports.
+
+PDF / PPTX / DOCX exports are queued in ``export_jobs`` and rendered by the
+worker (see app/export_jobs.py).  Finished documents are stored once per
+content hash in ``export_artifacts`` so unchanged content is never rendered
+twice; ``last_accessed_at`` drives pruning.
+
+Revision ID: 0025_export_jobs
+Revises: 0024_search_result_cache
+Create Date: 2026-02-26
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+revision: str = "0025_export_jobs"
+down_revision: Union[str, None] = "0024_search_result_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "export_jobs",
+        sa.Column(
+            "id",
+            UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            primary_key=True,
+        ),
+        sa.Column("user_id", UUID(), nullable=False),
+        sa.Column("kind", sa.Text(), nullable=False),
+        sa.Column("format", sa.Text(), nullable=False),
+        sa.Column("params", JSONB(), server_default="{}", nullable=False),
+        sa.Column("content_hash", sa.Text(), nullable=False),
+        sa.Column("status", sa.Text(), server_default="queued", nullable=False),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint(
+            "status IN ('queued','running','completed','failed')",
+            name="export_jobs_status_check",
+        ),
+    )
+    op.create_index(
+        "idx_export_jobs_status_created", "export_jobs", ["status", "created_at"]
+    )
+    op.create_index(
+        "idx_export_jobs_user_hash", "export_jobs", ["user_id", "content_hash"]
+    )
+
+    op.create_table(
+        "export_artifacts",
+        sa.Column("content_hash", sa.Text(), primary_key=True),
+        sa.Column("filename", sa.Text(), nullable=False),
+        sa.Column("media_type", sa.Text(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "last_accessed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "idx_export_artifacts_last_accessed", "export_artifacts", ["last_accessed_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("export_artifacts")
+    op.drop_index("idx_export_jobs_user_hash", table_name="export_jobs")
+    op.drop_index("idx_export_jobs_status_created", table_name="export_jobs")
+    op.drop_table("export_jobs")
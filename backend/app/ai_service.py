@@ -2,7 +2,8 @@
 AI Service for GrantScope2 application.
 
 Provides:
-- Embedding generation for semantic search
+- Embedding generation for semantic search (single, batched, and
+  micro-batched via :class:`EmbeddingCoalescer`)
 - Triage (cheap, fast relevance filtering)
 - Full analysis (classification, scoring, entity extraction)
 - Entity extraction for graph building
@@ -10,10 +11,12 @@ Provides:
 
 import json
 import logging
+import os
 import asyncio
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
-from functools import wraps
+from functools import partial, wraps
 import openai
 
 # Azure OpenAI deployment names
@@ -22,6 +25,7 @@ from app.openai_provider import (
     get_chat_mini_deployment,
     get_embedding_deployment,
 )
+from app.llm_result_cache import content_hash, llm_result_cache, prompt_version
 from app.taxonomy import PILLAR_NAMES
 
 logger = logging.getLogger(__name__)
@@ -32,6 +36,19 @@ INITIAL_BACKOFF = 1.0  # seconds
 BACKOFF_MULTIPLIER = 2.0
 REQUEST_TIMEOUT = 60  # seconds
 
+# Sync OpenAI clients run on this many dedicated threads so a slow LLM call
+# never blocks the event loop; async clients are awaited directly.
+AI_SERVICE_MAX_WORKERS = int(os.getenv("AI_SERVICE_MAX_WORKERS", "16"))
+
+# Embedding batching configuration
+EMBEDDING_MAX_CHARS = 8000  # per-input truncation (~2k tokens)
+EMBEDDING_BATCH_MAX_INPUTS = int(os.getenv("AI_EMBEDDING_BATCH_MAX_INPUTS", "256"))
+EMBEDDING_BATCH_TOKEN_BUDGET = int(
+    os.getenv("AI_EMBEDDING_BATCH_TOKEN_BUDGET", "100000")
+)
+# Micro-batching window for concurrent generate_embedding() callers; 0 disables
+EMBEDDING_COALESCE_WINDOW_MS = float(os.getenv("AI_EMBEDDING_COALESCE_MS", "0"))
+
 # Summary quality configuration
 SUMMARY_MIN_WORDS = 150
 SUMMARY_MAX_WORDS = 300
@@ -133,6 +150,149 @@ def with_retry(max_retries: int = MAX_RETRIES):
     return decorator
 
 
+# ============================================================================
+# Blocking-call Executor
+# ============================================================================
+
+_llm_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_llm_executor() -> ThreadPoolExecutor:
+    """Return the process-wide bounded executor for sync OpenAI client calls."""
+    global _llm_executor
+    if _llm_executor is None:
+        _llm_executor = ThreadPoolExecutor(
+            max_workers=AI_SERVICE_MAX_WORKERS, thread_name_prefix="ai-service"
+        )
+    return _llm_executor
+
+
+# ============================================================================
+# Embedding Batching
+# ============================================================================
+
+
+def estimate_embedding_tokens(text: str) -> int:
+    """Rough token count for an embedding input (~4 chars per token)."""
+    return len(text) // 4 + 1
+
+
+def plan_embedding_batches(
+    texts: List[str],
+    max_inputs: int = EMBEDDING_BATCH_MAX_INPUTS,
+    token_budget: int = EMBEDDING_BATCH_TOKEN_BUDGET,
+) -> List[List[int]]:
+    """
+    Split texts into request-sized batches of input indices.
+
+    Batches are contiguous and preserve input order.  A batch closes when
+    adding the next text would exceed ``max_inputs`` or ``token_budget``;
+    a single text larger than the budget still gets a batch of its own.
+
+    Args:
+        texts: Embedding inputs (already truncated)
+        max_inputs: Maximum inputs per embeddings request
+        token_budget: Maximum estimated tokens per embeddings request
+
+    Returns:
+        List of index lists, one per request
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+
+    for i, text in enumerate(texts):
+        tokens = estimate_embedding_tokens(text)
+        if current and (
+            len(current) >= max_inputs or current_tokens + tokens > token_budget
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+class EmbeddingCoalescer:
+    """
+    Micro-batches concurrent single-text embedding requests.
+
+    Callers of :meth:`embed` that arrive within ``window_ms`` of each other
+    share one batched embeddings request.  A batch is dispatched when the
+    window elapses or ``max_batch`` texts are pending, whichever is first.
+    A failed input raises only in the caller that submitted it.
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[
+            [List[str]], Awaitable[List[Union[List[float], Exception]]]
+        ],
+        window_ms: float = 5.0,
+        max_batch: int = EMBEDDING_BATCH_MAX_INPUTS,
+    ):
+        """
+        Initialize the coalescer.
+
+        Args:
+            embed_batch: Coroutine returning one vector or exception per input
+            window_ms: How long the first pending caller waits for company
+            max_batch: Pending-text count that triggers an immediate dispatch
+        """
+        self._embed_batch = embed_batch
+        self._window = window_ms / 1000.0
+        self._max_batch = max(1, max_batch)
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._inflight: set = set()
+
+    async def embed(self, text: str) -> List[float]:
+        """Queue a text for the next batch and wait for its vector."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self._max_batch:
+            self._dispatch()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window, self._dispatch)
+
+        return await future
+
+    def _dispatch(self) -> None:
+        """Send everything pending as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run_batch(batch))
+        # Hold a reference so the task isn't garbage-collected mid-flight
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            outcomes = await self._embed_batch([text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), outcome in zip(batch, outcomes):
+            if future.done():  # caller was cancelled
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+
 # ============================================================================
 # Data Classes
 # ============================================================================
@@ -479,6 +639,16 @@ Respond with JSON:
 }}
 """
 
+TRIAGE_MAX_TOKENS = 200
+ANALYSIS_MAX_TOKENS = 1500
+
+# Namespaces for llm_result_cache: editing a prompt or its request settings
+# changes the version, so cached output from the old prompt is not reused.
+TRIAGE_PROMPT_VERSION = prompt_version(TRIAGE_PROMPT, max_tokens=TRIAGE_MAX_TOKENS)
+ANALYSIS_PROMPT_VERSION = prompt_version(
+    ANALYSIS_PROMPT, max_tokens=ANALYSIS_MAX_TOKENS
+)
+
 DEEP_RESEARCH_REPORT_PROMPT = """You are a grant analyst creating a comprehensive grant opportunity assessment report for City of Austin decision-makers and grants management staff.
 
 Generate an in-depth grant opportunity assessment for "{card_name}" for the City of Austin's grant discovery platform.
@@ -657,42 +827,161 @@ GUIDELINES:
 class AIService:
     """Service for AI-powered analysis and classification."""
 
-    def __init__(self, openai_client: openai.AsyncOpenAI):
+    def __init__(
+        self,
+        openai_client: openai.AsyncOpenAI,
+        coalesce_window_ms: Optional[float] = None,
+    ):
         """
         Initialize the AI service.
 
         Args:
             openai_client: AsyncOpenAI client for async operations
+            coalesce_window_ms: Micro-batching window for concurrent
+                ``generate_embedding`` calls (default from
+                ``AI_EMBEDDING_COALESCE_MS``; 0 disables coalescing)
         """
         self.client = openai_client
+        # Async clients are awaited directly; sync ones go to the executor
+        self._client_is_async = isinstance(openai_client, openai.AsyncOpenAI)
+
+        if coalesce_window_ms is None:
+            coalesce_window_ms = EMBEDDING_COALESCE_WINDOW_MS
+        self._embedding_coalescer: Optional[EmbeddingCoalescer] = (
+            EmbeddingCoalescer(
+                self._embed_texts_detailed, window_ms=coalesce_window_ms
+            )
+            if coalesce_window_ms > 0
+            else None
+        )
+
+    async def _call_client(self, create: Callable[..., Any], **kwargs) -> Any:
+        """Invoke a client ``create`` method without blocking the event loop."""
+        if self._client_is_async:
+            return await create(**kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_llm_executor(), partial(create, **kwargs))
+
+    async def chat_completion(self, **kwargs) -> Any:
+        """
+        Create a chat completion without blocking the event loop.
+
+        Accepts the same keyword arguments as
+        ``client.chat.completions.create``.  Callers outside this class that
+        need a raw completion should use this rather than ``self.client``.
+        """
+        return await self._call_client(self.client.chat.completions.create, **kwargs)
+
+    async def _create_embeddings(self, **kwargs) -> Any:
+        """Create embeddings without blocking the event loop."""
+        return await self._call_client(self.client.embeddings.create, **kwargs)
 
-    @with_retry(max_retries=MAX_RETRIES)
     async def generate_embedding(self, text: str) -> List[float]:
         """
         Generate embedding vector for text using OpenAI.
 
+        When coalescing is enabled, concurrent callers share one batched
+        request; otherwise this issues a single-input request.
+
         Args:
             text: Text to embed (will be truncated to ~8000 chars)
 
         Returns:
             1536-dimensional embedding vector
         """
+        if self._embedding_coalescer is not None:
+            return await self._embedding_coalescer.embed(text)
+        return await self._generate_embedding_single(text)
+
+    @with_retry(max_retries=MAX_RETRIES)
+    async def _generate_embedding_single(self, text: str) -> List[float]:
+        """Embed one text with its own API request."""
         # Truncate to stay within token limits
-        truncated = text[:8000] if len(text) > 8000 else text
+        truncated = text[:EMBEDDING_MAX_CHARS]
 
         logger.debug(f"Generating embedding for text ({len(truncated)} chars)")
 
-        response = self.client.embeddings.create(
+        response = await self._create_embeddings(
             model=get_embedding_deployment(), input=truncated, timeout=REQUEST_TIMEOUT
         )
 
         return response.data[0].embedding
 
+    async def generate_embeddings_batch(
+        self, texts: List[str]
+    ) -> List[Optional[List[float]]]:
+        """
+        Generate embeddings for many texts using as few requests as possible.
+
+        Inputs are packed into requests of at most
+        ``EMBEDDING_BATCH_MAX_INPUTS`` texts / ``EMBEDDING_BATCH_TOKEN_BUDGET``
+        estimated tokens.  Failures are isolated per item: a failed slot is
+        ``None`` and every other result is still returned.
+
+        Args:
+            texts: Texts to embed (each truncated to ~8000 chars)
+
+        Returns:
+            One vector (or None on failure / empty input) per text, in input order
+        """
+        outcomes = await self._embed_texts_detailed(texts)
+        return [None if isinstance(o, Exception) else o for o in outcomes]
+
+    async def _embed_texts_detailed(
+        self, texts: List[str]
+    ) -> List[Union[List[float], Exception]]:
+        """Batch-embed texts, returning a vector or the failure for each input."""
+        prepared = [(text or "")[:EMBEDDING_MAX_CHARS] for text in texts]
+        outcomes: List[Union[List[float], Exception]] = [
+            ValueError("Cannot embed empty text") for _ in prepared
+        ]
+        indices = [i for i, text in enumerate(prepared) if text.strip()]
+
+        for batch in plan_embedding_batches([prepared[i] for i in indices]):
+            batch_indices = [indices[j] for j in batch]
+            batch_texts = [prepared[i] for i in batch_indices]
+            try:
+                vectors: List[Union[List[float], Exception]] = (
+                    await self._embed_request(batch_texts)
+                )
+            except Exception as e:
+                # One bad input fails the whole request; retry items alone
+                # so the rest of the batch still gets embedded.
+                logger.warning(
+                    f"Batch embedding of {len(batch_texts)} inputs failed ({e}); "
+                    f"falling back to per-item requests"
+                )
+                vectors = []
+                for text in batch_texts:
+                    try:
+                        vectors.extend(await self._embed_request([text]))
+                    except Exception as item_error:
+                        vectors.append(item_error)
+
+            for i, vector in zip(batch_indices, vectors):
+                outcomes[i] = vector
+
+        return outcomes
+
     @with_retry(max_retries=MAX_RETRIES)
+    async def _embed_request(self, inputs: List[str]) -> List[List[float]]:
+        """Send one embeddings request for a list of inputs."""
+        logger.debug(f"Generating embeddings for {len(inputs)} inputs in one request")
+
+        response = await self._create_embeddings(
+            model=get_embedding_deployment(), input=inputs, timeout=REQUEST_TIMEOUT
+        )
+
+        # The API tags each vector with its input index; don't rely on order
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
     async def triage_source(self, title: str, content: str) -> TriageResult:
         """
         Quick relevance check for a source using cheap model.
 
+        Parsed responses are memoized in ``llm_result_cache`` by prompt,
+        model and content, so re-triaging the same article is a lookup.
+
         Args:
             title: Source title
             content: Source content (will be truncated)
@@ -700,40 +989,55 @@ class AIService:
         Returns:
             TriageResult with relevance decision
         """
-        prompt = TRIAGE_PROMPT.format(
-            title=title,
-            content=content[:4000],  # Increased from 2000 for better context
+        content = content[:4000]  # Increased from 2000 for better context
+        model = get_chat_mini_deployment()
+        key = content_hash(title, content)
+
+        result = await llm_result_cache.get("triage", TRIAGE_PROMPT_VERSION, model, key)
+        if result is None:
+            result = await self._triage_source_llm(title, content, model)
+            if result is None:
+                return TriageResult(
+                    is_relevant=False,
+                    confidence=0.0,
+                    primary_pillar=None,
+                    reason="Parse error",
+                    relevance_level="low",
+                )
+            await llm_result_cache.put(
+                "triage", TRIAGE_PROMPT_VERSION, model, key, result
+            )
+
+        return TriageResult(
+            is_relevant=result.get("is_relevant", False),
+            confidence=result.get("confidence", 0.0),
+            primary_pillar=result.get("primary_pillar"),
+            reason=result.get("reason", ""),
+            relevance_level=result.get("relevance_level", "medium"),
         )
 
+    @with_retry(max_retries=MAX_RETRIES)
+    async def _triage_source_llm(
+        self, title: str, content: str, model: str
+    ) -> Optional[Dict[str, Any]]:
+        """Run the triage prompt; the parsed JSON, or None if unparseable."""
+        prompt = TRIAGE_PROMPT.format(title=title, content=content)
+
         logger.debug(f"Triaging source: {title[:50]}...")
 
-        response = self.client.chat.completions.create(
-            model=get_chat_mini_deployment(),
+        response = await self.chat_completion(
+            model=model,
             messages=[{"role": "user", "content": prompt}],
             response_format={"type": "json_object"},
-            max_tokens=200,
+            max_tokens=TRIAGE_MAX_TOKENS,
             timeout=REQUEST_TIMEOUT,
         )
 
         try:
-            result = json.loads(response.choices[0].message.content)
+            return json.loads(response.choices[0].message.content)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse triage response: {e}")
-            return TriageResult(
-                is_relevant=False,
-                confidence=0.0,
-                primary_pillar=None,
-                reason="Parse error",
-                relevance_level="low",
-            )
-
-        return TriageResult(
-            is_relevant=result.get("is_relevant", False),
-            confidence=result.get("confidence", 0.0),
-            primary_pillar=result.get("primary_pillar"),
-            reason=result.get("reason", ""),
-            relevance_level=result.get("relevance_level", "medium"),
-        )
+            return None
 
     async def generate_source_title(self, url: str, content_snippet: str) -> str:
         """
@@ -756,7 +1060,7 @@ Content excerpt:
 Respond with ONLY the title text, nothing else."""
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.chat_completion(
                 model=get_chat_mini_deployment(),
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=50,
@@ -768,13 +1072,17 @@ Respond with ONLY the title text, nothing else."""
             logger.warning(f"Title generation failed: {e}")
             return "Untitled"
 
-    @with_retry(max_retries=MAX_RETRIES)
     async def analyze_source(
         self, title: str, content: str, source_name: str, published_at: str
     ) -> AnalysisResult:
         """
         Full analysis of a source using powerful model.
 
+        Parsed responses are memoized in ``llm_result_cache`` by prompt,
+        model, source name and normalized title+content, so re-analyzing the
+        same article is a lookup. ``published_at`` is left out of the key:
+        several pipelines pass the scan time rather than a publish date.
+
         Args:
             title: Source title
             content: Full source content
@@ -784,54 +1092,85 @@ Respond with ONLY the title text, nothing else."""
         Returns:
             AnalysisResult with full classification and scoring
         """
+        content = content[:6000]  # More content for full analysis
+        model = get_chat_deployment()
+        key = content_hash(title, content, source_name)
+
+        result = await llm_result_cache.get("analysis", ANALYSIS_PROMPT_VERSION, model, key)
+        if result is None:
+            result = await self._analyze_source_llm(
+                title, content, source_name, published_at, model
+            )
+            if result is None:
+                # Return default analysis on parse error
+                return AnalysisResult(
+                    summary=f"Analysis failed for: {title}",
+                    key_excerpts=[],
+                    pillars=[],
+                    goals=[],
+                    steep_categories=[],
+                    anchors=[],
+                    horizon="H2",
+                    suggested_stage=4,
+                    triage_score=3,
+                    pipeline_status="discovered",
+                    credibility=3.0,
+                    novelty=3.0,
+                    likelihood=5.0,
+                    impact=3.0,
+                    relevance=3.0,
+                    velocity=5.0,
+                    risk=5.0,
+                    time_to_awareness_months=12,
+                    time_to_prepare_months=24,
+                    suggested_card_name=title[:50],
+                    is_new_concept=False,
+                    reasoning="Parse error in analysis",
+                    scores_are_defaults=True,
+                )
+            await llm_result_cache.put(
+                "analysis", ANALYSIS_PROMPT_VERSION, model, key, result
+            )
+
+        return self._analysis_from_response(title, result)
+
+    @with_retry(max_retries=MAX_RETRIES)
+    async def _analyze_source_llm(
+        self,
+        title: str,
+        content: str,
+        source_name: str,
+        published_at: str,
+        model: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Run the analysis prompt; the parsed JSON, or None if unparseable."""
         prompt = ANALYSIS_PROMPT.format(
             title=title,
-            content=content[:6000],  # More content for full analysis
+            content=content,
             source=source_name,
             published_at=published_at,
         )
 
         logger.info(f"Analyzing source: {title[:50]}...")
 
-        response = self.client.chat.completions.create(
-            model=get_chat_deployment(),
+        response = await self.chat_completion(
+            model=model,
             messages=[{"role": "user", "content": prompt}],
             response_format={"type": "json_object"},
-            max_tokens=1500,
+            max_tokens=ANALYSIS_MAX_TOKENS,
             timeout=REQUEST_TIMEOUT * 2,  # Longer timeout for full analysis
         )
 
         try:
-            result = json.loads(response.choices[0].message.content)
+            return json.loads(response.choices[0].message.content)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse analysis response: {e}")
-            # Return default analysis on parse error
-            return AnalysisResult(
-                summary=f"Analysis failed for: {title}",
-                key_excerpts=[],
-                pillars=[],
-                goals=[],
-                steep_categories=[],
-                anchors=[],
-                horizon="H2",
-                suggested_stage=4,
-                triage_score=3,
-                pipeline_status="discovered",
-                credibility=3.0,
-                novelty=3.0,
-                likelihood=5.0,
-                impact=3.0,
-                relevance=3.0,
-                velocity=5.0,
-                risk=5.0,
-                time_to_awareness_months=12,
-                time_to_prepare_months=24,
-                suggested_card_name=title[:50],
-                is_new_concept=False,
-                reasoning="Parse error in analysis",
-                scores_are_defaults=True,
-            )
+            return None
 
+    def _analysis_from_response(
+        self, title: str, result: Dict[str, Any]
+    ) -> AnalysisResult:
+        """Build an AnalysisResult from parsed model JSON (scores clamped)."""
         entities = [
             ExtractedEntity(
                 name=ent.get("name", ""),
@@ -937,7 +1276,7 @@ Respond with ONLY the title text, nothing else."""
 
         logger.debug("Extracting entities from content")
 
-        response = self.client.chat.completions.create(
+        response = await self.chat_completion(
             model=get_chat_mini_deployment(),
             messages=[{"role": "user", "content": prompt}],
             response_format={"type": "json_object"},
@@ -1011,7 +1350,7 @@ Respond with JSON:
 
         logger.debug(f"Checking card match: {source_card_name} vs {existing_card_name}")
 
-        response = self.client.chat.completions.create(
+        response = await self.chat_completion(
             model=get_chat_mini_deployment(),
             messages=[{"role": "user", "content": prompt}],
             response_format={"type": "json_object"},
@@ -1120,7 +1459,7 @@ Respond with JSON:
         # Use higher max_tokens for structured profiles to avoid truncation
         max_tokens = 3000 if is_structured else 1500
 
-        response = self.client.chat.completions.create(
+        response = await self.chat_completion(
             model=get_chat_deployment(),
             messages=[{"role": "user", "content": prompt}],
             response_format={"type": "json_object"},
@@ -1203,7 +1542,7 @@ Respond with JSON:
         )
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.chat_completion(
                 model=get_chat_deployment(),
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=2000,
@@ -1271,7 +1610,7 @@ Based on the publication frequency, recency, and content themes, classify this s
 Respond with ONLY the single word classification (accelerating, stable, emerging, or declining). No explanation."""
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.chat_completion(
                 model=get_chat_mini_deployment(),
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=10,
@@ -1337,7 +1676,7 @@ Respond as a JSON object:
 {{"queries": ["query 1", "query 2", "query 3", "query 4", "query 5"]}}"""
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.chat_completion(
                 model=get_chat_mini_deployment(),
                 messages=[{"role": "user", "content": prompt}],
                 response_format={"type": "json_object"},
@@ -1419,7 +1758,7 @@ Respond as JSON:
 }}"""
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.chat_completion(
                 model=get_chat_mini_deployment(),
                 messages=[{"role": "user", "content": prompt}],
                 response_format={"type": "json_object"},
@@ -1542,7 +1881,7 @@ Respond as JSON:
 
         logger.info(f"Generating comprehensive deep research report for: {card_name}")
 
-        response = self.client.chat.completions.create(
+        response = await self.chat_completion(
             model=get_chat_deployment(),
             messages=[{"role": "user", "content": prompt}],
             max_tokens=16384,  # Max output for GPT-4o to ensure complete report with sources
@@ -41,6 +41,7 @@ import openai
 
 # Azure OpenAI deployment names
 from app.openai_provider import get_chat_deployment
+from app.job_notify import notify_job
 from app.taxonomy import PILLAR_NAMES
 
 logger = logging.getLogger(__name__)
@@ -493,6 +494,7 @@ class ExecutiveBriefService:
         self.db.add(brief)
         await self.db.flush()
         await self.db.refresh(brief)
+        await notify_job(self.db, "brief")
 
         logger.info(
             f"Created brief record version {next_version} for workstream_card {workstream_card_id}"
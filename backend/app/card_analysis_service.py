@@ -18,6 +18,7 @@ from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.db.research import ResearchTask
+from app.job_notify import notify_job
 
 logger = logging.getLogger(__name__)
 
@@ -155,6 +156,7 @@ async def queue_card_analysis(
     )
     db.add(task)
     await db.flush()
+    await notify_job(db, "research")
 
     task_id = str(task.id)
     logger.info("Queued card_analysis task %s for card %s", task_id, card_id)
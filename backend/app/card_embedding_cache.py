@@ -0,0 +1,435 @@
+"""
+Process-level card embedding matrix for exact in-memory vector search.
+
+Used by the pgvector fallbacks (``DiscoveryService._python_vector_search``
+and ``RSSService._python_card_search``) when ``vector_search_cards`` fails.
+Instead of pulling the first 100-200 cards through the ORM and scoring them
+one by one, they query a cached float32 matrix of *every* card embedding,
+L2-normalized once at load time, so an exact top-k over the whole corpus is
+a single matrix-vector product.
+
+Freshness:
+- The first search loads all cards with embeddings.
+- Later searches (at most every ``CARD_EMBEDDING_CACHE_REFRESH_SECONDS``)
+  re-read only cards whose ``updated_at`` moved past the watermark, plus
+  any card IDs invalidated via :meth:`CardEmbeddingCache.invalidate`
+  (``store_card_embedding`` calls it on every write).
+- A row-count mismatch (deleted cards) or
+  ``CARD_EMBEDDING_CACHE_FULL_RELOAD_SECONDS`` forces a full reload.
+- Rows whose embedding dimension differs from the matrix are skipped (and
+  logged once per card) rather than counted as out of sync.
+
+Memory is capped by ``CARD_EMBEDDING_CACHE_MAX_MB``.  Rows freed by removed
+cards are reused; once the cap is hit, a new or updated card takes the row of
+the least recently written or matched card and a warning is logged.
+
+Usage:
+    from app.card_embedding_cache import card_embedding_cache
+
+    matches = await card_embedding_cache.search(
+        db, embedding, k=1, threshold=0.0, exclude_rejected=True
+    )
+"""
+
+import asyncio
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+import numpy as np
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.helpers.vector_utils import parse_embedding
+from app.models.db.card import Card
+
+logger = logging.getLogger(__name__)
+
+CARD_EMBEDDING_CACHE_MAX_MB = float(os.getenv("CARD_EMBEDDING_CACHE_MAX_MB", "256"))
+CARD_EMBEDDING_CACHE_REFRESH_SECONDS = float(
+    os.getenv("CARD_EMBEDDING_CACHE_REFRESH_SECONDS", "30")
+)
+CARD_EMBEDDING_CACHE_FULL_RELOAD_SECONDS = float(
+    os.getenv("CARD_EMBEDDING_CACHE_FULL_RELOAD_SECONDS", "3600")
+)
+
+_INITIAL_CAPACITY = 1024
+
+
+class CardEmbeddingCache:
+    """Normalized card embedding matrix with incremental refresh."""
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        refresh_interval: Optional[float] = None,
+        full_reload_interval: Optional[float] = None,
+    ):
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else int(CARD_EMBEDDING_CACHE_MAX_MB * 1024 * 1024)
+        )
+        self.refresh_interval = (
+            refresh_interval
+            if refresh_interval is not None
+            else CARD_EMBEDDING_CACHE_REFRESH_SECONDS
+        )
+        self.full_reload_interval = (
+            full_reload_interval
+            if full_reload_interval is not None
+            else CARD_EMBEDDING_CACHE_FULL_RELOAD_SECONDS
+        )
+        self._lock = asyncio.Lock()
+        self._dirty_ids: Set[str] = set()
+        self._dim_warned: Set[str] = set()
+        self._needs_reload = True
+        self._reset()
+
+    def _reset(self) -> None:
+        self._dim: Optional[int] = None
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._live = np.zeros(0, dtype=bool)
+        self._status = np.empty(0, dtype=object)
+        self._review_status = np.empty(0, dtype=object)
+        self._ids: List[Optional[str]] = []
+        self._names: List[Optional[str]] = []
+        self._summaries: List[Optional[str]] = []
+        # card id -> row, least recently written / matched first
+        self._slots: "OrderedDict[str, int]" = OrderedDict()
+        self._free: List[int] = []
+        self._skipped: Set[str] = set()
+        self._watermark: Optional[datetime] = None
+        self._loaded_at = 0.0
+        self._refreshed_at = 0.0
+        self._truncated = False
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    @property
+    def size(self) -> int:
+        """Number of cards currently held in the matrix."""
+        return len(self._slots)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for the embedding matrix."""
+        return int(self._matrix.nbytes)
+
+    @property
+    def max_rows(self) -> Optional[int]:
+        """Row cap implied by ``max_bytes`` (None until the dimension is known)."""
+        if not self._dim:
+            return None
+        return max(0, self.max_bytes // (self._dim * 4))
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def invalidate(
+        self,
+        card_id: Optional[str] = None,
+        embedding: Optional[Sequence[float]] = None,
+    ) -> None:
+        """
+        Mark a card (or, with no ID, the whole cache) as stale.
+
+        If *embedding* is given and the card is already cached, its row is
+        updated in place so searches in this process see it immediately; the
+        card is still re-read on the next refresh to pick up other changes.
+        """
+        if card_id is None:
+            self._needs_reload = True
+            return
+
+        card_id = str(card_id)
+        self._dirty_ids.add(card_id)
+        slot = self._slots.get(card_id)
+        if slot is not None and embedding is not None:
+            vec = self._normalized(embedding)
+            if vec is not None:
+                self._matrix[slot] = vec
+                self._slots.move_to_end(card_id)
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    async def refresh(self, db: AsyncSession, force: bool = False) -> None:
+        """Bring the matrix up to date with the cards table."""
+        async with self._lock:
+            now = time.monotonic()
+            if (
+                force
+                or self._needs_reload
+                or now - self._loaded_at >= self.full_reload_interval
+            ):
+                await self._full_load(db)
+                return
+            if not self._dirty_ids and now - self._refreshed_at < self.refresh_interval:
+                return
+            await self._incremental_load(db)
+
+    async def _full_load(self, db: AsyncSession) -> None:
+        started = time.perf_counter()
+        # Invalidations arriving during the query are kept for the next refresh
+        self._dirty_ids.clear()
+        self._needs_reload = False
+        result = await db.execute(
+            self._select_rows()
+            .where(Card.embedding.isnot(None))
+            .order_by(Card.updated_at.desc().nulls_last())
+        )
+        rows = result.all()
+
+        self._reset()
+        # Oldest first, so under the memory cap the newest cards survive
+        self._apply_rows(rows[::-1])
+        self._loaded_at = self._refreshed_at = time.monotonic()
+        logger.info(
+            f"Card embedding cache loaded {self.size} cards "
+            f"({self.nbytes / (1024 * 1024):.1f} MB) in "
+            f"{time.perf_counter() - started:.2f}s"
+        )
+
+    async def _incremental_load(self, db: AsyncSession) -> None:
+        conditions = []
+        if self._watermark is not None:
+            conditions.append(Card.updated_at >= self._watermark)
+        dirty = list(self._dirty_ids)
+        dirty_uuids = []
+        for card_id in dirty:
+            try:
+                dirty_uuids.append(uuid.UUID(card_id))
+            except ValueError:
+                continue
+        if dirty_uuids:
+            conditions.append(Card.id.in_(dirty_uuids))
+
+        if conditions:
+            result = await db.execute(self._select_rows().where(or_(*conditions)))
+            self._apply_rows(result.all())
+        self._dirty_ids.difference_update(dirty)
+
+        # Deletions don't move any watermark; a count mismatch reveals them.
+        if not self._truncated:
+            count_result = await db.execute(
+                select(func.count()).select_from(Card).where(Card.embedding.isnot(None))
+            )
+            if count_result.scalar() != self.size + len(self._skipped):
+                logger.info("Card embedding cache out of sync with cards table, reloading")
+                await self._full_load(db)
+                return
+
+        self._refreshed_at = time.monotonic()
+
+    @staticmethod
+    def _select_rows():
+        return select(
+            Card.id,
+            Card.name,
+            Card.summary,
+            Card.status,
+            Card.review_status,
+            Card.updated_at,
+            Card.embedding,
+        )
+
+    def _apply_rows(self, rows: Sequence[Any]) -> None:
+        for row in rows:
+            card_id = str(row.id)
+            if row.updated_at is not None and (
+                self._watermark is None or row.updated_at > self._watermark
+            ):
+                self._watermark = row.updated_at
+
+            self._skipped.discard(card_id)
+            raw = parse_embedding(row.embedding)
+            if raw is not None and self._dim is not None and raw.size != self._dim:
+                self._remove(card_id)
+                self._skipped.add(card_id)
+                if card_id not in self._dim_warned:
+                    self._dim_warned.add(card_id)
+                    logger.warning(
+                        f"Card {card_id} embedding has {raw.size} dimensions, "
+                        f"expected {self._dim}; skipping it in the embedding cache"
+                    )
+                continue
+
+            vec = self._normalized(raw)
+            if vec is None:
+                self._remove(card_id)
+                continue
+
+            slot = self._slots.get(card_id)
+            if slot is None:
+                slot = self._allocate_slot()
+                if slot is None:
+                    continue
+                self._slots[card_id] = slot
+                self._ids[slot] = card_id
+            else:
+                self._slots.move_to_end(card_id)
+            self._matrix[slot] = vec
+            self._live[slot] = True
+            self._names[slot] = row.name
+            self._summaries[slot] = row.summary
+            self._status[slot] = row.status
+            self._review_status[slot] = row.review_status
+
+    def _normalized(self, embedding: Any) -> Optional[np.ndarray]:
+        vec = parse_embedding(embedding)
+        if vec is None:
+            return None
+        if self._dim is None:
+            self._dim = vec.size
+        elif vec.size != self._dim:
+            return None
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm else vec
+
+    def _remove(self, card_id: str) -> None:
+        slot = self._slots.pop(card_id, None)
+        if slot is not None:
+            self._live[slot] = False
+            self._ids[slot] = None
+            self._free.append(slot)
+
+    def _allocate_slot(self) -> Optional[int]:
+        """
+        Row index for a new card.
+
+        Reuses rows freed by removed cards, then grows storage up to the
+        memory cap, then takes the row of the least recently used card.
+        """
+        if self._free:
+            return self._free.pop()
+
+        used = len(self._ids)
+        if used < len(self._live):
+            self._ids.append(None)
+            self._names.append(None)
+            self._summaries.append(None)
+            return used
+
+        cap = self.max_rows or 0
+        if used >= cap:
+            if not self._slots:
+                return None
+            if not self._truncated:
+                logger.warning(
+                    f"Card embedding cache hit its {self.max_bytes / (1024 * 1024):.0f} MB "
+                    f"cap at {used} cards; evicting least recently used cards, "
+                    f"which are not searchable in fallback mode"
+                )
+            self._truncated = True
+            self._remove(next(iter(self._slots)))
+            return self._free.pop()
+
+        capacity = min(cap, max(_INITIAL_CAPACITY, used * 2))
+        matrix = np.zeros((capacity, self._dim), dtype=np.float32)
+        if used:
+            matrix[:used] = self._matrix[:used]
+        self._matrix = matrix
+        self._live = np.concatenate([self._live, np.zeros(capacity - used, dtype=bool)])
+        self._status = np.concatenate(
+            [self._status, np.empty(capacity - used, dtype=object)]
+        )
+        self._review_status = np.concatenate(
+            [self._review_status, np.empty(capacity - used, dtype=object)]
+        )
+        return self._allocate_slot()
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    async def search(
+        self,
+        db: AsyncSession,
+        query_embedding: Sequence[float],
+        k: int = 5,
+        threshold: float = 0.0,
+        *,
+        exclude_rejected: bool = False,
+        status: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Refresh if due, then return :meth:`top_k`."""
+        await self.refresh(db)
+        return self.top_k(
+            query_embedding,
+            k=k,
+            threshold=threshold,
+            exclude_rejected=exclude_rejected,
+            status=status,
+        )
+
+    def top_k(
+        self,
+        query_embedding: Sequence[float],
+        k: int = 5,
+        threshold: float = 0.0,
+        *,
+        exclude_rejected: bool = False,
+        status: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Exact cosine top-k over the cached cards.
+
+        Like ``vector_search_cards``: only similarities strictly above
+        *threshold*, best first, as dicts with ``id``, ``name``, ``summary``
+        and ``similarity``.
+
+        Args:
+            query_embedding: Query vector (any scale; it is normalized here)
+            k: Maximum matches to return
+            threshold: Minimum similarity (exclusive)
+            exclude_rejected: Skip cards with ``review_status == 'rejected'``
+            status: Only consider cards with this ``status``
+        """
+        rows = len(self._ids)
+        if rows == 0 or k <= 0:
+            return []
+        query = parse_embedding(query_embedding)
+        if query is None or query.size != self._dim:
+            return []
+        norm = float(np.linalg.norm(query))
+        if not norm:
+            return []
+
+        mask = self._live[:rows].copy()
+        if exclude_rejected:
+            mask &= self._review_status[:rows] != "rejected"
+        if status is not None:
+            mask &= self._status[:rows] == status
+
+        sims = self._matrix[:rows] @ (query / norm)
+        sims[~mask] = -np.inf
+        candidates = np.flatnonzero(sims > threshold)
+        if candidates.size > k:
+            part = np.argpartition(-sims[candidates], k - 1)[:k]
+            candidates = candidates[part]
+        order = candidates[np.argsort(-sims[candidates], kind="stable")]
+
+        for slot in order:
+            self._slots.move_to_end(self._ids[slot])
+        return [
+            {
+                "id": self._ids[slot],
+                "name": self._names[slot],
+                "summary": self._summaries[slot],
+                "similarity": float(sims[slot]),
+            }
+            for slot in order
+        ]
+
+
+# Shared per-process instance
+card_embedding_cache = CardEmbeddingCache()
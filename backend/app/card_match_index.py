@@ -0,0 +1,314 @@
+"""
+Vectorized in-memory card index for discovery deduplication.
+
+Discovery deduplication used to load every non-rejected Card ORM object,
+compare each source name against every card name in a pure-Python loop,
+and issue one pgvector round-trip per source.  :class:`CardMatchIndex`
+loads ``id``/``name``/``summary``/``embedding`` once per run and answers
+the three dedup questions for a whole batch of sources:
+
+1. **URL exists** -- one ``find_existing_source_urls`` query for all
+   candidate URLs (normalized, hash-indexed).
+2. **Name similarity** -- token inverted index plus a length window, so
+   only cards that *can* reach the threshold are scored.  Scores are
+   identical to ``calculate_name_similarity``.
+3. **Top-k cosine** -- one normalized NumPy matrix product per chunk of
+   sources, mirroring ``vector_search_cards`` (strict ``> threshold``,
+   ordered by similarity).
+
+Usage::
+
+    from app.card_match_index import CardMatchIndex
+
+    index = await CardMatchIndex.load(db, urls=[s.raw.url for s in sources])
+    matches = index.top_matches([s.embedding for s in sources], k=3,
+                                threshold=config.weak_match_threshold)
+"""
+
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.helpers.db_utils import find_existing_source_urls, normalize_source_url
+from app.helpers.vector_utils import normalize_rows, parse_embedding
+from app.models.db.card import Card
+
+logger = logging.getLogger(__name__)
+
+# Max source rows multiplied against the card matrix at once; bounds the
+# similarity block to SOURCE_CHUNK x n_cards float32 values.
+SOURCE_CHUNK = 256
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+
+# ============================================================================
+# Name normalization / similarity (shared with discovery_service)
+# ============================================================================
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    return " ".join(_PUNCTUATION_RE.sub("", name.lower().strip()).split())
+
+
+def normalized_name_similarity(n1: str, n2: str) -> float:
+    """
+    Similarity between two *already normalized* names.
+
+    Exact match scores 1.0, containment scores shorter/longer length, and
+    anything else scores word-level Jaccard.
+    """
+    if n1 == n2:
+        return 1.0
+
+    # Check if one contains the other (high similarity)
+    if n1 in n2 or n2 in n1:
+        shorter = min(len(n1), len(n2))
+        longer = max(len(n1), len(n2))
+        return shorter / longer if longer > 0 else 0.0
+
+    words1 = set(n1.split())
+    words2 = set(n2.split())
+    if not words1 or not words2:
+        return 0.0
+
+    union = words1 | words2
+    return len(words1 & words2) / len(union) if union else 0.0
+
+
+# ============================================================================
+# Card Match Index
+# ============================================================================
+
+
+class CardMatchIndex:
+    """Per-run snapshot of non-rejected cards for batched dedup lookups."""
+
+    def __init__(
+        self,
+        cards: Sequence[Dict[str, Any]],
+        existing_urls: Optional[Iterable[str]] = None,
+    ):
+        """
+        Build the index from card dicts.
+
+        Args:
+            cards: Dicts with ``id``, ``name``, ``summary`` and ``embedding``
+                (any form accepted by :func:`parse_embedding`), in the order
+                name matching should prefer them.
+            existing_urls: Normalized URLs already stored in ``sources``
+                (keys of ``find_existing_source_urls``).
+        """
+        self.cards: List[Dict[str, Any]] = [
+            {"id": str(c["id"]), "name": c.get("name"), "summary": c.get("summary")}
+            for c in cards
+        ]
+        self.existing_urls = set(existing_urls or ())
+        self._build_name_index()
+        self._build_vector_index([c.get("embedding") for c in cards])
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    @classmethod
+    async def load(
+        cls, db: AsyncSession, urls: Optional[Iterable[str]] = None
+    ) -> "CardMatchIndex":
+        """
+        Load non-rejected cards (and which of *urls* already exist) from the DB.
+
+        Two queries total, regardless of how many sources will be checked.
+        """
+        result = await db.execute(
+            select(Card.id, Card.name, Card.summary, Card.embedding).where(
+                Card.review_status != "rejected"
+            )
+        )
+        cards = [
+            {"id": r.id, "name": r.name, "summary": r.summary, "embedding": r.embedding}
+            for r in result.all()
+        ]
+
+        urls = [u for u in (urls or ()) if u]
+        existing_urls = await find_existing_source_urls(db, urls)
+
+        index = cls(cards, existing_urls.keys())
+        logger.info(
+            f"CardMatchIndex loaded {len(index.cards)} cards "
+            f"({index.vector_count} with embeddings), "
+            f"{len(existing_urls)} of {len(urls)} candidate URLs already stored"
+        )
+        return index
+
+    # ------------------------------------------------------------------
+    # URL lookups
+    # ------------------------------------------------------------------
+
+    def url_exists(self, url: Optional[str]) -> bool:
+        """True if *url* (after normalization) is already stored as a source."""
+        return bool(url) and normalize_source_url(url) in self.existing_urls
+
+    # ------------------------------------------------------------------
+    # Name matching
+    # ------------------------------------------------------------------
+
+    def _build_name_index(self) -> None:
+        self._norm_names: List[Optional[str]] = []
+        postings: Dict[str, List[int]] = {}
+        lengths = np.full(len(self.cards), -1, dtype=np.int64)
+
+        for pos, card in enumerate(self.cards):
+            if not card["name"]:
+                self._norm_names.append(None)
+                continue
+            norm = normalize_name(card["name"])
+            self._norm_names.append(norm)
+            lengths[pos] = len(norm)
+            for token in set(norm.split()):
+                postings.setdefault(token, []).append(pos)
+
+        self._postings = {t: np.asarray(p, dtype=np.int64) for t, p in postings.items()}
+        self._name_lengths = lengths
+
+    def _name_candidates(self, norm: str, threshold: float) -> np.ndarray:
+        """Card positions that could score >= threshold against *norm*."""
+        tokens = set(norm.split())
+        parts = [self._postings[t] for t in tokens if t in self._postings]
+
+        # Equality or containment at ratio >= threshold needs a comparable
+        # length, whether or not any whole word is shared.
+        n = len(norm)
+        if n == 0:
+            window = self._name_lengths == 0
+        else:
+            window = (self._name_lengths >= n * threshold) & (
+                self._name_lengths * threshold <= n
+            )
+        parts.append(np.flatnonzero(window))
+        return np.unique(np.concatenate(parts)) if parts else np.empty(0, np.int64)
+
+    def first_name_match(
+        self, name: Optional[str], threshold: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        First card (in load order) whose name similarity is >= threshold.
+
+        Returns the card dict plus ``similarity``, or None.  Equivalent to
+        scanning every card with ``calculate_name_similarity`` and stopping
+        at the first hit.
+        """
+        if not name or not self.cards:
+            return None
+        if threshold <= 0:
+            # Every card qualifies; the first named one wins.
+            for pos, norm in enumerate(self._norm_names):
+                if norm is not None:
+                    return {
+                        **self.cards[pos],
+                        "similarity": normalized_name_similarity(
+                            normalize_name(name), norm
+                        ),
+                    }
+            return None
+
+        query = normalize_name(name)
+        for pos in self._name_candidates(query, threshold):  # ascending = load order
+            norm = self._norm_names[pos]
+            if norm is None:
+                continue
+            sim = normalized_name_similarity(query, norm)
+            if sim >= threshold:
+                return {**self.cards[pos], "similarity": sim}
+        return None
+
+    # ------------------------------------------------------------------
+    # Vector matching
+    # ------------------------------------------------------------------
+
+    def _build_vector_index(self, embeddings: List[Any]) -> None:
+        rows: List[np.ndarray] = []
+        positions: List[int] = []
+        dim: Optional[int] = None
+        for pos, raw in enumerate(embeddings):
+            vec = parse_embedding(raw)
+            if vec is None:
+                continue
+            if dim is None:
+                dim = vec.size
+            if vec.size != dim:
+                logger.warning(
+                    f"CardMatchIndex: skipping card {self.cards[pos]['id']} "
+                    f"with {vec.size}-dim embedding (expected {dim})"
+                )
+                continue
+            rows.append(vec)
+            positions.append(pos)
+
+        self._dim = dim
+        self._vector_positions = np.asarray(positions, dtype=np.int64)
+        self._matrix = (
+            normalize_rows(np.vstack(rows)) if rows else np.empty((0, 0), np.float32)
+        )
+
+    @property
+    def vector_count(self) -> int:
+        """Number of cards with a usable embedding."""
+        return len(self._vector_positions)
+
+    def top_matches(
+        self,
+        embeddings: Sequence[Optional[Sequence[float]]],
+        k: int,
+        threshold: float,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Top-k cards by cosine similarity for each query embedding.
+
+        Mirrors ``vector_search_cards``: only matches strictly above
+        *threshold*, best first.  Queries that are missing or have the wrong
+        dimension get an empty list.
+
+        Returns:
+            One list of card dicts (with ``similarity``) per query, in order
+        """
+        results: List[List[Dict[str, Any]]] = [[] for _ in embeddings]
+        if self.vector_count == 0 or k <= 0:
+            return results
+
+        valid: List[int] = []
+        vectors: List[np.ndarray] = []
+        for i, emb in enumerate(embeddings):
+            vec = parse_embedding(emb)
+            if vec is not None and vec.size == self._dim:
+                valid.append(i)
+                vectors.append(vec)
+        if not vectors:
+            return results
+
+        queries = normalize_rows(np.vstack(vectors))
+        k = min(k, self.vector_count)
+
+        for start in range(0, len(valid), SOURCE_CHUNK):
+            block = queries[start : start + SOURCE_CHUNK] @ self._matrix.T
+            if k < block.shape[1]:
+                top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            else:
+                top = np.tile(np.arange(block.shape[1]), (block.shape[0], 1))
+            for row, cols in enumerate(top):
+                sims = block[row, cols]
+                order = np.argsort(-sims, kind="stable")
+                matches = []
+                for col, sim in zip(cols[order], sims[order]):
+                    if sim <= threshold:
+                        break
+                    card = self.cards[self._vector_positions[col]]
+                    matches.append({**card, "similarity": float(sim)})
+                results[valid[start + row]] = matches
+
+        return results
@@ -18,6 +18,7 @@ from dataclasses import dataclass, field
 from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Union
 
 from app.openai_provider import azure_openai_async_client
+from app.rate_governor import Priority, request_priority
 
 logger = logging.getLogger(__name__)
 
@@ -300,13 +301,16 @@ async def execute_streaming_with_tools(
                             f"Executing {tool_name}...",
                         )
 
-                    # Dispatch to handler with timeout
+                    # Dispatch to handler with timeout.  Outbound API calls
+                    # made by the tool jump ahead of batch work in the rate
+                    # governor.
                     try:
                         handler = tool_handlers[tool_name]
-                        result = await asyncio.wait_for(
-                            handler(db=db, user_id=user_id, **args),
-                            timeout=30.0,
-                        )
+                        with request_priority(Priority.INTERACTIVE):
+                            result = await asyncio.wait_for(
+                                handler(db=db, user_id=user_id, **args),
+                                timeout=30.0,
+                            )
                     except asyncio.TimeoutError:
                         logger.warning("Tool handler %s timed out after 30s", tool_name)
                         result = {
@@ -151,7 +151,7 @@ class ConnectionService:
 
         embedding = card.embedding
 
-        if not embedding:
+        if embedding is None or len(embedding) == 0:
             logger.warning(
                 f"Card {card_id} has no embedding, skipping connection discovery"
             )
@@ -358,7 +358,7 @@ class ConnectionService:
         )
 
         try:
-            response = self.ai_service.client.chat.completions.create(
+            response = await self.ai_service.chat_completion(
                 model=get_chat_mini_deployment(),
                 messages=[{"role": "user", "content": prompt}],
                 response_format={"type": "json_object"},
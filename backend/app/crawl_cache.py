@@ -0,0 +1,246 @@
+"""
+On-disk cache of crawl results shared by every ``crawl_url`` caller.
+
+Discovery, RSS processing and workstream scans often crawl the same article
+within a day.  Successful ``CrawlResult`` objects are stored here, one JSON
+file per URL, together with the response's ``ETag`` / ``Last-Modified``
+validators and a SHA-256 of the body:
+
+- within ``CRAWL_CACHE_TTL_HOURS`` the cached result is returned without
+  touching the network;
+- after that the crawler revalidates with a conditional GET -- a ``304`` (or
+  a ``200`` whose body hashes the same) reuses the cached extraction and
+  only refreshes the entry's timestamp.
+
+The directory is shared by all processes on the host (web + worker); files
+are written atomically.  Total size is bounded by ``CRAWL_CACHE_MAX_MB``:
+reads bump a file's mtime and the least recently used files are evicted
+first.  ``CRAWL_CACHE_MAX_MB=0`` disables the cache.
+
+Usage:
+    from app.crawl_cache import crawl_cache
+
+    entry = await crawl_cache.get(url)
+    if entry and entry.is_fresh():
+        return entry.result
+    ...
+    await crawl_cache.put(url, result, etag=..., last_modified=..., content_hash=...)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from app.crawler import CrawlResult
+
+logger = logging.getLogger(__name__)
+
+CRAWL_CACHE_DIR = os.getenv(
+    "CRAWL_CACHE_DIR", os.path.join(tempfile.gettempdir(), "grantscope-crawl-cache")
+)
+CRAWL_CACHE_MAX_MB = float(os.getenv("CRAWL_CACHE_MAX_MB", "512"))
+CRAWL_CACHE_TTL_HOURS = float(os.getenv("CRAWL_CACHE_TTL_HOURS", "24"))
+
+
+def cache_key(url: str) -> str:
+    """Filename-safe key for a URL (fragment stripped)."""
+    return hashlib.sha256(url.split("#")[0].encode()).hexdigest()
+
+
+def content_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+@dataclass
+class CachedCrawl:
+    """A cached successful crawl plus what is needed to revalidate it."""
+
+    result: "CrawlResult"
+    stored_at: float
+    ttl: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+
+    def is_fresh(self) -> bool:
+        return time.time() - self.stored_at < self.ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class CrawlCache:
+    """Size-bounded LRU of crawl results in a directory of JSON files."""
+
+    def __init__(
+        self,
+        directory: str = CRAWL_CACHE_DIR,
+        max_bytes: int = int(CRAWL_CACHE_MAX_MB * 1024 * 1024),
+        ttl: float = CRAWL_CACHE_TTL_HOURS * 3600,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # key -> (size, last access); loaded from the directory on first use.
+        self._index: Optional[Dict[str, tuple[int, float]]] = None
+        self._size = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    # -- synchronous file operations (run in a thread) ----------------------
+
+    def _load_index(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        index: Dict[str, tuple[int, float]] = {}
+        with os.scandir(self.directory) as it:
+            for item in it:
+                if not item.name.endswith(".json"):
+                    continue
+                try:
+                    stat = item.stat()
+                except FileNotFoundError:
+                    continue
+                index[item.name[:-5]] = (stat.st_size, stat.st_mtime)
+        self._index = index
+        self._size = sum(size for size, _ in index.values())
+
+    def _read(self, key: str) -> Optional[dict]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            os.utime(path)
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            self._forget(key)
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Dropping unreadable crawl cache entry %s: %s", key, e)
+            self._remove(key)
+            return None
+        # May have been written by another process since the scan.
+        self._forget(key)
+        self._index[key] = (size, time.time())
+        self._size += size
+        return data
+
+    def _write(self, key: str, data: dict) -> None:
+        payload = json.dumps(data, separators=(",", ":")).encode()
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(payload)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        self._forget(key)
+        self._index[key] = (len(payload), time.time())
+        self._size += len(payload)
+        self._evict()
+
+    def _forget(self, key: str) -> None:
+        size, _ = self._index.pop(key, (0, 0.0))
+        self._size -= size
+
+    def _remove(self, key: str) -> None:
+        self._forget(key)
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        if self._size <= self.max_bytes:
+            return
+        for key, _ in sorted(self._index.items(), key=lambda kv: kv[1][1]):
+            self._remove(key)
+            if self._size <= self.max_bytes:
+                break
+
+    # -- public API ---------------------------------------------------------
+
+    async def _run(self, fn, *args):
+        async with self._lock:
+            if self._index is None:
+                await asyncio.to_thread(self._load_index)
+            return await asyncio.to_thread(fn, *args)
+
+    async def get(self, url: str) -> Optional[CachedCrawl]:
+        """Cached entry for ``url`` (fresh or stale), or None."""
+        if not self.enabled:
+            return None
+        from app.crawler import CrawlResult
+
+        try:
+            data = await self._run(self._read, cache_key(url))
+        except OSError as e:
+            logger.warning("Crawl cache read failed for %s: %s", url, e)
+            return None
+        if data is None:
+            return None
+        try:
+            return CachedCrawl(
+                result=CrawlResult(**data["result"]),
+                stored_at=data["stored_at"],
+                ttl=self.ttl,
+                etag=data.get("etag"),
+                last_modified=data.get("last_modified"),
+                content_hash=data.get("content_hash"),
+            )
+        except (KeyError, TypeError) as e:
+            logger.warning("Ignoring malformed crawl cache entry for %s: %s", url, e)
+            return None
+
+    async def put(
+        self,
+        url: str,
+        result: "CrawlResult",
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        content_hash: Optional[str] = None,
+    ) -> None:
+        """Store a successful crawl result (failures are never cached)."""
+        if not self.enabled or not result.success:
+            return
+        data = {
+            "result": asdict(result),
+            "stored_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": content_hash,
+        }
+        try:
+            await self._run(self._write, cache_key(url), data)
+        except OSError as e:
+            logger.warning("Crawl cache write failed for %s: %s", url, e)
+
+    async def clear(self) -> None:
+        async with self._lock:
+            if self._index is None:
+                await asyncio.to_thread(self._load_index)
+            for key in list(self._index):
+                await asyncio.to_thread(self._remove, key)
+
+
+crawl_cache = CrawlCache()
@@ -8,31 +8,67 @@ Supports three extraction backends:
   Enabled via CRAWLER_ENGINE=crawl4ai env var. Falls back to trafilatura if unavailable.
 - **pymupdf**: Automatic PDF text extraction when URL points to a PDF document.
 
+Pages are fetched through one pooled ``httpx.AsyncClient`` per event loop
+(keep-alive, HTTP/2 when ``h2`` is installed); the content type is sniffed
+from the GET response itself.  Extraction runs on a thread pool, or on a
+pool of worker processes with CRAWLER_EXTRACT_MODE=process (per-task time
+and per-worker memory limits, see Configuration).  Successful results go
+through the on-disk crawl cache (``app.crawl_cache``) so a URL crawled by
+several pipelines is fetched and extracted once per day.
+
 Public API:
     crawl_url(url, timeout) -> CrawlResult
     crawl_urls(urls, max_concurrent, timeout) -> List[CrawlResult]
+    close_http_client(), shutdown_extraction_pool()  # on shutdown
 """
 
 import asyncio
 import logging
 import os
+import multiprocessing
+import signal
 import time
-from concurrent.futures import ThreadPoolExecutor
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import httpx
 import trafilatura
 
+from app.crawl_cache import CachedCrawl, content_hash, crawl_cache
+
+# Optional: h2 enables HTTP/2 on the shared client
+try:
+    import h2  # noqa: F401
+
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
+
 # Optional: pymupdf for PDF extraction
 try:
-    import fitz  # PyMuPDF
+    import pymupdf as fitz  # PyMuPDF >= 1.24 (``import fitz`` warns)
 
     _HAS_PYMUPDF = True
 except ImportError:
-    _HAS_PYMUPDF = False
+    try:
+        import fitz  # PyMuPDF < 1.24
+
+        _HAS_PYMUPDF = True
+    except ImportError:
+        _HAS_PYMUPDF = False
+
+# Optional: resource for per-worker memory limits (Unix only)
+try:
+    import resource
+
+    _HAS_RESOURCE = True
+except ImportError:
+    _HAS_RESOURCE = False
 
 # Optional: crawl4ai for JS-rendered pages
 try:
@@ -52,10 +88,40 @@ CRAWLER_ENGINE: str = os.environ.get("CRAWLER_ENGINE", "trafilatura")
 CRAWLER_TIMEOUT: int = int(os.environ.get("CRAWLER_TIMEOUT", "30"))
 CRAWLER_MAX_CONTENT_SIZE: int = int(os.environ.get("CRAWLER_MAX_CONTENT_SIZE", "50000"))
 
+# Extraction backend: "thread" (default) or "process".  trafilatura and
+# PyMuPDF parsing is CPU-bound and mostly holds the GIL, so threads top out
+# around one core; "process" runs extraction in a pool of worker processes.
+CRAWLER_EXTRACT_MODE: str = os.environ.get("CRAWLER_EXTRACT_MODE", "thread")
+CRAWLER_EXTRACT_WORKERS: int = int(
+    os.environ.get("CRAWLER_EXTRACT_WORKERS", str(os.cpu_count() or 2))
+)
+# Per-task wall-clock limit and per-worker address-space limit (0 = none)
+CRAWLER_EXTRACT_TIMEOUT: int = int(os.environ.get("CRAWLER_EXTRACT_TIMEOUT", "60"))
+CRAWLER_EXTRACT_MAX_MEMORY_MB: int = int(
+    os.environ.get("CRAWLER_EXTRACT_MAX_MEMORY_MB", "1024")
+)
+# Recycle worker processes after this many tasks (bounds leaks/fragmentation)
+CRAWLER_EXTRACT_MAX_TASKS_PER_CHILD: int = int(
+    os.environ.get("CRAWLER_EXTRACT_MAX_TASKS_PER_CHILD", "200")
+)
+
+# Extra seconds the event loop waits past CRAWLER_EXTRACT_TIMEOUT before it
+# treats a process worker as wedged and recycles the pool
+_EXTRACT_TIMEOUT_GRACE: float = 5.0
+
 _MAX_PDF_PAGES: int = 20
 _MAX_RETRY_ATTEMPTS: int = 2
 _DOMAIN_CONCURRENCY: int = 3
 
+# Shared client pool.  Per-host concurrency is bounded by the per-domain
+# semaphores below (one request per crawl), so at most _DOMAIN_CONCURRENCY
+# connections are open to any host.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0,
+)
+
 # ---------------------------------------------------------------------------
 # Module-level resources
 # ---------------------------------------------------------------------------
@@ -63,6 +129,9 @@ _DOMAIN_CONCURRENCY: int = 3
 # Reusable thread pool for blocking I/O (trafilatura is synchronous)
 _executor = ThreadPoolExecutor(max_workers=5)
 
+# Process pool for CRAWLER_EXTRACT_MODE=process (created on first use)
+_process_pool: Optional[ProcessPoolExecutor] = None
+
 # Per-domain semaphores for rate limiting (lazily populated)
 _domain_semaphores: Dict[str, asyncio.Semaphore] = {}
 _domain_lock = asyncio.Lock()
@@ -78,6 +147,36 @@ _DEFAULT_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+# One pooled client per event loop (httpx connections are loop-bound; the
+# worker and web process each run their own loop).
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared keep-alive client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            headers=_DEFAULT_HEADERS,
+            follow_redirects=True,
+            max_redirects=5,
+            limits=_HTTP_LIMITS,
+            http2=_HAS_H2,
+            timeout=float(CRAWLER_TIMEOUT),
+        )
+        _http_clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the running loop's shared client (call on shutdown)."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -175,20 +274,143 @@ def _make_error_result(
     )
 
 
+# ---------------------------------------------------------------------------
+# Extraction pool
+# ---------------------------------------------------------------------------
+
+
+class ExtractionTimeout(Exception):
+    """Raised in an extraction worker that exceeded CRAWLER_EXTRACT_TIMEOUT."""
+
+
+def _init_extract_worker(max_memory_mb: int) -> None:
+    """Process-pool initializer: cap the worker's address space."""
+    if _HAS_RESOURCE and max_memory_mb > 0:
+        limit = max_memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _call_with_time_limit(fn: Callable[..., Any], seconds: float, *args: Any) -> Any:
+    """Run ``fn`` in a worker process, interrupting it after ``seconds``."""
+    if seconds <= 0 or not hasattr(signal, "setitimer"):
+        return fn(*args)
+
+    def _on_timeout(signum: int, frame: Any) -> None:
+        raise ExtractionTimeout(f"extraction exceeded {seconds}s")
+
+    signal.signal(signal.SIGALRM, _on_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        return fn(*args)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        # spawn: forking a process with a running event loop and thread
+        # pools is unsafe; workers import this module fresh.
+        _process_pool = ProcessPoolExecutor(
+            max_workers=max(1, CRAWLER_EXTRACT_WORKERS),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_extract_worker,
+            initargs=(CRAWLER_EXTRACT_MAX_MEMORY_MB,),
+            max_tasks_per_child=CRAWLER_EXTRACT_MAX_TASKS_PER_CHILD or None,
+        )
+    return _process_pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Stop the extraction worker processes (call on shutdown)."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor, kill: bool = False) -> None:
+    """
+    Drop ``pool`` so the next task starts a fresh one.
+
+    With ``kill``, its worker processes are killed first: ``shutdown()``
+    never interrupts a running task, so a wedged worker would otherwise hold
+    its slot forever.
+    """
+    global _process_pool
+    if _process_pool is pool:
+        _process_pool = None
+    if kill:
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            try:
+                process.kill()
+            except Exception as e:
+                logger.debug(f"Could not kill extraction worker: {e}")
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_extraction(fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a synchronous extractor on the configured backend.
+
+    Arguments should be raw bytes and plain values so they pickle cheaply
+    for the process pool; extractors return small ``(text, title, meta)``
+    tuples.  Exceptions (including :class:`ExtractionTimeout` and a worker
+    killed by its memory limit) propagate to the caller.
+    """
+    loop = asyncio.get_running_loop()
+    if CRAWLER_EXTRACT_MODE != "process":
+        return await loop.run_in_executor(_executor, fn, *args)
+
+    pool = _get_process_pool()
+    try:
+        # The worker's own alarm fires first; wait_for is the backstop for
+        # a wedged worker that can't take the signal.
+        return await asyncio.wait_for(
+            loop.run_in_executor(
+                pool, _call_with_time_limit, fn, CRAWLER_EXTRACT_TIMEOUT, *args
+            ),
+            timeout=(
+                CRAWLER_EXTRACT_TIMEOUT + _EXTRACT_TIMEOUT_GRACE
+                if CRAWLER_EXTRACT_TIMEOUT > 0
+                else None
+            ),
+        )
+    except asyncio.TimeoutError:
+        # The worker ignored its alarm; kill it rather than leak the slot.
+        logger.warning("Extraction worker wedged; killing and restarting process pool")
+        _discard_process_pool(pool, kill=True)
+        raise
+    except BrokenProcessPool:
+        # A worker died (e.g. MemoryError / killed); start a fresh pool.
+        logger.warning("Extraction worker died; restarting process pool")
+        _discard_process_pool(pool)
+        raise
+
+
 # ---------------------------------------------------------------------------
 # Trafilatura backend
 # ---------------------------------------------------------------------------
 
 
 def _trafilatura_extract_sync(
-    html: str,
+    html: Union[str, bytes],
+    encoding: Optional[str] = None,
 ) -> tuple[Optional[str], Optional[str], Dict[str, Any]]:
     """
-    Synchronous trafilatura extraction — designed to run in a thread pool.
+    Synchronous trafilatura extraction — runs in the extraction pool.
+
+    ``html`` may be the raw response body; it is decoded with ``encoding``
+    (the response charset) when given, otherwise trafilatura detects it.
 
     Returns:
         (text, title, metadata_dict)
     """
+    if isinstance(html, bytes) and encoding:
+        try:
+            html = html.decode(encoding, errors="replace")
+        except LookupError:
+            pass  # unknown charset: let trafilatura detect it
     text = trafilatura.extract(
         html,
         include_comments=False,
@@ -222,36 +444,13 @@ async def _extract_with_trafilatura(
     url: str, timeout: int = CRAWLER_TIMEOUT
 ) -> CrawlResult:
     """
-    Fetch a URL with httpx and extract content using trafilatura.
+    Fetch a URL with the shared httpx client and extract it with trafilatura.
 
-    This is the default, lightweight extraction path.
+    Used when crawl4ai is configured but unavailable; ``crawl_url`` itself
+    fetches once and calls :func:`_extract_html` directly.
     """
-    html: Optional[str] = None
-    status_code: int = 0
-    content_type: str = ""
-
     try:
-        async with httpx.AsyncClient(
-            timeout=float(timeout),
-            headers=_DEFAULT_HEADERS,
-            follow_redirects=True,
-            max_redirects=5,
-        ) as client:
-            response = await client.get(url)
-            status_code = response.status_code
-            content_type = response.headers.get("content-type", "")
-
-            if status_code >= 400:
-                return _make_error_result(
-                    url=url,
-                    error=f"HTTP {status_code}",
-                    status_code=status_code,
-                    content_type=content_type,
-                    engine="trafilatura",
-                )
-
-            html = response.text
-
+        response = await get_http_client().get(url, timeout=float(timeout))
     except httpx.TimeoutException:
         return _make_error_result(
             url=url,
@@ -265,7 +464,33 @@ async def _extract_with_trafilatura(
             engine="trafilatura",
         )
 
-    if not html:
+    status_code = response.status_code
+    content_type = response.headers.get("content-type", "")
+    if status_code >= 400:
+        return _make_error_result(
+            url=url,
+            error=f"HTTP {status_code}",
+            status_code=status_code,
+            content_type=content_type,
+            engine="trafilatura",
+        )
+    return await _extract_html(
+        url, response.content, response.charset_encoding, status_code, content_type
+    )
+
+
+async def _extract_html(
+    url: str,
+    body: Optional[bytes],
+    encoding: Optional[str],
+    status_code: int,
+    content_type: str,
+) -> CrawlResult:
+    """Extract a fetched HTML page (raw body bytes) with trafilatura.
+
+    This is the default, lightweight extraction path.
+    """
+    if not body:
         return _make_error_result(
             url=url,
             error="Empty response body",
@@ -274,11 +499,10 @@ async def _extract_with_trafilatura(
             engine="trafilatura",
         )
 
-    # Run trafilatura in thread pool (it's synchronous and CPU-bound)
-    loop = asyncio.get_running_loop()
+    # Run trafilatura in the extraction pool (it's synchronous and CPU-bound)
     try:
-        text, title, meta_dict = await loop.run_in_executor(
-            _executor, _trafilatura_extract_sync, html
+        text, title, meta_dict = await _run_extraction(
+            _trafilatura_extract_sync, body, encoding
         )
     except Exception as exc:
         logger.warning("Trafilatura extraction error for %s: %s", url, exc)
@@ -409,9 +633,11 @@ async def _extract_with_crawl4ai(
 # ---------------------------------------------------------------------------
 
 
-async def _extract_pdf(url: str, timeout: int = CRAWLER_TIMEOUT) -> CrawlResult:
+async def _extract_pdf(
+    url: str, pdf_bytes: bytes, status_code: int, content_type: str
+) -> CrawlResult:
     """
-    Download a PDF from a URL and extract text using PyMuPDF (fitz).
+    Extract text from a downloaded PDF using PyMuPDF (fitz).
 
     For large PDFs (>20 pages), extracts only the first 20 pages plus
     the table of contents. Content is capped at CRAWLER_MAX_CONTENT_SIZE chars.
@@ -423,46 +649,6 @@ async def _extract_pdf(url: str, timeout: int = CRAWLER_TIMEOUT) -> CrawlResult:
             engine="pymupdf",
         )
 
-    pdf_bytes: bytes = b""
-    status_code: int = 0
-    content_type: str = "application/pdf"
-
-    # Download the PDF
-    try:
-        async with httpx.AsyncClient(
-            timeout=float(timeout),
-            headers=_DEFAULT_HEADERS,
-            follow_redirects=True,
-            max_redirects=5,
-        ) as client:
-            response = await client.get(url)
-            status_code = response.status_code
-            content_type = response.headers.get("content-type", "application/pdf")
-
-            if status_code >= 400:
-                return _make_error_result(
-                    url=url,
-                    error=f"HTTP {status_code}",
-                    status_code=status_code,
-                    content_type=content_type,
-                    engine="pymupdf",
-                )
-
-            pdf_bytes = response.content
-
-    except httpx.TimeoutException:
-        return _make_error_result(
-            url=url,
-            error=f"PDF download timed out after {timeout}s",
-            engine="pymupdf",
-        )
-    except httpx.HTTPError as exc:
-        return _make_error_result(
-            url=url,
-            error=f"PDF download error: {exc}",
-            engine="pymupdf",
-        )
-
     if not pdf_bytes:
         return _make_error_result(
             url=url,
@@ -472,11 +658,10 @@ async def _extract_pdf(url: str, timeout: int = CRAWLER_TIMEOUT) -> CrawlResult:
             engine="pymupdf",
         )
 
-    # Extract text in thread pool (fitz is CPU-bound)
-    loop = asyncio.get_running_loop()
+    # Extract text in the extraction pool (fitz is CPU-bound)
     try:
-        text, title, meta_dict = await loop.run_in_executor(
-            _executor, _pymupdf_extract_sync, pdf_bytes, url
+        text, title, meta_dict = await _run_extraction(
+            _pymupdf_extract_sync, pdf_bytes, url
         )
     except Exception as exc:
         logger.warning("PDF extraction error for %s: %s", url, exc)
@@ -517,7 +702,7 @@ def _pymupdf_extract_sync(
     pdf_bytes: bytes, url: str
 ) -> tuple[Optional[str], Optional[str], Dict[str, Any]]:
     """
-    Synchronous PDF text extraction with PyMuPDF — runs in thread pool.
+    Synchronous PDF text extraction with PyMuPDF — runs in the extraction pool.
 
     Returns:
         (text, title, metadata_dict)
@@ -592,32 +777,110 @@ def _pymupdf_extract_sync(
 
 
 # ---------------------------------------------------------------------------
-# URL type detection
+# Fetch + dispatch
 # ---------------------------------------------------------------------------
 
 
-async def _is_pdf_content(url: str, timeout: int = 10) -> bool:
+def _is_pdf_response(url: str, content_type: str) -> bool:
+    """PDF if the URL path says so or the response Content-Type does."""
+    return _is_pdf_url(url) or "application/pdf" in content_type.lower()
+
+
+async def _crawl_once(
+    url: str,
+    timeout: int,
+    extractor: str,
+    cached: Optional[CachedCrawl] = None,
+) -> Tuple[CrawlResult, Dict[str, Optional[str]]]:
     """
-    Determine if a URL points to a PDF by checking the URL path extension
-    first, then falling back to a HEAD request to check Content-Type.
+    Fetch a URL once and extract it with the backend its content calls for.
+
+    The content type is taken from the GET response (no separate HEAD
+    request).  With ``cached`` the GET is conditional: a 304, or a body
+    identical to the cached one, returns the cached result without
+    re-extracting.
+
+    Returns:
+        (result, cache fields: etag / last_modified / content_hash)
     """
-    if _is_pdf_url(url):
-        return True
+    use_crawl4ai = extractor == "crawl4ai" and _HAS_CRAWL4AI
+    engine = "crawl4ai" if use_crawl4ai else "trafilatura"
+    headers = cached.conditional_headers() if cached else None
+    body: Optional[bytes] = None
+    encoding: Optional[str] = None
 
-    # HEAD request to check Content-Type without downloading the body
     try:
-        async with httpx.AsyncClient(
-            timeout=float(timeout),
-            headers=_DEFAULT_HEADERS,
-            follow_redirects=True,
-            max_redirects=5,
-        ) as client:
-            response = await client.head(url)
-            ct = response.headers.get("content-type", "").lower()
-            return "application/pdf" in ct
-    except (httpx.HTTPError, httpx.TimeoutException):
-        # If HEAD fails, proceed with HTML extraction — it will fail gracefully
-        return False
+        async with get_http_client().stream(
+            "GET", url, headers=headers, timeout=float(timeout)
+        ) as response:
+            status_code = response.status_code
+            content_type = response.headers.get("content-type", "")
+            is_pdf = _is_pdf_response(url, content_type)
+            fields: Dict[str, Optional[str]] = {
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+            }
+
+            if status_code == 304 and cached is not None:
+                return cached.result, {
+                    "etag": fields["etag"] or cached.etag,
+                    "last_modified": fields["last_modified"] or cached.last_modified,
+                    "content_hash": cached.content_hash,
+                }
+
+            if status_code >= 400:
+                return (
+                    _make_error_result(
+                        url=url,
+                        error=f"HTTP {status_code}",
+                        status_code=status_code,
+                        content_type=content_type,
+                        engine="pymupdf" if is_pdf else engine,
+                    ),
+                    {},
+                )
+
+            # crawl4ai renders HTML pages itself; don't download them twice.
+            if is_pdf or not use_crawl4ai:
+                body = await response.aread()
+                encoding = response.charset_encoding
+
+    except httpx.TimeoutException:
+        return (
+            _make_error_result(
+                url=url,
+                error=f"Request timed out after {timeout}s",
+                engine=engine,
+            ),
+            {},
+        )
+    except httpx.HTTPError as exc:
+        return (
+            _make_error_result(
+                url=url,
+                error=f"HTTP error: {exc}",
+                engine=engine,
+            ),
+            {},
+        )
+
+    fields["content_hash"] = content_hash(body) if body else None
+    if (
+        cached is not None
+        and fields["content_hash"]
+        and fields["content_hash"] == cached.content_hash
+    ):
+        return cached.result, fields
+
+    if is_pdf:
+        result = await _extract_pdf(
+            url, body or b"", status_code, content_type or "application/pdf"
+        )
+    elif use_crawl4ai:
+        result = await _extract_with_crawl4ai(url, timeout)
+    else:
+        result = await _extract_html(url, body, encoding, status_code, content_type)
+    return result, fields
 
 
 # ---------------------------------------------------------------------------
@@ -629,9 +892,12 @@ async def _crawl_with_retry(
     url: str,
     timeout: int,
     extractor: str,
-) -> CrawlResult:
+    cached: Optional[CachedCrawl] = None,
+) -> Tuple[CrawlResult, Dict[str, Optional[str]]]:
     """
     Attempt extraction up to _MAX_RETRY_ATTEMPTS times with exponential backoff.
+
+    Returns the result and the crawl cache fields of the successful attempt.
     """
     last_result: Optional[CrawlResult] = None
 
@@ -641,18 +907,10 @@ async def _crawl_with_retry(
             logger.debug("Retry %d for %s (backoff %ds)", attempt, url, backoff)
             await asyncio.sleep(backoff)
 
-        # Determine extraction method
-        is_pdf = await _is_pdf_content(url, timeout=min(timeout, 10))
-
-        if is_pdf:
-            result = await _extract_pdf(url, timeout)
-        elif extractor == "crawl4ai":
-            result = await _extract_with_crawl4ai(url, timeout)
-        else:
-            result = await _extract_with_trafilatura(url, timeout)
+        result, cache_fields = await _crawl_once(url, timeout, extractor, cached)
 
         if result.success:
-            return result
+            return result, cache_fields
 
         last_result = result
         logger.debug(
@@ -671,7 +929,7 @@ async def _crawl_with_retry(
         url,
         last_result.error,
     )
-    return last_result
+    return last_result, {}
 
 
 # ---------------------------------------------------------------------------
@@ -689,6 +947,8 @@ async def crawl_url(url: str, timeout: int = CRAWLER_TIMEOUT) -> CrawlResult:
 
     Includes built-in retry (2 attempts with exponential backoff) and
     per-domain rate limiting (max 3 concurrent requests per domain).
+    Successful results are served from the crawl cache for a day and then
+    revalidated with a conditional GET.
 
     Args:
         url: The URL to crawl.
@@ -703,6 +963,11 @@ async def crawl_url(url: str, timeout: int = CRAWLER_TIMEOUT) -> CrawlResult:
             error="Invalid URL: must start with http:// or https://",
         )
 
+    cached = await crawl_cache.get(url)
+    if cached is not None and cached.is_fresh():
+        logger.debug("Crawl cache hit for %s", url)
+        return cached.result
+
     domain = _get_domain(url)
     semaphore = await _get_domain_semaphore(domain)
 
@@ -710,7 +975,11 @@ async def crawl_url(url: str, timeout: int = CRAWLER_TIMEOUT) -> CrawlResult:
         logger.info("Crawling %s (engine=%s)", url, CRAWLER_ENGINE)
         start_time = time.monotonic()
 
-        result = await _crawl_with_retry(url, timeout, CRAWLER_ENGINE)
+        result, cache_fields = await _crawl_with_retry(
+            url, timeout, CRAWLER_ENGINE, cached
+        )
+        if result.success:
+            await crawl_cache.put(url, result, **cache_fields)
 
         elapsed = time.monotonic() - start_time
         if result.success:
@@ -19,6 +19,7 @@ import os
 from collections.abc import AsyncGenerator
 
 from dotenv import load_dotenv
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -26,6 +27,8 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import DeclarativeBase
 
+from app.helpers.vector_utils import register_vector_codec
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -58,6 +61,13 @@ if DATABASE_URL:
         class_=AsyncSession,
         expire_on_commit=False,
     )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _register_vector_codec(dbapi_connection, connection_record):
+        # pgvector values travel as binary float32 and come back as NumPy
+        # arrays (see app.helpers.vector_utils).
+        dbapi_connection.run_async(register_vector_codec)
+
     logger.info("SQLAlchemy async engine configured for Azure PostgreSQL")
 else:
     logger.warning(
@@ -38,12 +38,14 @@ Usage:
 import asyncio
 import logging
 import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 import uuid
 
+import numpy as np
 import openai
 from sqlalchemy import (
     select,
@@ -52,7 +54,6 @@ from sqlalchemy import (
     func,
     and_,
     or_,
-    text,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -69,7 +70,19 @@ from app.models.db.source import Source, DiscoveredSource
 from app.models.db.card_extras import CardTimeline
 from app.models.db.discovery import DiscoveryRun, DiscoveryBlock
 from app.models.db.workstream import Workstream, WorkstreamCard
-from app.helpers.db_utils import compose_embedding_text, vector_search_cards
+from app.card_embedding_cache import card_embedding_cache
+from app.card_match_index import (
+    CardMatchIndex,
+    normalize_name,
+    normalized_name_similarity,
+)
+from app.helpers.vector_utils import parse_embedding
+from app.helpers.db_utils import (
+    compose_embedding_text,
+    find_existing_source_urls,
+    store_card_embedding,
+    vector_search_cards,
+)
 
 # Import multi-source content fetchers (7 categories)
 from .source_fetchers import (
@@ -142,12 +155,21 @@ DEFAULT_SEARCH_TOPICS = [
 
 def get_discovery_defaults():
     """Get discovery defaults from environment variables."""
+    triage_concurrency = 8
+    if env_concurrency := os.getenv("DISCOVERY_TRIAGE_CONCURRENCY"):
+        try:
+            triage_concurrency = max(1, int(env_concurrency))
+        except ValueError:
+            logger.warning(
+                "discovery: invalid DISCOVERY_TRIAGE_CONCURRENCY: %r", env_concurrency
+            )
     return {
         "max_queries": int(os.getenv("DISCOVERY_MAX_QUERIES", "100")),
         "max_sources_per_query": int(
             os.getenv("DISCOVERY_MAX_SOURCES_PER_QUERY", "10")
         ),
         "max_sources_total": int(os.getenv("DISCOVERY_MAX_SOURCES_TOTAL", "500")),
+        "triage_concurrency": triage_concurrency,
     }
 
 
@@ -189,6 +211,9 @@ class DiscoveryConfig:
     # Card creation limits - PREVENT RUNAWAY CARD CREATION
     max_new_cards_per_run: int = 15  # Maximum new cards per discovery run
 
+    # Max sources in flight through triage -> analysis -> embedding at once
+    triage_concurrency: int = None
+
     # Filtering
     pillars_filter: List[str] = field(default_factory=list)  # Empty = all pillars
     horizons_filter: List[str] = field(default_factory=list)  # Empty = all horizons
@@ -216,6 +241,8 @@ class DiscoveryConfig:
             self.max_sources_per_query = defaults["max_sources_per_query"]
         if self.max_sources_total is None:
             self.max_sources_total = defaults["max_sources_total"]
+        if self.triage_concurrency is None:
+            self.triage_concurrency = defaults["triage_concurrency"]
 
         # Step 2: Initialize default source category configurations
         if not self.source_categories:
@@ -254,6 +281,9 @@ async def apply_admin_settings(
     Reads ``discovery_config`` from the database (cached 60s) and overrides
     matching fields on the provided config.  Falls back gracefully when no
     settings exist.
+
+    ``DISCOVERY_TRIAGE_CONCURRENCY``, when set in the environment, wins over
+    the admin setting so operators can throttle LLM fan-out per deployment.
     """
     try:
         from app.helpers.settings_reader import get_settings_batch
@@ -265,6 +295,7 @@ async def apply_admin_settings(
             "discovery.max_new_cards_per_run",
             "discovery.max_queries_per_run",
             "discovery.total_cap",
+            "discovery.triage_concurrency",
         ]
         admin_cfg = await get_settings_batch(db, keys)
 
@@ -275,6 +306,7 @@ async def apply_admin_settings(
             ("discovery.max_new_cards_per_run", "max_new_cards_per_run", int),
             ("discovery.max_queries_per_run", "max_queries_per_run", int),
             ("discovery.total_cap", "max_sources_total", int),
+            ("discovery.triage_concurrency", "triage_concurrency", int),
         ]:
             val = admin_cfg.get(key)
             if val is not None:
@@ -285,6 +317,15 @@ async def apply_admin_settings(
     except Exception as exc:
         logger.warning("discovery: failed to read admin settings: %s", exc)
 
+    if env_concurrency := os.getenv("DISCOVERY_TRIAGE_CONCURRENCY"):
+        try:
+            config.triage_concurrency = int(env_concurrency)
+        except ValueError:
+            logger.warning(
+                "discovery: invalid DISCOVERY_TRIAGE_CONCURRENCY: %r", env_concurrency
+            )
+    config.triage_concurrency = max(1, config.triage_concurrency or 1)
+
     return config
 
 
@@ -363,6 +404,9 @@ class CardAction(Enum):
     FILTERED = "filtered"  # Filtered by triage
 
 
+# Minimum (reputation-adjusted) triage confidence for a source to be analyzed
+TRIAGE_PASS_THRESHOLD = 0.6
+
 # DEPRECATED: Use PIPELINE_STATUSES from taxonomy.py for new code.
 # Stage number to ID mapping (matches stages table) - kept for backward compatibility.
 STAGE_NUMBER_TO_ID = {
@@ -443,38 +487,7 @@ def calculate_name_similarity(name1: str, name2: str) -> float:
     if not name1 or not name2:
         return 0.0
 
-    # Normalize: lowercase, remove punctuation, strip whitespace
-    import re
-
-    def normalize(s):
-        s = s.lower().strip()
-        s = re.sub(r"[^\w\s]", "", s)
-        return " ".join(s.split())
-
-    n1 = normalize(name1)
-    n2 = normalize(name2)
-
-    if n1 == n2:
-        return 1.0
-
-    # Check if one contains the other (high similarity)
-    if n1 in n2 or n2 in n1:
-        shorter = min(len(n1), len(n2))
-        longer = max(len(n1), len(n2))
-        return shorter / longer if longer > 0 else 0.0
-
-    # Word overlap calculation
-    words1 = set(n1.split())
-    words2 = set(n2.split())
-
-    if not words1 or not words2:
-        return 0.0
-
-    intersection = words1 & words2
-    union = words1 | words2
-
-    # Jaccard similarity
-    return len(intersection) / len(union) if union else 0.0
+    return normalized_name_similarity(normalize_name(name1), normalize_name(name2))
 
 
 def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
@@ -505,6 +518,165 @@ def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
     return dot_product / (magnitude1 * magnitude2)
 
 
+# Seeds whose embedding similarities are computed together; bounds the
+# scratch space to CLUSTER_BLOCK_ROWS x n values instead of n x n.
+CLUSTER_BLOCK_ROWS = 512
+
+
+def greedy_similarity_clusters(
+    names: List[str],
+    embeddings: List[Optional[List[float]]],
+    embedding_threshold: float,
+    name_threshold: float,
+) -> List[List[Tuple[int, str, float]]]:
+    """
+    Greedy single-pass clustering over items already sorted by priority.
+
+    Each unclaimed item (in order) seeds a cluster and claims every later
+    unclaimed item that matches *the seed* by embedding cosine similarity
+    (>= embedding_threshold) or, failing that, by name similarity
+    (>= name_threshold).  Scores equal ``cosine_similarity`` and
+    ``calculate_name_similarity``; only the evaluation is vectorized:
+
+    - Embeddings are normalized once.  Similarity rows are computed on
+      demand for the next block of ``CLUSTER_BLOCK_ROWS`` seeds (one matrix
+      product per block, skipping already claimed items), so memory stays
+      O(block x n) rather than O(n^2).
+    - Names are scored per seed against all unclaimed candidates at once
+      via a token inverted index (Jaccard) and NumPy string containment.
+
+    Args:
+        names: Raw candidate names ("" when unknown)
+        embeddings: Embedding per item (None/empty when missing)
+        embedding_threshold: Minimum cosine similarity to cluster
+        name_threshold: Minimum name similarity to cluster
+
+    Returns:
+        Clusters as lists of ``(position, reason, score)``; the first entry
+        is the seed (reason ``"seed"``), members follow in input order with
+        reason ``"embedding"`` or ``"name"``.
+    """
+    n = len(names)
+    if n == 0:
+        return []
+
+    # -- Embedding adjacency ------------------------------------------------
+    # Vectors are grouped by dimension: cosine_similarity scores mismatched
+    # dimensions (and zero vectors) as 0.0, so they never match.
+    vectors = [parse_embedding(e) if e is not None and len(e) else None for e in embeddings]
+    by_dim: Dict[int, List[int]] = {}
+    for pos, vec in enumerate(vectors):
+        if vec is not None and np.any(vec):
+            by_dim.setdefault(vec.size, []).append(pos)
+
+    has_embedding = np.zeros(n, dtype=bool)
+    unit_vectors: Dict[int, np.ndarray] = {}
+    row_in_group = np.zeros(n, dtype=np.int64)
+    groups: List[Tuple[np.ndarray, np.ndarray]] = []
+    for positions in by_dim.values():
+        members = np.asarray(positions)
+        matrix = np.vstack([vectors[pos] for pos in positions]).astype(np.float64)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        has_embedding[members] = True
+        row_in_group[members] = np.arange(len(members))
+        for row, pos in enumerate(positions):
+            unit_vectors[pos] = matrix[row]
+        groups.append((members, matrix))
+
+    def embedding_block(start: int, seeds: np.ndarray) -> np.ndarray:
+        """Thresholded similarity rows for positions start..start+block."""
+        block = np.zeros((CLUSTER_BLOCK_ROWS, n), dtype=bool)
+        for members, matrix in groups:
+            in_block = members[
+                (members >= start)
+                & (members < start + CLUSTER_BLOCK_ROWS)
+                & seeds[members]
+            ]
+            if len(in_block):
+                sims = matrix[row_in_group[in_block]] @ matrix.T
+                block[np.ix_(in_block - start, members)] = sims >= embedding_threshold
+        return block
+
+    # -- Name index -----------------------------------------------------------
+    has_name = np.array([bool(name) for name in names])
+    normalized = [normalize_name(name) if name else "" for name in names]
+    name_array = np.array(normalized, dtype=str)
+    lengths = np.array([len(name) for name in normalized], dtype=np.int64)
+    token_sets = [set(name.split()) for name in normalized]
+    token_counts = np.array([len(t) for t in token_sets], dtype=np.int64)
+    postings: Dict[str, List[int]] = {}
+    for pos, tokens in enumerate(token_sets):
+        for token in tokens:
+            postings.setdefault(token, []).append(pos)
+    posting_arrays = {t: np.asarray(p) for t, p in postings.items()}
+
+    def name_scores(seed: int, candidates: np.ndarray) -> np.ndarray:
+        seed_name = normalized[seed]
+        overlap = np.zeros(n, dtype=np.int64)
+        for token in token_sets[seed]:
+            overlap[posting_arrays[token]] += 1
+        overlap = overlap[candidates]
+        counts = token_counts[candidates]
+        union = token_counts[seed] + counts - overlap
+        jaccard = np.zeros(len(candidates), dtype=np.float64)
+        has_words = (counts > 0) & (token_counts[seed] > 0) & (union > 0)
+        jaccard[has_words] = overlap[has_words] / union[has_words]
+
+        others = name_array[candidates]
+        contained = (np.char.find(others, seed_name) >= 0) | (
+            np.char.find(seed_name, others) >= 0
+        )
+        shorter = np.minimum(lengths[candidates], len(seed_name))
+        longer = np.maximum(lengths[candidates], len(seed_name))
+        ratio = np.zeros(len(candidates), dtype=np.float64)
+        ratio[longer > 0] = shorter[longer > 0] / longer[longer > 0]
+
+        scores = np.where(contained, ratio, jaccard)
+        scores[others == seed_name] = 1.0
+        return scores
+
+    # -- Greedy assignment ------------------------------------------------------
+    clusters: List[List[Tuple[int, str, float]]] = []
+    unclaimed = np.ones(n, dtype=bool)
+    block_start = -CLUSTER_BLOCK_ROWS
+    embedding_match = np.zeros((0, n), dtype=bool)
+    for seed in range(n):
+        if not unclaimed[seed]:
+            continue
+        if has_embedding[seed] and seed >= block_start + CLUSTER_BLOCK_ROWS:
+            # Claimed items never seed, so their rows are skipped
+            block_start = seed
+            embedding_match = embedding_block(block_start, unclaimed)
+        unclaimed[seed] = False
+        cluster: List[Tuple[int, str, float]] = [(seed, "seed", 1.0)]
+
+        if has_embedding[seed] or has_name[seed]:
+            by_embedding = (
+                unclaimed & embedding_match[seed - block_start]
+                if has_embedding[seed]
+                else np.zeros(n, dtype=bool)
+            )
+            members = {
+                int(pos): ("embedding", float(unit_vectors[seed] @ unit_vectors[pos]))
+                for pos in np.flatnonzero(by_embedding)
+            }
+            if has_name[seed]:
+                candidates = np.flatnonzero(unclaimed & ~by_embedding & has_name)
+                if len(candidates):
+                    scores = name_scores(seed, candidates)
+                    for pos, score in zip(candidates, scores):
+                        if score >= name_threshold:
+                            members[int(pos)] = ("name", float(score))
+            for pos in sorted(members):
+                reason, score = members[pos]
+                cluster.append((pos, reason, score))
+                unclaimed[pos] = False
+
+        clusters.append(cluster)
+
+    return clusters
+
+
 # ============================================================================
 # Result Classes
 # ============================================================================
@@ -704,6 +876,11 @@ class ProcessingTimeMetrics:
 
     Provides observability into processing time distribution across
     the discovery pipeline for performance optimization and debugging.
+
+    The ``*_calls`` / ``*_call_seconds`` fields describe the concurrent
+    triage pipeline: items processed and summed call latency for each
+    stage (embeddings are sent in batches, so one call covers many items).  Because stages overlap, summed latency exceeds the wall-clock
+    ``triage_seconds``; the ratio is the effective parallelism.
     """
 
     query_generation_seconds: float = 0.0
@@ -715,6 +892,34 @@ class ProcessingTimeMetrics:
     card_creation_seconds: float = 0.0
     total_seconds: float = 0.0
 
+    # Triage pipeline stage stats
+    triage_concurrency: int = 0
+    triage_calls: int = 0
+    analysis_calls: int = 0
+    embedding_calls: int = 0
+    triage_call_seconds: float = 0.0
+    analysis_call_seconds: float = 0.0
+    embedding_call_seconds: float = 0.0
+
+    def record_stage(self, stage: str, elapsed: float, count: int = 1) -> None:
+        """Record ``count`` completed items for a triage pipeline stage."""
+        setattr(self, f"{stage}_calls", getattr(self, f"{stage}_calls") + count)
+        setattr(
+            self,
+            f"{stage}_call_seconds",
+            getattr(self, f"{stage}_call_seconds") + elapsed,
+        )
+
+    def stage_throughput(self) -> Dict[str, float]:
+        """Items per wall-clock second for each triage pipeline stage."""
+        if self.triage_seconds <= 0:
+            return {"triage": 0.0, "analysis": 0.0, "embedding": 0.0}
+        return {
+            "triage": self.triage_calls / self.triage_seconds,
+            "analysis": self.analysis_calls / self.triage_seconds,
+            "embedding": self.embedding_calls / self.triage_seconds,
+        }
+
     def log_metrics(self, logger_instance: logging.Logger) -> None:
         """Log processing time metrics for observability."""
         logger_instance.info(
@@ -728,8 +933,15 @@ class ProcessingTimeMetrics:
             f"card_create={self.card_creation_seconds:.2f}s, "
             f"total={self.total_seconds:.2f}s"
         )
+        throughput = self.stage_throughput()
+        logger_instance.info(
+            f"Triage Pipeline (concurrency={self.triage_concurrency}): "
+            f"triage={self.triage_calls} ({throughput['triage']:.2f}/s), "
+            f"analysis={self.analysis_calls} ({throughput['analysis']:.2f}/s), "
+            f"embedding={self.embedding_calls} ({throughput['embedding']:.2f}/s)"
+        )
 
-    def to_dict(self) -> Dict[str, float]:
+    def to_dict(self) -> Dict[str, Any]:
         """Convert metrics to dictionary for storage/API response."""
         return {
             "query_generation_seconds": self.query_generation_seconds,
@@ -740,6 +952,16 @@ class ProcessingTimeMetrics:
             "deduplication_seconds": self.deduplication_seconds,
             "card_creation_seconds": self.card_creation_seconds,
             "total_seconds": self.total_seconds,
+            "triage_pipeline": {
+                "concurrency": self.triage_concurrency,
+                "triage_calls": self.triage_calls,
+                "analysis_calls": self.analysis_calls,
+                "embedding_calls": self.embedding_calls,
+                "triage_call_seconds": self.triage_call_seconds,
+                "analysis_call_seconds": self.analysis_call_seconds,
+                "embedding_call_seconds": self.embedding_call_seconds,
+                "throughput_per_second": self.stage_throughput(),
+            },
         }
 
 
@@ -836,7 +1058,7 @@ class DiscoveryResult:
     execution_time_seconds: float = 0.0
 
     # Enhanced metrics (Phase 4)
-    processing_time: Optional[Dict[str, float]] = None  # ProcessingTimeMetrics as dict
+    processing_time: Optional[Dict[str, Any]] = None  # ProcessingTimeMetrics as dict
     api_token_usage: Optional[Dict[str, Any]] = None  # APITokenUsage as dict
 
     # Summary
@@ -844,6 +1066,21 @@ class DiscoveryResult:
     errors: List[str] = field(default_factory=list)
 
 
+@dataclass
+class _TriageOutcome:
+    """Per-source result of the concurrent triage pipeline."""
+
+    source: RawSource
+    triage: Optional[TriageResult] = None
+    passed: bool = False
+    analysis: Optional[AnalysisResult] = None
+    embedding: Optional[List[float]] = None
+    estimated_tokens: int = 0
+    reputation_tier: Optional[str] = None  # "tier1".."tier3"/"untiered" once looked up
+    confidence_adjusted: bool = False
+    error: Optional[str] = None
+
+
 # ============================================================================
 # Discovery Service
 # ============================================================================
@@ -1180,7 +1417,9 @@ class DiscoveryService:
                 run_id  # For domain reputation stats persistence (Task 2.7)
             )
             triaged_sources, triage_tokens = await self._triage_sources_with_metrics(
-                validated_sources
+                validated_sources,
+                concurrency=config.triage_concurrency,
+                processing_time=processing_time,
             )
             processing_time.triage_seconds = (
                 datetime.now(timezone.utc) - step_start
@@ -1559,70 +1798,49 @@ class DiscoveryService:
             logger.warning(f"Could not persist discovered source: {e}")
         return None
 
-    async def _update_source_triage(
-        self, source_id: str, triage: "TriageResult", passed: bool
-    ) -> None:
-        """Update source with triage results."""
-        try:
-            _sid = uuid.UUID(source_id) if isinstance(source_id, str) else source_id
-            await self.db.execute(
-                sa_update(DiscoveredSource)
-                .where(DiscoveredSource.id == _sid)
-                .values(
-                    triage_is_relevant=triage.is_relevant,
-                    triage_confidence=triage.confidence,
-                    triage_primary_pillar=triage.primary_pillar,
-                    triage_reason=triage.reason,
-                    triaged_at=datetime.now(timezone.utc),
-                    processing_status="triaged" if passed else "filtered_triage",
-                )
-            )
-            await self.db.flush()
-        except Exception as e:
-            logger.warning(f"Could not update source triage: {e}")
-
-    async def _update_source_analysis(
-        self, source_id: str, analysis: "AnalysisResult"
-    ) -> None:
-        """Update source with full analysis results."""
-        try:
-            entities_json = [
-                {"name": e.name, "type": e.entity_type, "context": e.context}
-                for e in (analysis.entities or [])
-            ]
+    @staticmethod
+    def _triage_values(triage: "TriageResult", passed: bool) -> Dict[str, Any]:
+        """Column values recording a triage result on ``discovered_sources``."""
+        return {
+            "triage_is_relevant": triage.is_relevant,
+            "triage_confidence": triage.confidence,
+            "triage_primary_pillar": triage.primary_pillar,
+            "triage_reason": triage.reason,
+            "triaged_at": datetime.now(timezone.utc),
+            "processing_status": "triaged" if passed else "filtered_triage",
+        }
 
-            _sid = uuid.UUID(source_id) if isinstance(source_id, str) else source_id
-            await self.db.execute(
-                sa_update(DiscoveredSource)
-                .where(DiscoveredSource.id == _sid)
-                .values(
-                    analysis_summary=analysis.summary,
-                    analysis_key_excerpts=analysis.key_excerpts,
-                    analysis_pillars=analysis.pillars,
-                    analysis_goals=analysis.goals,
-                    analysis_steep_categories=analysis.steep_categories,
-                    analysis_anchors=analysis.anchors,
-                    analysis_horizon=analysis.horizon,
-                    analysis_suggested_stage=analysis.suggested_stage,
-                    analysis_triage_score=analysis.triage_score,
-                    analysis_credibility=analysis.credibility,
-                    analysis_novelty=analysis.novelty,
-                    analysis_likelihood=analysis.likelihood,
-                    analysis_impact=analysis.impact,
-                    analysis_relevance=analysis.relevance,
-                    analysis_time_to_awareness_months=analysis.time_to_awareness_months,
-                    analysis_time_to_prepare_months=analysis.time_to_prepare_months,
-                    analysis_suggested_card_name=analysis.suggested_card_name,
-                    analysis_is_new_concept=analysis.is_new_concept,
-                    analysis_reasoning=analysis.reasoning,
-                    analysis_entities=entities_json,
-                    analyzed_at=datetime.now(timezone.utc),
-                    processing_status="analyzed",
-                )
-            )
-            await self.db.flush()
-        except Exception as e:
-            logger.warning(f"Could not update source analysis: {e}")
+    @staticmethod
+    def _analysis_values(analysis: "AnalysisResult") -> Dict[str, Any]:
+        """Column values recording a full analysis on ``discovered_sources``."""
+        entities_json = [
+            {"name": e.name, "type": e.entity_type, "context": e.context}
+            for e in (analysis.entities or [])
+        ]
+        return {
+            "analysis_summary": analysis.summary,
+            "analysis_key_excerpts": analysis.key_excerpts,
+            "analysis_pillars": analysis.pillars,
+            "analysis_goals": analysis.goals,
+            "analysis_steep_categories": analysis.steep_categories,
+            "analysis_anchors": analysis.anchors,
+            "analysis_horizon": analysis.horizon,
+            "analysis_suggested_stage": analysis.suggested_stage,
+            "analysis_triage_score": analysis.triage_score,
+            "analysis_credibility": analysis.credibility,
+            "analysis_novelty": analysis.novelty,
+            "analysis_likelihood": analysis.likelihood,
+            "analysis_impact": analysis.impact,
+            "analysis_relevance": analysis.relevance,
+            "analysis_time_to_awareness_months": analysis.time_to_awareness_months,
+            "analysis_time_to_prepare_months": analysis.time_to_prepare_months,
+            "analysis_suggested_card_name": analysis.suggested_card_name,
+            "analysis_is_new_concept": analysis.is_new_concept,
+            "analysis_reasoning": analysis.reasoning,
+            "analysis_entities": entities_json,
+            "analyzed_at": datetime.now(timezone.utc),
+            "processing_status": "analyzed",
+        }
 
     async def _update_source_dedup(
         self,
@@ -1708,11 +1926,11 @@ class DiscoveryService:
         new_concept_candidates: List[ProcessedSource],
     ) -> str:
         """
-        Python-based fallback for vector similarity search when RPC fails.
+        In-memory fallback for vector similarity search when pgvector fails.
 
-        This fetches cards with embeddings from the database and calculates
-        cosine similarity in Python. Less efficient than DB-side computation
-        but works around schema/extension issues.
+        Runs an exact cosine top-1 over every non-rejected card using the
+        process-level card embedding matrix, so no card is missed and no ORM
+        objects are loaded per source.
 
         Args:
             query_embedding: The source embedding to compare
@@ -1725,81 +1943,66 @@ class DiscoveryService:
         Returns:
             "enriched" if matched to existing card, "new" if new concept
         """
-        # Fetch cards with embeddings (non-rejected only)
-        result_cards = await self.db.execute(
-            select(Card)
-            .where(Card.review_status != "rejected")
-            .where(Card.embedding.isnot(None))
-            .limit(100)
+        matches = await card_embedding_cache.search(
+            self.db, query_embedding, k=1, threshold=0.0, exclude_rejected=True
         )
-        cards_with_emb = result_cards.scalars().all()
 
-        if not cards_with_emb:
-            logger.info("PYTHON FALLBACK: No cards with embeddings found - NEW CONCEPT")
+        if not matches:
+            logger.info(
+                "PYTHON FALLBACK: No similar cards with embeddings found - NEW CONCEPT"
+            )
             new_concept_candidates.append(source)
             if source.discovered_source_id:
                 await self._update_source_dedup(source.discovered_source_id, "unique")
             return "new"
 
-        # Calculate similarities using Python
-        best_match = None
-        best_similarity = 0.0
+        best_match = matches[0]
+        best_similarity = best_match["similarity"]
 
-        for card in cards_with_emb:
-            card_embedding = card.embedding
-            if not card_embedding:
-                continue
-
-            similarity = cosine_similarity(query_embedding, card_embedding)
-
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = card
-
-        if best_match and best_similarity >= config.similarity_threshold:
+        if best_similarity >= config.similarity_threshold:
             # Strong match - enrich existing card
             logger.info(
-                f"PYTHON FALLBACK MATCH (strong): '{suggested_name}' -> '{best_match.name}' "
+                f"PYTHON FALLBACK MATCH (strong): '{suggested_name}' -> '{best_match['name']}' "
                 f"(similarity: {best_similarity:.3f}) - ENRICHING"
             )
-            enrichment_candidates.append((source, str(best_match.id), best_similarity))
+            enrichment_candidates.append((source, best_match["id"], best_similarity))
             if source.discovered_source_id:
                 await self._update_source_dedup(
                     source.discovered_source_id,
                     "enrichment_candidate",
-                    str(best_match.id),
+                    best_match["id"],
                     best_similarity,
                 )
             return "enriched"
 
-        elif best_match and best_similarity >= config.weak_match_threshold:
+        elif best_similarity >= config.weak_match_threshold:
             # Weak match - use LLM to decide
             decision = await self.ai_service.check_card_match(
                 source_summary=source.analysis.summary,
                 source_card_name=source.analysis.suggested_card_name,
-                existing_card_name=best_match.name,
-                existing_card_summary=best_match.summary or "",
+                existing_card_name=best_match["name"],
+                existing_card_summary=best_match["summary"] or "",
             )
 
             if decision.get("is_match") and decision.get("confidence", 0) >= 0.6:
                 logger.info(
-                    f"PYTHON FALLBACK + LLM MATCH: '{suggested_name}' -> '{best_match.name}' "
+                    f"PYTHON FALLBACK + LLM MATCH: '{suggested_name}' -> '{best_match['name']}' "
                     f"(similarity: {best_similarity:.3f}, llm_conf: {decision.get('confidence', 0):.2f}) - ENRICHING"
                 )
                 enrichment_candidates.append(
-                    (source, str(best_match.id), best_similarity)
+                    (source, best_match["id"], best_similarity)
                 )
                 if source.discovered_source_id:
                     await self._update_source_dedup(
                         source.discovered_source_id,
                         "enrichment_candidate",
-                        str(best_match.id),
+                        best_match["id"],
                         best_similarity,
                     )
                 return "enriched"
             else:
                 logger.info(
-                    f"PYTHON FALLBACK + LLM NO MATCH: '{suggested_name}' vs '{best_match.name}' "
+                    f"PYTHON FALLBACK + LLM NO MATCH: '{suggested_name}' vs '{best_match['name']}' "
                     f"(reason: {decision.get('reasoning', 'unknown')[:80]}) - NEW CONCEPT"
                 )
                 new_concept_candidates.append(source)
@@ -2331,148 +2534,44 @@ class DiscoveryService:
     # Step 4: Triage Sources
     # ========================================================================
 
-    async def _triage_sources(self, sources: List[RawSource]) -> List[ProcessedSource]:
+    async def _triage_sources(
+        self, sources: List[RawSource], concurrency: Optional[int] = None
+    ) -> List[ProcessedSource]:
         """
         Triage sources for municipal relevance.
 
         Args:
             sources: Raw sources from search
+            concurrency: Max sources in flight (defaults to env/config value)
 
         Returns:
-            List of processed sources that passed triage
+            List of processed sources that passed triage, in input order
         """
-        processed = []
-        triage_threshold = 0.6
-
-        for source in sources:
-            try:
-                # Skip sources without content for full triage
-                if not source.content:
-                    # Auto-pass URL-only sources with lower confidence
-                    triage = TriageResult(
-                        is_relevant=True,
-                        confidence=0.65,
-                        primary_pillar=getattr(source, "pillar_code", None),
-                        reason="Auto-passed (no content)",
-                    )
-                else:
-                    triage = await self.ai_service.triage_source(
-                        title=source.title, content=source.content
-                    )
-
-                # Pre-print relevance penalty (Task 2.6): soft penalty, not a hard block
-                if getattr(source, "is_preprint", False) and triage.confidence > 0:
-                    original_confidence = triage.confidence
-                    triage.confidence = max(0.0, triage.confidence - 0.2)
-                    logger.debug(
-                        f"Pre-print penalty applied: {source.url} "
-                        f"confidence {original_confidence:.2f} -> {triage.confidence:.2f}"
-                    )
-
-                # Domain reputation confidence adjustment (Task 2.7)
-                try:
-                    reputation = await domain_reputation_service.get_reputation(
-                        self.db, source.url or ""
-                    )
-                    adj = domain_reputation_service.get_confidence_adjustment(
-                        reputation
-                    )
-                    if adj != 0.0:
-                        pre_adj_confidence = triage.confidence
-                        triage.confidence = max(0.0, min(1.0, triage.confidence + adj))
-                        logger.debug(
-                            f"Domain reputation adjustment: {source.url} "
-                            f"adj={adj:+.2f} confidence "
-                            f"{pre_adj_confidence:.2f} -> {triage.confidence:.2f}"
-                        )
-                except Exception as e:
-                    logger.debug(f"Domain reputation lookup failed (non-fatal): {e}")
-
-                # Determine triage pass/fail
-                passed_triage = (
-                    triage.is_relevant and triage.confidence >= triage_threshold
-                )
-
-                # Record triage result for domain reputation stats (Task 2.7)
-                try:
-                    from urllib.parse import urlparse as _urlparse
-
-                    if _domain := _urlparse(source.url or "").netloc:
-                        await domain_reputation_service.record_triage_result(
-                            self.db, _domain, passed=passed_triage
-                        )
-                except Exception as e:
-                    logger.debug(f"Domain triage recording failed (non-fatal): {e}")
-
-                if passed_triage:
-                    # Update discovered_sources with triage passed
-                    if source.discovered_source_id:
-                        await self._update_source_triage(
-                            source.discovered_source_id, triage, True
-                        )
-
-                    # Full analysis
-                    analysis = await self.ai_service.analyze_source(
-                        title=source.title,
-                        content=source.content or "",
-                        source_name=source.source_name,
-                        published_at=datetime.now(timezone.utc).isoformat(),
-                    )
-
-                    # Update discovered_sources with analysis
-                    if source.discovered_source_id:
-                        await self._update_source_analysis(
-                            source.discovered_source_id, analysis
-                        )
-
-                    # Generate embedding
-                    embed_text = f"{source.title} {analysis.summary}"
-                    embedding = await self.ai_service.generate_embedding(embed_text)
-
-                    processed_source = ProcessedSource(
-                        raw=source,
-                        triage=triage,
-                        analysis=analysis,
-                        embedding=embedding,
-                        discovered_source_id=source.discovered_source_id,
-                    )
-                    processed.append(processed_source)
-                else:
-                    # Update discovered_sources with triage failed
-                    if source.discovered_source_id:
-                        await self._update_source_triage(
-                            source.discovered_source_id, triage, False
-                        )
-
-            except Exception as e:
-                logger.warning(f"Triage/analysis failed for {source.url}: {e}")
-                # Mark error in discovered_sources
-                if source.discovered_source_id:
-                    await self._update_source_outcome(
-                        source.discovered_source_id,
-                        "error",
-                        error_message=str(e),
-                        error_stage="triage",
-                    )
-                continue
-
-        return processed
+        outcomes = await self._run_triage_pipeline(sources, concurrency)
+        return self._collect_processed_sources(outcomes)
 
     async def _triage_sources_with_metrics(
-        self, sources: List[RawSource]
+        self,
+        sources: List[RawSource],
+        concurrency: Optional[int] = None,
+        processing_time: Optional[ProcessingTimeMetrics] = None,
     ) -> Tuple[List[ProcessedSource], int]:
         """
         Triage sources for municipal relevance with token usage tracking.
 
         Args:
             sources: Raw sources from search
+            concurrency: Max sources in flight (defaults to env/config value)
+            processing_time: Metrics object that receives per-stage stats
 
         Returns:
             Tuple of (processed sources, estimated token count)
         """
-        processed = []
-        triage_threshold = 0.6
-        total_tokens = 0
+        outcomes = await self._run_triage_pipeline(
+            sources, concurrency, processing_time
+        )
+        processed = self._collect_processed_sources(outcomes)
+        total_tokens = sum(o.estimated_tokens for o in outcomes)
 
         # Domain reputation stats tracking (Task 2.7)
         domain_rep_stats = {
@@ -2483,123 +2582,13 @@ class DiscoveryService:
             "tier3_source_count": 0,
             "untiered_source_count": 0,
         }
-
-        for source in sources:
-            try:
-                # Skip sources without content for full triage
-                if not source.content:
-                    # Auto-pass URL-only sources with lower confidence
-                    triage = TriageResult(
-                        is_relevant=True,
-                        confidence=0.65,
-                        primary_pillar=getattr(source, "pillar_code", None),
-                        reason="Auto-passed (no content)",
-                    )
-                else:
-                    triage = await self.ai_service.triage_source(
-                        title=source.title, content=source.content
-                    )
-                    # Estimate tokens: ~4 chars per token for input, fixed output
-                    input_tokens = (
-                        len(source.title or "") // 4 + len(source.content or "") // 4
-                    )
-                    output_tokens = 100  # Estimated output tokens for triage
-                    total_tokens += input_tokens + output_tokens
-
-                # Pre-print relevance penalty (Task 2.6): soft penalty, not a hard block
-                if getattr(source, "is_preprint", False) and triage.confidence > 0:
-                    original_confidence = triage.confidence
-                    triage.confidence = max(0.0, triage.confidence - 0.2)
-                    logger.debug(
-                        f"Pre-print penalty applied: {source.url} "
-                        f"confidence {original_confidence:.2f} -> {triage.confidence:.2f}"
-                    )
-
-                # Domain reputation confidence adjustment (Task 2.7)
-                try:
-                    reputation = await domain_reputation_service.get_reputation(
-                        self.db, source.url or ""
-                    )
-                    domain_rep_stats["domain_reputation_lookups"] += 1
-
-                    # Track tier distribution
-                    if reputation:
-                        tier = reputation.get("curated_tier")
-                        if tier == 1:
-                            domain_rep_stats["tier1_source_count"] += 1
-                        elif tier == 2:
-                            domain_rep_stats["tier2_source_count"] += 1
-                        elif tier == 3:
-                            domain_rep_stats["tier3_source_count"] += 1
-                        else:
-                            domain_rep_stats["untiered_source_count"] += 1
-                    else:
-                        domain_rep_stats["untiered_source_count"] += 1
-
-                    adj = domain_reputation_service.get_confidence_adjustment(
-                        reputation
-                    )
-                    if adj != 0.0:
-                        pre_adj_confidence = triage.confidence
-                        triage.confidence = max(0.0, min(1.0, triage.confidence + adj))
-                        domain_rep_stats["confidence_adjustments"] += 1
-                        logger.debug(
-                            f"Domain reputation adjustment: {source.url} "
-                            f"adj={adj:+.2f} confidence "
-                            f"{pre_adj_confidence:.2f} -> {triage.confidence:.2f}"
-                        )
-                except Exception as e:
-                    logger.debug(f"Domain reputation lookup failed (non-fatal): {e}")
-
-                # Determine triage pass/fail
-                passed_triage = (
-                    triage.is_relevant and triage.confidence >= triage_threshold
-                )
-
-                # Record triage result for domain reputation stats (Task 2.7)
-                try:
-                    from urllib.parse import urlparse as _urlparse
-
-                    if _domain := _urlparse(source.url or "").netloc:
-                        await domain_reputation_service.record_triage_result(
-                            self.db, _domain, passed=passed_triage
-                        )
-                except Exception as e:
-                    logger.debug(f"Domain triage recording failed (non-fatal): {e}")
-
-                if passed_triage:
-                    # Full analysis
-                    analysis = await self.ai_service.analyze_source(
-                        title=source.title,
-                        content=source.content or "",
-                        source_name=source.source_name,
-                        published_at=datetime.now(timezone.utc).isoformat(),
-                    )
-                    # Estimate tokens for analysis
-                    input_tokens = (
-                        len(source.title or "") // 4 + len(source.content or "") // 4
-                    )
-                    output_tokens = 500  # Estimated output tokens for analysis
-                    total_tokens += input_tokens + output_tokens
-
-                    # Generate embedding
-                    embed_text = f"{source.title} {analysis.summary}"
-                    embedding = await self.ai_service.generate_embedding(embed_text)
-                    # Estimate tokens for embedding
-                    total_tokens += len(embed_text) // 4
-
-                    processed.append(
-                        ProcessedSource(
-                            raw=source,
-                            triage=triage,
-                            analysis=analysis,
-                            embedding=embedding,
-                        )
-                    )
-
-            except Exception as e:
-                logger.warning(f"Triage/analysis failed for {source.url}: {e}")
+        for outcome in outcomes:
+            if outcome.reputation_tier is None:
                 continue
+            domain_rep_stats["domain_reputation_lookups"] += 1
+            domain_rep_stats[f"{outcome.reputation_tier}_source_count"] += 1
+            if outcome.confidence_adjusted:
+                domain_rep_stats["confidence_adjustments"] += 1
 
         # Log domain reputation stats (Task 2.7)
         if domain_rep_stats["domain_reputation_lookups"] > 0:
@@ -2645,6 +2634,260 @@ class DiscoveryService:
 
         return processed, total_tokens
 
+    async def _run_triage_pipeline(
+        self,
+        sources: List[RawSource],
+        concurrency: Optional[int] = None,
+        processing_time: Optional[ProcessingTimeMetrics] = None,
+    ) -> List["_TriageOutcome"]:
+        """
+        Fan sources out through triage -> analysis concurrently, then embed.
+
+        Up to ``concurrency`` sources are in flight at once and each runs
+        its LLM calls back-to-back, so analysis of early sources overlaps
+        triage of later ones.  Sources that pass analysis are then embedded
+        together in batched requests.  The shared AsyncSession cannot be
+        used concurrently, so domain reputation reads/writes are serialized
+        behind a lock and ``discovered_sources`` status writes are buffered
+        and flushed in bulk once every source has finished.
+
+        Args:
+            sources: Raw sources to triage
+            concurrency: Max sources in flight (defaults to env/config value)
+            processing_time: Metrics object that receives per-stage stats
+
+        Returns:
+            One outcome per input source, in input order
+        """
+        if concurrency is None:
+            concurrency = get_discovery_defaults()["triage_concurrency"]
+        concurrency = max(1, concurrency)
+        if processing_time is None:
+            processing_time = ProcessingTimeMetrics()
+        processing_time.triage_concurrency = concurrency
+
+        semaphore = asyncio.Semaphore(concurrency)
+        db_lock = asyncio.Lock()
+
+        async def _bounded(source: RawSource) -> _TriageOutcome:
+            async with semaphore:
+                return await self._triage_one_source(source, db_lock, processing_time)
+
+        # gather() preserves input order regardless of completion order
+        outcomes = await asyncio.gather(*(_bounded(s) for s in sources))
+        await self._embed_triage_outcomes(outcomes, processing_time)
+        await self._flush_triage_outcomes(outcomes)
+        return list(outcomes)
+
+    async def _triage_one_source(
+        self,
+        source: RawSource,
+        db_lock: asyncio.Lock,
+        processing_time: ProcessingTimeMetrics,
+    ) -> "_TriageOutcome":
+        """Run one source through triage and analysis."""
+        outcome = _TriageOutcome(source=source)
+        try:
+            # Skip sources without content for full triage
+            if not source.content:
+                # Auto-pass URL-only sources with lower confidence
+                triage = TriageResult(
+                    is_relevant=True,
+                    confidence=0.65,
+                    primary_pillar=getattr(source, "pillar_code", None),
+                    reason="Auto-passed (no content)",
+                )
+            else:
+                started = time.monotonic()
+                triage = await self.ai_service.triage_source(
+                    title=source.title, content=source.content
+                )
+                processing_time.record_stage("triage", time.monotonic() - started)
+                # Estimate tokens: ~4 chars per token for input, fixed output
+                input_tokens = (
+                    len(source.title or "") // 4 + len(source.content or "") // 4
+                )
+                outcome.estimated_tokens += input_tokens + 100
+
+            # Pre-print relevance penalty (Task 2.6): soft penalty, not a hard block
+            if getattr(source, "is_preprint", False) and triage.confidence > 0:
+                original_confidence = triage.confidence
+                triage.confidence = max(0.0, triage.confidence - 0.2)
+                logger.debug(
+                    f"Pre-print penalty applied: {source.url} "
+                    f"confidence {original_confidence:.2f} -> {triage.confidence:.2f}"
+                )
+
+            async with db_lock:
+                outcome.passed = await self._apply_domain_reputation(
+                    source, triage, outcome
+                )
+            outcome.triage = triage
+
+            if not outcome.passed:
+                return outcome
+
+            # Full analysis
+            started = time.monotonic()
+            analysis = await self.ai_service.analyze_source(
+                title=source.title,
+                content=source.content or "",
+                source_name=source.source_name,
+                published_at=datetime.now(timezone.utc).isoformat(),
+            )
+            processing_time.record_stage("analysis", time.monotonic() - started)
+            input_tokens = len(source.title or "") // 4 + len(source.content or "") // 4
+            outcome.estimated_tokens += input_tokens + 500
+            outcome.analysis = analysis
+
+        except Exception as e:
+            logger.warning(f"Triage/analysis failed for {source.url}: {e}")
+            outcome.error = str(e)
+
+        return outcome
+
+    async def _embed_triage_outcomes(
+        self,
+        outcomes: List["_TriageOutcome"],
+        processing_time: ProcessingTimeMetrics,
+    ) -> None:
+        """Embed every analysed outcome with batched embedding requests."""
+        pending = [o for o in outcomes if o.analysis is not None and not o.error]
+        if not pending:
+            return
+
+        embed_texts = [f"{o.source.title} {o.analysis.summary}" for o in pending]
+        started = time.monotonic()
+        embeddings = await self.ai_service.generate_embeddings_batch(embed_texts)
+        processing_time.record_stage(
+            "embedding", time.monotonic() - started, count=len(pending)
+        )
+
+        for outcome, embed_text, embedding in zip(pending, embed_texts, embeddings):
+            outcome.estimated_tokens += len(embed_text) // 4
+            if embedding is None:
+                logger.warning(f"Embedding failed for {outcome.source.url}")
+                outcome.error = "Embedding generation failed"
+            else:
+                outcome.embedding = embedding
+
+    async def _apply_domain_reputation(
+        self, source: RawSource, triage: TriageResult, outcome: "_TriageOutcome"
+    ) -> bool:
+        """
+        Adjust triage confidence by domain reputation and decide pass/fail.
+
+        Must be called with the pipeline's DB lock held; both the lookup
+        and the triage recording can touch the shared session.
+        """
+        # Domain reputation confidence adjustment (Task 2.7)
+        try:
+            reputation = await domain_reputation_service.get_reputation(
+                self.db, source.url or ""
+            )
+            tier = reputation.get("curated_tier") if reputation else None
+            outcome.reputation_tier = (
+                f"tier{tier}" if tier in (1, 2, 3) else "untiered"
+            )
+
+            adj = domain_reputation_service.get_confidence_adjustment(reputation)
+            if adj != 0.0:
+                pre_adj_confidence = triage.confidence
+                triage.confidence = max(0.0, min(1.0, triage.confidence + adj))
+                outcome.confidence_adjusted = True
+                logger.debug(
+                    f"Domain reputation adjustment: {source.url} "
+                    f"adj={adj:+.2f} confidence "
+                    f"{pre_adj_confidence:.2f} -> {triage.confidence:.2f}"
+                )
+        except Exception as e:
+            logger.debug(f"Domain reputation lookup failed (non-fatal): {e}")
+
+        # Determine triage pass/fail
+        passed_triage = (
+            triage.is_relevant and triage.confidence >= TRIAGE_PASS_THRESHOLD
+        )
+
+        # Record triage result for domain reputation stats (Task 2.7)
+        try:
+            from urllib.parse import urlparse as _urlparse
+
+            if _domain := _urlparse(source.url or "").netloc:
+                await domain_reputation_service.record_triage_result(
+                    self.db, _domain, passed=passed_triage
+                )
+        except Exception as e:
+            logger.debug(f"Domain triage recording failed (non-fatal): {e}")
+
+        return passed_triage
+
+    async def _flush_triage_outcomes(self, outcomes: List["_TriageOutcome"]) -> None:
+        """
+        Write buffered triage/analysis/error statuses to ``discovered_sources``.
+
+        Each group is one ORM bulk UPDATE by primary key.  Groups are applied
+        in pipeline order (triage, analysis, error) so ``processing_status``
+        ends at the same value the per-source writes used to leave it.
+        """
+        triage_rows: List[Dict[str, Any]] = []
+        analysis_rows: List[Dict[str, Any]] = []
+        error_rows: List[Dict[str, Any]] = []
+
+        for outcome in outcomes:
+            source_id = outcome.source.discovered_source_id
+            if not source_id:
+                continue
+            _sid = uuid.UUID(source_id) if isinstance(source_id, str) else source_id
+            if outcome.triage is not None:
+                triage_rows.append(
+                    {"id": _sid, **self._triage_values(outcome.triage, outcome.passed)}
+                )
+            if outcome.analysis is not None:
+                analysis_rows.append(
+                    {"id": _sid, **self._analysis_values(outcome.analysis)}
+                )
+            if outcome.error:
+                error_rows.append(
+                    {
+                        "id": _sid,
+                        "processing_status": "error",
+                        "resulting_card_id": None,
+                        "resulting_source_id": None,
+                        "error_message": outcome.error,
+                        "error_stage": "triage",
+                    }
+                )
+
+        for stage, rows in (
+            ("triage", triage_rows),
+            ("analysis", analysis_rows),
+            ("error", error_rows),
+        ):
+            if not rows:
+                continue
+            try:
+                await self.db.execute(sa_update(DiscoveredSource), rows)
+                await self.db.flush()
+            except Exception as e:
+                logger.warning(f"Could not batch-update source {stage} status: {e}")
+
+    @staticmethod
+    def _collect_processed_sources(
+        outcomes: List["_TriageOutcome"],
+    ) -> List[ProcessedSource]:
+        """Build ProcessedSource objects for outcomes that completed the pipeline."""
+        return [
+            ProcessedSource(
+                raw=outcome.source,
+                triage=outcome.triage,
+                analysis=outcome.analysis,
+                embedding=outcome.embedding,
+                discovered_source_id=outcome.source.discovered_source_id,
+            )
+            for outcome in outcomes
+            if outcome.passed and outcome.embedding is not None and not outcome.error
+        ]
+
     # ========================================================================
     # Step 5: Check Blocked Topics
     # ========================================================================
@@ -2713,6 +2956,33 @@ class DiscoveryService:
     # Step 6: Deduplicate Sources
     # ========================================================================
 
+    async def _load_card_match_index(
+        self, sources: List[ProcessedSource]
+    ) -> Optional[CardMatchIndex]:
+        """
+        Load the per-run card index used by deduplication.
+
+        Returns None if loading fails, in which case callers fall back to
+        one URL query and one pgvector search per source.
+        """
+        try:
+            return await CardMatchIndex.load(
+                self.db, urls=[s.raw.url for s in sources]
+            )
+        except Exception as e:
+            logger.warning(
+                f"Could not load card match index, using per-source queries: {e}"
+            )
+            return None
+
+    async def _source_url_exists(
+        self, index: Optional[CardMatchIndex], url: str
+    ) -> bool:
+        """Check whether a source URL is already stored."""
+        if index is not None:
+            return index.url_exists(url)
+        return bool(await find_existing_source_urls(self.db, [url]))
+
     async def _deduplicate_sources(
         self, sources: List[ProcessedSource], config: DiscoveryConfig
     ) -> DeduplicationResult:
@@ -2737,22 +3007,19 @@ class DiscoveryService:
         enrichment_candidates = []
         new_concept_candidates = []
 
-        # Pre-fetch existing card names for name-based matching
-        try:
-            result_cards = await self.db.execute(
-                select(Card).where(Card.review_status != "rejected")
+        # Load cards and known URLs once; answer every lookup from memory
+        index = await self._load_card_match_index(sources)
+        vector_matches = (
+            index.top_matches(
+                [s.embedding for s in sources],
+                k=5,
+                threshold=config.weak_match_threshold,
             )
-            existing_card_objs = result_cards.scalars().all()
-            card_name_map = {
-                str(c.id): {"id": str(c.id), "name": c.name, "summary": c.summary}
-                for c in existing_card_objs
-            }
-            logger.info(f"Loaded {len(card_name_map)} existing cards for deduplication")
-        except Exception as e:
-            logger.warning(f"Could not load existing cards for name matching: {e}")
-            card_name_map = {}
+            if index is not None
+            else None
+        )
 
-        for source in sources:
+        for i, source in enumerate(sources):
             try:
                 suggested_name = (
                     source.analysis.suggested_card_name if source.analysis else ""
@@ -2762,12 +3029,7 @@ class DiscoveryService:
                 )
 
                 # STEP 1: Check for existing URL first
-                url_result = await self.db.execute(
-                    select(Source.id).where(Source.url == source.raw.url)
-                )
-                url_existing = url_result.scalars().first()
-
-                if url_existing:
+                if await self._source_url_exists(index, source.raw.url):
                     duplicate_count += 1
                     logger.info(f"URL duplicate found: {source.raw.url[:60]}")
                     if source.discovered_source_id:
@@ -2777,40 +3039,42 @@ class DiscoveryService:
                     continue
 
                 # STEP 2: Name-based matching (fast, no AI call needed)
-                name_match_found = False
-                if suggested_name and card_name_map:
-                    for card_id, card_data in card_name_map.items():
-                        name_sim = calculate_name_similarity(
-                            suggested_name, card_data["name"]
+                name_match = (
+                    index.first_name_match(
+                        suggested_name, config.name_similarity_threshold
+                    )
+                    if suggested_name and index is not None
+                    else None
+                )
+                if name_match:
+                    card_id = name_match["id"]
+                    name_sim = name_match["similarity"]
+                    logger.info(
+                        f"NAME MATCH: '{suggested_name}' -> '{name_match['name']}' "
+                        f"(similarity: {name_sim:.2f}) - ENRICHING"
+                    )
+                    enrichment_candidates.append((source, card_id, name_sim))
+                    if source.discovered_source_id:
+                        await self._update_source_dedup(
+                            source.discovered_source_id,
+                            "enrichment_candidate",
+                            card_id,
+                            name_sim,
                         )
-                        if name_sim >= config.name_similarity_threshold:
-                            logger.info(
-                                f"NAME MATCH: '{suggested_name}' -> '{card_data['name']}' "
-                                f"(similarity: {name_sim:.2f}) - ENRICHING"
-                            )
-                            enrichment_candidates.append((source, card_id, name_sim))
-                            if source.discovered_source_id:
-                                await self._update_source_dedup(
-                                    source.discovered_source_id,
-                                    "enrichment_candidate",
-                                    card_id,
-                                    name_sim,
-                                )
-                            name_match_found = True
-                            break
-
-                if name_match_found:
                     unique_sources.append(source)
                     continue
 
                 # STEP 3: Vector similarity search against existing cards
                 try:
-                    match_data = await vector_search_cards(
-                        self.db,
-                        query_embedding=source.embedding,
-                        match_threshold=config.weak_match_threshold,
-                        match_count=5,
-                    )
+                    if vector_matches is not None:
+                        match_data = vector_matches[i]
+                    else:
+                        match_data = await vector_search_cards(
+                            self.db,
+                            query_embedding=source.embedding,
+                            match_threshold=config.weak_match_threshold,
+                            match_count=5,
+                        )
 
                     if match_data:
                         top_match = match_data[0]
@@ -2833,20 +3097,17 @@ class DiscoveryService:
                                     similarity,
                                 )
                         elif similarity >= config.weak_match_threshold:
-                            # Weak match - use LLM to decide (biased toward enrichment)
-                            card_result_q = await self.db.execute(
-                                select(Card).where(
-                                    Card.id == uuid.UUID(top_match["id"])
-                                )
-                            )
-                            card_obj = card_result_q.scalar_one_or_none()
+                            # Weak match - use LLM to decide (biased toward enrichment).
+                            # Search results already carry the card name/summary.
+                            card_name = top_match.get("name")
+                            card_summary = top_match.get("summary") or ""
 
-                            if card_obj:
+                            if card_name:
                                 decision = await self.ai_service.check_card_match(
                                     source_summary=source.analysis.summary,
                                     source_card_name=source.analysis.suggested_card_name,
-                                    existing_card_name=card_obj.name,
-                                    existing_card_summary=card_obj.summary or "",
+                                    existing_card_name=card_name,
+                                    existing_card_summary=card_summary,
                                 )
 
                                 # Lower threshold from 0.7 to 0.6 - prefer enrichment
@@ -2855,7 +3116,7 @@ class DiscoveryService:
                                     and decision.get("confidence", 0) >= 0.6
                                 ):
                                     logger.info(
-                                        f"LLM MATCH: '{suggested_name}' -> '{card_obj.name}' "
+                                        f"LLM MATCH: '{suggested_name}' -> '{card_name}' "
                                         f"(vector: {similarity:.3f}, llm_conf: {decision.get('confidence', 0):.2f}) - ENRICHING"
                                     )
                                     enrichment_candidates.append(
@@ -2870,7 +3131,7 @@ class DiscoveryService:
                                         )
                                 else:
                                     logger.info(
-                                        f"LLM NO MATCH: '{suggested_name}' vs '{card_obj.name}' "
+                                        f"LLM NO MATCH: '{suggested_name}' vs '{card_name}' "
                                         f"(reason: {decision.get('reasoning', 'unknown')[:80]}) - NEW CONCEPT"
                                     )
                                     new_concept_candidates.append(source)
@@ -2966,26 +3227,36 @@ class DiscoveryService:
         new_concept_candidates = []
         total_tokens = 0
 
-        for source in sources:
+        # Load cards and known URLs once; answer every lookup from memory
+        index = await self._load_card_match_index(sources)
+        vector_matches = (
+            index.top_matches(
+                [s.embedding for s in sources],
+                k=3,
+                threshold=config.weak_match_threshold,
+            )
+            if index is not None
+            else None
+        )
+
+        for i, source in enumerate(sources):
             try:
                 # Check for existing URL first
-                url_result = await self.db.execute(
-                    select(Source.id).where(Source.url == source.raw.url)
-                )
-                url_existing = url_result.scalars().first()
-
-                if url_existing:
+                if await self._source_url_exists(index, source.raw.url):
                     duplicate_count += 1
                     continue
 
                 # Vector similarity search against existing cards
                 try:
-                    match_data = await vector_search_cards(
-                        self.db,
-                        query_embedding=source.embedding,
-                        match_threshold=config.weak_match_threshold,
-                        match_count=3,
-                    )
+                    if vector_matches is not None:
+                        match_data = vector_matches[i]
+                    else:
+                        match_data = await vector_search_cards(
+                            self.db,
+                            query_embedding=source.embedding,
+                            match_threshold=config.weak_match_threshold,
+                            match_count=3,
+                        )
 
                     if match_data:
                         top_match = match_data[0]
@@ -2998,22 +3269,18 @@ class DiscoveryService:
                             )
                         elif similarity >= config.weak_match_threshold:
                             # Weak match - use LLM to decide
-                            card_result_q = await self.db.execute(
-                                select(Card).where(
-                                    Card.id == uuid.UUID(top_match["id"])
-                                )
-                            )
-                            card_obj = card_result_q.scalar_one_or_none()
+                            card_name = top_match.get("name")
+                            card_summary = top_match.get("summary") or ""
 
-                            if card_obj:
+                            if card_name:
                                 decision = await self.ai_service.check_card_match(
                                     source_summary=source.analysis.summary,
                                     source_card_name=source.analysis.suggested_card_name,
-                                    existing_card_name=card_obj.name,
-                                    existing_card_summary=card_obj.summary or "",
+                                    existing_card_name=card_name,
+                                    existing_card_summary=card_summary,
                                 )
                                 # Estimate tokens for card match check
-                                input_text = f"{source.analysis.summary} {source.analysis.suggested_card_name} {card_obj.name} {card_obj.summary or ''}"
+                                input_text = f"{source.analysis.summary} {source.analysis.suggested_card_name} {card_name} {card_summary}"
                                 total_tokens += (
                                     len(input_text) // 4 + 100
                                 )  # input + output estimate
@@ -3298,10 +3565,6 @@ class DiscoveryService:
         if not sources:
             return []
 
-        # Use a simple greedy clustering approach
-        clusters: List[List[ProcessedSource]] = []
-        used = set()
-
         # Threshold for embedding-based clustering (lower than dedup's 0.85
         # to catch topically-related articles that aren't exact duplicates)
         EMBEDDING_CLUSTER_THRESHOLD = 0.80
@@ -3311,66 +3574,31 @@ class DiscoveryService:
         sorted_sources = sorted(
             sources, key=lambda s: self._calculate_discovery_confidence(s), reverse=True
         )
+        names = [
+            s.analysis.suggested_card_name if s.analysis else "" for s in sorted_sources
+        ]
 
-        for source in sorted_sources:
-            if id(source) in used:
-                continue
-
-            # Start a new cluster with this source
-            cluster = [source]
-            used.add(id(source))
-
-            source_name = source.analysis.suggested_card_name if source.analysis else ""
-            source_embedding = source.embedding if source.embedding else None
-
-            if not source_name and not source_embedding:
-                clusters.append(cluster)
-                continue
-
-            # Find similar sources to add to this cluster
-            for other in sorted_sources:
-                if id(other) in used:
-                    continue
-
-                matched = False
-                match_reason = ""
-                match_score = 0.0
-
-                # Tier 1: Embedding cosine similarity (semantic)
-                other_embedding = other.embedding if other.embedding else None
-                if source_embedding and other_embedding:
-                    sim = cosine_similarity(source_embedding, other_embedding)
-                    if sim >= EMBEDDING_CLUSTER_THRESHOLD:
-                        matched = True
-                        match_reason = "embedding"
-                        match_score = sim
-
-                # Tier 2: Name similarity fallback (when embeddings unavailable)
-                if not matched:
-                    other_name = (
-                        other.analysis.suggested_card_name if other.analysis else ""
-                    )
-                    if source_name and other_name:
-                        name_sim = calculate_name_similarity(source_name, other_name)
-                        if name_sim >= NAME_CLUSTER_THRESHOLD:
-                            matched = True
-                            match_reason = "name"
-                            match_score = name_sim
-
-                if matched:
-                    cluster.append(other)
-                    used.add(id(other))
-                    other_name = (
-                        other.analysis.suggested_card_name
-                        if other.analysis
-                        else other.raw.title[:40]
-                    )
-                    logger.info(
-                        f"Clustered '{other_name}' with '{source_name}' "
-                        f"({match_reason} similarity: {match_score:.2f})"
-                    )
-
-            clusters.append(cluster)
+        # Greedy clustering, vectorized over all sources at once
+        clusters: List[List[ProcessedSource]] = []
+        for group in greedy_similarity_clusters(
+            names,
+            [s.embedding or None for s in sorted_sources],
+            EMBEDDING_CLUSTER_THRESHOLD,
+            NAME_CLUSTER_THRESHOLD,
+        ):
+            seed = group[0][0]
+            for pos, match_reason, match_score in group[1:]:
+                other = sorted_sources[pos]
+                other_name = (
+                    other.analysis.suggested_card_name
+                    if other.analysis
+                    else other.raw.title[:40]
+                )
+                logger.info(
+                    f"Clustered '{other_name}' with '{names[seed]}' "
+                    f"({match_reason} similarity: {match_score:.2f})"
+                )
+            clusters.append([sorted_sources[pos] for pos, _, _ in group])
 
         return clusters
 
@@ -3498,7 +3726,7 @@ class DiscoveryService:
             card_id = str(card_obj.id)
 
             # Store embedding on the card for Related Trends feature
-            # pgvector NullType column requires raw SQL with CAST
+            # pgvector NullType column goes through store_card_embedding (raw SQL CAST)
             try:
                 emb_data = source.embedding
                 if not emb_data:
@@ -3507,13 +3735,7 @@ class DiscoveryService:
                     )
                     emb_data = await self.ai_service.generate_embedding(embed_text)
                 if emb_data:
-                    vec_str = "[" + ",".join(str(v) for v in emb_data) + "]"
-                    await self.db.execute(
-                        text(
-                            "UPDATE cards SET embedding = CAST(:vec AS vector) WHERE id = CAST(:cid AS uuid)"
-                        ),
-                        {"vec": vec_str, "cid": card_id},
-                    )
+                    await store_card_embedding(self.db, card_id, emb_data)
                     await self.db.flush()
             except Exception as e:
                 logger.warning(f"Failed to store embedding on card {card_id}: {e}")
@@ -3712,7 +3934,11 @@ class DiscoveryService:
             if not card_obj:
                 return
             # Convert to dict for alignment service compatibility
-            card = {c.key: getattr(card_obj, c.key) for c in Card.__table__.columns}
+            card = {
+                c.key: getattr(card_obj, c.key)
+                for c in Card.__table__.columns
+                if c.key not in ("embedding", "search_vector")
+            }
             card["id"] = str(card_obj.id)
 
             # Fetch all active workstreams for this user
@@ -4097,6 +4323,13 @@ class DiscoveryService:
 - **Deduplication**: {processing_time_metrics.deduplication_seconds:.2f}s
 - **Card Creation**: {processing_time_metrics.card_creation_seconds:.2f}s
 - **Total**: {processing_time_metrics.total_seconds:.2f}s
+"""
+            throughput = processing_time_metrics.stage_throughput()
+            report += f"""
+## Triage Pipeline (concurrency {processing_time_metrics.triage_concurrency})
+- **Triage Calls**: {processing_time_metrics.triage_calls} ({throughput['triage']:.2f}/s)
+- **Analysis Calls**: {processing_time_metrics.analysis_calls} ({throughput['analysis']:.2f}/s)
+- **Embedding Calls**: {processing_time_metrics.embedding_calls} ({throughput['embedding']:.2f}/s)
 """
 
         # Add API token usage if available
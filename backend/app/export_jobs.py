@@ -0,0 +1,662 @@
+"""
+Background export jobs with content-addressed artifact caching.
+
+Card, workstream, brief and portfolio exports render matplotlib charts and
+ReportLab / python-pptx layouts, and portfolios add an LLM synthesis and
+Gamma polling on top, so generating them inside an API request can take
+minutes.  ``POST /api/v1/exports`` instead records an ``export_jobs`` row;
+the worker's ``export`` consumer renders it and the client polls
+``GET /api/v1/exports/{job_id}`` and downloads the document when it is
+ready.
+
+Every job carries a content hash (:func:`content_hash`) over the export
+kind, format and options plus the versions of the rows the document is
+built from -- ``updated_at`` of the card / workstream / application /
+proposal / budget rows and the id and version of the brief(s).  Rendered
+documents are stored once per hash in ``export_artifacts``, so exporting
+unchanged content again completes at enqueue time and is served straight
+from the table; editing any input changes the hash.  Bump
+``EXPORT_ARTIFACT_VERSION`` when a template changes.
+
+Kinds (``EXPORT_KINDS``) and formats:
+
+- ``card``: pdf, pptx, csv
+- ``workstream``: pdf, pptx (workstream report)
+- ``brief``: pdf, pptx (one executive brief)
+- ``portfolio``: pdf, pptx (bulk brief export)
+- ``application``, ``budget``, ``proposal``: docx
+
+Artifacts not downloaded for ``EXPORT_ARTIFACT_TTL_DAYS`` are pruned,
+together with finished jobs of the same age, at most every
+``EXPORT_ARTIFACT_PRUNE_SECONDS`` (piggybacked on renders).  The renderers
+themselves live next to the synchronous export endpoints in
+``app.routers.card_export``, ``briefs`` and ``exports``.
+
+Usage:
+    from app.export_jobs import enqueue_export
+
+    job = await enqueue_export(db, user_id, "card", "pdf", {"card_id": card_id})
+    # job.status == "completed" when an artifact already exists
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from fastapi.responses import Response
+from sqlalchemy import func, select
+from sqlalchemy import update as sa_update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.database as database
+from app.job_notify import notify_job
+from app.models.db.brief import ExecutiveBrief
+from app.models.db.budget import BudgetLineItem, BudgetSettings
+from app.models.db.card import Card
+from app.models.db.checklist import ChecklistItem
+from app.models.db.export import ExportArtifact as StoredArtifact
+from app.models.db.export import ExportJob
+from app.models.db.grant_application import GrantApplication
+from app.models.db.proposal import Proposal
+from app.models.db.research import ResearchTask
+from app.models.db.workstream import Workstream, WorkstreamCard
+
+logger = logging.getLogger(__name__)
+
+# Folded into every content hash; bump when export templates change.
+EXPORT_ARTIFACT_VERSION = "1"
+
+EXPORT_ARTIFACT_TTL_DAYS = float(os.getenv("EXPORT_ARTIFACT_TTL_DAYS", "14"))
+EXPORT_ARTIFACT_PRUNE_SECONDS = float(
+    os.getenv("EXPORT_ARTIFACT_PRUNE_SECONDS", "3600")
+)
+
+EXPORT_QUEUE = "export"
+
+_last_prune = time.monotonic()
+
+
+class ExportUnavailable(ValueError):
+    """The requested content cannot be exported (yet), e.g. no completed brief."""
+
+
+@dataclass
+class ExportArtifact:
+    """A rendered export document."""
+
+    filename: str
+    media_type: str
+    data: bytes
+
+
+def artifact_from_file(path: str, filename: str, media_type: str) -> ExportArtifact:
+    """Read a rendered temp file into an artifact and delete the file."""
+    file_path = Path(path)
+    try:
+        data = file_path.read_bytes()
+    finally:
+        try:
+            file_path.unlink()
+        except OSError:
+            pass
+    return ExportArtifact(filename=filename, media_type=media_type, data=data)
+
+
+def artifact_response(artifact: ExportArtifact) -> Response:
+    """Download response for an artifact."""
+    quoted = quote(artifact.filename)
+    if quoted != artifact.filename:
+        disposition = f"attachment; filename*=utf-8''{quoted}"
+    else:
+        disposition = f'attachment; filename="{artifact.filename}"'
+    return Response(
+        content=artifact.data,
+        media_type=artifact.media_type,
+        headers={"Content-Disposition": disposition},
+    )
+
+
+# ============================================================================
+# Content versions
+# ============================================================================
+
+Params = Dict[str, Any]
+
+
+def _stamp(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+async def _card_versions(db: AsyncSession, params: Params) -> Dict[str, Any]:
+    card_updated = (
+        await db.execute(select(Card.updated_at).where(Card.id == params["card_id"]))
+    ).one_or_none()
+    if card_updated is None:
+        raise ExportUnavailable(f"Card not found: {params['card_id']}")
+    # The export embeds the three most recent deep research reports
+    research = await db.execute(
+        select(ResearchTask.id, ResearchTask.completed_at)
+        .where(
+            ResearchTask.card_id == params["card_id"],
+            ResearchTask.status == "completed",
+            ResearchTask.task_type == "deep_research",
+        )
+        .order_by(ResearchTask.completed_at.desc())
+        .limit(3)
+    )
+    return {
+        "card": _stamp(card_updated[0]),
+        "research": [[str(row.id), _stamp(row.completed_at)] for row in research],
+    }
+
+
+async def _workstream_versions(db: AsyncSession, params: Params) -> Dict[str, Any]:
+    workstream_id = params["workstream_id"]
+    ws_updated = (
+        await db.execute(
+            select(Workstream.updated_at).where(Workstream.id == workstream_id)
+        )
+    ).one_or_none()
+    if ws_updated is None:
+        raise ExportUnavailable("Workstream not found")
+    cards = await db.execute(
+        select(Card.id, Card.updated_at)
+        .join(WorkstreamCard, WorkstreamCard.card_id == Card.id)
+        .where(WorkstreamCard.workstream_id == workstream_id)
+        .order_by(Card.id)
+    )
+    return {
+        "workstream": _stamp(ws_updated[0]),
+        "cards": [[str(row.id), _stamp(row.updated_at)] for row in cards],
+    }
+
+
+async def _brief_versions(db: AsyncSession, params: Params) -> Dict[str, Any]:
+    query = (
+        select(
+            ExecutiveBrief.id,
+            ExecutiveBrief.status,
+            ExecutiveBrief.version,
+            ExecutiveBrief.updated_at,
+            Card.updated_at.label("card_updated"),
+        )
+        .join(WorkstreamCard, WorkstreamCard.id == ExecutiveBrief.workstream_card_id)
+        .join(Card, Card.id == WorkstreamCard.card_id)
+        .where(
+            WorkstreamCard.workstream_id == params["workstream_id"],
+            WorkstreamCard.card_id == params["card_id"],
+        )
+    )
+    if params.get("version") is not None:
+        query = query.where(ExecutiveBrief.version == params["version"])
+    else:
+        query = query.order_by(ExecutiveBrief.version.desc()).limit(1)
+    brief = (await db.execute(query)).first()
+    if brief is None:
+        raise ExportUnavailable("No brief found for this card")
+    if brief.status != "completed":
+        raise ExportUnavailable(
+            "Brief is not yet complete. Please wait for generation to finish."
+        )
+    return {
+        "brief": [str(brief.id), brief.version, _stamp(brief.updated_at)],
+        "card": _stamp(brief.card_updated),
+    }
+
+
+async def _portfolio_versions(db: AsyncSession, params: Params) -> Dict[str, Any]:
+    workstream_id = params["workstream_id"]
+    card_order: List[str] = params["card_order"]
+    ws_updated = (
+        await db.execute(
+            select(Workstream.updated_at).where(Workstream.id == workstream_id)
+        )
+    ).one_or_none()
+    if ws_updated is None:
+        raise ExportUnavailable("Workstream not found")
+    rows = await db.execute(
+        select(
+            WorkstreamCard.card_id,
+            Card.updated_at,
+            ExecutiveBrief.id,
+            ExecutiveBrief.version,
+            ExecutiveBrief.updated_at.label("brief_updated"),
+        )
+        .join(Card, Card.id == WorkstreamCard.card_id)
+        .join(ExecutiveBrief, ExecutiveBrief.workstream_card_id == WorkstreamCard.id)
+        .where(
+            WorkstreamCard.workstream_id == workstream_id,
+            WorkstreamCard.card_id.in_(card_order),
+            ExecutiveBrief.status == "completed",
+        )
+    )
+    # Latest completed brief per card, as used by the portfolio renderer
+    latest: Dict[str, Any] = {}
+    for row in rows:
+        card_id = str(row.card_id)
+        if card_id not in latest or row.version > latest[card_id].version:
+            latest[card_id] = row
+    if not latest:
+        raise ExportUnavailable(
+            "No completed briefs found for the specified cards. Generate briefs first."
+        )
+    return {
+        "workstream": _stamp(ws_updated[0]),
+        "cards": [
+            [
+                card_id,
+                _stamp(latest[card_id].updated_at),
+                str(latest[card_id].id),
+                latest[card_id].version,
+                _stamp(latest[card_id].brief_updated),
+            ]
+            for card_id in card_order
+            if card_id in latest
+        ],
+    }
+
+
+async def _rows_version(db: AsyncSession, model: Any, application_id: Any) -> list:
+    """Row count and newest ``updated_at`` of an application's child rows."""
+    count, newest = (
+        await db.execute(
+            select(func.count(), func.max(model.updated_at)).where(
+                model.application_id == application_id
+            )
+        )
+    ).one()
+    return [count, _stamp(newest)]
+
+
+async def _application_versions(
+    db: AsyncSession, application_id: str, *, checklist: bool
+) -> Dict[str, Any]:
+    app_updated = (
+        await db.execute(
+            select(GrantApplication.updated_at).where(
+                GrantApplication.id == application_id
+            )
+        )
+    ).one_or_none()
+    if app_updated is None:
+        raise ExportUnavailable("Grant application not found")
+    proposal = (
+        await db.execute(
+            select(Proposal.id, Proposal.updated_at).where(
+                Proposal.application_id == application_id
+            )
+        )
+    ).first()
+    versions: Dict[str, Any] = {
+        "application": _stamp(app_updated[0]),
+        "proposal": (
+            [str(proposal.id), _stamp(proposal.updated_at)] if proposal else None
+        ),
+        "budget_items": await _rows_version(db, BudgetLineItem, application_id),
+        "budget_settings": await _rows_version(db, BudgetSettings, application_id),
+    }
+    if checklist:
+        versions["checklist"] = await _rows_version(db, ChecklistItem, application_id)
+    return versions
+
+
+async def _package_versions(db: AsyncSession, params: Params) -> Dict[str, Any]:
+    versions = await _application_versions(
+        db, params["application_id"], checklist=True
+    )
+    if versions["proposal"] is None:
+        raise ExportUnavailable("No proposal found for this application")
+    return versions
+
+
+async def _budget_versions(db: AsyncSession, params: Params) -> Dict[str, Any]:
+    return await _application_versions(
+        db, params["application_id"], checklist=False
+    )
+
+
+async def _proposal_versions(db: AsyncSession, params: Params) -> Dict[str, Any]:
+    proposal = (
+        await db.execute(
+            select(Proposal.updated_at, Proposal.application_id).where(
+                Proposal.id == params["proposal_id"]
+            )
+        )
+    ).one_or_none()
+    if proposal is None:
+        raise ExportUnavailable("Proposal not found")
+    versions: Dict[str, Any] = {"proposal": _stamp(proposal.updated_at)}
+    if proposal.application_id is not None:
+        versions["application"] = _stamp(
+            (
+                await db.execute(
+                    select(GrantApplication.updated_at).where(
+                        GrantApplication.id == proposal.application_id
+                    )
+                )
+            ).scalar_one_or_none()
+        )
+        versions["budget_items"] = await _rows_version(
+            db, BudgetLineItem, proposal.application_id
+        )
+    return versions
+
+
+# ============================================================================
+# Renderers (they live with the synchronous export endpoints)
+# ============================================================================
+
+
+async def _render_card(db: AsyncSession, fmt: str, params: Params) -> ExportArtifact:
+    from app.models.export import ExportFormat
+    from app.routers.card_export import render_card_export
+
+    return await render_card_export(
+        db,
+        params["card_id"],
+        ExportFormat(fmt),
+        include_charts=params.get("include_charts", True),
+    )
+
+
+async def _render_workstream(
+    db: AsyncSession, fmt: str, params: Params
+) -> ExportArtifact:
+    from app.models.export import ExportFormat
+    from app.routers.card_export import render_workstream_export
+
+    return await render_workstream_export(
+        db,
+        params["workstream_id"],
+        ExportFormat(fmt),
+        include_charts=params.get("include_charts", True),
+        max_cards=params.get("max_cards", 50),
+    )
+
+
+async def _render_brief(db: AsyncSession, fmt: str, params: Params) -> ExportArtifact:
+    from app.routers.briefs import render_brief_export
+
+    return await render_brief_export(
+        db,
+        params["workstream_id"],
+        params["card_id"],
+        fmt,
+        version=params.get("version"),
+    )
+
+
+async def _render_portfolio(
+    db: AsyncSession, fmt: str, params: Params
+) -> ExportArtifact:
+    from app.routers.briefs import render_portfolio_export
+
+    return await render_portfolio_export(
+        db, params["workstream_id"], fmt, params["card_order"]
+    )
+
+
+async def _render_application(
+    db: AsyncSession, fmt: str, params: Params
+) -> ExportArtifact:
+    from app.routers.exports import render_application_docx
+
+    return await render_application_docx(db, uuid.UUID(params["application_id"]))
+
+
+async def _render_budget(db: AsyncSession, fmt: str, params: Params) -> ExportArtifact:
+    from app.routers.exports import render_budget_docx
+
+    return await render_budget_docx(db, uuid.UUID(params["application_id"]))
+
+
+async def _render_proposal(
+    db: AsyncSession, fmt: str, params: Params
+) -> ExportArtifact:
+    from app.routers.exports import render_proposal_docx
+
+    return await render_proposal_docx(db, uuid.UUID(params["proposal_id"]))
+
+
+@dataclass(frozen=True)
+class ExportKind:
+    formats: Tuple[str, ...]
+    versions: Callable[[AsyncSession, Params], Awaitable[Dict[str, Any]]]
+    render: Callable[[AsyncSession, str, Params], Awaitable[ExportArtifact]]
+
+
+EXPORT_KINDS: Dict[str, ExportKind] = {
+    "card": ExportKind(("pdf", "pptx", "csv"), _card_versions, _render_card),
+    "workstream": ExportKind(("pdf", "pptx"), _workstream_versions, _render_workstream),
+    "brief": ExportKind(("pdf", "pptx"), _brief_versions, _render_brief),
+    "portfolio": ExportKind(("pdf", "pptx"), _portfolio_versions, _render_portfolio),
+    "application": ExportKind(("docx",), _package_versions, _render_application),
+    "budget": ExportKind(("docx",), _budget_versions, _render_budget),
+    "proposal": ExportKind(("docx",), _proposal_versions, _render_proposal),
+}
+
+
+def content_hash(kind: str, fmt: str, params: Params, versions: Dict[str, Any]) -> str:
+    """Digest of everything an export is rendered from."""
+    payload = json.dumps(
+        {
+            "artifact_version": EXPORT_ARTIFACT_VERSION,
+            "kind": kind,
+            "format": fmt,
+            "params": params,
+            "versions": versions,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ============================================================================
+# Jobs
+# ============================================================================
+
+
+async def enqueue_export(
+    db: AsyncSession, user_id: str, kind: str, fmt: str, params: Params
+) -> ExportJob:
+    """
+    Create an export job, completing it at once if the artifact exists.
+
+    A queued or running job of the same user for the same content hash is
+    returned instead of queueing a duplicate.  The caller commits.
+
+    Raises:
+        ExportUnavailable: nothing to export for these parameters.
+    """
+    versions = await EXPORT_KINDS[kind].versions(db, params)
+    digest = content_hash(kind, fmt, params, versions)
+    now = datetime.now(timezone.utc)
+
+    if await touch_artifact(db, digest):
+        # Served from storage: completed without ever being started
+        job = ExportJob(
+            id=uuid.uuid4(),
+            user_id=uuid.UUID(user_id),
+            kind=kind,
+            format=fmt,
+            params=params,
+            content_hash=digest,
+            status="completed",
+            created_at=now,
+            completed_at=now,
+        )
+        db.add(job)
+        await db.flush()
+        logger.info(f"Export {kind}/{fmt} served from artifact {digest[:12]}")
+        return job
+
+    pending = (
+        await db.execute(
+            select(ExportJob)
+            .where(
+                ExportJob.user_id == uuid.UUID(user_id),
+                ExportJob.content_hash == digest,
+                ExportJob.status.in_(("queued", "running")),
+            )
+            .order_by(ExportJob.created_at.desc())
+            .limit(1)
+        )
+    ).scalar_one_or_none()
+    if pending is not None:
+        return pending
+
+    job = ExportJob(
+        id=uuid.uuid4(),
+        user_id=uuid.UUID(user_id),
+        kind=kind,
+        format=fmt,
+        params=params,
+        content_hash=digest,
+        status="queued",
+        created_at=now,
+    )
+    db.add(job)
+    await db.flush()
+    await notify_job(db, EXPORT_QUEUE)
+    logger.info(f"Queued export job {job.id} ({kind}/{fmt})")
+    return job
+
+
+async def execute_export_job(job_id: str) -> None:
+    """Render a claimed export job (unless its artifact exists) and complete it."""
+    global _last_prune
+    async with database.async_session_factory() as db:
+        job = await db.get(ExportJob, uuid.UUID(job_id))
+        if job is None:
+            logger.warning(f"Export job {job_id} disappeared before rendering")
+            return
+        if not await touch_artifact(db, job.content_hash):
+            started = time.monotonic()
+            artifact = await EXPORT_KINDS[job.kind].render(
+                db, job.format, job.params or {}
+            )
+            await store_artifact(db, job.content_hash, artifact)
+            logger.info(
+                f"Rendered export job {job_id} ({job.kind}/{job.format}, "
+                f"{len(artifact.data)} bytes) in {time.monotonic() - started:.1f}s"
+            )
+        await db.execute(
+            sa_update(ExportJob)
+            .where(ExportJob.id == job.id)
+            .values(
+                status="completed",
+                completed_at=datetime.now(timezone.utc),
+                error_message=None,
+            )
+        )
+        await db.commit()
+
+        if time.monotonic() - _last_prune >= EXPORT_ARTIFACT_PRUNE_SECONDS:
+            _last_prune = time.monotonic()
+            await prune_exports(db)
+
+
+# ============================================================================
+# Artifacts
+# ============================================================================
+
+
+async def touch_artifact(db: AsyncSession, digest: str) -> bool:
+    """Whether an artifact is stored, bumping ``last_accessed_at`` if so.
+
+    A job completed from an existing artifact is downloaded later; touching
+    it here keeps :func:`prune_exports` from deleting it in between.
+    """
+    found = await db.execute(
+        sa_update(StoredArtifact)
+        .where(StoredArtifact.content_hash == digest)
+        .values(last_accessed_at=func.now())
+        .returning(StoredArtifact.content_hash)
+        .execution_options(synchronize_session=False)
+    )
+    return found.scalar_one_or_none() is not None
+
+
+async def artifact_info(db: AsyncSession, digest: str) -> Optional[Tuple[str, int]]:
+    """``(filename, size_bytes)`` of a stored artifact, without its data."""
+    row = (
+        await db.execute(
+            select(StoredArtifact.filename, StoredArtifact.size_bytes).where(
+                StoredArtifact.content_hash == digest
+            )
+        )
+    ).one_or_none()
+    return (row.filename, row.size_bytes) if row is not None else None
+
+
+async def load_artifact(db: AsyncSession, digest: str) -> Optional[ExportArtifact]:
+    """The stored artifact (bumping ``last_accessed_at``), or None if pruned."""
+    row = (
+        await db.execute(
+            sa_update(StoredArtifact)
+            .where(StoredArtifact.content_hash == digest)
+            .values(last_accessed_at=func.now())
+            .returning(
+                StoredArtifact.filename, StoredArtifact.media_type, StoredArtifact.data
+            )
+            .execution_options(synchronize_session=False)
+        )
+    ).one_or_none()
+    if row is None:
+        return None
+    return ExportArtifact(
+        filename=row.filename, media_type=row.media_type, data=row.data
+    )
+
+
+async def store_artifact(
+    db: AsyncSession, digest: str, artifact: ExportArtifact
+) -> None:
+    """Store a rendered artifact (a concurrent render of the same hash wins)."""
+    await db.execute(
+        pg_insert(StoredArtifact)
+        .values(
+            content_hash=digest,
+            filename=artifact.filename,
+            media_type=artifact.media_type,
+            data=artifact.data,
+            size_bytes=len(artifact.data),
+        )
+        .on_conflict_do_nothing(index_elements=["content_hash"])
+    )
+
+
+async def prune_exports(db: AsyncSession) -> int:
+    """Delete artifacts not downloaded within the TTL and finished jobs as old."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=EXPORT_ARTIFACT_TTL_DAYS)
+    try:
+        result = await db.execute(
+            StoredArtifact.__table__.delete().where(
+                StoredArtifact.last_accessed_at < cutoff
+            )
+        )
+        await db.execute(
+            ExportJob.__table__.delete().where(
+                ExportJob.status.in_(("completed", "failed")),
+                ExportJob.created_at < cutoff,
+            )
+        )
+        await db.commit()
+    except Exception as exc:
+        await db.rollback()
+        logger.warning("Export artifact prune failed: %s", exc)
+        return 0
+    removed = result.rowcount or 0
+    if removed:
+        logger.info("Pruned %d export artifacts", removed)
+    return removed
@@ -128,6 +128,9 @@ def _parse_float_safe(value: Any, default: float = 0.0) -> float:
 # Constants
 # ============================================================================
 
+# Card columns deferred by the ORM mapping (not loaded with select(Card))
+_CARD_DEFERRED_COLUMNS = frozenset({"embedding", "search_vector"})
+
 # Official City of Austin Brand Colors
 # https://austin.gov/design/brand
 COA_BRAND_COLORS = {
@@ -2618,7 +2621,11 @@ class ExportService:
                 return None
 
             # Convert ORM object to dict for CardExportData
-            card_dict = {c.key: getattr(card, c.key) for c in Card.__table__.columns}
+            card_dict = {
+                c.key: getattr(card, c.key)
+                for c in Card.__table__.columns
+                if c.key not in _CARD_DEFERRED_COLUMNS
+            }
             return CardExportData(**card_dict)
         except Exception as e:
             logger.error(f"Error fetching card {card_id}: {e}")
@@ -2667,7 +2674,9 @@ class ExportService:
                 )
                 for card_obj in cards_result.scalars().all():
                     card_dict = {
-                        c.key: getattr(card_obj, c.key) for c in Card.__table__.columns
+                        c.key: getattr(card_obj, c.key)
+                        for c in Card.__table__.columns
+                        if c.key not in _CARD_DEFERRED_COLUMNS
                     }
                     cards.append(CardExportData(**card_dict))
 
@@ -0,0 +1,263 @@
+"""Keyset pagination and cached counts for ``GET /cards``.
+
+Pages are ordered by ``(sort column, id)`` so every row has a unique
+position.  ``next_cursor`` encodes the last row's position; the next page is
+``WHERE (col, id) < (:value, :id)`` (or ``>`` ascending) rather than an
+``OFFSET``, so page 100 costs the same as page 1.  Sort columns are
+``NULLS LAST``; once the cursor reaches the NULL tail it pages by id alone.
+
+Totals are optional.  ``count=exact`` runs ``count(*)`` over the filtered
+query and caches the result for a short TTL, keyed by the normalized filter
+set (so paging and re-sorting reuse it).  ``count=approximate`` returns the
+planner's row estimate for large result sets and only counts exactly below
+:data:`APPROX_EXACT_BELOW`.  ``count=none`` skips the count.
+
+Usage::
+
+    column = sort_column(sort_by)
+    stmt = base.order_by(*keyset_order(column, ascending))
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort_by, ascending)
+        stmt = stmt.where(keyset_after(column, ascending, value, last_id))
+"""
+
+import base64
+import binascii
+import json
+import logging
+import time
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from sqlalchemy import and_, func, literal, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.models.db.card import Card
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SORT = "created_at"
+
+# sort_by value -> Card column (unknown values fall back to created_at).
+SORT_COLUMNS = {
+    "created_at": Card.created_at,
+    "name": Card.name,
+    "deadline": Card.deadline,
+    "funding_amount_max": Card.funding_amount_max,
+    "updated_at": Card.updated_at,
+    "signal_quality_score": Card.signal_quality_score,
+    "relevance_score": Card.relevance_score,
+    "opportunity_score": Card.opportunity_score,
+}
+
+COUNT_MODES = ("exact", "approximate", "none")
+
+# Below this many estimated rows, count=approximate counts exactly.
+APPROX_EXACT_BELOW = 10_000
+
+_COUNT_CACHE_TTL = 30.0  # seconds
+_COUNT_CACHE_MAX_ENTRIES = 1024
+
+
+class CursorError(ValueError):
+    """Raised for a malformed cursor or one issued for a different sort."""
+
+
+def sort_key(sort_by: Optional[str]) -> str:
+    return sort_by if sort_by in SORT_COLUMNS else DEFAULT_SORT
+
+
+def sort_column(sort_by: Optional[str]) -> Any:
+    return SORT_COLUMNS[sort_key(sort_by)]
+
+
+def keyset_order(column: Any, ascending: bool) -> Tuple[Any, ...]:
+    """ORDER BY for ``column`` with ``id`` as the tiebreaker."""
+    if ascending:
+        return (column.asc().nulls_last(), Card.id.asc())
+    return (column.desc().nulls_last(), Card.id.desc())
+
+
+def keyset_after(column: Any, ascending: bool, value: Any, card_id: uuid.UUID) -> Any:
+    """WHERE clause selecting rows after ``(value, card_id)`` in keyset order."""
+    last_id = literal(card_id, Card.id.type)
+    if value is None:
+        # Already in the NULL tail: only NULL rows with a later id remain.
+        id_after = Card.id > last_id if ascending else Card.id < last_id
+        return and_(column.is_(None), id_after)
+    position = tuple_(column, Card.id)
+    bound = tuple_(literal(value, column.type), last_id)
+    after = position > bound if ascending else position < bound
+    return or_(after, column.is_(None))
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _load_value(column: Any, raw: Any) -> Any:
+    if raw is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(raw)
+    if python_type is Decimal:
+        return Decimal(raw)
+    if python_type is int:
+        return int(raw)
+    if python_type is str and isinstance(raw, str):
+        return raw
+    raise ValueError(f"unexpected cursor value {raw!r}")
+
+
+def encode_cursor(
+    sort_by: Optional[str], ascending: bool, value: Any, card_id: Any
+) -> str:
+    """Opaque cursor for the row at ``(value, card_id)``."""
+    payload = {
+        "s": sort_key(sort_by),
+        "a": bool(ascending),
+        "v": _dump_value(value),
+        "id": str(card_id),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, sort_by: Optional[str], ascending: bool
+) -> Tuple[Any, uuid.UUID]:
+    """Decode a cursor into ``(sort value, card id)``.
+
+    Raises:
+        CursorError: If the cursor is malformed or was issued for another
+            ``sort_by`` / ``sort_asc`` combination.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key = payload["s"]
+        asc = payload["a"]
+        card_id = uuid.UUID(payload["id"])
+        value = _load_value(SORT_COLUMNS[key], payload["v"])
+    except (binascii.Error, UnicodeDecodeError, KeyError, TypeError, ValueError) as e:
+        raise CursorError("Invalid cursor") from e
+    if key != sort_key(sort_by) or asc != bool(ascending):
+        raise CursorError("Cursor does not match sort_by / sort_asc")
+    return value, card_id
+
+
+# ---------------------------------------------------------------------------
+# Counts
+# ---------------------------------------------------------------------------
+
+
+class CountCache:
+    """Short-TTL in-process cache of filtered card counts."""
+
+    def __init__(
+        self,
+        ttl: float = _COUNT_CACHE_TTL,
+        max_entries: int = _COUNT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[int, bool, float]] = {}
+
+    def get(self, key: Hashable) -> Optional[Tuple[int, bool]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        count, approximate, cached_at = entry
+        if time.monotonic() - cached_at >= self.ttl:
+            del self._entries[key]
+            return None
+        return count, approximate
+
+    def set(self, key: Hashable, count: int, approximate: bool) -> None:
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            # Evict the oldest entry (dicts keep insertion order).
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (count, approximate, time.monotonic())
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+card_count_cache = CountCache()
+
+
+def filter_key(**filters: Any) -> Tuple[Tuple[str, Any], ...]:
+    """Normalize a filter set into a hashable cache key.
+
+    Empty filters are dropped and list values are sorted, so equivalent
+    requests share an entry regardless of parameter order.
+    """
+    items = []
+    for name, value in filters.items():
+        if value is None or value == [] or value is False:
+            continue
+        if isinstance(value, (list, tuple, set, frozenset)):
+            value = tuple(sorted(value))
+        items.append((name, value))
+    return tuple(sorted(items))
+
+
+async def _exact_count(db: AsyncSession, stmt: Select) -> int:
+    result = await db.execute(select(func.count()).select_from(stmt.subquery()))
+    return result.scalar() or 0
+
+
+async def _estimated_count(db: AsyncSession, stmt: Select) -> int:
+    conn = await db.connection()
+    sql = stmt.compile(
+        dialect=conn.dialect, compile_kwargs={"literal_binds": True}
+    )
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_cards(
+    db: AsyncSession, base: Select, key: Hashable, mode: str = "exact"
+) -> Tuple[Optional[int], bool]:
+    """Total rows of the filtered (unpaginated) ``base`` query.
+
+    Returns ``(count, approximate)``; ``(None, False)`` for ``mode="none"``.
+    """
+    if mode == "none":
+        return None, False
+
+    cache_key = (mode, key)
+    cached = card_count_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    ids = base.with_only_columns(Card.id).order_by(None)
+    approximate = False
+    if mode == "approximate":
+        try:
+            # Savepoint: a failed EXPLAIN must not abort the request's transaction.
+            async with db.begin_nested():
+                estimate = await _estimated_count(db, ids)
+        except Exception as e:
+            logger.warning(f"Card count estimate failed, counting exactly: {e}")
+            estimate = 0
+        if estimate >= APPROX_EXACT_BELOW:
+            count, approximate = estimate, True
+        else:
+            count = await _exact_count(db, ids)
+    else:
+        count = await _exact_count(db, ids)
+
+    card_count_cache.set(cache_key, count, approximate)
+    return count, approximate
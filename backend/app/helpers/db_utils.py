@@ -7,11 +7,16 @@ return types).
 """
 
 import logging
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Iterable, Optional, TYPE_CHECKING
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.card_embedding_cache import card_embedding_cache
+from app.rag_cache import rag_query_cache
+from app.helpers.vector_utils import to_float32
+from app.multi_source_search import _normalize_url_for_dedup
+
 if TYPE_CHECKING:
     from app.ai_service import AIService
 
@@ -23,19 +28,21 @@ async def store_card_embedding(
     card_id: str,
     embedding: list[float],
 ) -> None:
-    """Persist a pgvector embedding on a card using raw SQL CAST.
+    """Persist a pgvector embedding on a card.
 
-    Centralises the pgvector NullType workaround so callers don't need
-    to know about the ``CAST(:vec AS vector)`` idiom.
+    The vector is bound as a float32 array and sent in pgvector's binary
+    format (see ``app.helpers.vector_utils``); keeps the in-process card
+    embedding cache in sync and drops cached RAG answers that used the card.
     """
-    vec_str = "[" + ",".join(str(v) for v in embedding) + "]"
     await db.execute(
         text(
             "UPDATE cards SET embedding = CAST(:vec AS vector) "
             "WHERE id = CAST(:cid AS uuid)"
         ),
-        {"vec": vec_str, "cid": card_id},
+        {"vec": to_float32(embedding), "cid": card_id},
     )
+    card_embedding_cache.invalidate(card_id, embedding)
+    rag_query_cache.invalidate(card_id)
 
 
 def compose_embedding_text(
@@ -164,7 +171,7 @@ async def vector_search_cards(
         behaviour).  If False, filter by ``review_status != 'rejected'``
         (find_similar_cards behaviour).
     """
-    embedding_str = "[" + ",".join(str(v) for v in query_embedding) + "]"
+    query_vec = to_float32(query_embedding)
 
     if require_active:
         status_clause = "AND c.status = 'active'"
@@ -173,7 +180,7 @@ async def vector_search_cards(
 
     exclude_clause = ""
     params: dict[str, Any] = {
-        "embedding": embedding_str,
+        "embedding": query_vec,
         "threshold": match_threshold,
         "limit": match_count,
     }
@@ -228,10 +235,10 @@ async def vector_search_sources(
     If *target_card_id* is given, scopes the search to that card's sources
     (the card-scoped deduplication variant).
     """
-    embedding_str = "[" + ",".join(str(v) for v in query_embedding) + "]"
+    query_vec = to_float32(query_embedding)
 
     params: dict[str, Any] = {
-        "embedding": embedding_str,
+        "embedding": query_vec,
         "threshold": match_threshold,
         "limit": match_count,
     }
@@ -272,6 +279,55 @@ async def vector_search_sources(
     ]
 
 
+# SQL mirror of ``normalize_source_url``.  Must match the expression of the
+# ``idx_sources_url_norm_hash`` index (migration 0020) character for character.
+SOURCE_URL_NORM_SQL = "split_part(rtrim(lower(url), '/'), '#', 1)"
+
+
+def normalize_source_url(url: str) -> str:
+    """Normalise a source URL for existence checks (see ``SOURCE_URL_NORM_SQL``)."""
+    return _normalize_url_for_dedup(url)
+
+
+async def find_existing_source_urls(
+    db: AsyncSession,
+    urls: Iterable[Optional[str]],
+) -> dict[str, list[dict[str, Optional[str]]]]:
+    """Resolve which of *urls* are already stored as sources, in one query.
+
+    URLs are compared after normalisation (lowercase, no trailing slash, no
+    fragment), backed by a hash index on the same expression.
+
+    Returns
+    -------
+    dict
+        ``normalize_source_url(url)`` -> list of ``{"id", "card_id"}`` for
+        every existing source with that URL.  URLs with no match are absent.
+    """
+    normalized = {normalize_source_url(u) for u in urls if u}
+    if not normalized:
+        return {}
+
+    sql = text(
+        f"""
+        SELECT id, card_id, {SOURCE_URL_NORM_SQL} AS norm_url
+        FROM sources
+        WHERE {SOURCE_URL_NORM_SQL} = ANY(:urls)
+    """
+    )
+    result = await db.execute(sql, {"urls": list(normalized)})
+
+    existing: dict[str, list[dict[str, Optional[str]]]] = {}
+    for r in result.mappings().all():
+        existing.setdefault(r["norm_url"], []).append(
+            {
+                "id": str(r["id"]),
+                "card_id": str(r["card_id"]) if r["card_id"] else None,
+            }
+        )
+    return existing
+
+
 async def hybrid_search_cards(
     db: AsyncSession,
     query_text: str,
@@ -299,7 +355,7 @@ async def hybrid_search_cards(
         strong FTS signal from being excluded simply because they fell
         outside the vector candidate window.
     """
-    embedding_str = "[" + ",".join(str(v) for v in query_embedding) + "]"
+    query_vec = to_float32(query_embedding)
 
     effective_pool = (
         vector_pool_size if vector_pool_size is not None else match_count * 2
@@ -307,7 +363,7 @@ async def hybrid_search_cards(
 
     params: dict[str, Any] = {
         "query_text": query_text,
-        "embedding": embedding_str,
+        "embedding": query_vec,
         "match_count": match_count,
         "vector_pool": effective_pool,
         "fts_weight": fts_weight,
@@ -387,18 +443,23 @@ async def hybrid_search_sources(
     vector_weight: float = 1.0,
     rrf_k: int = 60,
     scope_card_ids: Optional[list[str]] = None,
+    include_full_text: bool = False,
 ) -> list[dict[str, Any]]:
     """Hybrid full-text + vector search over sources using RRF fusion.
 
     Replaces the ``hybrid_search_sources`` Supabase RPC function.
+
+    ``full_text`` (often tens of KB per source) is only returned with
+    ``include_full_text=True``; otherwise rows carry a ``has_full_text``
+    flag and callers fetch truncated slices for the sources they use.
     """
-    embedding_str = "[" + ",".join(str(v) for v in query_embedding) + "]"
+    query_vec = to_float32(query_embedding)
 
     vector_pool = match_count * 2
 
     params: dict[str, Any] = {
         "query_text": query_text,
-        "embedding": embedding_str,
+        "embedding": query_vec,
         "match_count": match_count,
         "vector_pool": vector_pool,
         "fts_weight": fts_weight,
@@ -413,6 +474,10 @@ async def hybrid_search_sources(
         scope_clause_fts = "AND s.card_id = ANY(:scope_ids)"
         scope_clause_vec = "AND s.card_id = ANY(:scope_ids)"
 
+    full_text_column = (
+        "s.full_text" if include_full_text else "s.full_text IS NOT NULL AS has_full_text"
+    )
+
     sql = text(
         f"""
         WITH fts AS (
@@ -450,7 +515,7 @@ async def hybrid_search_sources(
         SELECT
             s.id, s.card_id, c.name AS card_name, c.slug AS card_slug,
             s.title, s.url, s.ai_summary, s.key_excerpts,
-            s.published_date, s.full_text,
+            s.published_date, {full_text_column},
             rrf.fts_rank, rrf.vector_similarity, rrf.rrf_score
         FROM rrf
         JOIN sources s ON s.id = rrf.id
@@ -0,0 +1,117 @@
+"""Column projections and fast row serializers for list endpoints.
+
+List views (``GET /cards``, ``/cards/pending-review``, ``/cards/search``,
+``/cards/filter-preview``) select only the columns they return instead of
+whole ``Card`` entities, then turn each result row into a dict with a
+serializer compiled once per projection: the per-column conversion
+(UUID -> str, datetime/date -> ISO string, Decimal -> float) is chosen from
+the column type up front rather than by ``isinstance`` checks on every value.
+
+Long text / JSON columns that no list view renders are opt-in through an
+``include`` parameter; the vector columns are never part of a projection
+(they are also deferred on the ORM models).
+
+Usage:
+    projection = card_list_projection(parse_include(include))
+    rows = (await db.execute(select(*projection.columns).where(...))).all()
+    cards = [projection.serialize(r) for r in rows]
+"""
+
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from app.models.db.card import Card
+
+# Never returned by the API (binary / internal).
+CARD_VECTOR_COLUMNS = frozenset({"embedding", "search_vector"})
+
+# Returned by card detail only; list endpoints take them via ?include=.
+CARD_OPTIONAL_FIELDS = frozenset(
+    {
+        "description",
+        "eligibility_text",
+        "match_requirement",
+        "quality_breakdown",
+        "source_preferences",
+        "review_notes",
+    }
+)
+
+_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    uuid.UUID: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    Decimal: float,
+}
+
+
+def parse_include(value: Optional[str]) -> frozenset:
+    """Parse a comma-separated ``include`` parameter into optional field names.
+
+    Raises:
+        ValueError: If a name is not one of :data:`CARD_OPTIONAL_FIELDS`.
+    """
+    if not value:
+        return frozenset()
+    names = frozenset(part.strip() for part in value.split(",") if part.strip())
+    unknown = names - CARD_OPTIONAL_FIELDS
+    if unknown:
+        raise ValueError(
+            f"Unknown include field(s): {', '.join(sorted(unknown))}. "
+            f"Allowed: {', '.join(sorted(CARD_OPTIONAL_FIELDS))}"
+        )
+    return names
+
+
+class Projection:
+    """A fixed column list plus a row serializer compiled for it.
+
+    Select with ``select(*projection.columns)`` and pass each result row to
+    :meth:`serialize`.  Keys are the column keys.
+    """
+
+    def __init__(self, columns: Iterable[Any]) -> None:
+        self.columns: Tuple[Any, ...] = tuple(columns)
+        self.keys: Tuple[str, ...] = tuple(c.key for c in self.columns)
+        self._converted = tuple(
+            (i, self.keys[i], conv)
+            for i, conv in enumerate(_converter(c) for c in self.columns)
+            if conv is not None
+        )
+
+    def serialize(self, row: Any) -> Dict[str, Any]:
+        result = dict(zip(self.keys, row))
+        for i, key, conv in self._converted:
+            value = row[i]
+            if value is not None:
+                result[key] = conv(value)
+        return result
+
+
+def _converter(column: Any) -> Optional[Callable[[Any], Any]]:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return None
+    return _CONVERTERS.get(python_type)
+
+
+@lru_cache(maxsize=64)
+def _card_projection(include: frozenset) -> Projection:
+    skip = CARD_VECTOR_COLUMNS | (CARD_OPTIONAL_FIELDS - include)
+    return Projection(
+        getattr(Card, col.key) for col in Card.__table__.columns if col.key not in skip
+    )
+
+
+def card_list_projection(include: Iterable[str] = ()) -> Projection:
+    """Card columns for a list view, plus any requested optional fields."""
+    return _card_projection(frozenset(include))
+
+
+def card_detail_projection() -> Projection:
+    """Every Card column the API returns (all but the vector columns)."""
+    return _card_projection(CARD_OPTIONAL_FIELDS)
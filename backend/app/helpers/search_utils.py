@@ -1,96 +1,126 @@
 """Search-related utility functions extracted from main.py.
 
-Functions for applying advanced search filters, score threshold filters,
-and extracting text highlights from search results.
+Builds the ``/cards/search`` query -- filters, ranking and ordering all in
+SQL so the database paginates and counts -- and extracts text highlights
+from search results.
 """
 
-from typing import Any, Dict, List, Optional
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from sqlalchemy import func, null, select
+from sqlalchemy.sql import Select
+
+from app.models.db.card import Card
 from app.models.search import SearchFilters
 
 
-def _apply_search_filters(
-    results: List[Dict[str, Any]], filters: SearchFilters
-) -> List[Dict[str, Any]]:
-    """Apply advanced filters to search results."""
-    filtered = results
+# SearchFilters.score_thresholds field -> Card column.
+SCORE_COLUMNS = {
+    "impact_score": Card.impact_score,
+    "relevance_score": Card.relevance_score,
+    "novelty_score": Card.novelty_score,
+    "maturity_score": Card.maturity_score,
+    "velocity_score": Card.velocity_score,
+    "risk_score": Card.risk_score,
+    "opportunity_score": Card.opportunity_score,
+}
 
-    # Filter by pillar_ids
-    if filters.pillar_ids:
-        filtered = [r for r in filtered if r.get("pillar_id") in filters.pillar_ids]
+# Minimum cosine similarity for vector matches (as vector_search_cards).
+VECTOR_MATCH_THRESHOLD = 0.5
 
-    # Filter by goal_ids
-    if filters.goal_ids:
-        filtered = [r for r in filtered if r.get("goal_id") in filters.goal_ids]
 
-    # Filter by stage_ids
-    if filters.stage_ids:
-        filtered = [r for r in filtered if r.get("stage_id") in filters.stage_ids]
+def search_filter_clauses(filters: Optional[SearchFilters]) -> List[Any]:
+    """Translate :class:`SearchFilters` into WHERE clauses on ``cards``.
 
-    # Filter by horizon
-    if filters.horizon and filters.horizon != "ALL":
-        filtered = [r for r in filtered if r.get("horizon") == filters.horizon]
+    Date bounds are inclusive calendar days (UTC) on ``created_at``; score
+    thresholds exclude cards without a score, as the old in-memory filter
+    did.
+    """
+    if filters is None:
+        return []
 
-    # Filter by status
+    clauses: List[Any] = []
+    if filters.pillar_ids:
+        clauses.append(Card.pillar_id.in_(filters.pillar_ids))
+    if filters.goal_ids:
+        clauses.append(Card.goal_id.in_(filters.goal_ids))
+    if filters.stage_ids:
+        clauses.append(Card.stage_id.in_(filters.stage_ids))
+    if filters.horizon and filters.horizon != "ALL":
+        clauses.append(Card.horizon == filters.horizon)
     if filters.status:
-        filtered = [r for r in filtered if r.get("status") == filters.status]
+        clauses.append(Card.status == filters.status)
 
-    # Filter by date range
     if filters.date_range:
         if filters.date_range.start:
-            start_str = filters.date_range.start.isoformat()
-            filtered = [
-                r
-                for r in filtered
-                if r.get("created_at") and r["created_at"][:10] >= start_str
-            ]
+            start = datetime.combine(filters.date_range.start, time.min, timezone.utc)
+            clauses.append(Card.created_at >= start)
         if filters.date_range.end:
-            end_str = filters.date_range.end.isoformat()
-            filtered = [
-                r
-                for r in filtered
-                if r.get("created_at") and r["created_at"][:10] <= end_str
-            ]
-
-    # Filter by score thresholds
-    if filters.score_thresholds:
-        filtered = _apply_score_filters(filtered, filters.score_thresholds)
-
-    return filtered
-
+            end = datetime.combine(filters.date_range.end, time.min, timezone.utc)
+            clauses.append(Card.created_at < end + timedelta(days=1))
 
-def _apply_score_filters(
-    results: List[Dict[str, Any]], thresholds
-) -> List[Dict[str, Any]]:
-    """Apply score threshold filters to results."""
-    filtered = results
-
-    score_fields = [
-        ("impact_score", thresholds.impact_score),
-        ("relevance_score", thresholds.relevance_score),
-        ("novelty_score", thresholds.novelty_score),
-        ("maturity_score", thresholds.maturity_score),
-        ("velocity_score", thresholds.velocity_score),
-        ("risk_score", thresholds.risk_score),
-        ("opportunity_score", thresholds.opportunity_score),
-    ]
-
-    for field_name, threshold in score_fields:
-        if threshold:
+    if filters.score_thresholds:
+        for field_name, column in SCORE_COLUMNS.items():
+            threshold = getattr(filters.score_thresholds, field_name)
+            if threshold is None:
+                continue
             if threshold.min is not None:
-                filtered = [
-                    r
-                    for r in filtered
-                    if r.get(field_name) is not None and r[field_name] >= threshold.min
-                ]
+                clauses.append(column >= threshold.min)
             if threshold.max is not None:
-                filtered = [
-                    r
-                    for r in filtered
-                    if r.get(field_name) is not None and r[field_name] <= threshold.max
-                ]
-
-    return filtered
+                clauses.append(column <= threshold.max)
+
+    return clauses
+
+
+def build_card_search(
+    columns: Sequence[Any],
+    filters: Optional[SearchFilters] = None,
+    *,
+    query: Optional[str] = None,
+    query_embedding: Optional[Any] = None,
+    match_threshold: float = VECTOR_MATCH_THRESHOLD,
+) -> Tuple[Select, str]:
+    """Build the unpaginated, ordered ``/cards/search`` query.
+
+    The mode follows the inputs: ``vector`` when ``query_embedding`` is
+    given (cosine similarity above ``match_threshold``, nearest first),
+    ``text`` when only ``query`` is (``search_vector`` matched with
+    ``websearch_to_tsquery`` and ranked by ``ts_rank_cd``), otherwise
+    ``filter`` (newest first).  The statement selects ``columns`` plus a
+    ``search_relevance`` column (NULL in filter mode); every ordering
+    ends with ``id`` so LIMIT / OFFSET pages are stable.
+
+    Returns:
+        ``(stmt, mode)``; callers add LIMIT / OFFSET and count with
+        ``stmt`` as the base.
+    """
+    where = search_filter_clauses(filters)
+
+    if query_embedding is not None:
+        distance = Card.embedding.cosine_distance(query_embedding)
+        relevance = (1 - distance).label("search_relevance")
+        where += [
+            Card.embedding.isnot(None),
+            Card.review_status != "rejected",
+            distance < 1 - match_threshold,
+        ]
+        order_by = (distance.asc(), Card.id)
+        mode = "vector"
+    elif query:
+        tsquery = func.websearch_to_tsquery("english", query)
+        rank = func.ts_rank_cd(Card.search_vector, tsquery)
+        relevance = rank.label("search_relevance")
+        where.append(Card.search_vector.op("@@")(tsquery))
+        order_by = (rank.desc(), Card.id)
+        mode = "text"
+    else:
+        relevance = null().label("search_relevance")
+        order_by = (Card.created_at.desc().nulls_last(), Card.id.desc())
+        mode = "filter"
+
+    stmt = select(*columns, relevance).where(*where).order_by(*order_by)
+    return stmt, mode
 
 
 def _extract_highlights(item: Dict[str, Any], query: str) -> Optional[List[str]]:
@@ -0,0 +1,84 @@
+"""Run independent read queries on short-lived sessions of their own.
+
+An ``AsyncSession`` owns a single connection and does not allow concurrent
+operations, so ``asyncio.gather`` over queries on one session runs them back
+to back at best.  :class:`SessionFanout` hands each concurrent read its own
+session from ``async_session_factory`` (read-only transaction, rolled back
+and returned to the pool when done) so the queries really overlap.  A
+per-request semaphore caps how many pooled connections one request can hold.
+
+Without a configured session factory (or with ``max_sessions=0``) every
+borrow gets the request's own session, serialized with a lock, which keeps
+concurrent callers correct if not parallel.
+
+Usage::
+
+    fanout = SessionFanout(db)
+    cards, sources = await asyncio.gather(
+        fanout.run(hybrid_search_cards, query_text=q, query_embedding=e),
+        fanout.run(hybrid_search_sources, query_text=q, query_embedding=e),
+    )
+
+    async with fanout.session() as session:
+        rows = (await session.execute(stmt)).all()
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import app.database as database
+
+T = TypeVar("T")
+
+# Pooled connections one request may hold at once (pool is 10 + 20 overflow).
+FANOUT_MAX_SESSIONS = int(os.getenv("DB_FANOUT_MAX_SESSIONS", "4"))
+
+
+class SessionFanout:
+    """Per-request pool of read-only sessions for concurrent queries."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        max_sessions: int = FANOUT_MAX_SESSIONS,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+    ) -> None:
+        self.db = db
+        self.max_sessions = max_sessions
+        self._factory = session_factory
+        self._semaphore = asyncio.Semaphore(max(1, max_sessions))
+        self._db_lock = asyncio.Lock()
+
+    @property
+    def factory(self) -> Optional[async_sessionmaker[AsyncSession]]:
+        return self._factory or database.async_session_factory
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """Borrow a read-only session for one independent read."""
+        factory = self.factory
+        if factory is None or self.max_sessions <= 0:
+            async with self._db_lock:
+                yield self.db
+            return
+
+        async with self._semaphore:
+            async with factory() as session:
+                await session.connection(
+                    execution_options={"postgresql_readonly": True}
+                )
+                try:
+                    yield session
+                finally:
+                    await session.rollback()
+
+    async def run(
+        self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Call ``fn(session, *args, **kwargs)`` on a borrowed session."""
+        async with self.session() as session:
+            return await fn(session, *args, **kwargs)
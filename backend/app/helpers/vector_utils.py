@@ -0,0 +1,93 @@
+"""NumPy helpers for working with stored embeddings.
+
+Shared by the in-memory card indexes (``app.card_match_index`` and
+``app.card_embedding_cache``), and home of the binary pgvector codec that
+``app.database`` registers on every asyncpg connection, so ``vector``
+values cross the wire as raw float32 instead of ``"[0.1,0.2,...]"`` text.
+"""
+
+import logging
+import struct
+from typing import Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# pgvector binary format: uint16 dim, uint16 unused (0), then dim
+# big-endian float4 values.
+_VECTOR_HEADER = struct.Struct(">HH")
+_WIRE_DTYPE = np.dtype(">f4")
+
+
+def parse_embedding(value: Any) -> Optional[np.ndarray]:
+    """Coerce a stored embedding to a float32 vector.
+
+    Accepts pgvector's text form (``"[0.1,0.2,...]"``), lists/tuples and
+    NumPy arrays.  Returns None for missing or empty values.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        stripped = value.strip().strip("[]")
+        if not stripped:
+            return None
+        vec = np.fromstring(stripped, dtype=np.float32, sep=",")
+    else:
+        vec = np.asarray(value, dtype=np.float32)
+    return vec if vec.size else None
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row; zero rows stay zero."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def to_float32(value: Any) -> Optional[np.ndarray]:
+    """Coerce an embedding (array, list or pgvector text) to a 1-D float32 array."""
+    if isinstance(value, np.ndarray) and value.dtype == np.float32:
+        return value
+    return parse_embedding(value)
+
+
+def encode_vector_binary(value: Any) -> bytes:
+    """asyncpg encoder: embedding -> pgvector binary ``vector``."""
+    vec = to_float32(value)
+    if vec is None or vec.ndim != 1:
+        raise ValueError("expected a non-empty 1-D embedding")
+    return _VECTOR_HEADER.pack(vec.shape[0], 0) + vec.astype(_WIRE_DTYPE).tobytes()
+
+
+def decode_vector_binary(data: bytes) -> np.ndarray:
+    """asyncpg decoder: pgvector binary ``vector`` -> float32 array."""
+    dim, unused = _VECTOR_HEADER.unpack_from(data)
+    if unused != 0 or len(data) != _VECTOR_HEADER.size + 4 * dim:
+        raise ValueError("malformed pgvector binary value")
+    return np.frombuffer(
+        data, dtype=_WIRE_DTYPE, count=dim, offset=_VECTOR_HEADER.size
+    ).astype(np.float32)
+
+
+async def register_vector_codec(conn: Any) -> bool:
+    """Register the binary ``vector`` codec on an asyncpg connection.
+
+    pgvector lives in ``public`` on Azure and in ``extensions`` on Supabase;
+    both are tried.  Returns False (text transfer stays in effect) when the
+    extension is not installed.
+    """
+    for schema in ("public", "extensions"):
+        try:
+            await conn.set_type_codec(
+                "vector",
+                schema=schema,
+                encoder=encode_vector_binary,
+                decoder=decode_vector_binary,
+                format="binary",
+            )
+            return True
+        except ValueError:
+            continue
+    logger.warning("pgvector type not found; vectors use text transfer")
+    return False
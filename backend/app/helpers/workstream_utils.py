@@ -10,6 +10,7 @@ from typing import Any, Dict, List
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.db.workstream import WorkstreamScan
+from app.job_notify import notify_job
 
 logger = logging.getLogger(__name__)
 
@@ -115,6 +116,7 @@ async def _auto_queue_workstream_scan(
         db.add(scan_obj)
         await db.flush()
         await db.refresh(scan_obj)
+        await notify_job(db, "workstream_scan")
         scan_id = str(scan_obj.id)
         logger.info(
             f"Auto-queued workstream scan {scan_id} for workstream {workstream_id} "
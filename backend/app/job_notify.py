@@ -0,0 +1,142 @@
+"""
+Postgres LISTEN/NOTIFY wakeups for the background worker.
+
+Code that enqueues a job (a ``research_tasks`` / ``executive_briefs`` /
+``discovery_runs`` / ``workstream_scans`` / ``export_jobs`` row) calls
+:func:`notify_job` in the same session.  ``pg_notify`` is transactional, so
+the notification is delivered when the enqueueing transaction commits --
+never before the row is visible -- and is dropped if it rolls back.
+
+The worker runs a :class:`JobNotificationListener` on one dedicated
+connection.  Each notification sets the wake event for its queue, so the
+matching consumer polls immediately instead of sleeping out its backoff.
+Polling stays on as a slow safety net (``GRANTSCOPE_WORKER_SAFETY_POLL_SECONDS``)
+for notifications lost while the listener was reconnecting.
+
+Usage:
+    from app.job_notify import notify_job
+
+    db.add(ResearchTask(..., status="queued"))
+    await db.flush()
+    await notify_job(db, "research")
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+logger = logging.getLogger(__name__)
+
+JOB_CHANNEL = "grantscope_jobs"
+
+# Queues that are woken by NOTIFY (the RSS and scheduled-discovery consumers
+# are time-driven and keep polling).
+NOTIFY_QUEUES = ("research", "brief", "discovery", "workstream_scan", "export")
+
+
+async def notify_job(db: AsyncSession, queue: str) -> None:
+    """Queue a wakeup for ``queue``'s consumers, sent when ``db`` commits.
+
+    Runs in a savepoint and never raises: a failed NOTIFY must not abort the
+    transaction that enqueued the job (the worker's safety poll still finds it).
+    """
+    try:
+        async with db.begin_nested():
+            await db.execute(
+                text("SELECT pg_notify(:channel, :queue)"),
+                {"channel": JOB_CHANNEL, "queue": queue},
+            )
+    except Exception as e:
+        logger.warning(f"Failed to notify worker of new {queue} job: {e}")
+
+
+class JobNotificationListener:
+    """Holds a LISTEN connection and turns notifications into wake events."""
+
+    def __init__(
+        self,
+        engine: Optional[AsyncEngine],
+        queues: Iterable[str] = NOTIFY_QUEUES,
+        max_reconnect_seconds: float = 60.0,
+    ) -> None:
+        self.engine = engine
+        self.wake_events: Dict[str, asyncio.Event] = {
+            name: asyncio.Event() for name in queues
+        }
+        self.max_reconnect_seconds = max_reconnect_seconds
+        self.connected = False
+        self.notifications = 0
+
+    def _wake_all(self) -> None:
+        for event in self.wake_events.values():
+            event.set()
+
+    def _on_notify(
+        self, connection: Any, pid: int, channel: str, payload: str
+    ) -> None:
+        self.notifications += 1
+        event = self.wake_events.get(payload)
+        if event is not None:
+            event.set()
+        else:
+            # Unknown payload (e.g. a manual NOTIFY without one): wake everyone.
+            self._wake_all()
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """LISTEN until ``stop_event`` is set, reconnecting with backoff."""
+        if self.engine is None:
+            logger.warning("Database not configured — job notifications disabled")
+            return
+
+        first_backoff = min(1.0, self.max_reconnect_seconds)
+        backoff = first_backoff
+        while not stop_event.is_set():
+            try:
+                async with self.engine.connect() as conn:
+                    raw = await conn.get_raw_connection()
+                    driver = raw.driver_connection
+                    lost = asyncio.Event()
+                    driver.add_termination_listener(lambda _conn: lost.set())
+                    await driver.add_listener(JOB_CHANNEL, self._on_notify)
+                    self.connected = True
+                    backoff = first_backoff
+                    logger.info(f"Listening for job notifications on {JOB_CHANNEL}")
+                    # Anything queued while we were disconnected was not
+                    # announced to us; have every consumer poll once.
+                    self._wake_all()
+                    try:
+                        await _wait_any(stop_event, lost)
+                    finally:
+                        self.connected = False
+                        if driver.is_closed():
+                            await conn.invalidate()
+                        else:
+                            await driver.remove_listener(
+                                JOB_CHANNEL, self._on_notify
+                            )
+                if not stop_event.is_set():
+                    logger.warning("Job notification connection lost, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.connected = False
+                logger.warning(
+                    f"Job notification listener error (retry in {backoff:.0f}s): {e}"
+                )
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=backoff)
+            except asyncio.TimeoutError:
+                pass
+            backoff = min(backoff * 2, self.max_reconnect_seconds)
+
+
+async def _wait_any(*events: asyncio.Event) -> None:
+    waiters = [asyncio.create_task(event.wait()) for event in events]
+    try:
+        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
@@ -0,0 +1,266 @@
+"""
+Persistent, content-addressed memo of LLM triage / analysis results.
+
+The same article is routinely triaged and analyzed more than once (discovery,
+research, RSS polling, workstream scans and the recovery reprocessors all
+call ``AIService.triage_source`` / ``analyze_source``).  Results are stored in
+the ``llm_result_cache`` table under::
+
+    (operation, prompt_version, model, content_hash)
+
+- ``prompt_version`` is a digest of the prompt template and request
+  parameters (:func:`prompt_version`), so editing a prompt or ``max_tokens``
+  starts a fresh namespace instead of serving stale output.
+- ``model`` is the deployment name the call would use.
+- ``content_hash`` is the SHA-256 of every prompt input after Unicode and
+  whitespace normalization (:func:`content_hash`).
+
+A lookup is a single primary-key ``UPDATE ... RETURNING`` that also bumps
+``hit_count`` / ``last_hit_at``.  Entries older than
+``LLM_RESULT_CACHE_TTL_DAYS`` are ignored and pruned; when the table grows
+past ``LLM_RESULT_CACHE_MAX_MB`` the least recently used entries are
+deleted.  Pruning runs at most every ``LLM_RESULT_CACHE_PRUNE_SECONDS``,
+piggybacked on writes.
+
+The cache is best-effort: without a configured database, or on any database
+error, lookups miss and writes are skipped, so the LLM path is never worse
+off.  Only successfully parsed model output is stored.
+
+Usage:
+    from app.llm_result_cache import llm_result_cache
+
+    cached = await llm_result_cache.get("triage", version, model, key)
+    await llm_result_cache.put("triage", version, model, key, parsed_json)
+    llm_result_cache.stats()   # per-operation hit/miss counters
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+import unicodedata
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func, text
+from sqlalchemy import update as sa_update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import app.database as database
+from app.models.db.analytics import CachedLLMResult
+
+logger = logging.getLogger(__name__)
+
+LLM_RESULT_CACHE_ENABLED = os.getenv("LLM_RESULT_CACHE_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+LLM_RESULT_CACHE_TTL_DAYS = float(os.getenv("LLM_RESULT_CACHE_TTL_DAYS", "30"))
+LLM_RESULT_CACHE_MAX_MB = float(os.getenv("LLM_RESULT_CACHE_MAX_MB", "512"))
+LLM_RESULT_CACHE_PRUNE_SECONDS = float(
+    os.getenv("LLM_RESULT_CACHE_PRUNE_SECONDS", "3600")
+)
+
+# Keep the most recently used rows whose sizes add up to :max_bytes.
+_PRUNE_BY_SIZE_SQL = text(
+    """
+    DELETE FROM llm_result_cache
+    WHERE ctid IN (
+        SELECT ctid FROM (
+            SELECT ctid,
+                   SUM(size_bytes) OVER (
+                       ORDER BY COALESCE(last_hit_at, created_at) DESC
+                   ) AS running_bytes
+            FROM llm_result_cache
+        ) ranked
+        WHERE running_bytes > :max_bytes
+    )
+    """
+)
+
+
+def _normalize(value: Any) -> str:
+    text_value = "" if value is None else str(value)
+    return " ".join(unicodedata.normalize("NFC", text_value).split())
+
+
+def content_hash(*parts: Any) -> str:
+    """SHA-256 over the normalized prompt inputs (order-sensitive)."""
+    joined = "\x1f".join(_normalize(part) for part in parts)
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+def prompt_version(template: str, **params: Any) -> str:
+    """Short digest of a prompt template and the request parameters."""
+    payload = template + json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class LLMResultCache:
+    """Best-effort persistent memo of parsed LLM output."""
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        ttl: Optional[timedelta] = None,
+        max_bytes: Optional[int] = None,
+        prune_interval: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        self._factory = session_factory
+        self.ttl = ttl if ttl is not None else timedelta(days=LLM_RESULT_CACHE_TTL_DAYS)
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else int(LLM_RESULT_CACHE_MAX_MB * 1024 * 1024)
+        )
+        self.prune_interval = (
+            prune_interval
+            if prune_interval is not None
+            else LLM_RESULT_CACHE_PRUNE_SECONDS
+        )
+        self.enabled = LLM_RESULT_CACHE_ENABLED if enabled is None else enabled
+        self._counts: Counter = Counter()
+        self._last_prune = time.monotonic()
+
+    @property
+    def factory(self) -> Optional[async_sessionmaker[AsyncSession]]:
+        if not self.enabled:
+            return None
+        return self._factory or database.async_session_factory
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    async def get(
+        self, operation: str, version: str, model: str, key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Cached result for the key, or None (also on any database error)."""
+        factory = self.factory
+        if factory is None:
+            return None
+        cutoff = datetime.now(timezone.utc) - self.ttl
+        try:
+            async with factory() as db:
+                result = await db.execute(
+                    sa_update(CachedLLMResult)
+                    .where(
+                        CachedLLMResult.operation == operation,
+                        CachedLLMResult.prompt_version == version,
+                        CachedLLMResult.model == model,
+                        CachedLLMResult.content_hash == key,
+                        CachedLLMResult.created_at > cutoff,
+                    )
+                    .values(
+                        hit_count=CachedLLMResult.hit_count + 1,
+                        last_hit_at=func.now(),
+                    )
+                    .returning(CachedLLMResult.result)
+                    .execution_options(synchronize_session=False)
+                )
+                cached = result.scalar_one_or_none()
+                await db.commit()
+        except Exception as exc:
+            self._counts[(operation, "error")] += 1
+            logger.warning("LLM result cache lookup failed (%s): %s", operation, exc)
+            return None
+
+        self._counts[(operation, "hit" if cached is not None else "miss")] += 1
+        return cached
+
+    async def put(
+        self,
+        operation: str,
+        version: str,
+        model: str,
+        key: str,
+        result: Dict[str, Any],
+    ) -> None:
+        """Store a parsed result (replacing any expired entry for the key)."""
+        factory = self.factory
+        if factory is None:
+            return
+        size = len(json.dumps(result, default=str).encode("utf-8"))
+        stmt = pg_insert(CachedLLMResult).values(
+            operation=operation,
+            prompt_version=version,
+            model=model,
+            content_hash=key,
+            result=result,
+            size_bytes=size,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["operation", "prompt_version", "model", "content_hash"],
+            set_={
+                "result": stmt.excluded.result,
+                "size_bytes": stmt.excluded.size_bytes,
+                "created_at": func.now(),
+                "hit_count": 0,
+                "last_hit_at": None,
+            },
+        )
+        try:
+            async with factory() as db:
+                await db.execute(stmt)
+                await db.commit()
+            self._counts[(operation, "store")] += 1
+        except Exception as exc:
+            self._counts[(operation, "error")] += 1
+            logger.warning("LLM result cache write failed (%s): %s", operation, exc)
+            return
+
+        if time.monotonic() - self._last_prune >= self.prune_interval:
+            self._last_prune = time.monotonic()
+            await self.prune()
+
+    # ------------------------------------------------------------------
+    # Maintenance / stats
+    # ------------------------------------------------------------------
+
+    async def prune(self) -> int:
+        """Delete expired rows, then the least recently used over the size cap."""
+        factory = self.factory
+        if factory is None:
+            return 0
+        cutoff = datetime.now(timezone.utc) - self.ttl
+        try:
+            async with factory() as db:
+                expired = await db.execute(
+                    CachedLLMResult.__table__.delete().where(
+                        CachedLLMResult.created_at <= cutoff
+                    )
+                )
+                oversize = await db.execute(
+                    _PRUNE_BY_SIZE_SQL, {"max_bytes": self.max_bytes}
+                )
+                await db.commit()
+        except Exception as exc:
+            logger.warning("LLM result cache prune failed: %s", exc)
+            return 0
+        removed = (expired.rowcount or 0) + (oversize.rowcount or 0)
+        if removed:
+            logger.info("Pruned %d LLM result cache entries", removed)
+        return removed
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-operation hit / miss / store / error counts since process start."""
+        operations = sorted({operation for operation, _ in self._counts})
+        stats: Dict[str, Dict[str, Any]] = {}
+        for operation in operations:
+            counts = {
+                kind: self._counts[(operation, kind)]
+                for kind in ("hit", "miss", "store", "error")
+            }
+            lookups = counts["hit"] + counts["miss"]
+            counts["hit_rate"] = round(counts["hit"] / lookups, 4) if lookups else 0.0
+            stats[operation] = counts
+        return stats
+
+
+# Shared per-process instance
+llm_result_cache = LLMResultCache()
@@ -23,6 +23,7 @@ from app.database import get_db
 from app.models.db.user import User
 from app.security import setup_security
 from app.scheduler import start_scheduler, shutdown_scheduler
+from app.crawler import close_http_client, shutdown_extraction_pool
 
 # Routers
 from app.routers.health import router as health_router
@@ -54,6 +55,7 @@ from app.routers.checklist import router as checklist_router
 from app.routers.budget import router as budget_router
 from app.routers.attachments import router as attachments_router
 from app.routers.exports import router as exports_router
+from app.routers.export_jobs import router as export_jobs_router
 from app.routers.collaboration import router as collaboration_router
 from app.routers.applications import router as applications_router
 from app.routers.dashboard import router as dashboard_router
@@ -164,6 +166,8 @@ async def lifespan(_app: FastAPI):
         logger.info("Embedded worker stopped")
 
     shutdown_scheduler()
+    await close_http_client()
+    shutdown_extraction_pool()
     logger.info("GrantScope2 API shutdown complete")
 
 
@@ -298,6 +302,7 @@ def create_app() -> FastAPI:
     application.include_router(budget_router)
     application.include_router(attachments_router)
     application.include_router(exports_router)
+    application.include_router(export_jobs_router)
     application.include_router(collaboration_router)
     application.include_router(applications_router)
     application.include_router(dashboard_router)
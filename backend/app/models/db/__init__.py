@@ -66,8 +66,11 @@ from app.models.db.card_extras import (  # noqa: F401
 )
 from app.models.db.brief import ExecutiveBrief  # noqa: F401
 from app.models.db.research import ResearchTask  # noqa: F401
+from app.models.db.export import ExportArtifact, ExportJob  # noqa: F401
 from app.models.db.analytics import (  # noqa: F401
     CachedInsight,
+    CachedLLMResult,
+    CachedSearchResult,
     ClassificationValidation,
     DomainReputation,
     PatternInsight,
@@ -139,6 +142,8 @@ __all__ = [
     "UserSignalPreference",
     "ExecutiveBrief",
     "ResearchTask",
+    "ExportJob",
+    "ExportArtifact",
     "CachedInsight",
     "DomainReputation",
     "PatternInsight",
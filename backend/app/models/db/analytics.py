@@ -3,6 +3,8 @@
 Tables
 ------
 - cached_insights    (TTL-based cache for AI-generated insights)
+- llm_result_cache   (content-addressed memo of triage / analysis LLM output)
+- search_result_cache (shared cache of external search provider responses)
 - domain_reputation  (credibility tiers and reputation for source domains)
 - pattern_insights   (AI-detected cross-signal patterns)
 """
@@ -10,7 +12,7 @@ Tables
 import uuid
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Optional
 
 from sqlalchemy import (
     Boolean,
@@ -30,6 +32,8 @@ from app.models.db.base import Base
 
 __all__ = [
     "CachedInsight",
+    "CachedLLMResult",
+    "CachedSearchResult",
     "ClassificationValidation",
     "DomainReputation",
     "PatternInsight",
@@ -81,6 +85,54 @@ class CachedInsight(Base):
     )
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# llm_result_cache
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class CachedLLMResult(Base):
+    """Parsed LLM output keyed by operation, prompt, model and content hash."""
+
+    __tablename__ = "llm_result_cache"
+
+    operation: Mapped[str] = mapped_column(Text, primary_key=True)
+    prompt_version: Mapped[str] = mapped_column(Text, primary_key=True)
+    model: Mapped[str] = mapped_column(Text, primary_key=True)
+    content_hash: Mapped[str] = mapped_column(Text, primary_key=True)
+
+    result: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    hit_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    last_hit_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# search_result_cache
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class CachedSearchResult(Base):
+    """Raw search provider response keyed by provider and request digest."""
+
+    __tablename__ = "search_result_cache"
+
+    provider: Mapped[str] = mapped_column(Text, primary_key=True)
+    cache_key: Mapped[str] = mapped_column(Text, primary_key=True)
+
+    payload: Mapped[Any] = mapped_column(JSONB, nullable=False)
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # domain_reputation
 # ═══════════════════════════════════════════════════════════════════════════
@@ -1,13 +1,16 @@
-"""Re-export Base and provide common mixins for ORM models."""
+"""Re-export Base and provide common mixins and column types for ORM models."""
 
 from datetime import datetime
+from typing import Any, Optional
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, Float, func
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeEngine, UserDefinedType
 
 from app.database import Base
+from app.helpers.vector_utils import to_float32
 
-__all__ = ["Base", "TimestampMixin"]
+__all__ = ["Base", "TimestampMixin", "Vector"]
 
 
 class TimestampMixin:
@@ -28,3 +31,38 @@ class TimestampMixin:
         onupdate=func.now(),
         nullable=False,
     )
+
+
+class Vector(UserDefinedType):
+    """pgvector ``VECTOR(dim)`` column that round-trips ``numpy.float32`` arrays.
+
+    Binds lists or arrays; the binary codec registered in ``app.database``
+    does the wire encoding.  Results are float32 arrays (text values from a
+    connection without the codec are parsed too).  Declare it with
+    old-style ``Column(...)``: ``Mapped[]`` cannot resolve this type.
+    """
+
+    cache_ok = True
+
+    def __init__(self, dim: Optional[int] = None) -> None:
+        super().__init__()
+        self.dim = dim
+
+    def get_col_spec(self, **kw: Any) -> str:
+        return "VECTOR" if self.dim is None else f"VECTOR({self.dim})"
+
+    def bind_processor(self, dialect):
+        def process(value):
+            return None if value is None else to_float32(value)
+
+        return process
+
+    def result_processor(self, dialect, coltype):
+        return to_float32
+
+    class comparator_factory(TypeEngine.Comparator):
+        def cosine_distance(self, other):
+            return self.op("<=>", return_type=Float)(other)
+
+        def l2_distance(self, other):
+            return self.op("<->", return_type=Float)(other)
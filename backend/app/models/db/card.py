@@ -45,9 +45,9 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.types import NullType
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, deferred, mapped_column
 
-from app.models.db.base import Base
+from app.models.db.base import Base, Vector
 
 __all__ = ["Card", "CardEmbedding"]
 
@@ -175,9 +175,11 @@ class Card(Base):
     )
 
     # ── Embedding (1766434901) ───────────────────────────────────────────
-    # pgvector VECTOR(1536) — use old-style Column(NullType) because
-    # SQLAlchemy 2.0 Mapped[] cannot resolve pgvector types.
-    embedding = Column("embedding", NullType(), nullable=True)
+    # pgvector VECTOR(1536) — old-style Column because SQLAlchemy 2.0
+    # Mapped[] cannot resolve pgvector types; values are float32 arrays.
+    # Deferred: select(Card) leaves it out; use undefer(Card.embedding) or
+    # select the column explicitly when it is needed.
+    embedding = deferred(Column("embedding", Vector(1536), nullable=True))
 
     # ── Discovery workflow (1766435000) ──────────────────────────────────
     review_status: Mapped[Optional[str]] = mapped_column(
@@ -246,8 +248,8 @@ class Card(Base):
     )
 
     # ── Hybrid search (20260211) ─────────────────────────────────────────
-    # tsvector column — managed by DB trigger, use old-style Column
-    search_vector = Column("search_vector", NullType(), nullable=True)
+    # tsvector column — managed by DB trigger, use old-style Column (deferred)
+    search_vector = deferred(Column("search_vector", NullType(), nullable=True))
 
     # ── Profile tracking (20260213000002) ────────────────────────────────
     profile_generated_at: Mapped[Optional[datetime]] = mapped_column(
@@ -299,9 +301,9 @@ class CardEmbedding(Base):
     __tablename__ = "card_embeddings"
 
     card_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
-    # pgvector VECTOR(1536) — use old-style Column(NullType) because
-    # SQLAlchemy 2.0 Mapped[] cannot resolve pgvector types.
-    embedding = Column("embedding", NullType(), nullable=True)
+    # pgvector VECTOR(1536) — old-style Column because SQLAlchemy 2.0
+    # Mapped[] cannot resolve pgvector types; values are float32 arrays.
+    embedding = Column("embedding", Vector(1536), nullable=True)
     created_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=True
     )
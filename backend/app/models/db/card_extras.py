@@ -31,10 +31,9 @@ from sqlalchemy import (
     text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.types import NullType
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.db.base import Base
+from app.models.db.base import Base, Vector
 
 __all__ = [
     "CardTimeline",
@@ -299,7 +298,7 @@ class Entity(Base):
     canonical_name: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Embedding (vector)
-    embedding = Column("embedding", NullType(), nullable=True)
+    embedding = Column("embedding", Vector(1536), nullable=True)
 
     created_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=True
@@ -24,10 +24,9 @@ from sqlalchemy import (
     text,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
-from sqlalchemy.types import NullType
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.db.base import Base
+from app.models.db.base import Base, Vector
 
 __all__ = [
     "DiscoveryRun",
@@ -149,7 +148,7 @@ class DiscoveryBlock(Base):
     # Topic identification
     topic_name: Mapped[str] = mapped_column(Text, nullable=False)
     # topic_embedding: VECTOR(1536) -- managed by pgvector, use old-style Column
-    topic_embedding = Column("topic_embedding", NullType(), nullable=True)
+    topic_embedding = Column("topic_embedding", Vector(1536), nullable=True)
     keywords: Mapped[Optional[list[str]]] = mapped_column(
         ARRAY(Text), server_default="{}", nullable=True
     )
@@ -0,0 +1,75 @@
+"""Export job ORM models.
+
+Tables
+------
+- export_jobs       (queued PDF / PPTX / DOCX exports processed by the worker)
+- export_artifacts  (finished export documents keyed by content hash)
+"""
+
+import uuid
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import BigInteger, DateTime, LargeBinary, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.db.base import Base
+
+__all__ = ["ExportArtifact", "ExportJob"]
+
+
+class ExportJob(Base):
+    """One requested export; several jobs may share an artifact."""
+
+    __tablename__ = "export_jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+
+    # What to export: kind (card, workstream, brief, ...), format and the
+    # target ids / options the renderer needs
+    kind: Mapped[str] = mapped_column(Text, nullable=False)
+    format: Mapped[str] = mapped_column(Text, nullable=False)
+    params: Mapped[dict[str, Any]] = mapped_column(
+        JSONB, nullable=False, server_default="{}"
+    )
+    content_hash: Mapped[str] = mapped_column(Text, nullable=False)
+
+    # Job status: queued -> running -> completed / failed
+    status: Mapped[str] = mapped_column(Text, nullable=False, server_default="queued")
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    completed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+class ExportArtifact(Base):
+    """A rendered export document, stored once per content hash."""
+
+    __tablename__ = "export_artifacts"
+
+    content_hash: Mapped[str] = mapped_column(Text, primary_key=True)
+    filename: Mapped[str] = mapped_column(Text, nullable=False)
+    media_type: Mapped[str] = mapped_column(Text, nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    last_accessed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
@@ -59,6 +59,9 @@ class RssFeed(Base):
     articles_matched_total: Mapped[Optional[int]] = mapped_column(
         Integer, server_default="0", nullable=True
     )
+    # Validators from the last 200 response, replayed as a conditional GET
+    http_etag: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    http_last_modified: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     metadata_: Mapped[Optional[dict]] = mapped_column(
         "metadata", JSONB, server_default="{}", nullable=True
     )
@@ -26,9 +26,9 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.types import NullType
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, deferred, mapped_column
 
-from app.models.db.base import Base
+from app.models.db.base import Base, Vector
 
 __all__ = ["Source", "DiscoveredSource", "SignalSource", "SourceRating"]
 
@@ -79,7 +79,10 @@ class Source(Base):
 
     # Enhanced research columns (1766434901)
     publication: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    full_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Deferred (up to ~50KB per row); undefer(Source.full_text) to load it
+    full_text: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True
+    )
     ai_summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     key_excerpts: Mapped[Optional[list[str]]] = mapped_column(
         ARRAY(Text), server_default="{}", nullable=True
@@ -94,8 +97,8 @@ class Source(Base):
         DateTime(timezone=True), server_default=func.now(), nullable=True
     )
 
-    # Embedding (vector)
-    embedding = Column("embedding", NullType(), nullable=True)
+    # Embedding (vector, deferred)
+    embedding = deferred(Column("embedding", Vector(1536), nullable=True))
 
     # Quality fields (1766739004)
     is_peer_reviewed: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
@@ -113,8 +116,8 @@ class Source(Base):
         UUID(as_uuid=True), nullable=True
     )
 
-    # Hybrid search (20260211)
-    search_vector = Column("search_vector", NullType(), nullable=True)
+    # Hybrid search (20260211, deferred)
+    search_vector = deferred(Column("search_vector", NullType(), nullable=True))
 
     # Timestamp
     created_at: Mapped[Optional[datetime]] = mapped_column(
@@ -241,7 +244,7 @@ class DiscoveredSource(Base):
     error_stage: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Embedding (vector)
-    content_embedding = Column("content_embedding", NullType(), nullable=True)
+    content_embedding = Column("content_embedding", Vector(1536), nullable=True)
 
     # Timestamps
     created_at: Mapped[Optional[datetime]] = mapped_column(
@@ -10,6 +10,7 @@ Supports:
 - ExportRequest: Configuration options for export generation
 - ExportResponse: Metadata about generated export files
 - WorkstreamExportRequest: Options for workstream report generation
+- ExportJobRequest / ExportJobResponse: Background export jobs
 """
 
 from datetime import datetime
@@ -191,6 +192,72 @@ class WorkstreamExportResponse(BaseModel):
     )
 
 
+class ExportJobRequest(BaseModel):
+    """
+    Request model for a background export job.
+
+    ``kind`` selects what to export and which ids are required:
+    card (card_id), workstream (workstream_id), brief (workstream_id,
+    card_id), portfolio (workstream_id, card_order), application and
+    budget (application_id), proposal (proposal_id).
+    """
+
+    kind: str = Field(
+        ...,
+        description="card, workstream, brief, portfolio, application, budget or proposal",
+    )
+    format: str = Field(
+        ..., description="Export format: pdf, pptx, csv or docx (depends on kind)"
+    )
+    card_id: Optional[str] = Field(None, description="Card to export")
+    workstream_id: Optional[str] = Field(None, description="Workstream to export")
+    application_id: Optional[str] = Field(None, description="Grant application")
+    proposal_id: Optional[str] = Field(None, description="Proposal to export")
+    include_charts: bool = Field(
+        True, description="Include visualizations (card / workstream PDF and PPTX)"
+    )
+    max_cards: int = Field(
+        50, ge=1, le=100, description="Maximum cards in a workstream report"
+    )
+    version: Optional[int] = Field(
+        None, ge=1, description="Brief version to export (defaults to latest)"
+    )
+    card_order: List[str] = Field(
+        default_factory=list, description="Portfolio cards in presentation order"
+    )
+
+
+class ExportJobResponse(BaseModel):
+    """
+    Status of a background export job.
+
+    ``cached`` jobs were served from an existing artifact without
+    rendering; ``download_url`` is set once the job has completed.
+    """
+
+    job_id: str = Field(..., description="Export job identifier")
+    kind: str = Field(..., description="What is being exported")
+    format: str = Field(..., description="Export format")
+    status: str = Field(..., description="queued, running, completed or failed")
+    cached: bool = Field(
+        False, description="Served from a previously rendered artifact"
+    )
+    filename: Optional[str] = Field(None, description="Filename of the artifact")
+    file_size_bytes: Optional[int] = Field(
+        None, ge=0, description="Size of the artifact in bytes"
+    )
+    download_url: Optional[str] = Field(
+        None, description="Where to download the artifact once completed"
+    )
+    error_message: Optional[str] = Field(
+        None, description="Error message if export failed"
+    )
+    created_at: datetime = Field(..., description="When the job was requested")
+    completed_at: Optional[datetime] = Field(
+        None, description="When the artifact became available"
+    )
+
+
 class CardExportData(BaseModel):
     """
     Card data structure used for export generation.
@@ -9,6 +9,18 @@ a missing dependency for one source never prevents the others from working.
 Every wrapper catches all exceptions and returns an empty list (with logging),
 ensuring that one failing source never breaks the aggregate result.
 
+Each source also runs under its own deadline (``SOURCE_TIMEOUTS``, capped by
+the overall ``deadline``).  A source that misses its deadline contributes no
+results, but the sources that finished in time are still fused, so a hung
+provider costs at most its own timeout instead of the whole search.  Slow
+sources can optionally be hedged: after ``MULTI_SOURCE_HEDGE_AFTER_SECONDS``
+a second identical request is started and whichever finishes first wins.
+The hedged request runs under ``search_cache.bypass_inflight`` so that, for
+cached providers, it is a real second request rather than a wait on the
+single-flight request it is racing.
+Per-source latency histograms and timeout counts are kept in-process
+(:func:`source_latency_stats`).
+
 Used by:
 - Chat tools (search_all_sources)
 - Card analysis service (gathering context for new cards)
@@ -20,8 +32,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import time
 from dataclasses import dataclass, field
-from typing import Any, List, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, Dict, List, TYPE_CHECKING
+
+from app.search_cache import bypass_inflight
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -178,6 +193,155 @@ def _rrf_rerank(
     return merged
 
 
+# ---------------------------------------------------------------------------
+# Per-source deadlines, hedging and latency stats
+# ---------------------------------------------------------------------------
+
+# Upper bound on the whole search; every per-source timeout is capped by it.
+SEARCH_DEADLINE_SECONDS = float(os.getenv("MULTI_SOURCE_DEADLINE_SECONDS", "30"))
+
+# Per-source timeouts (seconds), overridable with MULTI_SOURCE_TIMEOUT_<SOURCE>.
+# The government and academic fetchers crawl several endpoints and get more.
+SOURCE_TIMEOUTS: dict[str, float] = {
+    label: float(os.getenv(f"MULTI_SOURCE_TIMEOUT_{label.upper()}", default))
+    for label, default in {
+        "grants_gov": "12",
+        "sam_gov": "12",
+        "web": "10",
+        "news": "10",
+        "government": "20",
+        "academic": "15",
+    }.items()
+}
+
+# Start a duplicate request for a source still running after this many
+# seconds (0 disables hedging).  SAM.gov is excluded by default because its
+# API key has a small daily quota.
+HEDGE_AFTER_SECONDS = float(os.getenv("MULTI_SOURCE_HEDGE_AFTER_SECONDS", "0"))
+HEDGED_SOURCES = frozenset(
+    s.strip()
+    for s in os.getenv(
+        "MULTI_SOURCE_HEDGE_SOURCES", "grants_gov,web,news,government,academic"
+    ).split(",")
+    if s.strip()
+)
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket
+# is open-ended.
+LATENCY_BUCKETS: tuple[float, ...] = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0)
+
+
+@dataclass
+class SourceLatencyStats:
+    """Latency histogram and timeout / hedge counters for one source."""
+
+    calls: int = 0
+    timeouts: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    total_seconds: float = 0.0
+    buckets: List[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+
+    def record(self, elapsed: float, *, timed_out: bool = False) -> None:
+        self.calls += 1
+        if timed_out:
+            self.timeouts += 1
+            return
+        self.total_seconds += elapsed
+        index = next(
+            (i for i, bound in enumerate(LATENCY_BUCKETS) if elapsed <= bound),
+            len(LATENCY_BUCKETS),
+        )
+        self.buckets[index] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        completed = self.calls - self.timeouts
+        labels = [f"le_{bound:g}s" for bound in LATENCY_BUCKETS] + [
+            f"gt_{LATENCY_BUCKETS[-1]:g}s"
+        ]
+        return {
+            "calls": self.calls,
+            "timeouts": self.timeouts,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "avg_seconds": (
+                round(self.total_seconds / completed, 3) if completed else None
+            ),
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+_latency: Dict[str, SourceLatencyStats] = {}
+
+
+def source_latency_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-source latency histograms since process start (admin health)."""
+    return {label: stats.to_dict() for label, stats in sorted(_latency.items())}
+
+
+async def _run_source(
+    label: str,
+    searcher: Callable[[str, int], Awaitable[List[MultiSourceResult]]],
+    query: str,
+    max_results: int,
+    *,
+    timeout: float,
+    hedge_after: float,
+) -> List[MultiSourceResult]:
+    """Run one source under its deadline, hedging it if it is slow.
+
+    Returns the first attempt to finish, or ``[]`` when none finishes within
+    *timeout*.  Outstanding attempts are always cancelled.
+    """
+    stats = _latency.setdefault(label, SourceLatencyStats())
+    started = time.monotonic()
+    attempts = [asyncio.create_task(searcher(query, max_results))]
+    try:
+        if 0 < hedge_after < timeout:
+            done, _ = await asyncio.wait(attempts, timeout=hedge_after)
+            if not done:
+                # The task copies the context, so its cache misses skip
+                # single-flight and actually race the first attempt.
+                with bypass_inflight():
+                    attempts.append(asyncio.create_task(searcher(query, max_results)))
+                stats.hedged += 1
+                logger.info(
+                    "search_all_sources [%s]: no response after %.1fs, hedging",
+                    label,
+                    hedge_after,
+                )
+
+        remaining = max(0.0, timeout - (time.monotonic() - started))
+        done, _ = await asyncio.wait(
+            attempts, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+        )
+        if not done:
+            stats.record(time.monotonic() - started, timed_out=True)
+            logger.warning(
+                "search_all_sources [%s]: timed out after %.1fs for query=%r",
+                label,
+                timeout,
+                query[:80],
+            )
+            return []
+
+        winner = next(task for task in attempts if task in done)
+        stats.record(time.monotonic() - started)
+        if winner is not attempts[0]:
+            stats.hedge_wins += 1
+        try:
+            return winner.result()
+        except Exception:
+            logger.exception("search_all_sources [%s]: source failed", label)
+            return []
+    finally:
+        for task in attempts:
+            if not task.done():
+                task.cancel()
+
+
 # ---------------------------------------------------------------------------
 # Per-source wrapper coroutines
 # ---------------------------------------------------------------------------
@@ -424,6 +588,9 @@ async def search_all_sources(
     rrf_k: int = 60,
     source_weights: dict[str, float] | None = None,
     db: AsyncSession | None = None,
+    deadline: float | None = None,
+    source_timeouts: dict[str, float] | None = None,
+    hedge_after: float | None = None,
 ) -> List[MultiSourceResult]:
     """Search across multiple source types in parallel and return merged results.
 
@@ -435,6 +602,10 @@ async def search_all_sources(
     combines per-source rankings into a single unified ranking.  Results
     that appear in multiple sources receive a natural boost.
 
+    Every source runs under its own timeout; sources that miss it are left
+    out and the rest are still merged, so the call returns within
+    *deadline* seconds with partial results rather than none.
+
     Args:
         query: The search query string (required).
         include_grants_gov: Search Grants.gov for federal grant opportunities.
@@ -455,6 +626,13 @@ async def search_all_sources(
         db: Optional async DB session.  When provided, admin-configured
             ``source_toggles`` and ``rrf_weights`` are read from
             ``system_settings`` (cached 60s).
+        deadline: Upper bound in seconds on the whole search (default
+            ``MULTI_SOURCE_DEADLINE_SECONDS``, 30).
+        source_timeouts: Per-source timeout overrides in seconds, merged
+            over :data:`SOURCE_TIMEOUTS`.  Each is capped by *deadline*.
+        hedge_after: Seconds after which a still-running source in
+            :data:`HEDGED_SOURCES` gets a duplicate request (default
+            ``MULTI_SOURCE_HEDGE_AFTER_SECONDS``; 0 disables hedging).
 
     Returns:
         A flat list of :class:`MultiSourceResult` objects, deduplicated by URL
@@ -504,50 +682,56 @@ async def search_all_sources(
                 "multi_source_search: failed to read admin settings: %s", exc
             )
 
-    # Build the list of coroutines for enabled sources.
-    tasks: List[Any] = []
+    # Build the list of searchers for enabled sources.
+    searchers: List[Callable[[str, int], Awaitable[List[MultiSourceResult]]]] = []
     source_labels: List[str] = []
 
     if include_grants_gov:
-        tasks.append(_search_grants_gov(query, max_results_per_source))
+        searchers.append(_search_grants_gov)
         source_labels.append("grants_gov")
 
     if include_sam_gov:
-        tasks.append(_search_sam_gov(query, max_results_per_source))
+        searchers.append(_search_sam_gov)
         source_labels.append("sam_gov")
 
     if include_web:
-        tasks.append(_search_web(query, max_results_per_source))
+        searchers.append(_search_web)
         source_labels.append("web")
 
     if include_news:
-        tasks.append(_search_news(query, max_results_per_source))
+        searchers.append(_search_news)
         source_labels.append("news")
 
     if include_government:
-        tasks.append(_search_government(query, max_results_per_source))
+        searchers.append(_search_government)
         source_labels.append("government")
 
     if include_academic:
-        tasks.append(_search_academic(query, max_results_per_source))
+        searchers.append(_search_academic)
         source_labels.append("academic")
 
-    if not tasks:
+    if not searchers:
         logger.info("search_all_sources: no sources enabled")
         return []
 
-    # Run all source searches in parallel with a timeout.  Exceptions inside
-    # each wrapper are already caught, so return_exceptions=False is fine.
-    # The 30-second timeout prevents a hung source from blocking all callers.
-    try:
-        results_per_source: List[List[MultiSourceResult]] = await asyncio.wait_for(
-            asyncio.gather(*tasks), timeout=30
-        )
-    except asyncio.TimeoutError:
-        logger.warning(
-            "search_all_sources: timed out after 30s for query=%r", query[:80]
+    # Run all sources in parallel, each under its own deadline.  A source
+    # that times out contributes an empty list; the others are unaffected.
+    deadline = SEARCH_DEADLINE_SECONDS if deadline is None else deadline
+    timeouts = {**SOURCE_TIMEOUTS, **(source_timeouts or {})}
+    hedge_after = HEDGE_AFTER_SECONDS if hedge_after is None else hedge_after
+    results_per_source: List[List[MultiSourceResult]] = await asyncio.gather(
+        *(
+            _run_source(
+                label,
+                searcher,
+                query,
+                max_results_per_source,
+                timeout=min(timeouts.get(label, deadline), deadline),
+                hedge_after=hedge_after if label in HEDGED_SOURCES else 0.0,
+            )
+            for label, searcher in zip(source_labels, searchers)
         )
-        results_per_source = []
+    )
 
     # Log per-source counts for observability.
     for label, source_results in zip(source_labels, results_per_source):
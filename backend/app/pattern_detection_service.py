@@ -219,14 +219,8 @@ class PatternDetectionService:
         cards: List[CardSignal] = []
         for row in cards_data:
             embedding = row.embedding
-            if not embedding:
+            if embedding is None or len(embedding) == 0:
                 continue
-            # Embedding may come as a list or a string representation
-            if isinstance(embedding, str):
-                try:
-                    embedding = json.loads(embedding)
-                except (json.JSONDecodeError, ValueError):
-                    continue
 
             cards.append(
                 CardSignal(
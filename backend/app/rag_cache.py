@@ -0,0 +1,355 @@
+"""
+Process-level cache for the model calls made by ``RAGEngine.retrieve``.
+
+Every chat turn used to make three model calls before any retrieval
+happened: query expansion (LLM), the query embedding, and an LLM rerank of
+the search candidates.  Suggested prompts and follow-ups repeat heavily, so
+:class:`RAGQueryCache` remembers all three:
+
+- **Embeddings** are keyed by normalized query text only; they do not
+  depend on scope or on the corpus.
+- **Expansions** are keyed by ``(scope, scope_id, normalized query)``.  On
+  an exact miss, an entry in the same scope whose query embedding has
+  cosine similarity >= ``RAG_CACHE_SIMILARITY`` is reused (near-duplicate
+  phrasing such as "grants for EV chargers?" / "EV charger grants").
+- **Rerank scores** are keyed the same way plus a fingerprint of the
+  numbered candidate list the LLM would see.  Any change to the candidates
+  (a new card or source in scope, an edited name or summary, a different
+  ordering) changes the fingerprint and misses, so scores are never
+  applied to a list they were not computed for.
+
+Entries expire after ``RAG_CACHE_TTL_SECONDS`` and the cache holds at most
+``RAG_CACHE_MAX_ENTRIES`` queries (LRU).  :meth:`RAGQueryCache.invalidate`
+drops entries tied to a card (its signal scope, or any entry whose rerank
+candidates included it); ``store_card_embedding`` calls it on every write.
+Failed model calls are never cached.
+
+The cache is per process, like ``card_count_cache``; invalidations do not
+reach other workers, which rely on the TTL and the candidate fingerprint.
+
+Usage:
+    from app.rag_cache import rag_query_cache
+
+    rag_query_cache.stats()   # hit rates per layer, for monitoring
+"""
+
+import hashlib
+import os
+import re
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from app.helpers.vector_utils import parse_embedding
+
+RAG_CACHE_TTL_SECONDS = float(os.getenv("RAG_CACHE_TTL_SECONDS", "900"))
+RAG_CACHE_MAX_ENTRIES = int(os.getenv("RAG_CACHE_MAX_ENTRIES", "2000"))
+RAG_CACHE_SIMILARITY = float(os.getenv("RAG_CACHE_SIMILARITY", "0.95"))
+
+_WHITESPACE = re.compile(r"\s+")
+
+EntryKey = Tuple[str, str, str]
+
+
+def normalize_query(query: str) -> str:
+    """Case-fold, collapse whitespace and trim surrounding punctuation."""
+    return _WHITESPACE.sub(" ", query.casefold()).strip(" \t\n?!.,;:")
+
+
+def candidate_fingerprint(numbered: str) -> str:
+    """Stable digest of the candidate list shown to the reranker."""
+    return hashlib.sha256(numbered.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class QueryEntry:
+    """Cached model output for one normalized query in one scope."""
+
+    query: str
+    stored_at: float
+    embedding: Optional[np.ndarray] = None
+    expansions: Optional[List[str]] = None
+    rerank: Dict[str, Dict[int, float]] = field(default_factory=dict)
+    card_ids: Set[str] = field(default_factory=set)
+
+
+class RAGQueryCache:
+    """Exact + near-duplicate cache of RAG expansion, embedding and rerank."""
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        similarity: Optional[float] = None,
+    ) -> None:
+        self.ttl = ttl if ttl is not None else RAG_CACHE_TTL_SECONDS
+        self.max_entries = (
+            max_entries if max_entries is not None else RAG_CACHE_MAX_ENTRIES
+        )
+        self.similarity = similarity if similarity is not None else RAG_CACHE_SIMILARITY
+        self._entries: "OrderedDict[EntryKey, QueryEntry]" = OrderedDict()
+        self._embeddings: "OrderedDict[str, Tuple[List[float], float]]" = OrderedDict()
+        self._counts: Counter = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl > 0
+
+    # ------------------------------------------------------------------
+    # Embeddings (scope-independent)
+    # ------------------------------------------------------------------
+
+    def get_embedding(self, query: str) -> Optional[List[float]]:
+        if not self.enabled:
+            return None
+        key = normalize_query(query)
+        item = self._embeddings.get(key)
+        if item is not None and self._fresh(item[1]):
+            self._embeddings.move_to_end(key)
+            self._counts["embedding_hit"] += 1
+            return item[0]
+        if item is not None:
+            del self._embeddings[key]
+        self._counts["embedding_miss"] += 1
+        return None
+
+    def put_embedding(self, query: str, embedding: Sequence[float]) -> None:
+        if not self.enabled or not embedding:
+            return
+        key = normalize_query(query)
+        self._embeddings[key] = (list(embedding), time.monotonic())
+        self._embeddings.move_to_end(key)
+        while len(self._embeddings) > self.max_entries:
+            self._embeddings.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Query expansion
+    # ------------------------------------------------------------------
+
+    def get_expansion(
+        self,
+        scope: str,
+        scope_id: Optional[str],
+        query: str,
+        embedding: Optional[Sequence[float]] = None,
+        *,
+        count_miss: bool = True,
+    ) -> Optional[List[str]]:
+        """
+        Cached expansion variants for *query* (without the query itself).
+
+        Tries the exact normalized query first, then - if *embedding* is
+        given - the most similar cached query in the same scope.  Pass
+        ``count_miss=False`` for a first, embedding-less probe that will be
+        retried once the embedding is known.
+        """
+        if not self.enabled:
+            return None
+        entry = self._exact(scope, scope_id, query)
+        if entry is not None and entry.expansions is not None:
+            self._counts["expansion_exact"] += 1
+            return list(entry.expansions)
+        if embedding is not None:
+            entry = self._similar(
+                scope, scope_id, embedding, lambda e: e.expansions is not None
+            )
+            if entry is not None:
+                self._counts["expansion_similar"] += 1
+                return list(entry.expansions)
+        if count_miss:
+            self._counts["expansion_miss"] += 1
+        return None
+
+    def put_expansion(
+        self,
+        scope: str,
+        scope_id: Optional[str],
+        query: str,
+        expansions: Iterable[str],
+        embedding: Optional[Sequence[float]] = None,
+    ) -> None:
+        if not self.enabled:
+            return
+        entry = self._entry(scope, scope_id, query, embedding)
+        entry.expansions = [v for v in expansions if v != query]
+
+    # ------------------------------------------------------------------
+    # Rerank scores
+    # ------------------------------------------------------------------
+
+    def get_rerank(
+        self,
+        scope: str,
+        scope_id: Optional[str],
+        query: str,
+        fingerprint: str,
+        embedding: Optional[Sequence[float]] = None,
+    ) -> Optional[Dict[int, float]]:
+        """Cached ``{candidate index: score}`` for this exact candidate list."""
+        if not self.enabled:
+            return None
+        entry = self._exact(scope, scope_id, query)
+        if entry is not None and fingerprint in entry.rerank:
+            self._counts["rerank_exact"] += 1
+            return dict(entry.rerank[fingerprint])
+        if embedding is not None:
+            entry = self._similar(
+                scope, scope_id, embedding, lambda e: fingerprint in e.rerank
+            )
+            if entry is not None:
+                self._counts["rerank_similar"] += 1
+                return dict(entry.rerank[fingerprint])
+        self._counts["rerank_miss"] += 1
+        return None
+
+    def put_rerank(
+        self,
+        scope: str,
+        scope_id: Optional[str],
+        query: str,
+        fingerprint: str,
+        scores: Dict[int, float],
+        embedding: Optional[Sequence[float]] = None,
+        card_ids: Iterable[str] = (),
+    ) -> None:
+        if not self.enabled:
+            return
+        entry = self._entry(scope, scope_id, query, embedding)
+        entry.rerank[fingerprint] = dict(scores)
+        entry.card_ids.update(str(c) for c in card_ids if c)
+
+    # ------------------------------------------------------------------
+    # Invalidation, stats
+    # ------------------------------------------------------------------
+
+    def invalidate(self, card_id: Optional[str] = None) -> None:
+        """Drop entries that depend on *card_id* (everything if None)."""
+        if card_id is None:
+            self.clear()
+            return
+        card_id = str(card_id)
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if (key[0] == "signal" and key[1] == card_id) or card_id in entry.card_ids
+        ]
+        for key in stale:
+            del self._entries[key]
+        self._counts["invalidated"] += len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._embeddings.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry counts and hit rates per layer since process start."""
+        layers: Dict[str, Any] = {}
+        for layer, hit_kinds in (
+            ("embedding", ("hit",)),
+            ("expansion", ("exact", "similar")),
+            ("rerank", ("exact", "similar")),
+        ):
+            hits = {kind: self._counts[f"{layer}_{kind}"] for kind in hit_kinds}
+            misses = self._counts[f"{layer}_miss"]
+            total = sum(hits.values()) + misses
+            layers[layer] = {
+                **hits,
+                "miss": misses,
+                "hit_rate": round(sum(hits.values()) / total, 4) if total else 0.0,
+            }
+        return {
+            "entries": len(self._entries),
+            "embeddings": len(self._embeddings),
+            "evicted": self._counts["evicted"],
+            "invalidated": self._counts["invalidated"],
+            **layers,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _fresh(self, stored_at: float) -> bool:
+        return time.monotonic() - stored_at < self.ttl
+
+    @staticmethod
+    def _key(scope: str, scope_id: Optional[str], query: str) -> EntryKey:
+        return scope, str(scope_id or ""), normalize_query(query)
+
+    def _exact(
+        self, scope: str, scope_id: Optional[str], query: str
+    ) -> Optional[QueryEntry]:
+        key = self._key(scope, scope_id, query)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not self._fresh(entry.stored_at):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _similar(
+        self,
+        scope: str,
+        scope_id: Optional[str],
+        embedding: Sequence[float],
+        usable,
+    ) -> Optional[QueryEntry]:
+        query = _unit(embedding)
+        if query is None:
+            return None
+        scope_key = (scope, str(scope_id or ""))
+        keys, vectors = [], []
+        for key, entry in self._entries.items():
+            if (
+                key[:2] == scope_key
+                and entry.embedding is not None
+                and entry.embedding.size == query.size
+                and self._fresh(entry.stored_at)
+                and usable(entry)
+            ):
+                keys.append(key)
+                vectors.append(entry.embedding)
+        if not keys:
+            return None
+        sims = np.stack(vectors) @ query
+        best = int(np.argmax(sims))
+        if sims[best] < self.similarity:
+            return None
+        self._entries.move_to_end(keys[best])
+        return self._entries[keys[best]]
+
+    def _entry(
+        self,
+        scope: str,
+        scope_id: Optional[str],
+        query: str,
+        embedding: Optional[Sequence[float]],
+    ) -> QueryEntry:
+        key = self._key(scope, scope_id, query)
+        entry = self._exact(scope, scope_id, query)
+        if entry is None:
+            entry = QueryEntry(query=key[2], stored_at=time.monotonic())
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counts["evicted"] += 1
+        if entry.embedding is None and embedding is not None:
+            entry.embedding = _unit(embedding)
+        return entry
+
+
+def _unit(embedding: Sequence[float]) -> Optional[np.ndarray]:
+    vec = parse_embedding(embedding)
+    if vec is None:
+        return None
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm else None
+
+
+# Shared per-process instance
+rag_query_cache = RAGQueryCache()
@@ -18,12 +18,15 @@ import json
 import logging
 import os
 import re
+import uuid
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.helpers.db_utils import hybrid_search_cards, hybrid_search_sources
+from app.helpers.session_fanout import SessionFanout
+from app.rag_cache import candidate_fingerprint, rag_query_cache
 from app.models.db.card import Card
 from app.models.db.source import Source
 from app.models.db.card_extras import CardTimeline
@@ -51,9 +54,13 @@ class RAGEngine:
 
     MAX_CONTEXT_CHARS = 120_000  # ~30K tokens, generous for 1M context window
     MAX_MENTION_CONTEXT_CHARS = 15_000
+    MIN_SOURCE_CONTENT_CHARS = 200  # smaller leftover budgets skip source content
 
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
+        # Independent reads (search, enrichment) borrow their own sessions so
+        # asyncio.gather actually overlaps them; see app.helpers.session_fanout.
+        self._fanout = SessionFanout(db)
         self._ws_card_ids_cache: Dict[str, List[str]] = {}
 
     # ------------------------------------------------------------------
@@ -95,10 +102,9 @@ class RAGEngine:
 
         budget = max_context_chars or self.MAX_CONTEXT_CHARS
 
-        # Step 1 + 2: expand query & generate embedding (parallel)
-        expanded_queries, embedding = await asyncio.gather(
-            self._expand_query(query),
-            self._generate_embedding(query),
+        # Step 1 + 2: expand query & generate embedding (parallel, cached)
+        expanded_queries, embedding = await self._expand_and_embed(
+            query, scope, scope_id
         )
 
         # Step 3: hybrid search (cards + sources in parallel inside)
@@ -116,7 +122,7 @@ class RAGEngine:
         # Step 4 + 5: enrich + rerank (can run in parallel)
         enrichment, (reranked_cards, reranked_sources) = await asyncio.gather(
             self._enrich_context(scope, scope_id, search_results),
-            self._rerank_results(query, cards, sources),
+            self._rerank_results(query, cards, sources, scope, scope_id, embedding),
         )
 
         # Step 6: resolve @mentions
@@ -125,7 +131,7 @@ class RAGEngine:
             mention_data = await self._resolve_mentions(query, mentions)
 
         # Step 7: assemble final context
-        context_text, metadata = self._assemble_context(
+        context_text, metadata = await self._assemble_context(
             scope,
             scope_id,
             reranked_cards,
@@ -141,6 +147,45 @@ class RAGEngine:
     # Query expansion
     # ------------------------------------------------------------------
 
+    async def _expand_and_embed(
+        self, query: str, scope: str, scope_id: Optional[str]
+    ) -> Tuple[List[str], List[float]]:
+        """
+        Expanded queries and the query embedding, via ``rag_query_cache``.
+
+        On a cache miss both model calls start together as before; once the
+        embedding is known, a near-duplicate query cached in the same scope
+        supplies the expansion and the LLM call is cancelled.
+        """
+        embedding = rag_query_cache.get_embedding(query)
+        cached = rag_query_cache.get_expansion(
+            scope, scope_id, query, embedding, count_miss=embedding is not None
+        )
+        expand_task: Optional[asyncio.Task] = None
+        if cached is None:
+            expand_task = asyncio.ensure_future(self._expand_query(query))
+
+        if embedding is None:
+            embedding = await self._generate_embedding(query)
+            if embedding:
+                rag_query_cache.put_embedding(query, embedding)
+            if expand_task is not None:
+                cached = rag_query_cache.get_expansion(
+                    scope, scope_id, query, embedding or None
+                )
+                if cached is not None:
+                    expand_task.cancel()
+
+        if cached is not None:
+            return [query] + [v for v in cached if v != query], embedding
+
+        expanded = await expand_task
+        if len(expanded) > 1:  # [query] alone means expansion failed
+            rag_query_cache.put_expansion(
+                scope, scope_id, query, expanded, embedding or None
+            )
+        return expanded, embedding
+
     async def _expand_query(self, query: str) -> List[str]:
         """Use gpt-4.1-mini to produce 2-3 search-query variants."""
         try:
@@ -207,7 +252,7 @@ class RAGEngine:
     ) -> Dict[str, list]:
         """
         Run ``hybrid_search_cards`` and ``hybrid_search_sources``
-        in parallel and return their combined results.
+        in parallel (one session each) and return their combined results.
         """
         if not embedding:
             logger.warning(
@@ -250,8 +295,8 @@ class RAGEngine:
             source_kwargs["scope_card_ids"] = source_scope_ids
 
         # Execute both searches in parallel
-        card_task = hybrid_search_cards(self.db, **card_kwargs)
-        source_task = hybrid_search_sources(self.db, **source_kwargs)
+        card_task = self._fanout.run(hybrid_search_cards, **card_kwargs)
+        source_task = self._fanout.run(hybrid_search_sources, **source_kwargs)
 
         card_results, source_results = await asyncio.gather(card_task, source_task)
 
@@ -293,13 +338,14 @@ class RAGEngine:
         # Full card data (always fetch to get ALL columns)
         async def fetch_card() -> None:
             try:
-                result = await self.db.execute(select(Card).where(Card.id == card_id))
-                card = result.scalar_one_or_none()
-                if card:
-                    enrichment["primary_card"] = _card_to_dict(card)
-                    # If not already in search results, flag it
-                    if card_id not in existing_ids:
-                        enrichment["primary_card_missing_from_search"] = True
+                async with self._fanout.session() as db:
+                    result = await db.execute(select(Card).where(Card.id == card_id))
+                    card = result.scalar_one_or_none()
+                    if card:
+                        enrichment["primary_card"] = _card_to_dict(card)
+                        # If not already in search results, flag it
+                        if card_id not in existing_ids:
+                            enrichment["primary_card_missing_from_search"] = True
             except Exception:
                 logger.warning(
                     "Failed to fetch primary card %s", card_id, exc_info=True
@@ -308,22 +354,23 @@ class RAGEngine:
         # ALL sources for the primary card
         async def fetch_all_sources() -> None:
             try:
-                result = await self.db.execute(
-                    select(
-                        Source.id,
-                        Source.title,
-                        Source.url,
-                        Source.ai_summary,
-                        Source.key_excerpts,
-                        Source.full_text,
-                        Source.source_type,
-                        Source.publisher,
-                        Source.published_date,
-                        Source.relevance_score,
+                async with self._fanout.session() as db:
+                    result = await db.execute(
+                        select(
+                            Source.id,
+                            Source.title,
+                            Source.url,
+                            Source.ai_summary,
+                            Source.key_excerpts,
+                            Source.full_text.isnot(None).label("has_full_text"),
+                            Source.source_type,
+                            Source.publisher,
+                            Source.published_date,
+                            Source.relevance_score,
+                        )
+                        .where(Source.card_id == card_id)
+                        .order_by(Source.relevance_score.desc().nullslast())
                     )
-                    .where(Source.card_id == card_id)
-                    .order_by(Source.relevance_score.desc().nullslast())
-                )
                 rows = result.all()
                 enrichment["all_sources"] = [
                     {
@@ -332,7 +379,7 @@ class RAGEngine:
                         "url": r.url,
                         "ai_summary": r.ai_summary,
                         "key_excerpts": r.key_excerpts,
-                        "full_text": r.full_text,
+                        "has_full_text": r.has_full_text,
                         "source_type": r.source_type,
                         "publisher": r.publisher,
                         "published_date": (
@@ -353,18 +400,19 @@ class RAGEngine:
         # Timeline events
         async def fetch_timeline() -> None:
             try:
-                result = await self.db.execute(
-                    select(
-                        CardTimeline.event_type,
-                        CardTimeline.title,
-                        CardTimeline.description,
-                        CardTimeline.metadata_,
-                        CardTimeline.created_at,
+                async with self._fanout.session() as db:
+                    result = await db.execute(
+                        select(
+                            CardTimeline.event_type,
+                            CardTimeline.title,
+                            CardTimeline.description,
+                            CardTimeline.metadata_,
+                            CardTimeline.created_at,
+                        )
+                        .where(CardTimeline.card_id == card_id)
+                        .order_by(CardTimeline.created_at.desc())
+                        .limit(15)
                     )
-                    .where(CardTimeline.card_id == card_id)
-                    .order_by(CardTimeline.created_at.desc())
-                    .limit(15)
-                )
                 rows = result.all()
                 enrichment["timeline"] = [
                     {
@@ -387,19 +435,20 @@ class RAGEngine:
         # Research tasks
         async def fetch_research() -> None:
             try:
-                result = await self.db.execute(
-                    select(
-                        ResearchTask.task_type,
-                        ResearchTask.result_summary,
-                        ResearchTask.completed_at,
-                    )
-                    .where(
-                        ResearchTask.card_id == card_id,
-                        ResearchTask.status == "completed",
+                async with self._fanout.session() as db:
+                    result = await db.execute(
+                        select(
+                            ResearchTask.task_type,
+                            ResearchTask.result_summary,
+                            ResearchTask.completed_at,
+                        )
+                        .where(
+                            ResearchTask.card_id == card_id,
+                            ResearchTask.status == "completed",
+                        )
+                        .order_by(ResearchTask.completed_at.desc())
+                        .limit(3)
                     )
-                    .order_by(ResearchTask.completed_at.desc())
-                    .limit(3)
-                )
                 rows = result.all()
                 enrichment["research_tasks"] = [
                     {
@@ -427,100 +476,107 @@ class RAGEngine:
         """Fetch workstream details and all member cards' basic info."""
         enrichment: Dict[str, Any] = {}
 
-        try:
-            ws_result = await self.db.execute(
-                select(
-                    Workstream.id,
-                    Workstream.name,
-                    Workstream.description,
-                    Workstream.keywords,
-                    Workstream.pillar_ids,
-                    Workstream.goal_ids,
-                    Workstream.horizon,
-                ).where(Workstream.id == workstream_id)
-            )
-            ws = ws_result.one_or_none()
-            if ws:
-                enrichment["workstream"] = {
-                    "id": str(ws.id),
-                    "name": ws.name,
-                    "description": ws.description,
-                    "keywords": ws.keywords,
-                    "pillar_ids": ws.pillar_ids,
-                    "goal_ids": ws.goal_ids,
-                    "horizon": ws.horizon,
-                }
-        except Exception:
-            logger.warning(
-                "Failed to fetch workstream %s", workstream_id, exc_info=True
-            )
+        # Workstream details and member cards are independent reads
+        async def fetch_workstream() -> None:
+            try:
+                async with self._fanout.session() as db:
+                    ws_result = await db.execute(
+                        select(
+                            Workstream.id,
+                            Workstream.name,
+                            Workstream.description,
+                            Workstream.keywords,
+                            Workstream.pillar_ids,
+                            Workstream.goal_ids,
+                            Workstream.horizon,
+                        ).where(Workstream.id == workstream_id)
+                    )
+                ws = ws_result.one_or_none()
+                if ws:
+                    enrichment["workstream"] = {
+                        "id": str(ws.id),
+                        "name": ws.name,
+                        "description": ws.description,
+                        "keywords": ws.keywords,
+                        "pillar_ids": ws.pillar_ids,
+                        "goal_ids": ws.goal_ids,
+                        "horizon": ws.horizon,
+                    }
+            except Exception:
+                logger.warning(
+                    "Failed to fetch workstream %s", workstream_id, exc_info=True
+                )
 
-        try:
-            card_ids = await self._fetch_workstream_card_ids(workstream_id)
-            if card_ids:
-                cards_result = await self.db.execute(
-                    select(
-                        Card.id,
-                        Card.slug,
-                        Card.name,
-                        Card.summary,
-                        Card.pillar_id,
-                        Card.horizon,
-                        Card.stage_id,
-                        Card.pipeline_status,
-                        Card.impact_score,
-                        Card.relevance_score,
-                        Card.velocity_score,
-                    ).where(Card.id.in_(card_ids))
+        async def fetch_cards() -> None:
+            try:
+                card_ids = await self._fetch_workstream_card_ids(workstream_id)
+                if card_ids:
+                    async with self._fanout.session() as db:
+                        cards_result = await db.execute(
+                            select(
+                                Card.id,
+                                Card.slug,
+                                Card.name,
+                                Card.summary,
+                                Card.pillar_id,
+                                Card.horizon,
+                                Card.stage_id,
+                                Card.pipeline_status,
+                                Card.impact_score,
+                                Card.relevance_score,
+                                Card.velocity_score,
+                            ).where(Card.id.in_(card_ids))
+                        )
+                    rows = cards_result.all()
+                    enrichment["workstream_cards"] = [
+                        {
+                            "id": str(r.id),
+                            "slug": r.slug,
+                            "name": r.name,
+                            "summary": r.summary,
+                            "pillar_id": r.pillar_id,
+                            "horizon": r.horizon,
+                            "stage_id": r.stage_id,
+                            "pipeline_status": getattr(r, "pipeline_status", None),
+                            "impact_score": r.impact_score,
+                            "relevance_score": r.relevance_score,
+                            "velocity_score": (
+                                float(r.velocity_score) if r.velocity_score else None
+                            ),
+                        }
+                        for r in rows
+                    ]
+                else:
+                    enrichment["workstream_cards"] = []
+            except Exception:
+                logger.warning(
+                    "Failed to fetch workstream cards for %s",
+                    workstream_id,
+                    exc_info=True,
                 )
-                rows = cards_result.all()
-                enrichment["workstream_cards"] = [
-                    {
-                        "id": str(r.id),
-                        "slug": r.slug,
-                        "name": r.name,
-                        "summary": r.summary,
-                        "pillar_id": r.pillar_id,
-                        "horizon": r.horizon,
-                        "stage_id": r.stage_id,
-                        "pipeline_status": getattr(r, "pipeline_status", None),
-                        "impact_score": r.impact_score,
-                        "relevance_score": r.relevance_score,
-                        "velocity_score": (
-                            float(r.velocity_score) if r.velocity_score else None
-                        ),
-                    }
-                    for r in rows
-                ]
-            else:
                 enrichment["workstream_cards"] = []
-        except Exception:
-            logger.warning(
-                "Failed to fetch workstream cards for %s",
-                workstream_id,
-                exc_info=True,
-            )
-            enrichment["workstream_cards"] = []
 
+        await asyncio.gather(fetch_workstream(), fetch_cards())
         return enrichment
 
     async def _enrich_global(self) -> Dict[str, Any]:
         """Fetch active pattern insights for cross-signal context."""
         enrichment: Dict[str, Any] = {}
         try:
-            result = await self.db.execute(
-                select(
-                    PatternInsight.pattern_title,
-                    PatternInsight.pattern_summary,
-                    PatternInsight.opportunity,
-                    PatternInsight.affected_pillars,
-                    PatternInsight.urgency,
-                    PatternInsight.confidence,
+            async with self._fanout.session() as db:
+                result = await db.execute(
+                    select(
+                        PatternInsight.pattern_title,
+                        PatternInsight.pattern_summary,
+                        PatternInsight.opportunity,
+                        PatternInsight.affected_pillars,
+                        PatternInsight.urgency,
+                        PatternInsight.confidence,
+                    )
+                    .where(PatternInsight.status == "active")
+                    .order_by(PatternInsight.created_at.desc())
+                    .limit(10)
                 )
-                .where(PatternInsight.status == "active")
-                .order_by(PatternInsight.created_at.desc())
-                .limit(10)
-            )
             rows = result.all()
             enrichment["pattern_insights"] = [
                 {
@@ -658,11 +714,17 @@ class RAGEngine:
         query: str,
         cards: List[Dict[str, Any]],
         sources: List[Dict[str, Any]],
+        scope: str = "global",
+        scope_id: Optional[str] = None,
+        embedding: Optional[List[float]] = None,
     ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
         Use gpt-4.1-mini to rerank the top candidates by relevance.
 
-        Falls back to original ordering on any failure.
+        Scores are cached in ``rag_query_cache`` against a fingerprint of
+        the candidate list, so a repeated (or near-duplicate) question over
+        the same candidates skips the LLM call.  Falls back to original
+        ordering on any failure.
         """
         if not cards and not sources:
             return cards, sources
@@ -685,43 +747,24 @@ class RAGEngine:
             return cards, sources
 
         numbered = "\n".join(f"{c['index']}. {c['text']}" for c in candidates)
+        fingerprint = candidate_fingerprint(numbered)
 
         try:
-            response = await azure_openai_async_client.chat.completions.create(
-                model=get_chat_mini_deployment(),
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are a relevance judge. Given a query and numbered results, "
-                            "rate each result 1-10 for relevance. Return ONLY valid JSON: "
-                            '[{"index": N, "score": N}, ...]'
-                        ),
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Query: {query}\n\nResults:\n{numbered}",
-                    },
-                ],
-                max_tokens=300,
-                temperature=0,
-                timeout=15,
+            score_map = rag_query_cache.get_rerank(
+                scope, scope_id, query, fingerprint, embedding or None
             )
-
-            raw = (response.choices[0].message.content or "").strip()
-            # Strip markdown code fences if present
-            if raw.startswith("```"):
-                raw = re.sub(r"^```(?:json)?\s*", "", raw)
-                raw = re.sub(r"\s*```$", "", raw)
-            scores = json.loads(raw)
-
-            # Build a score lookup
-            score_map: Dict[int, float] = {}
-            for item in scores:
-                idx = item.get("index")
-                sc = item.get("score", 0)
-                if idx is not None:
-                    score_map[int(idx)] = float(sc)
+            if score_map is None:
+                score_map = await self._score_candidates(query, numbered)
+                rag_query_cache.put_rerank(
+                    scope,
+                    scope_id,
+                    query,
+                    fingerprint,
+                    score_map,
+                    embedding or None,
+                    card_ids=[c.get("id") for c in cards[:15]]
+                    + [s.get("card_id") for s in sources[:15]],
+                )
 
             # Separate card and source scores
             card_scores: List[Tuple[int, float]] = []
@@ -759,11 +802,50 @@ class RAGEngine:
             logger.warning("Reranking failed; returning original order", exc_info=True)
             return cards, sources
 
+    async def _score_candidates(self, query: str, numbered: str) -> Dict[int, float]:
+        """Ask the LLM for ``{candidate index: relevance 1-10}``."""
+        response = await azure_openai_async_client.chat.completions.create(
+            model=get_chat_mini_deployment(),
+            messages=[
+                {
+                    "role": "system",
+                    "content": (
+                        "You are a relevance judge. Given a query and numbered results, "
+                        "rate each result 1-10 for relevance. Return ONLY valid JSON: "
+                        '[{"index": N, "score": N}, ...]'
+                    ),
+                },
+                {
+                    "role": "user",
+                    "content": f"Query: {query}\n\nResults:\n{numbered}",
+                },
+            ],
+            max_tokens=300,
+            temperature=0,
+            timeout=15,
+        )
+
+        raw = (response.choices[0].message.content or "").strip()
+        # Strip markdown code fences if present
+        if raw.startswith("```"):
+            raw = re.sub(r"^```(?:json)?\s*", "", raw)
+            raw = re.sub(r"\s*```$", "", raw)
+        scores = json.loads(raw)
+
+        # Build a score lookup
+        score_map: Dict[int, float] = {}
+        for item in scores:
+            idx = item.get("index")
+            sc = item.get("score", 0)
+            if idx is not None:
+                score_map[int(idx)] = float(sc)
+        return score_map
+
     # ------------------------------------------------------------------
     # Context assembly
     # ------------------------------------------------------------------
 
-    def _assemble_context(
+    async def _assemble_context(
         self,
         scope: str,
         scope_id: Optional[str],
@@ -776,7 +858,11 @@ class RAGEngine:
         """
         Build the final context string and source_map for citation resolution.
 
-        Truncates from the bottom (lowest-ranked results) if the budget is exceeded.
+        Source ``full_text`` is not loaded by retrieval: the context is first
+        built with placeholders, then :meth:`_fill_source_content` fetches
+        server-side truncated slices for the highest-ranked sources that fit
+        the remaining budget.  Truncates from the bottom (lowest-ranked
+        results) if the budget is still exceeded.
         """
         parts: List[str] = []
         source_map: Dict[int, Dict[str, Any]] = {}
@@ -838,8 +924,9 @@ class RAGEngine:
                                 parts.append("      Key excerpts:")
                                 for exc in excerpts[:3]:
                                     parts.append(f"        - {exc}")
-                        if src.get("full_text"):
-                            parts.append(f"      Content: {src['full_text'][:5000]}")
+                        content = _source_content(src, 5000)
+                        if content:
+                            parts.append(f"      Content: {content}")
                         source_idx += 1
 
                 parts.append("")  # blank line between signals
@@ -864,8 +951,9 @@ class RAGEngine:
                 )
                 if src.get("ai_summary"):
                     parts.append(f"      {src['ai_summary']}")
-                if src.get("full_text"):
-                    parts.append(f"      {src['full_text'][:3000]}")
+                content = _source_content(src, 3000)
+                if content:
+                    parts.append(f"      {content}")
                 source_idx += 1
 
         # ---- Section 3: Scope-specific enrichment ----
@@ -881,8 +969,8 @@ class RAGEngine:
             if mention_text:
                 parts.append(mention_text)
 
-        # ---- Truncation from bottom ----
-        context_text = "\n".join(parts)
+        # ---- Source content, then truncation from bottom ----
+        context_text = await self._fill_source_content("\n".join(parts), max_chars)
         if len(context_text) > max_chars:
             context_text = context_text[:max_chars] + "\n\n[Context truncated]"
 
@@ -911,6 +999,59 @@ class RAGEngine:
 
         return context_text, metadata
 
+    async def _fill_source_content(self, text: str, max_chars: int) -> str:
+        """
+        Replace source-content placeholders with ``left(full_text, n)`` slices.
+
+        Placeholders are filled in context order (search rank first) while
+        budget remains; each gets at most its own cap and at least
+        :pyattr:`MIN_SOURCE_CONTENT_CHARS`.  Lines whose placeholder gets no
+        budget, or whose source has no text, are dropped.
+        """
+        placeholders = list(_CONTENT_PLACEHOLDER.finditer(text))
+        if not placeholders:
+            return text
+
+        remaining = max_chars - len(_CONTENT_PLACEHOLDER.sub(r"\1\4", text))
+        limits: Dict[str, int] = {}
+        for match in placeholders:
+            source_id, cap = match.group(2), int(match.group(3))
+            take = min(cap, remaining)
+            if take < self.MIN_SOURCE_CONTENT_CHARS:
+                break
+            if source_id not in limits:
+                limits[source_id] = take
+                remaining -= take
+
+        texts: Dict[str, str] = {}
+        if limits:
+            try:
+                texts = await self._fetch_source_text(limits)
+            except Exception:
+                logger.warning("Failed to fetch source content", exc_info=True)
+
+        def fill(match: re.Match) -> str:
+            content = texts.get(match.group(2))
+            if not content:
+                return ""
+            return f"{match.group(1)}{content[: int(match.group(3))]}{match.group(4)}"
+
+        return _CONTENT_PLACEHOLDER.sub(fill, text)
+
+    async def _fetch_source_text(self, limits: Dict[str, int]) -> Dict[str, str]:
+        """``{source_id: full_text[:n]}``, truncated server-side."""
+        lengths = {uuid.UUID(source_id): n for source_id, n in limits.items()}
+        async with self._fanout.session() as db:
+            result = await db.execute(
+                select(
+                    Source.id,
+                    func.left(
+                        Source.full_text, case(lengths, value=Source.id)
+                    ).label("content"),
+                ).where(Source.id.in_(list(lengths)), Source.full_text.isnot(None))
+            )
+        return {str(r.id): r.content for r in result.all()}
+
     # ------------------------------------------------------------------
     # Enrichment formatters
     # ------------------------------------------------------------------
@@ -956,8 +1097,9 @@ class RAGEngine:
                     parts.append(f"  [{source_idx}] {src.get('title', 'Untitled')}")
                     if src.get("ai_summary"):
                         parts.append(f"      Summary: {src['ai_summary']}")
-                    if src.get("full_text"):
-                        parts.append(f"      Content: {src['full_text'][:3000]}")
+                    content = _source_content(src, 3000)
+                    if content:
+                        parts.append(f"      Content: {content}")
                     source_idx += 1
 
             # Timeline
@@ -1127,11 +1269,12 @@ class RAGEngine:
             return self._ws_card_ids_cache[workstream_id]
 
         try:
-            result = await self.db.execute(
-                select(WorkstreamCard.card_id)
-                .where(WorkstreamCard.workstream_id == workstream_id)
-                .limit(50)
-            )
+            async with self._fanout.session() as db:
+                result = await db.execute(
+                    select(WorkstreamCard.card_id)
+                    .where(WorkstreamCard.workstream_id == workstream_id)
+                    .limit(50)
+                )
             card_ids = [str(wc.card_id) for wc in result.all()]
             self._ws_card_ids_cache[workstream_id] = card_ids
             return card_ids
@@ -1269,6 +1412,25 @@ def _sanitize_fts_query(q: str) -> str:
     return re.sub(r"[():<>!|&]", " ", q).strip()
 
 
+# "<prefix>\x00<source id>:<max chars>\x00" on its own line; see _source_content
+_CONTENT_PLACEHOLDER = re.compile(r"^([^\n\x00]*)\x00([^:\x00]+):(\d+)\x00(\n?)", re.M)
+
+
+def _source_content(src: Dict[str, Any], max_chars: int) -> Optional[str]:
+    """
+    Text to show for a source's full content, at most *max_chars*.
+
+    Retrieval rows only say whether a source ``has_full_text``; for those a
+    placeholder is returned that :meth:`RAGEngine._fill_source_content`
+    replaces once the remaining context budget is known.
+    """
+    if src.get("full_text"):
+        return src["full_text"][:max_chars]
+    if src.get("has_full_text") and src.get("id"):
+        return f"\x00{src['id']}:{max_chars}\x00"
+    return None
+
+
 def _extract_mention_titles(text: str) -> List[str]:
     """Extract ``@[Title]`` patterns from a message string."""
     return re.findall(r"@\[([^\]]+)\]", text)
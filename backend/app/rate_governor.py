@@ -0,0 +1,288 @@
+"""
+Process-wide rate governor for outbound search / grant APIs.
+
+Every request to Grants.gov, SAM.gov, the web search backend and arXiv
+first takes a token from that provider's bucket via
+:meth:`RateGovernor.acquire`.  One bucket per provider is shared by every
+caller in the process (chat tools, discovery runs, workstream scans), so
+concurrent work is paced together instead of each call site sleeping on
+its own and retrying into 429s.
+
+- **Token buckets**: ``RATE_LIMIT_<PROVIDER>_PER_SECOND`` refill rate and
+  ``RATE_LIMIT_<PROVIDER>_BURST`` capacity.
+- **Priority classes**: waiters are served interactive first, then normal,
+  then batch (FIFO within a class).  Chat tool calls run as
+  ``Priority.INTERACTIVE`` and worker jobs as ``Priority.BATCH``; anything
+  else is ``Priority.NORMAL``.  Set it for a block with
+  :func:`request_priority`.
+- **Daily quotas**: ``RATE_LIMIT_<PROVIDER>_DAILY`` (UTC day; SAM.gov
+  keys have one).  Batch calls stop once less than
+  ``RATE_LIMIT_QUOTA_RESERVE`` of the quota is left, keeping the rest for
+  interactive use.  Past the quota :class:`QuotaExhausted` is raised.
+- **Throttle feedback**: on a 429 the caller reports it with
+  :meth:`RateGovernor.throttle` (honouring ``Retry-After``), which pauses
+  the whole bucket so other callers stop sending too.
+
+Counters are per process; quotas shared by several processes (API and
+worker) should be split between them with the env settings.
+
+Usage:
+    from app.rate_governor import rate_governor
+
+    await rate_governor.acquire("sam_gov")
+    ...
+    rate_governor.throttle("sam_gov", retry_after)   # after a 429
+    rate_governor.stats()   # budgets and backlog, for monitoring
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import IntEnum
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_QUOTA_RESERVE = float(os.getenv("RATE_LIMIT_QUOTA_RESERVE", "0.1"))
+
+# Non-head waiters re-check at least this often (seconds).
+_POLL_SECONDS = 0.05
+
+
+class Priority(IntEnum):
+    """Request priority; lower values are served first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BATCH = 2
+
+
+_priority: ContextVar[Priority] = ContextVar(
+    "grantscope_rate_priority", default=Priority.NORMAL
+)
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Run outbound API calls made inside the block at *priority*."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+class QuotaExhausted(Exception):
+    """The provider's daily quota (or the share open to batch work) is spent."""
+
+
+@dataclass
+class ProviderLimit:
+    rate: float  # tokens per second
+    burst: float
+    daily_quota: Optional[int] = None
+
+
+def _limit_from_env(
+    provider: str, rate: str, burst: str, daily: str = ""
+) -> ProviderLimit:
+    prefix = f"RATE_LIMIT_{provider.upper()}"
+    quota = os.getenv(f"{prefix}_DAILY", daily)
+    return ProviderLimit(
+        rate=float(os.getenv(f"{prefix}_PER_SECOND", rate)),
+        burst=float(os.getenv(f"{prefix}_BURST", burst)),
+        daily_quota=int(quota) if quota else None,
+    )
+
+
+# arXiv asks for at most one request every three seconds; SAM.gov keys
+# default to 1,000 requests a day.
+DEFAULT_LIMITS: Dict[str, ProviderLimit] = {
+    "grants_gov": _limit_from_env("grants_gov", "5", "5"),
+    "sam_gov": _limit_from_env("sam_gov", "1", "2", "1000"),
+    "search": _limit_from_env("search", "5", "10"),
+    "arxiv": _limit_from_env("arxiv", "0.34", "1"),
+}
+
+
+@dataclass
+class TokenBucket:
+    """Priority-ordered token bucket with an optional daily quota."""
+
+    name: str
+    limit: ProviderLimit
+    tokens: float = field(init=False)
+    updated: float = field(default_factory=time.monotonic)
+    paused_until: float = 0.0
+    day: str = ""
+    used_today: int = 0
+    granted: int = 0
+    rejected: int = 0
+    throttled: int = 0
+    waited_seconds: float = 0.0
+    _waiters: List[List[Any]] = field(default_factory=list)
+    _seq: Iterator[int] = field(default_factory=itertools.count)
+
+    def __post_init__(self) -> None:
+        self.tokens = self.limit.burst
+
+    async def acquire(self, priority: Priority) -> float:
+        """Wait for a token; returns the seconds spent waiting."""
+        self._check_quota(priority)
+        started = time.monotonic()
+        entry = [int(priority), next(self._seq)]
+        heapq.heappush(self._waiters, entry)
+        try:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                head = self._waiters[0] is entry
+                if head and self.tokens >= 1 and now >= self.paused_until:
+                    self._check_quota(priority)
+                    heapq.heappop(self._waiters)
+                    self.tokens -= 1
+                    self.used_today += 1
+                    self.granted += 1
+                    waited = now - started
+                    self.waited_seconds += waited
+                    return waited
+                refill = (
+                    (1 - self.tokens) / self.limit.rate if self.limit.rate > 0 else 1.0
+                )
+                delay = max(self.paused_until - now, refill, 0.0)
+                if not head:
+                    delay = min(max(delay, 0.005), _POLL_SECONDS)
+                await asyncio.sleep(delay)
+        except BaseException:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+
+    def throttle(self, seconds: float) -> None:
+        """Pause the bucket after the provider pushed back (HTTP 429)."""
+        self.throttled += 1
+        self.tokens = min(self.tokens, 0.0)
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        self._refill(time.monotonic())
+        self._roll_day()
+        backlog = {p.name.lower(): 0 for p in Priority}
+        for priority, _seq in self._waiters:
+            backlog[Priority(priority).name.lower()] += 1
+        quota = self.limit.daily_quota
+        return {
+            "rate_per_second": self.limit.rate,
+            "burst": self.limit.burst,
+            "tokens": round(self.tokens, 2),
+            "paused_for_seconds": round(
+                max(0.0, self.paused_until - time.monotonic()), 2
+            ),
+            "backlog": backlog,
+            "granted": self.granted,
+            "rejected": self.rejected,
+            "throttled": self.throttled,
+            "avg_wait_seconds": (
+                round(self.waited_seconds / self.granted, 3) if self.granted else 0.0
+            ),
+            "daily_quota": quota,
+            "used_today": self.used_today,
+            "remaining_today": None if quota is None else quota - self.used_today,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.limit.burst, self.tokens + elapsed * self.limit.rate)
+        self.updated = now
+
+    def _roll_day(self) -> None:
+        today = datetime.now(timezone.utc).date().isoformat()
+        if today != self.day:
+            self.day = today
+            self.used_today = 0
+
+    def _check_quota(self, priority: Priority) -> None:
+        quota = self.limit.daily_quota
+        if quota is None:
+            return
+        self._roll_day()
+        remaining = quota - self.used_today
+        reserve = quota * RATE_LIMIT_QUOTA_RESERVE if priority == Priority.BATCH else 0
+        if remaining <= reserve:
+            self.rejected += 1
+            raise QuotaExhausted(
+                f"{self.name} daily quota exhausted for {priority.name.lower()} "
+                f"requests ({self.used_today}/{quota} used)"
+            )
+
+
+class RateGovernor:
+    """Per-provider token buckets shared by every caller in the process."""
+
+    def __init__(self, limits: Optional[Dict[str, ProviderLimit]] = None) -> None:
+        limits = DEFAULT_LIMITS if limits is None else limits
+        self._buckets = {
+            name: TokenBucket(name, limit) for name, limit in limits.items()
+        }
+
+    async def acquire(
+        self, provider: str, priority: Optional[Priority] = None
+    ) -> float:
+        """
+        Wait for the provider's next request slot.
+
+        Uses the caller's :func:`request_priority` unless *priority* is
+        given.  Providers without a configured limit pass straight through.
+
+        Raises:
+            QuotaExhausted: the provider's daily quota is spent.
+        """
+        bucket = self._buckets.get(provider)
+        if bucket is None:
+            return 0.0
+        if priority is None:
+            priority = _priority.get()
+        waited = await bucket.acquire(priority)
+        if waited >= 1.0:
+            logger.debug("Rate governor: waited %.1fs for %s", waited, provider)
+        return waited
+
+    def throttle(self, provider: str, seconds: float) -> None:
+        """Report a 429 (or similar push-back) so every caller backs off."""
+        bucket = self._buckets.get(provider)
+        if bucket is not None:
+            logger.warning("Rate governor: pausing %s for %.1fs", provider, seconds)
+            bucket.throttle(seconds)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Current budget, backlog by priority and counters per provider."""
+        return {name: bucket.stats() for name, bucket in sorted(self._buckets.items())}
+
+
+def retry_after_seconds(headers: Any, default: float) -> float:
+    """Seconds from a ``Retry-After`` header (delta-seconds form), else *default*."""
+    try:
+        value = float(headers.get("Retry-After", ""))
+    except (AttributeError, TypeError, ValueError):
+        return default
+    return value if value >= 0 else default
+
+
+# Shared per-process instance
+rate_governor = RateGovernor()
@@ -41,6 +41,24 @@ async def _generate_embedding(text: str) -> List[float]:
     return resp.data[0].embedding
 
 
+async def _fill_missing_embeddings(processed: List[ProcessedSource]) -> None:
+    """Regenerate embeddings for sources that lack one, in batched requests."""
+    from app.ai_service import AIService
+
+    pending = [ps for ps in processed if not ps.embedding]
+    if not pending:
+        return
+
+    ai_service = AIService(openai_client=azure_openai_async_embedding_client)
+    embeddings = await ai_service.generate_embeddings_batch(
+        [f"{ps.raw.title} {ps.analysis.summary}" for ps in pending]
+    )
+    for ps, embedding in zip(pending, embeddings):
+        if embedding is None:
+            logger.warning(f"Failed to generate embedding for {ps.raw.url}")
+        ps.embedding = embedding or []
+
+
 def _reconstruct_processed_source(ds) -> Optional[ProcessedSource]:
     """Reconstruct a ProcessedSource from a discovered_sources row.
 
@@ -210,13 +228,7 @@ async def recover_cards_from_discovered_sources(
 
     # Step 4: Regenerate embeddings (discovered_sources has them but as DB vectors)
     logger.info("Regenerating embeddings for recovered sources...")
-    for ps in processed:
-        try:
-            embed_text = f"{ps.raw.title} {ps.analysis.summary}"
-            ps.embedding = await _generate_embedding(embed_text)
-        except Exception as e:
-            logger.warning(f"Failed to generate embedding for {ps.raw.url}: {e}")
-            ps.embedding = []
+    await _fill_missing_embeddings(processed)
 
     # Step 5: Create a recovery discovery run record
     run_id = str(uuid.uuid4())
@@ -334,7 +346,7 @@ async def reprocess_errored_sources(
     from app.discovery_service import DiscoveryConfig
     from app.openai_provider import (
         azure_openai_client,
-    )  # Sync — AIService methods aren't truly async
+    )  # Sync client — AIService runs its calls on a worker thread
     from app.signal_agent_service import SignalAgentService
 
     logger.info(f"Starting reprocess of errored sources for {date_start} to {date_end}")
@@ -594,7 +606,7 @@ async def recover_analyzed_errors(
     from app.discovery_service import DiscoveryConfig
     from app.openai_provider import (
         azure_openai_client,
-    )  # Sync client — AIService methods aren't truly async
+    )  # Sync client — AIService runs its calls on a worker thread
     from app.signal_agent_service import SignalAgentService
 
     logger.info(f"Recovering errored sources for {date_start} to {date_end}")
@@ -735,14 +747,7 @@ async def recover_analyzed_errors(
 
     # Regenerate embeddings for fast-path sources (already analyzed)
     logger.info("Regenerating embeddings for pre-analyzed sources...")
-    for ps in processed:
-        if not ps.embedding:
-            try:
-                embed_text = f"{ps.raw.title} {ps.analysis.summary}"
-                ps.embedding = await _generate_embedding(embed_text)
-            except Exception as e:
-                logger.warning(f"Failed to generate embedding for {ps.raw.url}: {e}")
-                ps.embedding = []
+    await _fill_missing_embeddings(processed)
 
     # Create discovery run record
     run_id = str(uuid.uuid4())
@@ -281,6 +281,8 @@ def _card_to_dict(card: Card) -> dict:
     """Convert a Card ORM object to a dictionary for compatibility with existing code."""
     result = {}
     for col in Card.__table__.columns:
+        if col.key in ("embedding", "search_vector"):
+            continue  # deferred; never loaded with the card
         val = getattr(card, col.key, None)
         if isinstance(val, uuid_mod.UUID):
             val = str(val)
@@ -2143,7 +2145,7 @@ Research analyzed {len(source_analyses)} sources related to {card["name"]}.
                     try:
                         from .openai_provider import get_chat_mini_deployment
 
-                        evo_resp = self.ai_service.client.chat.completions.create(
+                        evo_resp = await self.ai_service.chat_completion(
                             model=get_chat_mini_deployment(),
                             messages=[{"role": "user", "content": evo_prompt}],
                             max_tokens=200,
@@ -15,6 +15,7 @@ from app.deps import get_db, _safe_error, limiter
 from app.chat.admin_deps import require_admin
 from app.models.db.card import Card
 from app.models.db.research import ResearchTask
+from app.job_notify import notify_job
 from app.routers.admin._helpers import _row_to_dict
 
 logger = logging.getLogger(__name__)
@@ -94,6 +95,7 @@ async def trigger_manual_scan(
 
         # Flush so the inserts are visible; commit happens on session close
         await db.flush()
+        await notify_job(db, "research")
 
         return {
             "status": "scan_triggered",
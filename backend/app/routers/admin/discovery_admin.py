@@ -22,6 +22,7 @@ from app.models.db.discovery import (
     DiscoverySchedule,
 )
 from app.models.db.system_settings import SystemSetting
+from app.job_notify import notify_job
 from app.routers.admin._helpers import _row_to_dict
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,7 @@ DISCOVERY_DEFAULTS: dict[str, Any] = {
     "discovery.auto_approve_threshold": 0.95,
     "discovery.dry_run": False,
     "discovery.pillars_filter": [],
+    "discovery.triage_concurrency": 8,
 }
 
 
@@ -188,6 +190,12 @@ async def update_discovery_config(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail="discovery.total_cap must be a positive integer",
                     )
+            elif key == "discovery.triage_concurrency":
+                if not isinstance(value, int) or value < 1 or value > 64:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="discovery.triage_concurrency must be an integer between 1 and 64",
+                    )
 
             result = await db.execute(
                 select(SystemSetting).where(SystemSetting.key == key)
@@ -449,6 +457,7 @@ async def trigger_discovery_run(
             pillars_scanned=body.pillars_filter or [],
         )
         db.add(new_run)
+        await notify_job(db, "discovery")
         await db.commit()
 
         logger.info(
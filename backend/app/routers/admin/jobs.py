@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.chat.admin_deps import require_admin
 from app.deps import get_db
 from app.models.db.research import ResearchTask
+from app.job_notify import notify_job
 from app.routers.admin._helpers import _row_to_dict
 
 logger = logging.getLogger(__name__)
@@ -138,6 +139,8 @@ async def retry_all_failed(
             )
         )
         retried = result.rowcount
+        if retried:
+            await notify_job(db, "research")
         await db.commit()
         return {"retried": retried}
 
@@ -351,6 +354,7 @@ async def retry_job(
         task.started_at = None
         task.result_summary = None
 
+        await notify_job(db, "research")
         await db.commit()
         await db.refresh(task)
 
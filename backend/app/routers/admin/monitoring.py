@@ -14,6 +14,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.chat.admin_deps import require_admin
 from app.database import engine
 from app.deps import get_db
+from app.llm_result_cache import llm_result_cache
+from app.multi_source_search import source_latency_stats
+from app.rag_cache import rag_query_cache
+from app.rate_governor import rate_governor
+from app.search_cache import search_cache
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -27,7 +32,21 @@ async def system_health(
     db: AsyncSession = Depends(get_db),
     _current_user: dict = Depends(require_admin),
 ):
-    """System health overview: DB latency, table counts, worker queue, embeddings, description quality."""
+    """System health overview.
+
+    Response sections:
+
+    - ``database``: ``SELECT 1`` latency
+    - ``counts``: row counts for the main tables
+    - ``worker``: research task queue depth and last completion
+    - ``embeddings``: card embedding coverage
+    - ``descriptions``: card description length buckets
+    - ``rag_cache``: RAG expansion / embedding / rerank cache hit rates
+    - ``llm_result_cache``: triage and analysis result cache hit rates
+    - ``search_sources``: per-source search latency histograms
+    - ``search_cache``: federated search result cache hit rates
+    - ``rate_limits``: outbound API token-bucket budgets
+    """
     try:
         # -- Database latency -----------------------------------------------
         t0 = time.time()
@@ -146,6 +165,11 @@ async def system_health(
             "worker": worker,
             "embeddings": embeddings,
             "descriptions": descriptions,
+            "rag_cache": rag_query_cache.stats(),
+            "llm_result_cache": llm_result_cache.stats(),
+            "search_sources": source_latency_stats(),
+            "search_cache": search_cache.stats(),
+            "rate_limits": rate_governor.stats(),
         }
 
     except HTTPException:
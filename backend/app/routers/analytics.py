@@ -515,7 +515,19 @@ async def get_analytics_insights(
         # -------------------------------------------------------------------------
         # Step 1: Fetch top cards (needed for both cache check and generation)
         # -------------------------------------------------------------------------
-        stmt = select(Card).where(Card.status == "active")
+        # Only the fields used for scoring and the prompt (not whole cards).
+        stmt = select(
+            Card.id,
+            Card.name,
+            Card.slug,
+            Card.summary,
+            Card.pillar_id,
+            Card.horizon,
+            Card.velocity_score,
+            Card.impact_score,
+            Card.relevance_score,
+            Card.novelty_score,
+        ).where(Card.status == "active")
 
         if pillar_id:
             stmt = stmt.where(Card.pillar_id == pillar_id)
@@ -523,7 +535,7 @@ async def get_analytics_insights(
         stmt = stmt.order_by(Card.velocity_score.desc().nullslast()).limit(limit * 2)
 
         result = await db.execute(stmt)
-        card_rows = result.scalars().all()
+        card_rows = result.all()
 
         if not card_rows:
             return InsightsResponse(
@@ -6,13 +6,14 @@ from datetime import datetime, date
 from decimal import Decimal
 from typing import Optional, List
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.deps import get_db, get_current_user_hardcoded, _safe_error, openai_client
 from app.brief_service import ExecutiveBriefService
+from app.export_jobs import ExportArtifact, artifact_from_file, artifact_response
 from app.export_service import ExportService
 from app.models.brief import (
     ExecutiveBriefResponse,
@@ -53,6 +54,8 @@ def _row_to_dict(obj, skip_cols=None) -> dict:
             result[col.name] = value.isoformat()
         elif isinstance(value, Decimal):
             result[col.name] = float(value)
+        elif isinstance(value, np.ndarray):
+            result[col.name] = value.tolist()
         else:
             result[col.name] = value
     return result
@@ -354,45 +357,20 @@ async def get_brief_status(
     )
 
 
-@router.get("/me/workstreams/{workstream_id}/cards/{card_id}/brief/export/{format}")
-async def export_brief(
+async def render_brief_export(
+    db: AsyncSession,
     workstream_id: str,
     card_id: str,
-    format: str,
+    format_lower: str,
     version: Optional[int] = None,
-    db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user_hardcoded),
-):
+) -> ExportArtifact:
     """
-    Export an executive brief in the specified format.
-
-    Exports the brief content (not the original card) as a PDF or PowerPoint
-    presentation formatted for executive communication.
-
-    Args:
-        workstream_id: UUID of the workstream
-        card_id: UUID of the card
-        format: Export format (pdf or pptx)
-        version: Optional version number to export (defaults to latest)
-        current_user: Authenticated user (injected)
-
-    Returns:
-        FileResponse with the exported brief document
+    Render an executive brief as PDF or PPTX (used by the endpoint and jobs).
 
     Raises:
-        HTTPException 400: Invalid export format
-        HTTPException 404: Workstream, card, or brief not found
-        HTTPException 403: Not authorized to access workstream
+        HTTPException 404: Card not in the workstream, or no brief
+        HTTPException 400: Brief is not yet complete
     """
-    # Validate format
-    format_lower = format.lower()
-    if format_lower not in ("pdf", "pptx"):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid export format: {format}. Supported formats: pdf, pptx",
-        )
-
-    await _verify_workstream_ownership(db, workstream_id, current_user["id"])
     wsc = await _get_workstream_card(db, workstream_id, card_id)
     workstream_card_id = str(wsc.id)
 
@@ -433,56 +411,103 @@ async def export_brief(
     # Generate export using ExportService
     export_service = ExportService(db)
 
-    try:
-        # Parse generated_at if present
-        generated_at = None
-        if brief.get("generated_at"):
-            if isinstance(brief["generated_at"], str):
-                generated_at = datetime.fromisoformat(
-                    brief["generated_at"].replace("Z", "+00:00")
-                )
-            else:
-                generated_at = brief["generated_at"]
-
-        if format_lower == "pdf":
-            # Use professional PDF with logo, branding, and AI disclosure
-            file_path = await export_service.generate_professional_brief_pdf(
-                brief_title=card_name,
-                card_name=card_name,
-                executive_summary=brief.get("summary", ""),
-                content_markdown=brief.get("content_markdown", ""),
-                generated_at=generated_at,
-                version=brief.get("version", 1),
-                classification=classification,
+    # Parse generated_at if present
+    generated_at = None
+    if brief.get("generated_at"):
+        if isinstance(brief["generated_at"], str):
+            generated_at = datetime.fromisoformat(
+                brief["generated_at"].replace("Z", "+00:00")
             )
-            content_type = "application/pdf"
-            extension = "pdf"
         else:
-            file_path = await export_service.generate_brief_pptx(
-                brief_title=card_name,
-                card_name=card_name,
-                executive_summary=brief.get("summary", ""),
-                content_markdown=brief.get("content_markdown", ""),
-                generated_at=generated_at,
-                version=brief.get("version", 1),
-                classification=classification,
-                use_gamma=True,  # Try Gamma.app first, fallback to local
-            )
-            content_type = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
-            extension = "pptx"
-
-        # Generate safe filename
-        safe_name = "".join(c if c.isalnum() or c in " -_" else "_" for c in card_name)
-        safe_name = safe_name[:50]  # Limit length
-        version_str = (
-            f"_v{brief.get('version', 1)}" if brief.get("version", 1) > 1 else ""
+            generated_at = brief["generated_at"]
+
+    if format_lower == "pdf":
+        # Use professional PDF with logo, branding, and AI disclosure
+        file_path = await export_service.generate_professional_brief_pdf(
+            brief_title=card_name,
+            card_name=card_name,
+            executive_summary=brief.get("summary", ""),
+            content_markdown=brief.get("content_markdown", ""),
+            generated_at=generated_at,
+            version=brief.get("version", 1),
+            classification=classification,
         )
-        filename = f"Brief_{safe_name}{version_str}.{extension}"
+        content_type = "application/pdf"
+        extension = "pdf"
+    else:
+        file_path = await export_service.generate_brief_pptx(
+            brief_title=card_name,
+            card_name=card_name,
+            executive_summary=brief.get("summary", ""),
+            content_markdown=brief.get("content_markdown", ""),
+            generated_at=generated_at,
+            version=brief.get("version", 1),
+            classification=classification,
+            use_gamma=True,  # Try Gamma.app first, fallback to local
+        )
+        content_type = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+        extension = "pptx"
+
+    # Generate safe filename
+    safe_name = "".join(c if c.isalnum() or c in " -_" else "_" for c in card_name)
+    safe_name = safe_name[:50]  # Limit length
+    version_str = (
+        f"_v{brief.get('version', 1)}" if brief.get("version", 1) > 1 else ""
+    )
+    filename = f"Brief_{safe_name}{version_str}.{extension}"
+
+    return artifact_from_file(file_path, filename, content_type)
+
+
+@router.get("/me/workstreams/{workstream_id}/cards/{card_id}/brief/export/{format}")
+async def export_brief(
+    workstream_id: str,
+    card_id: str,
+    format: str,
+    version: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user_hardcoded),
+):
+    """
+    Export an executive brief in the specified format.
+
+    Exports the brief content (not the original card) as a PDF or PowerPoint
+    presentation formatted for executive communication.
+
+    Renders inline; ``POST /api/v1/exports`` (kind ``brief``) queues the
+    same export for the worker and caches the result.
+
+    Args:
+        workstream_id: UUID of the workstream
+        card_id: UUID of the card
+        format: Export format (pdf or pptx)
+        version: Optional version number to export (defaults to latest)
+        current_user: Authenticated user (injected)
 
-        return FileResponse(
-            path=file_path, filename=filename, media_type=content_type, background=None
+    Returns:
+        Response with the exported brief document
+
+    Raises:
+        HTTPException 400: Invalid export format
+        HTTPException 404: Workstream, card, or brief not found
+        HTTPException 403: Not authorized to access workstream
+    """
+    # Validate format
+    format_lower = format.lower()
+    if format_lower not in ("pdf", "pptx"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid export format: {format}. Supported formats: pdf, pptx",
         )
 
+    await _verify_workstream_ownership(db, workstream_id, current_user["id"])
+
+    try:
+        artifact = await render_brief_export(
+            db, workstream_id, card_id, format_lower, version=version
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Brief export generation failed: {str(e)}")
         raise HTTPException(
@@ -490,6 +515,8 @@ async def export_brief(
             detail=_safe_error("export generation", e),
         ) from e
 
+    return artifact_response(artifact)
+
 
 # =============================================================================
 # Bulk Brief Export (Portfolio)
@@ -572,32 +599,18 @@ async def get_bulk_brief_status(
     )
 
 
-@router.post("/me/workstreams/{workstream_id}/bulk-brief-export")
-async def bulk_brief_export(
+async def render_portfolio_export(
+    db: AsyncSession,
     workstream_id: str,
-    request: BulkExportRequest,
-    db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user_hardcoded),
-):
+    format_lower: str,
+    card_order: List[str],
+    workstream_name: Optional[str] = None,
+) -> ExportArtifact:
     """
-    Export multiple briefs as a single portfolio presentation.
-
-    Generates an AI-synthesized portfolio deck combining briefs from
-    multiple cards in the Brief column. Uses Gamma.app for PPTX with
-    fallback to local generation.
-
-    Args:
-        workstream_id: UUID of the workstream
-        request: BulkExportRequest with format and card order
-        current_user: Authenticated user (injected)
-
-    Returns:
-        FileResponse with the exported portfolio document
+    Render a portfolio of briefs as PDF or PPTX (used by the endpoint and jobs).
 
     Raises:
-        HTTPException 400: Invalid format, no cards, or >15 cards
-        HTTPException 403: Not authorized
-        HTTPException 404: Workstream not found
+        HTTPException 400: None of the cards has a completed brief
     """
     from app.brief_service import ExecutiveBriefService, PortfolioBrief
     from app.gamma_service import (
@@ -607,33 +620,19 @@ async def bulk_brief_export(
         calculate_slides_per_card,
     )
 
-    # Validate format
-    format_lower = request.format.lower()
-    if format_lower not in ("pdf", "pptx"):
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid format: {request.format}. Supported: pdf, pptx",
-        )
-
-    # Validate card count
-    if not request.card_order:
-        raise HTTPException(status_code=400, detail="No cards provided for export")
-
-    if len(request.card_order) > 15:
-        raise HTTPException(
-            status_code=400,
-            detail="Maximum 15 cards per portfolio. Archive some cards or create separate workstreams.",
+    if workstream_name is None:
+        ws_result = await db.execute(
+            select(Workstream.name).where(Workstream.id == workstream_id)
         )
-
-    ws = await _verify_workstream_ownership(db, workstream_id, current_user["id"])
-    workstream_name = ws.name or "Strategic Portfolio"
+        workstream_name = ws_result.scalar_one_or_none()
+    workstream_name = workstream_name or "Strategic Portfolio"
 
     # Fetch briefs in the specified order
     brief_service = ExecutiveBriefService(db, openai_client)
     portfolio_briefs = []
     skipped_cards = []
 
-    for cid in request.card_order:
+    for cid in card_order:
         # Get workstream_card record
         wsc_stmt = (
             select(WorkstreamCard)
@@ -664,7 +663,7 @@ async def bulk_brief_export(
             skipped_cards.append(cid)
             continue
 
-        card_data = _row_to_dict(card_row)
+        card_data = _row_to_dict(card_row, skip_cols={"embedding", "search_vector"})
 
         portfolio_briefs.append(
             PortfolioBrief(
@@ -694,139 +693,189 @@ async def bulk_brief_export(
     if skipped_cards:
         logger.warning(f"Skipped {len(skipped_cards)} cards without completed briefs")
 
-    try:
-        # Step 1: Generate AI synthesis
-        logger.info("Generating portfolio synthesis...")
-        synthesis = await brief_service.synthesize_portfolio(
-            briefs=portfolio_briefs, workstream_name=workstream_name
-        )
+    # Step 1: Generate AI synthesis
+    logger.info("Generating portfolio synthesis...")
+    synthesis = await brief_service.synthesize_portfolio(
+        briefs=portfolio_briefs, workstream_name=workstream_name
+    )
 
-        # Convert to Gamma format
-        gamma_cards = [
-            PortfolioCard(
-                card_id=b.card_id,
-                card_name=b.card_name,
-                pillar_id=b.pillar_id,
-                horizon=b.horizon,
-                stage_id=b.stage_id,
-                brief_summary=b.brief_summary,
-                brief_content=b.brief_content_markdown[:1500],  # Truncate for slides
-                impact_score=b.impact_score,
-                relevance_score=b.relevance_score,
-            )
-            for b in portfolio_briefs
-        ]
-
-        synthesis_data = PortfolioSynthesisData(
-            executive_overview=synthesis.executive_overview,
-            key_themes=synthesis.key_themes,
-            priority_matrix=synthesis.priority_matrix,
-            cross_cutting_insights=synthesis.cross_cutting_insights,
-            recommended_actions=synthesis.recommended_actions,
-            urgency_statement=synthesis.urgency_statement,
-            implementation_guidance=synthesis.implementation_guidance,
-            ninety_day_actions=synthesis.ninety_day_actions,
-            risk_summary=synthesis.risk_summary,
-            opportunity_summary=synthesis.opportunity_summary,
+    # Convert to Gamma format
+    gamma_cards = [
+        PortfolioCard(
+            card_id=b.card_id,
+            card_name=b.card_name,
+            pillar_id=b.pillar_id,
+            horizon=b.horizon,
+            stage_id=b.stage_id,
+            brief_summary=b.brief_summary,
+            brief_content=b.brief_content_markdown[:1500],  # Truncate for slides
+            impact_score=b.impact_score,
+            relevance_score=b.relevance_score,
         )
+        for b in portfolio_briefs
+    ]
+
+    synthesis_data = PortfolioSynthesisData(
+        executive_overview=synthesis.executive_overview,
+        key_themes=synthesis.key_themes,
+        priority_matrix=synthesis.priority_matrix,
+        cross_cutting_insights=synthesis.cross_cutting_insights,
+        recommended_actions=synthesis.recommended_actions,
+        urgency_statement=synthesis.urgency_statement,
+        implementation_guidance=synthesis.implementation_guidance,
+        ninety_day_actions=synthesis.ninety_day_actions,
+        risk_summary=synthesis.risk_summary,
+        opportunity_summary=synthesis.opportunity_summary,
+    )
+
+    # Step 2: Generate presentation
+    if format_lower == "pptx":
+        # Try Gamma first
+        gamma_service = GammaPortfolioService()
 
-        # Step 2: Generate presentation
-        if format_lower == "pptx":
-            # Try Gamma first
-            gamma_service = GammaPortfolioService()
-
-            if gamma_service.is_available():
-                logger.info(
-                    f"Generating portfolio via Gamma for {len(gamma_cards)} cards..."
-                )
-                result = await gamma_service.generate_portfolio_presentation(
-                    workstream_name=workstream_name,
-                    cards=gamma_cards,
-                    synthesis=synthesis_data,
-                    include_images=True,
-                    export_format="pptx",
-                )
-
-                if result.success and result.pptx_url:
-                    # Download from Gamma
-                    from app.gamma_service import GammaService
-
-                    gamma_dl = GammaService()
-                    pptx_bytes = await gamma_dl.download_export(result.pptx_url)
-
-                    if pptx_bytes:
-                        import tempfile
-
-                        temp_file = tempfile.NamedTemporaryFile(
-                            suffix=".pptx", delete=False, prefix="grantscope_portfolio_"
-                        )
-                        temp_file.write(pptx_bytes)
-                        temp_file.close()
-
-                        safe_name = "".join(
-                            c if c.isalnum() or c in " -_" else "_"
-                            for c in workstream_name
-                        )[:40]
-                        filename = f"Portfolio_{safe_name}.pptx"
-
-                        logger.info(
-                            f"Portfolio generated via Gamma: {len(portfolio_briefs)} cards"
-                        )
-
-                        return FileResponse(
-                            path=temp_file.name,
-                            filename=filename,
-                            media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                        )
-
-                logger.warning(
-                    f"Gamma portfolio failed: {result.error_message}, falling back to local"
-                )
-            else:
-                logger.info(
-                    "Gamma API not available (no API key or disabled), using local generation"
-                )
-
-            # Fallback to local PPTX generation
-            logger.info("Generating portfolio locally...")
-            export_service = ExportService(db)
-            file_path = await export_service.generate_portfolio_pptx_local(
+        if gamma_service.is_available():
+            logger.info(
+                f"Generating portfolio via Gamma for {len(gamma_cards)} cards..."
+            )
+            result = await gamma_service.generate_portfolio_presentation(
                 workstream_name=workstream_name,
-                briefs=portfolio_briefs,
+                cards=gamma_cards,
                 synthesis=synthesis_data,
+                include_images=True,
+                export_format="pptx",
             )
 
-            safe_name = "".join(
-                c if c.isalnum() or c in " -_" else "_" for c in workstream_name
-            )[:40]
-            filename = f"Portfolio_{safe_name}.pptx"
+            if result.success and result.pptx_url:
+                # Download from Gamma
+                from app.gamma_service import GammaService
 
-            return FileResponse(
-                path=file_path,
-                filename=filename,
-                media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            )
+                gamma_dl = GammaService()
+                pptx_bytes = await gamma_dl.download_export(result.pptx_url)
+
+                if pptx_bytes:
+                    safe_name = "".join(
+                        c if c.isalnum() or c in " -_" else "_"
+                        for c in workstream_name
+                    )[:40]
+                    filename = f"Portfolio_{safe_name}.pptx"
+
+                    logger.info(
+                        f"Portfolio generated via Gamma: {len(portfolio_briefs)} cards"
+                    )
 
+                    return ExportArtifact(
+                        filename=filename,
+                        media_type=EXPORT_CONTENT_TYPES[ExportFormat.PPTX],
+                        data=pptx_bytes,
+                    )
+
+            logger.warning(
+                f"Gamma portfolio failed: {result.error_message}, falling back to local"
+            )
         else:
-            # PDF generation - expanded detail format
-            export_service = ExportService(db)
-            file_path = await export_service.generate_portfolio_pdf(
-                workstream_name=workstream_name,
-                briefs=portfolio_briefs,
-                synthesis=synthesis_data,
+            logger.info(
+                "Gamma API not available (no API key or disabled), using local generation"
             )
 
-            safe_name = "".join(
-                c if c.isalnum() or c in " -_" else "_" for c in workstream_name
-            )[:40]
-            filename = f"Portfolio_{safe_name}.pdf"
+        # Fallback to local PPTX generation
+        logger.info("Generating portfolio locally...")
+        export_service = ExportService(db)
+        file_path = await export_service.generate_portfolio_pptx_local(
+            workstream_name=workstream_name,
+            briefs=portfolio_briefs,
+            synthesis=synthesis_data,
+        )
 
-            return FileResponse(
-                path=file_path, filename=filename, media_type="application/pdf"
-            )
+        safe_name = "".join(
+            c if c.isalnum() or c in " -_" else "_" for c in workstream_name
+        )[:40]
+        filename = f"Portfolio_{safe_name}.pptx"
+
+        return artifact_from_file(
+            file_path, filename, EXPORT_CONTENT_TYPES[ExportFormat.PPTX]
+        )
+
+    else:
+        # PDF generation - expanded detail format
+        export_service = ExportService(db)
+        file_path = await export_service.generate_portfolio_pdf(
+            workstream_name=workstream_name,
+            briefs=portfolio_briefs,
+            synthesis=synthesis_data,
+        )
+
+        safe_name = "".join(
+            c if c.isalnum() or c in " -_" else "_" for c in workstream_name
+        )[:40]
+        filename = f"Portfolio_{safe_name}.pdf"
+
+        return artifact_from_file(file_path, filename, "application/pdf")
+
+
+@router.post("/me/workstreams/{workstream_id}/bulk-brief-export")
+async def bulk_brief_export(
+    workstream_id: str,
+    request: BulkExportRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user_hardcoded),
+):
+    """
+    Export multiple briefs as a single portfolio presentation.
+
+    Generates an AI-synthesized portfolio deck combining briefs from
+    multiple cards in the Brief column. Uses Gamma.app for PPTX with
+    fallback to local generation.
+
+    Renders inline; ``POST /api/v1/exports`` (kind ``portfolio``) queues the
+    same export for the worker and caches the result.
+
+    Args:
+        workstream_id: UUID of the workstream
+        request: BulkExportRequest with format and card order
+        current_user: Authenticated user (injected)
+
+    Returns:
+        Response with the exported portfolio document
+
+    Raises:
+        HTTPException 400: Invalid format, no cards, or >15 cards
+        HTTPException 403: Not authorized
+        HTTPException 404: Workstream not found
+    """
+    # Validate format
+    format_lower = request.format.lower()
+    if format_lower not in ("pdf", "pptx"):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid format: {request.format}. Supported: pdf, pptx",
+        )
+
+    # Validate card count
+    if not request.card_order:
+        raise HTTPException(status_code=400, detail="No cards provided for export")
+
+    if len(request.card_order) > 15:
+        raise HTTPException(
+            status_code=400,
+            detail="Maximum 15 cards per portfolio. Archive some cards or create separate workstreams.",
+        )
+
+    ws = await _verify_workstream_ownership(db, workstream_id, current_user["id"])
 
+    try:
+        artifact = await render_portfolio_export(
+            db,
+            workstream_id,
+            format_lower,
+            request.card_order,
+            workstream_name=ws.name,
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Portfolio export failed: {str(e)}")
         raise HTTPException(
             status_code=500, detail=_safe_error("portfolio generation", e)
         ) from e
+
+    return artifact_response(artifact)
@@ -1,6 +1,5 @@
 """Card and workstream export router -- PDF, PPTX, CSV exports."""
 
-import io
 import logging
 import uuid
 from datetime import datetime, date
@@ -9,11 +8,11 @@ from pathlib import Path
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse, FileResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.deps import get_db, get_current_user_hardcoded, _safe_error
+from app.export_jobs import ExportArtifact, artifact_from_file, artifact_response
 from app.export_service import ExportService
 from app.models.export import (
     ExportFormat,
@@ -35,40 +34,19 @@ router = APIRouter(prefix="/api/v1", tags=["card-export"])
 # ============================================================================
 
 
-@router.get("/cards/{card_id}/export/{format}")
-async def export_card(
+async def render_card_export(
+    db: AsyncSession,
     card_id: str,
-    format: str,
+    export_format: ExportFormat,
     include_charts: bool = True,
-    current_user: dict = Depends(get_current_user_hardcoded),
-    db: AsyncSession = Depends(get_db),
-):
+) -> ExportArtifact:
     """
-    Export a single card in the specified format.
-
-    Supported formats:
-    - pdf: Portable Document Format with charts and full details
-    - pptx: PowerPoint presentation with formatted slides
-    - csv: Comma-Separated Values for data analysis
+    Render a single card export (used by the endpoint and export jobs).
 
-    Args:
-        card_id: UUID of the card to export
-        format: Export format (pdf, pptx, csv)
-        include_charts: Whether to include visualizations (PDF/PPTX only)
-
-    Returns:
-        FileResponse for PDF/PPTX, StreamingResponse for CSV
+    Raises:
+        HTTPException 404: Card not found
+        HTTPException 500: Card could not be loaded or prepared
     """
-    # Validate format
-    format_lower = format.lower()
-    try:
-        export_format = ExportFormat(format_lower)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid export format: {format}. Supported formats: pdf, pptx, csv",
-        ) from e
-
     # Fetch card from database
     try:
         result = await db.execute(select(Card).where(Card.id == card_id))
@@ -172,56 +150,69 @@ async def export_card(
 
     # Initialize export service
     export_service = ExportService(db)
+    filename = get_export_filename(export_data.name, export_format)
+    content_type = EXPORT_CONTENT_TYPES[export_format]
 
     # Generate export based on format
-    try:
-        if export_format == ExportFormat.PDF:
-            file_path = await export_service.generate_pdf(
-                export_data, include_charts=include_charts
-            )
-            filename = get_export_filename(export_data.name, export_format)
-            content_type = EXPORT_CONTENT_TYPES[export_format]
-
-            # Return file response (FastAPI handles cleanup with FileResponse)
-            return FileResponse(
-                path=file_path,
-                filename=filename,
-                media_type=content_type,
-                background=None,  # File will be cleaned up after response is sent
-            )
+    if export_format == ExportFormat.PDF:
+        file_path = await export_service.generate_pdf(
+            export_data, include_charts=include_charts
+        )
+        return artifact_from_file(file_path, filename, content_type)
 
-        elif export_format == ExportFormat.PPTX:
-            file_path = await export_service.generate_pptx(
-                export_data, include_charts=include_charts
-            )
-            filename = get_export_filename(export_data.name, export_format)
-            content_type = EXPORT_CONTENT_TYPES[export_format]
-
-            return FileResponse(
-                path=file_path,
-                filename=filename,
-                media_type=content_type,
-                background=None,
-            )
+    if export_format == ExportFormat.PPTX:
+        file_path = await export_service.generate_pptx(
+            export_data, include_charts=include_charts
+        )
+        return artifact_from_file(file_path, filename, content_type)
 
-        elif export_format == ExportFormat.CSV:
-            csv_content = await export_service.generate_csv(export_data)
-            filename = get_export_filename(export_data.name, export_format)
-            content_type = EXPORT_CONTENT_TYPES[export_format]
+    csv_content = await export_service.generate_csv(export_data)
+    return ExportArtifact(
+        filename=filename, media_type=content_type, data=csv_content.encode("utf-8")
+    )
 
-            # Return streaming response for CSV
-            return StreamingResponse(
-                io.BytesIO(csv_content.encode("utf-8")),
-                media_type=content_type,
-                headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-            )
 
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unsupported export format: {format}",
-            )
+@router.get("/cards/{card_id}/export/{format}")
+async def export_card(
+    card_id: str,
+    format: str,
+    include_charts: bool = True,
+    current_user: dict = Depends(get_current_user_hardcoded),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Export a single card in the specified format.
+
+    Supported formats:
+    - pdf: Portable Document Format with charts and full details
+    - pptx: PowerPoint presentation with formatted slides
+    - csv: Comma-Separated Values for data analysis
+
+    Renders inline; ``POST /api/v1/exports`` (kind ``card``) queues the same
+    export for the worker and caches the result.
+
+    Args:
+        card_id: UUID of the card to export
+        format: Export format (pdf, pptx, csv)
+        include_charts: Whether to include visualizations (PDF/PPTX only)
 
+    Returns:
+        Response with the generated file as an attachment
+    """
+    # Validate format
+    format_lower = format.lower()
+    try:
+        export_format = ExportFormat(format_lower)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid export format: {format}. Supported formats: pdf, pptx, csv",
+        ) from e
+
+    try:
+        artifact = await render_card_export(
+            db, card_id, export_format, include_charts=include_charts
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -231,12 +222,94 @@ async def export_card(
             detail=_safe_error("export generation", e),
         ) from e
 
+    return artifact_response(artifact)
+
 
 # ============================================================================
 # Workstream Export Endpoints
 # ============================================================================
 
 
+async def render_workstream_export(
+    db: AsyncSession,
+    workstream_id: str,
+    export_format: ExportFormat,
+    include_charts: bool = True,
+    max_cards: int = 50,
+    workstream_name: Optional[str] = None,
+) -> ExportArtifact:
+    """
+    Render a workstream report (used by the endpoint and export jobs).
+
+    Raises:
+        HTTPException 404: Workstream not found
+        HTTPException 500: Export file was not created
+    """
+    if workstream_name is None:
+        ws_result = await db.execute(
+            select(Workstream.name).where(Workstream.id == workstream_id)
+        )
+        workstream_name = ws_result.scalar_one_or_none()
+
+    # Initialize export service
+    export_service = ExportService(db)
+
+    # Generate export file path
+    export_path = None
+
+    try:
+        if export_format == ExportFormat.PDF:
+            # Generate PDF report
+            export_path = await export_service.generate_workstream_pdf(
+                workstream_id=workstream_id,
+                include_charts=include_charts,
+                max_cards=max_cards,
+            )
+        else:
+            # Generate PowerPoint report
+            # First fetch workstream and cards for PPTX generation
+            workstream_data, cards = await export_service.get_workstream_cards(
+                workstream_id=workstream_id, max_cards=max_cards
+            )
+
+            if not workstream_data:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Workstream not found"
+                )
+
+            export_path = await export_service.generate_workstream_pptx(
+                workstream=workstream_data,
+                cards=cards,
+                include_charts=include_charts,
+                include_card_details=True,
+            )
+
+        # Verify file was created
+        if not export_path or not Path(export_path).exists():
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Export generation failed - file not created",
+            )
+    except BaseException:
+        # Clean up temp file if it was created
+        if export_path and Path(export_path).exists():
+            try:
+                Path(export_path).unlink()
+            except Exception:
+                pass
+        raise
+
+    # Generate filename for download
+    filename = get_export_filename(
+        workstream_name or "workstream-report", export_format
+    )
+
+    # Get content type
+    content_type = EXPORT_CONTENT_TYPES.get(export_format, "application/octet-stream")
+
+    return artifact_from_file(export_path, filename, content_type)
+
+
 @router.get("/workstreams/{workstream_id}/export/{format}")
 async def export_workstream_report(
     workstream_id: str,
@@ -259,6 +332,9 @@ async def export_workstream_report(
     Note: CSV export is not supported for workstream reports.
     Use individual card exports for CSV data.
 
+    Renders inline; ``POST /api/v1/exports`` (kind ``workstream``) queues
+    the same export for the worker and caches the result.
+
     Args:
         workstream_id: UUID of the workstream to export
         format: Export format ('pdf' or 'pptx')
@@ -267,7 +343,7 @@ async def export_workstream_report(
         max_cards: Maximum number of cards to include (default: 50, max: 100)
 
     Returns:
-        FileResponse with the generated export file
+        Response with the generated file as an attachment
 
     Raises:
         HTTPException 400: Invalid export format
@@ -312,81 +388,27 @@ async def export_workstream_report(
             detail="Not authorized to export this workstream",
         )
 
-    # Initialize export service
-    export_service = ExportService(db)
-
     # Get export format enum
     export_format = ExportFormat.PDF if format_lower == "pdf" else ExportFormat.PPTX
 
-    # Generate export file path
-    export_path = None
-
     try:
-        if format_lower == "pdf":
-            # Generate PDF report
-            export_path = await export_service.generate_workstream_pdf(
-                workstream_id=workstream_id,
-                include_charts=include_charts,
-                max_cards=max_cards,
-            )
-        else:
-            # Generate PowerPoint report
-            # First fetch workstream and cards for PPTX generation
-            workstream_data, cards = await export_service.get_workstream_cards(
-                workstream_id=workstream_id, max_cards=max_cards
-            )
-
-            if not workstream_data:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="Workstream not found"
-                )
-
-            export_path = await export_service.generate_workstream_pptx(
-                workstream=workstream_data,
-                cards=cards,
-                include_charts=include_charts,
-                include_card_details=True,
-            )
-
-        # Verify file was created
-        if not export_path or not Path(export_path).exists():
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Export generation failed - file not created",
-            )
-
-        # Generate filename for download
-        workstream_name = workstream.name or "workstream-report"
-        filename = get_export_filename(workstream_name, export_format)
-
-        # Get content type
-        content_type = EXPORT_CONTENT_TYPES.get(
-            export_format, "application/octet-stream"
+        artifact = await render_workstream_export(
+            db,
+            workstream_id,
+            export_format,
+            include_charts=include_charts,
+            max_cards=max_cards,
+            workstream_name=workstream.name,
         )
-
-        logger.info(f"Workstream export generated: {workstream_id} as {format_lower}")
-
-        # Return file response
-        # Note: FileResponse will handle file cleanup after sending
-        return FileResponse(
-            path=export_path,
-            filename=filename,
-            media_type=content_type,
-            background=None,  # Let FileResponse handle the response
-        )
-
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
         logger.error(f"Failed to generate workstream export: {str(e)}")
-        # Clean up temp file if it was created
-        if export_path and Path(export_path).exists():
-            try:
-                Path(export_path).unlink()
-            except Exception:
-                pass
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=_safe_error("export generation", e),
         ) from e
+
+    logger.info(f"Workstream export generated: {workstream_id} as {format_lower}")
+    return artifact_response(artifact)
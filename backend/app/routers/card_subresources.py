@@ -24,6 +24,7 @@ from fastapi import (
 from pydantic import BaseModel
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.deps import get_db, get_current_user_hardcoded, _safe_error
 from app.taxonomy import VALID_PIPELINE_STATUSES
@@ -70,15 +71,18 @@ def _row_to_dict(obj, skip_cols: set | None = None) -> dict:
 
     Uses SQLAlchemy's mapper to correctly resolve Python attribute names
     that differ from DB column names (e.g. ``metadata_`` mapped to ``metadata``).
+    Deferred columns that were not loaded (e.g. ``Source.full_text``) are
+    left out rather than lazy-loaded.
     """
     from sqlalchemy import inspect as sa_inspect
 
     skip = skip_cols or _SKIP_COLS
     result: dict[str, Any] = {}
+    unloaded = sa_inspect(obj).unloaded
     mapper = sa_inspect(obj.__class__)
     for prop in mapper.column_attrs:
         col = prop.columns[0]
-        if col.name in skip:
+        if col.name in skip or (prop.deferred and prop.key in unloaded):
             continue
         value = getattr(obj, prop.key, None)  # prop.key = Python attribute name
         if isinstance(value, _uuid.UUID):
@@ -121,15 +125,21 @@ class EntityListResponse(BaseModel):
 @router.get("/cards/{card_id}/sources")
 async def get_card_sources(
     card_id: str,
+    include: Optional[str] = Query(
+        None, pattern="^full_text$", description="Set to full_text to load it"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get sources for a card"""
+    """Get sources for a card (``full_text`` only with ``include=full_text``)"""
     try:
-        result = await db.execute(
+        stmt = (
             select(Source)
             .where(Source.card_id == card_id)
             .order_by(Source.relevance_score.desc().nulls_last())
         )
+        if include == "full_text":
+            stmt = stmt.options(undefer(Source.full_text))
+        result = await db.execute(stmt)
         sources = result.scalars().all()
     except Exception as e:
         raise HTTPException(
@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
-from sqlalchemy import select, func, and_, or_, text
+from sqlalchemy import select, and_, or_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.deps import (
@@ -40,12 +40,25 @@ from app.models.workstream import FilterPreviewRequest, FilterPreviewResponse
 from app.models.db.card import Card
 from app.models.db.card_extras import CardFollow, CardScoreHistory, CardTimeline
 from app.models.db.discovery import DiscoveryBlock
+from app.helpers.card_pagination import (
+    COUNT_MODES,
+    card_count_cache,
+    count_cards,
+    decode_cursor,
+    encode_cursor,
+    filter_key,
+    keyset_after,
+    keyset_order,
+    sort_column,
+)
 from app.helpers.db_utils import vector_search_cards
-from app.helpers.search_utils import (
-    _apply_search_filters,
-    _apply_score_filters,
-    _extract_highlights,
+from app.helpers.projection import (
+    Projection,
+    card_detail_projection,
+    card_list_projection,
+    parse_include,
 )
+from app.helpers.search_utils import _extract_highlights, build_card_search
 from app.taxonomy import VALID_PIPELINE_STATUSES
 
 logger = logging.getLogger(__name__)
@@ -59,6 +72,22 @@ router = APIRouter(prefix="/api/v1", tags=["cards"])
 
 _SKIP_COLUMNS = {"embedding", "search_vector"}
 
+# /cards/search returns description (SearchResultItem) on top of the list view.
+_SEARCH_PROJECTION = card_list_projection({"description"})
+
+# Only what filter-preview matches on and echoes back in its sample.
+_FILTER_PREVIEW_PROJECTION = Projection(
+    (
+        Card.id,
+        Card.name,
+        Card.summary,
+        Card.description,
+        Card.pillar_id,
+        Card.stage_id,
+        Card.horizon,
+    )
+)
+
 
 def _card_to_dict(card: Card) -> dict[str, Any]:
     """Convert a Card ORM instance to a JSON-safe dictionary.
@@ -160,12 +189,25 @@ async def get_cards(
     sort_asc: Optional[bool] = None,
     slug: Optional[str] = None,
     status: Optional[str] = None,
+    include: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: str = "exact",
     request: Request = None,
     db: AsyncSession = Depends(get_db),
 ):
     """Get cards with filtering and pagination.
 
-    Returns { cards: [...], total_count, limit, offset, has_more }.
+    Pass ``next_cursor`` from the previous response as ``cursor`` for keyset
+    pagination (``offset`` is ignored then); ``offset`` paging still works.
+    ``count`` is ``exact`` (cached briefly per filter set), ``approximate``
+    (planner estimate for large results) or ``none``.
+
+    List rows leave out long text / JSON fields (``description``,
+    ``eligibility_text``, ...); request them with ``include=description,...``.
+    A ``slug`` lookup is the card detail fetch and returns every field.
+
+    Returns { cards: [...], total_count, total_count_approximate, limit,
+    offset, has_more, next_cursor }.
     """
     # Support both singular and repeated query params for filters like:
     # ?pillar_id=a&pillar_id=b
@@ -196,9 +238,27 @@ async def get_cards(
             ),
         )
 
+    if count not in COUNT_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid count '{count}'. Must be one of: {', '.join(COUNT_MODES)}",
+        )
+
+    sort_col = sort_column(sort_by)
+    ascending = bool(sort_asc)
+    try:
+        projection = (
+            card_detail_projection()
+            if slug
+            else card_list_projection(parse_include(include))
+        )
+        after = decode_cursor(cursor, sort_by, ascending) if cursor else None
+    except ValueError as e:  # bad include field or CursorError
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
     try:
         active_status = status or "active"
-        base = select(Card).where(Card.status == active_status)
+        base = select(*projection.columns).where(Card.status == active_status)
 
         # Parse date/datetime filter bounds.
         try:
@@ -211,6 +271,7 @@ async def get_cards(
         except ValueError as e:
             raise HTTPException(status_code=400, detail=f"Invalid date filter: {e}") from e
 
+        user_uuid = None
         if following_only:
             if request is None:
                 raise HTTPException(status_code=401, detail="Authentication required")
@@ -262,44 +323,63 @@ async def get_cards(
         if funding_max is not None:
             base = base.where(Card.funding_amount_min <= funding_max)
 
-        # Total count (before pagination)
-        count_result = await db.execute(
-            select(func.count()).select_from(base.subquery())
+        # Total count of the filtered set (cached per normalized filters)
+        total_count, approximate = await count_cards(
+            db,
+            base,
+            filter_key(
+                status=active_status,
+                following_user=user_uuid,
+                slug=slug,
+                pillar_ids=pillar_ids,
+                pipeline_statuses=pipeline_statuses,
+                stage_id=stage_id,
+                horizon=horizon,
+                grant_type=grant_type,
+                category_id=category_id,
+                search=search,
+                created_after=created_after_dt,
+                created_before=created_before_dt,
+                updated_after=updated_after_dt,
+                updated_before=updated_before_dt,
+                deadline_after=deadline_after_dt,
+                deadline_before=deadline_before_dt,
+                impact_min=impact_min,
+                relevance_min=relevance_min,
+                novelty_min=novelty_min,
+                funding_min=funding_min,
+                funding_max=funding_max,
+            ),
+            count,
         )
-        total_count = count_result.scalar() or 0
-
-        # Sorting
-        sort_column = Card.created_at
-        if sort_by == "name":
-            sort_column = Card.name
-        elif sort_by == "deadline":
-            sort_column = Card.deadline
-        elif sort_by == "funding_amount_max":
-            sort_column = Card.funding_amount_max
-        elif sort_by == "updated_at":
-            sort_column = Card.updated_at
-        elif sort_by == "signal_quality_score":
-            sort_column = Card.signal_quality_score
-        elif sort_by == "relevance_score":
-            sort_column = Card.relevance_score
-        elif sort_by == "opportunity_score":
-            sort_column = Card.opportunity_score
-
-        if sort_asc:
-            base = base.order_by(sort_column.asc().nulls_last())
-        else:
-            base = base.order_by(sort_column.desc().nulls_last())
 
-        stmt = base.offset(offset).limit(limit)
-        result = await db.execute(stmt)
-        cards = result.scalars().all()
+        # Keyset order: sort column, then id so every position is unique
+        stmt = base.order_by(*keyset_order(sort_col, ascending))
+        if after is not None:
+            stmt = stmt.where(keyset_after(sort_col, ascending, *after))
+        else:
+            stmt = stmt.offset(offset)
+        # One extra row tells us whether another page exists
+        result = await db.execute(stmt.limit(limit + 1))
+        rows = result.all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]._mapping
+            next_cursor = encode_cursor(
+                sort_by, ascending, last[sort_col.key], last["id"]
+            )
 
         return {
-            "cards": [_card_to_dict(c) for c in cards],
+            "cards": [projection.serialize(r) for r in rows],
             "total_count": total_count,
+            "total_count_approximate": approximate,
             "limit": limit,
             "offset": offset,
-            "has_more": (offset + limit) < total_count,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
         }
     except HTTPException:
         raise
@@ -315,6 +395,7 @@ async def get_pending_review_cards(
     offset: int = 0,
     pillar_id: Optional[str] = None,
     sort: Optional[str] = Query(None, regex="^(confidence|date)$"),
+    include: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -323,10 +404,16 @@ async def get_pending_review_cards(
     Returns discovered cards that need human review.
     Default sort: newest first (discovered_at desc), with confidence as tiebreaker.
     Use sort=confidence for confidence-first ordering.
+    Long text / JSON fields are opt-in via ``include`` (as in ``GET /cards``).
     """
+    try:
+        projection = card_list_projection(parse_include(include))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
     try:
         # Backward-compatible: include draft cards even if `review_status` wasn't set correctly.
-        stmt = select(Card).where(
+        stmt = select(*projection.columns).where(
             Card.review_status != "rejected",
             or_(
                 Card.review_status.in_(["discovered", "pending_review"]),
@@ -352,9 +439,8 @@ async def get_pending_review_cards(
         stmt = stmt.order_by(Card.created_at.desc()).offset(offset).limit(limit)
 
         result = await db.execute(stmt)
-        cards = result.scalars().all()
 
-        return [_card_to_dict(c) for c in cards]
+        return [projection.serialize(r) for r in result.all()]
     except HTTPException:
         raise
     except Exception as e:
@@ -589,6 +675,8 @@ async def create_card(
         db.add(new_card)
         await db.flush()
         await db.refresh(new_card)
+        # Show the new card in this process's totals without waiting out the TTL
+        card_count_cache.clear()
 
         # Queue background AI analysis for the new card
         try:
@@ -614,19 +702,17 @@ async def search_cards(
     Advanced search for intelligence cards with filtering and vector similarity.
 
     Supports:
-    - Text query with optional vector (semantic) search
+    - Text query with optional vector (semantic) search; text matching uses
+      the ``search_vector`` tsvector
     - Filters: pillar_ids, stage_ids, date_range, score_thresholds
     - Pagination with limit and offset
 
-    Returns cards sorted by relevance with search metadata.
+    Filtering, ranking, pagination and ``total_count`` all run in SQL (see
+    ``build_card_search``).  Returns cards sorted by relevance with search
+    metadata.
     """
     try:
-        results: list[dict[str, Any]] = []
-        search_type = (
-            "vector" if request.use_vector_search and request.query else "text"
-        )
-
-        # Vector search path
+        query_embedding = None
         if request.use_vector_search and request.query:
             try:
                 # Get embedding for search query
@@ -636,83 +722,51 @@ async def search_cards(
                     input=request.query,
                 )
                 query_embedding = embedding_response.data[0].embedding
-
-                # Vector similarity search
-                matched = await vector_search_cards(
-                    db,
-                    query_embedding,
-                    match_threshold=0.5,
-                    match_count=request.limit + request.offset + 100,
+            except Exception as embed_error:
+                logger.warning(
+                    f"Query embedding failed, falling back to text: {embed_error}"
                 )
 
-                if matched:
-                    similarity_map = {
-                        item["id"]: item.get("similarity", 0.0) for item in matched
-                    }
-                    matched_ids = list(similarity_map.keys())
+        filters_key = (
+            request.filters.model_dump_json(exclude_none=True)
+            if request.filters
+            else None
+        )
 
-                    # Hydrate with full card data
-                    hydrate_result = await db.execute(
-                        select(Card).where(Card.id.in_(matched_ids))
-                    )
-                    hydrated_cards = hydrate_result.scalars().all()
-
-                    results = [_card_to_dict(c) for c in hydrated_cards]
-                    for item in results:
-                        item["search_relevance"] = similarity_map.get(item["id"], 0.0)
-                    # Preserve similarity ordering
-                    results.sort(
-                        key=lambda x: x.get("search_relevance", 0), reverse=True
-                    )
+        async def run_search(embedding):
+            base, mode = build_card_search(
+                _SEARCH_PROJECTION.columns,
+                request.filters,
+                query=request.query,
+                query_embedding=embedding,
+            )
+            key = filter_key(search=request.query, mode=mode, filters=filters_key)
+            total, _ = await count_cards(db, base, key)
+            page = await db.execute(base.offset(request.offset).limit(request.limit))
+            return mode, total, page.all()
 
+        if query_embedding is not None:
+            try:
+                # Savepoint: a pgvector failure must not abort the transaction
+                # the text fallback runs in.
+                async with db.begin_nested():
+                    search_type, total_count, rows = await run_search(query_embedding)
             except Exception as vector_error:
                 logger.warning(
                     f"Vector search failed, falling back to text: {vector_error}"
                 )
-                search_type = "text"
-                results = []
-
-        # Text search path (or fallback)
-        if search_type == "text" or (not request.use_vector_search and request.query):
-            search_type = "text"
-            stmt = select(Card)
-
-            if request.query:
-                # Text search on name and summary
-                pattern = f"%{request.query}%"
-                stmt = stmt.where(
-                    or_(
-                        Card.name.ilike(pattern),
-                        Card.summary.ilike(pattern),
-                    )
-                )
-
-            stmt = stmt.limit(request.limit + request.offset + 100)
-            text_result = await db.execute(stmt)
-            text_cards = text_result.scalars().all()
-            results = [_card_to_dict(c) for c in text_cards]
-
-            # Add placeholder relevance for text search
-            for item in results:
-                item["search_relevance"] = None
-
-        # If no query provided, fetch all cards (for filter-only searches)
-        if not request.query:
-            search_type = "filter"
-            stmt = select(Card).limit(request.limit + request.offset + 100)
-            filter_result = await db.execute(stmt)
-            filter_cards = filter_result.scalars().all()
-            results = [_card_to_dict(c) for c in filter_cards]
-
-        # Apply filters
-        if request.filters:
-            results = _apply_search_filters(results, request.filters)
-
-        # Get total count before pagination
-        total_count = len(results)
-
-        # Apply pagination
-        results = results[request.offset : request.offset + request.limit]
+                query_embedding = None
+        if query_embedding is None:
+            search_type, total_count, rows = await run_search(None)
+
+        results = []
+        for row in rows:
+            item = _SEARCH_PROJECTION.serialize(row)
+            relevance = row[-1]
+            item["search_relevance"] = (
+                float(relevance) if relevance is not None else None
+            )
+            results.append(item)
 
         # Convert to response format
         result_items = [
@@ -788,7 +842,7 @@ async def get_similar_cards(
         List of similar cards with similarity scores
     """
     try:
-        # Get the source card's embedding via raw SQL (embedding is NullType in ORM)
+        # Get the source card's embedding (decoded to a float32 array)
         embed_sql = text("SELECT id, name, embedding FROM cards WHERE id = :card_id")
         embed_result = await db.execute(embed_sql, {"card_id": card_id})
         card_row = embed_result.mappings().first()
@@ -796,7 +850,7 @@ async def get_similar_cards(
         if not card_row:
             raise HTTPException(status_code=404, detail="Card not found")
 
-        if not card_row["embedding"]:
+        if card_row["embedding"] is None:
             # Fallback: return empty list if no embedding
             logger.warning(f"Card {card_id} has no embedding for similarity search")
             return []
@@ -904,7 +958,9 @@ async def preview_filter_count(
     """
     try:
         # Build base query for active cards
-        stmt = select(Card).where(Card.status == "active")
+        stmt = select(*_FILTER_PREVIEW_PROJECTION.columns).where(
+            Card.status == "active"
+        )
 
         # Apply filters
         if filters.pillar_ids:
@@ -923,8 +979,7 @@ async def preview_filter_count(
         # Fetch cards (limit to reasonable amount for performance)
         stmt = stmt.order_by(Card.created_at.desc()).limit(500)
         result = await db.execute(stmt)
-        cards_orm = result.scalars().all()
-        cards = [_card_to_dict(c) for c in cards_orm]
+        cards = [_FILTER_PREVIEW_PROJECTION.serialize(r) for r in result.all()]
 
         # Apply stage filtering client-side
         if filters.stage_ids:
@@ -7,6 +7,7 @@ from datetime import datetime, date, timezone
 from decimal import Decimal
 from typing import Dict, List, Optional
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 from sqlalchemy import select, update, desc, asc
@@ -33,6 +34,7 @@ from app.models.db.user import User
 from app.alignment_service import AlignmentService
 from app.discovery_service import DiscoveryService
 from app.helpers.workstream_utils import _filter_cards_for_workstream
+from app.job_notify import notify_job
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["discovery"])
@@ -57,6 +59,8 @@ def _row_to_dict(obj, skip_cols=None) -> dict:
             result[col.name] = value.isoformat()
         elif isinstance(value, Decimal):
             result[col.name] = float(value)
+        elif isinstance(value, np.ndarray):
+            result[col.name] = value.tolist()
         else:
             result[col.name] = value
     return result
@@ -99,7 +103,10 @@ async def _distribute_cards_to_auto_add_workstreams(new_card_ids: List[str]):
             stmt = select(Card).where(Card.id.in_(uuid_ids))
             result = await db.execute(stmt)
             card_rows = result.scalars().all()
-            new_cards = [_row_to_dict(c) for c in card_rows]
+            new_cards = [
+                _row_to_dict(c, skip_cols={"embedding", "search_vector"})
+                for c in card_rows
+            ]
             if not new_cards:
                 return
 
@@ -339,6 +346,7 @@ async def run_weekly_discovery():
                 summary_report={"stage": "queued", "config": config.dict()},
             )
             db.add(run)
+            await notify_job(db, "discovery")
             await db.commit()
             await db.refresh(run)
 
@@ -416,6 +424,7 @@ async def trigger_discovery_run(
         db.add(run)
         await db.flush()
         await db.refresh(run)
+        await notify_job(db, "discovery")
 
         run_dict = _row_to_dict(run)
 
@@ -1034,7 +1043,7 @@ async def score_grant_against_program(
         card_row = card_result.scalar_one_or_none()
         if not card_row:
             raise HTTPException(status_code=404, detail="Card not found")
-        card = _row_to_dict(card_row)
+        card = _row_to_dict(card_row, skip_cols={"embedding", "search_vector"})
 
         # Fetch workstream and verify ownership
         ws_stmt = select(Workstream).where(Workstream.id == uuid.UUID(program_id))
@@ -1103,7 +1112,10 @@ async def get_program_matches(
         )
         cards_result = await db.execute(cards_stmt)
         card_rows = cards_result.scalars().all()
-        cards = [_row_to_dict(c) for c in card_rows]
+        cards = [
+            _row_to_dict(c, skip_cols={"embedding", "search_vector"})
+            for c in card_rows
+        ]
 
         # Filter: deadline is null or >= now
         eligible_cards = [
@@ -1205,7 +1217,10 @@ async def auto_match_program(
         )
         cards_result = await db.execute(cards_stmt)
         card_rows = cards_result.scalars().all()
-        cards = [_row_to_dict(c) for c in card_rows]
+        cards = [
+            _row_to_dict(c, skip_cols={"embedding", "search_vector"})
+            for c in card_rows
+        ]
 
         eligible_cards = [
             c
@@ -0,0 +1,306 @@
+"""Background export jobs router -- queue, poll and download exports.
+
+Exports queued here are rendered by the worker (see ``app.export_jobs``)
+instead of inside the request.  Finished documents are cached by content
+hash, so exporting unchanged content again completes immediately.
+"""
+
+import logging
+import uuid
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.deps import get_db, get_current_user_hardcoded, _safe_error
+from app.export_jobs import (
+    EXPORT_KINDS,
+    ExportUnavailable,
+    artifact_info,
+    artifact_response,
+    enqueue_export,
+    load_artifact,
+)
+from app.models.db.card import Card
+from app.models.db.export import ExportJob
+from app.models.export import ExportJobRequest, ExportJobResponse
+from app.routers.briefs import _get_workstream_card, _verify_workstream_ownership
+from app.services.access_control import (
+    ROLE_VIEWER,
+    require_application_access,
+    require_proposal_access,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1", tags=["export-jobs"])
+
+MAX_PORTFOLIO_CARDS = 15
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _require_id(value: Optional[str], field: str, kind: str) -> str:
+    """Canonical UUID string for a required id field (400 if missing/invalid)."""
+    if not value:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{field} is required for {kind} exports",
+        )
+    try:
+        return str(uuid.UUID(value))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid {field}: {value}",
+        ) from e
+
+
+async def _authorize_export(
+    db: AsyncSession, request: ExportJobRequest, user_id: str
+) -> Dict[str, Any]:
+    """Check access to the export target and return the job parameters."""
+    kind = request.kind
+
+    if kind == "card":
+        card_id = _require_id(request.card_id, "card_id", kind)
+        result = await db.execute(select(Card.id).where(Card.id == card_id))
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Card not found: {card_id}",
+            )
+        return {"card_id": card_id, "include_charts": request.include_charts}
+
+    if kind in ("workstream", "brief", "portfolio"):
+        workstream_id = _require_id(request.workstream_id, "workstream_id", kind)
+        await _verify_workstream_ownership(db, workstream_id, user_id)
+
+        if kind == "workstream":
+            return {
+                "workstream_id": workstream_id,
+                "include_charts": request.include_charts,
+                "max_cards": request.max_cards,
+            }
+
+        if kind == "brief":
+            card_id = _require_id(request.card_id, "card_id", kind)
+            await _get_workstream_card(db, workstream_id, card_id)
+            return {
+                "workstream_id": workstream_id,
+                "card_id": card_id,
+                "version": request.version,
+            }
+
+        if not request.card_order:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No cards provided for export",
+            )
+        if len(request.card_order) > MAX_PORTFOLIO_CARDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Maximum 15 cards per portfolio. Archive some cards or create separate workstreams.",
+            )
+        return {
+            "workstream_id": workstream_id,
+            "card_order": [
+                _require_id(cid, "card_order", kind) for cid in request.card_order
+            ],
+        }
+
+    if kind in ("application", "budget"):
+        application_id = _require_id(request.application_id, "application_id", kind)
+        await require_application_access(
+            db,
+            application_id=uuid.UUID(application_id),
+            user_id=user_id,
+            minimum_role=ROLE_VIEWER,
+        )
+        return {"application_id": application_id}
+
+    proposal_id = _require_id(request.proposal_id, "proposal_id", kind)
+    await require_proposal_access(
+        db,
+        proposal_id=uuid.UUID(proposal_id),
+        user_id=user_id,
+        minimum_role=ROLE_VIEWER,
+    )
+    return {"proposal_id": proposal_id}
+
+
+async def _get_user_job(db: AsyncSession, job_id: str, user_id: str) -> ExportJob:
+    """Load an export job owned by the user (404 otherwise)."""
+    try:
+        job_uuid = uuid.UUID(job_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Export job not found"
+        ) from e
+    job = await db.get(ExportJob, job_uuid)
+    if job is None or str(job.user_id) != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Export job not found"
+        )
+    return job
+
+
+def _job_response(
+    job: ExportJob, info: Optional[Tuple[str, int]] = None
+) -> ExportJobResponse:
+    completed = job.status == "completed"
+    return ExportJobResponse(
+        job_id=str(job.id),
+        kind=job.kind,
+        format=job.format,
+        status=job.status,
+        # Jobs served from an existing artifact are never started
+        cached=completed and job.started_at is None,
+        filename=info[0] if info else None,
+        file_size_bytes=info[1] if info else None,
+        download_url=f"/api/v1/exports/{job.id}/download" if completed else None,
+        error_message=job.error_message,
+        created_at=job.created_at,
+        completed_at=job.completed_at,
+    )
+
+
+# ============================================================================
+# Endpoints
+# ============================================================================
+
+
+@router.post("/exports", response_model=ExportJobResponse)
+async def create_export_job(
+    request: ExportJobRequest,
+    current_user: dict = Depends(get_current_user_hardcoded),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Queue an export for the background worker.
+
+    If the same content (unchanged rows, same format and options) has been
+    exported before, the job is returned already completed and can be
+    downloaded immediately.  Otherwise poll ``GET /exports/{job_id}`` until
+    ``status`` is ``completed`` and fetch ``download_url``.
+
+    Args:
+        request: ExportJobRequest with kind, format, target ids and options
+        current_user: Authenticated user (injected)
+
+    Returns:
+        ExportJobResponse for the new (or matching in-flight) job
+
+    Raises:
+        HTTPException 400: Invalid kind / format, or nothing to export yet
+        HTTPException 403: Not authorized to export the target
+        HTTPException 404: Export target not found
+    """
+    kind = EXPORT_KINDS.get(request.kind)
+    if kind is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid export kind: {request.kind}. Supported kinds: "
+            + ", ".join(EXPORT_KINDS),
+        )
+    format_lower = request.format.lower()
+    if format_lower not in kind.formats:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid export format for {request.kind}: {request.format}. "
+            f"Supported formats: {', '.join(kind.formats)}",
+        )
+
+    user_id = current_user["id"]
+    params = await _authorize_export(db, request, user_id)
+
+    try:
+        job = await enqueue_export(db, user_id, request.kind, format_lower, params)
+    except ExportUnavailable as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Failed to create export job: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=_safe_error("export job creation", e),
+        ) from e
+
+    info = None
+    if job.status == "completed":
+        info = await artifact_info(db, job.content_hash)
+    return _job_response(job, info)
+
+
+@router.get("/exports/{job_id}", response_model=ExportJobResponse)
+async def get_export_job(
+    job_id: str,
+    current_user: dict = Depends(get_current_user_hardcoded),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get the status of an export job.
+
+    Args:
+        job_id: UUID of the export job
+        current_user: Authenticated user (injected)
+
+    Returns:
+        ExportJobResponse; ``download_url`` is set once completed
+
+    Raises:
+        HTTPException 404: Job not found
+    """
+    job = await _get_user_job(db, job_id, current_user["id"])
+    info = None
+    if job.status == "completed":
+        info = await artifact_info(db, job.content_hash)
+    return _job_response(job, info)
+
+
+@router.get("/exports/{job_id}/download")
+async def download_export(
+    job_id: str,
+    current_user: dict = Depends(get_current_user_hardcoded),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Download the document of a completed export job.
+
+    Args:
+        job_id: UUID of the export job
+        current_user: Authenticated user (injected)
+
+    Returns:
+        Response with the exported document as an attachment
+
+    Raises:
+        HTTPException 404: Job not found
+        HTTPException 409: Job not completed (still running, or failed)
+        HTTPException 410: The artifact has been pruned; start a new export
+    """
+    job = await _get_user_job(db, job_id, current_user["id"])
+    if job.status == "failed":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Export failed: {job.error_message or 'unknown error'}",
+        )
+    if job.status != "completed":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Export is not ready yet. Please wait for it to finish.",
+        )
+
+    artifact = await load_artifact(db, job.content_hash)
+    if artifact is None:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Export has expired. Please start a new export.",
+        )
+    return artifact_response(artifact)
@@ -4,16 +4,15 @@ Provides endpoints that fetch application data from the database and
 generate downloadable Word documents via DocxExportService.
 """
 
-import io
 import logging
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.deps import get_db, get_current_user_hardcoded, _safe_error
+from app.export_jobs import ExportArtifact, artifact_response
 from app.models.db.budget import BudgetLineItem, BudgetSettings
 from app.models.db.checklist import ChecklistItem
 from app.models.db.grant_application import GrantApplication
@@ -148,41 +147,19 @@ def _compute_budget_calculations(
 
 
 # ---------------------------------------------------------------------------
-# Endpoints
+# Renderers (shared with background export jobs)
 # ---------------------------------------------------------------------------
 
 
-@router.get("/applications/{application_id}/export/docx")
-async def export_application_docx(
+async def render_application_docx(
+    db: AsyncSession,
     application_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user_hardcoded),
-):
-    """Export a full application package (proposal + budget + checklist) as DOCX.
-
-    Fetches the grant application, its associated proposal, budget items,
-    budget settings, and checklist items, then generates a combined Word
-    document with page breaks between sections.
-
-    Args:
-        application_id: UUID of the grant application.
-        db: Async database session (injected).
-        current_user: Authenticated user (injected).
-
-    Returns:
-        StreamingResponse with the DOCX file.
+) -> ExportArtifact:
+    """Build the full application package DOCX.
 
     Raises:
         HTTPException 404: Application or proposal not found.
-        HTTPException 500: Document generation failed.
     """
-    await require_application_access(
-        db,
-        application_id=application_id,
-        user_id=current_user["id"],
-        minimum_role=ROLE_VIEWER,
-    )
-
     # Fetch the application
     result = await db.execute(
         select(GrantApplication).where(GrantApplication.id == application_id)
@@ -219,57 +196,30 @@ async def export_application_docx(
     # Build grant context from application metadata
     grant_context = app_dict.get("proposal_content") or {}
 
-    try:
-        docx_bytes = DocxExportService.generate_package_docx(
-            proposal=proposal_dict,
-            budget_items=budget_items,
-            budget_settings=budget_settings,
-            budget_calculations=budget_calculations,
-            checklist_items=checklist_items,
-            grant_context=grant_context,
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=_safe_error("application DOCX export", e),
-        ) from e
+    docx_bytes = DocxExportService.generate_package_docx(
+        proposal=proposal_dict,
+        budget_items=budget_items,
+        budget_settings=budget_settings,
+        budget_calculations=budget_calculations,
+        checklist_items=checklist_items,
+        grant_context=grant_context,
+    )
 
     filename = _make_safe_filename(proposal_dict.get("title", "application"), "package")
-
-    return StreamingResponse(
-        io.BytesIO(docx_bytes),
-        media_type=_DOCX_MEDIA_TYPE,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    return ExportArtifact(
+        filename=filename, media_type=_DOCX_MEDIA_TYPE, data=docx_bytes
     )
 
 
-@router.get("/applications/{application_id}/export/budget-docx")
-async def export_budget_docx(
+async def render_budget_docx(
+    db: AsyncSession,
     application_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user_hardcoded),
-):
-    """Export the budget detail for an application as a standalone DOCX.
-
-    Args:
-        application_id: UUID of the grant application.
-        db: Async database session (injected).
-        current_user: Authenticated user (injected).
-
-    Returns:
-        StreamingResponse with the DOCX file.
+) -> ExportArtifact:
+    """Build the standalone budget DOCX for an application.
 
     Raises:
         HTTPException 404: Application not found.
-        HTTPException 500: Document generation failed.
     """
-    await require_application_access(
-        db,
-        application_id=application_id,
-        user_id=current_user["id"],
-        minimum_role=ROLE_VIEWER,
-    )
-
     # Verify application exists
     result = await db.execute(
         select(GrantApplication).where(GrantApplication.id == application_id)
@@ -295,26 +245,160 @@ async def export_budget_docx(
         proposal_title_row[0] if proposal_title_row else "Grant Application"
     )
 
-    try:
-        docx_bytes = DocxExportService.generate_budget_docx(
-            budget_items=budget_items,
-            settings=budget_settings,
-            calculations=budget_calculations,
+    docx_bytes = DocxExportService.generate_budget_docx(
+        budget_items=budget_items,
+        settings=budget_settings,
+        calculations=budget_calculations,
+    )
+
+    filename = _make_safe_filename(budget_calculations.get("title", "budget"), "budget")
+    return ExportArtifact(
+        filename=filename, media_type=_DOCX_MEDIA_TYPE, data=docx_bytes
+    )
+
+
+async def render_proposal_docx(
+    db: AsyncSession,
+    proposal_id: uuid.UUID,
+) -> ExportArtifact:
+    """Build the proposal narrative DOCX (with budget data when linked).
+
+    Raises:
+        HTTPException 404: Proposal not found.
+    """
+    result = await db.execute(select(Proposal).where(Proposal.id == proposal_id))
+    proposal = result.scalars().first()
+    if not proposal:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Proposal not found",
         )
+
+    proposal_dict = _row_to_dict(proposal)
+
+    # Optionally fetch budget items if proposal is linked to an application
+    budget_items: list[dict] | None = None
+    grant_context: dict | None = None
+
+    if proposal.application_id:
+        budget_items = await _fetch_budget_items(db, proposal.application_id)
+        if not budget_items:
+            budget_items = None
+
+        # Fetch grant context from the application
+        app_result = await db.execute(
+            select(GrantApplication).where(
+                GrantApplication.id == proposal.application_id
+            )
+        )
+        app_row = app_result.scalars().first()
+        if app_row:
+            grant_context = _row_to_dict(app_row).get("proposal_content")
+
+    docx_bytes = DocxExportService.generate_proposal_docx(
+        proposal=proposal_dict,
+        grant_context=grant_context,
+        budget_items=budget_items,
+    )
+
+    filename = _make_safe_filename(proposal_dict.get("title", "proposal"), "proposal")
+    return ExportArtifact(
+        filename=filename, media_type=_DOCX_MEDIA_TYPE, data=docx_bytes
+    )
+
+
+# ---------------------------------------------------------------------------
+# Endpoints
+# ---------------------------------------------------------------------------
+
+
+@router.get("/applications/{application_id}/export/docx")
+async def export_application_docx(
+    application_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user_hardcoded),
+):
+    """Export a full application package (proposal + budget + checklist) as DOCX.
+
+    Fetches the grant application, its associated proposal, budget items,
+    budget settings, and checklist items, then generates a combined Word
+    document with page breaks between sections.  ``POST /api/v1/exports``
+    (kind ``application``) queues the same export for the worker instead.
+
+    Args:
+        application_id: UUID of the grant application.
+        db: Async database session (injected).
+        current_user: Authenticated user (injected).
+
+    Returns:
+        Response with the DOCX file.
+
+    Raises:
+        HTTPException 404: Application or proposal not found.
+        HTTPException 500: Document generation failed.
+    """
+    await require_application_access(
+        db,
+        application_id=application_id,
+        user_id=current_user["id"],
+        minimum_role=ROLE_VIEWER,
+    )
+
+    try:
+        artifact = await render_application_docx(db, application_id)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=_safe_error("budget DOCX export", e),
+            detail=_safe_error("application DOCX export", e),
         ) from e
 
-    filename = _make_safe_filename(budget_calculations.get("title", "budget"), "budget")
+    return artifact_response(artifact)
+
+
+@router.get("/applications/{application_id}/export/budget-docx")
+async def export_budget_docx(
+    application_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user_hardcoded),
+):
+    """Export the budget detail for an application as a standalone DOCX.
+
+    ``POST /api/v1/exports`` (kind ``budget``) queues the same export for
+    the worker instead.
 
-    return StreamingResponse(
-        io.BytesIO(docx_bytes),
-        media_type=_DOCX_MEDIA_TYPE,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    Args:
+        application_id: UUID of the grant application.
+        db: Async database session (injected).
+        current_user: Authenticated user (injected).
+
+    Returns:
+        Response with the DOCX file.
+
+    Raises:
+        HTTPException 404: Application not found.
+        HTTPException 500: Document generation failed.
+    """
+    await require_application_access(
+        db,
+        application_id=application_id,
+        user_id=current_user["id"],
+        minimum_role=ROLE_VIEWER,
     )
 
+    try:
+        artifact = await render_budget_docx(db, application_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=_safe_error("budget DOCX export", e),
+        ) from e
+
+    return artifact_response(artifact)
+
 
 @router.get("/proposals/{proposal_id}/export/docx")
 async def export_proposal_docx(
@@ -325,7 +409,8 @@ async def export_proposal_docx(
     """Export a proposal narrative as a DOCX document.
 
     Optionally includes budget data if the proposal is linked to an
-    application that has budget line items.
+    application that has budget line items.  ``POST /api/v1/exports``
+    (kind ``proposal``) queues the same export for the worker instead.
 
     Args:
         proposal_id: UUID of the proposal.
@@ -333,56 +418,27 @@ async def export_proposal_docx(
         current_user: Authenticated user (injected).
 
     Returns:
-        StreamingResponse with the DOCX file.
+        Response with the DOCX file.
 
     Raises:
         HTTPException 404: Proposal not found.
         HTTPException 500: Document generation failed.
     """
-    proposal = await require_proposal_access(
+    await require_proposal_access(
         db,
         proposal_id=proposal_id,
         user_id=current_user["id"],
         minimum_role=ROLE_VIEWER,
     )
 
-    proposal_dict = _row_to_dict(proposal)
-
-    # Optionally fetch budget items if proposal is linked to an application
-    budget_items: list[dict] | None = None
-    grant_context: dict | None = None
-
-    if proposal.application_id:
-        budget_items = await _fetch_budget_items(db, proposal.application_id)
-        if not budget_items:
-            budget_items = None
-
-        # Fetch grant context from the application
-        app_result = await db.execute(
-            select(GrantApplication).where(
-                GrantApplication.id == proposal.application_id
-            )
-        )
-        app_row = app_result.scalars().first()
-        if app_row:
-            grant_context = _row_to_dict(app_row).get("proposal_content")
-
     try:
-        docx_bytes = DocxExportService.generate_proposal_docx(
-            proposal=proposal_dict,
-            grant_context=grant_context,
-            budget_items=budget_items,
-        )
+        artifact = await render_proposal_docx(db, proposal_id)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=_safe_error("proposal DOCX export", e),
         ) from e
 
-    filename = _make_safe_filename(proposal_dict.get("title", "proposal"), "proposal")
-
-    return StreamingResponse(
-        io.BytesIO(docx_bytes),
-        media_type=_DOCX_MEDIA_TYPE,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    return artifact_response(artifact)
@@ -4,6 +4,8 @@ import logging
 import uuid as _uuid
 from datetime import datetime, date, timezone
 from decimal import Decimal
+
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -45,6 +47,8 @@ def _row_to_dict(obj, skip_cols=None) -> dict:
             result[col.name] = value.isoformat()
         elif isinstance(value, Decimal):
             result[col.name] = float(value)
+        elif isinstance(value, np.ndarray):
+            result[col.name] = value.tolist()
         else:
             result[col.name] = value
     return result
@@ -428,7 +432,7 @@ async def generate_section(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Associated card not found",
         )
-    card = _row_to_dict(card_obj)
+    card = _row_to_dict(card_obj, skip_cols={"embedding", "search_vector"})
 
     # Fetch workstream context
     try:
@@ -558,7 +562,7 @@ async def generate_all_sections(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Associated card not found",
         )
-    card = _row_to_dict(card_obj)
+    card = _row_to_dict(card_obj, skip_cols={"embedding", "search_vector"})
 
     # Fetch workstream context
     try:
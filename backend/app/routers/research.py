@@ -25,6 +25,7 @@ from app.models.research import (
     VALID_TASK_TYPES,
 )
 from app.models.db.research import ResearchTask
+from app.job_notify import notify_job
 from app.research_service import ResearchService
 
 logger = logging.getLogger(__name__)
@@ -341,6 +342,7 @@ async def create_research_task(
         db.add(task)
         await db.flush()
         await db.refresh(task)
+        await notify_job(db, "research")
 
         task_dict = _row_to_dict(task)
 
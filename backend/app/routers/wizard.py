@@ -15,6 +15,8 @@ from decimal import Decimal
 from typing import Any, Callable, Literal, Optional, Union
 from uuid import UUID
 
+import numpy as np
+
 try:
     import fitz  # PyMuPDF -- for PDF text extraction from uploaded files
 
@@ -107,6 +109,8 @@ def _row_to_dict(obj, skip_cols=None) -> dict:
             result[col.name] = value.isoformat()
         elif isinstance(value, Decimal):
             result[col.name] = float(value)
+        elif isinstance(value, np.ndarray):
+            result[col.name] = value.tolist()
         else:
             result[col.name] = value
     return result
@@ -1078,7 +1082,7 @@ async def generate_proposal(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Associated card not found",
         )
-    card = _row_to_dict(card_obj)
+    card = _row_to_dict(card_obj, skip_cols={"embedding", "search_vector"})
 
     # Find or create a workstream for this wizard session
     try:
@@ -29,6 +29,7 @@ from app.models.research import ResearchTask as ResearchTaskSchema
 from app.models.db.workstream import Workstream, WorkstreamCard
 from app.models.db.card import Card
 from app.models.db.research import ResearchTask
+from app.job_notify import notify_job
 
 logger = logging.getLogger(__name__)
 
@@ -575,6 +576,7 @@ async def trigger_card_deep_dive(
         db.add(new_task)
         await db.flush()
         await db.refresh(new_task)
+        await notify_job(db, "research")
 
     except HTTPException:
         raise
@@ -658,6 +660,7 @@ async def trigger_card_quick_update(
         db.add(new_task)
         await db.flush()
         await db.refresh(new_task)
+        await notify_job(db, "research")
 
     except HTTPException:
         raise
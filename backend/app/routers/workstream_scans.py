@@ -21,6 +21,7 @@ from app.helpers.db_utils import (
     has_active_workstream_scan,
 )
 from app.models.db.workstream import Workstream, WorkstreamScan
+from app.job_notify import notify_job
 from app.models.workstream import (
     WorkstreamScanResponse,
     WorkstreamScanStatusResponse,
@@ -185,6 +186,7 @@ async def start_workstream_scan(
                     detail="Rate limit exceeded: Maximum 2 scans per workstream per day. Try again tomorrow.",
                 )
 
+        await notify_job(db, "workstream_scan")
         logger.info(f"Created workstream scan {scan_id} for workstream {workstream_id}")
 
         return WorkstreamScanResponse(
@@ -13,6 +13,7 @@ from app.models.db.workstream import Workstream as WorkstreamORM
 from app.models.db.workstream import WorkstreamCard as WorkstreamCardORM
 from app.models.db.workstream import WorkstreamScan as WorkstreamScanORM
 from app.models.db.card import Card as CardORM
+from app.job_notify import notify_job
 from app.models.workstream import (
     Workstream,
     WorkstreamCreate,
@@ -131,6 +132,7 @@ async def _auto_queue_workstream_scan_sa(
         db.add(scan)
         await db.flush()
         await db.refresh(scan)
+        await notify_job(db, "workstream_scan")
         logger.info(
             "Auto-queued workstream scan %s for workstream %s " "(triggered_by: %s)",
             scan.id,
@@ -15,23 +15,33 @@ Usage:
     process_stats = await service.process_new_items()
 """
 
+import asyncio
 import hashlib
 import logging
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import aiohttp
 
 from sqlalchemy import select, update as sa_update, delete as sa_delete, func
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.helpers.db_utils import vector_search_cards
-from app.models.db.card import Card
+from app.card_embedding_cache import card_embedding_cache
+from app.helpers.db_utils import (
+    find_existing_source_urls,
+    normalize_source_url,
+    vector_search_cards,
+)
 from app.models.db.rss import RssFeed, RssFeedItem
 from app.models.db.source import Source
 
 from .ai_service import AIService
 from .crawler import crawl_url
-from .source_fetchers.rss_fetcher import fetch_single_feed
+from .source_fetchers.rss_fetcher import FeedFetchResult, fetch_single_feed
 from app.helpers.settings_reader import get_setting
 
 logger = logging.getLogger(__name__)
@@ -43,6 +53,8 @@ logger = logging.getLogger(__name__)
 SIMILARITY_MATCH_THRESHOLD = 0.85  # Strong match — attach source to card
 SIMILARITY_WEAK_THRESHOLD = 0.75  # Weak match — still worth linking
 MAX_ERROR_COUNT = 5  # Disable feed after this many consecutive errors
+FETCH_CONCURRENCY = 10  # Feeds fetched at once by check_feeds
+FETCH_PER_HOST_LIMIT = 2  # ...of which at most this many from one host
 
 
 def _content_hash(title: str, url: str) -> str:
@@ -51,10 +63,29 @@ def _content_hash(title: str, url: str) -> str:
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
+def _feed_host(url: str) -> str:
+    """Host used to bound concurrent fetches against one server."""
+    try:
+        return urlparse(url).netloc.lower()
+    except ValueError:
+        return ""
+
+
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+@dataclass
+class _TriagedItem:
+    """A feed item that passed triage and is waiting for its embedding."""
+
+    item: Any
+    title: str
+    url: str
+    content: str
+    triage: Any
+
+
 # ---------------------------------------------------------------------------
 # Service
 # ---------------------------------------------------------------------------
@@ -81,21 +112,26 @@ class RSSService:
     # 1. check_feeds — poll feeds that are due
     # -----------------------------------------------------------------------
 
-    async def check_feeds(self, max_feeds: int = 10) -> Dict[str, Any]:
+    async def check_feeds(self, max_feeds: int = 100) -> Dict[str, Any]:
         """
         Check feeds that are due for polling.
 
         Queries ``rss_feeds`` where ``status = 'active'`` and
-        ``next_check_at <= now()``, then fetches each feed.
+        ``next_check_at <= now()``, then fetches them concurrently over one
+        shared HTTP session (bounded by the ``rss_fetch_concurrency`` and
+        ``rss_fetch_per_host_limit`` settings).  Each result is stored as
+        soon as it arrives; database writes stay sequential on ``self.db``.
 
         Args:
             max_feeds: Maximum number of feeds to check in this batch.
 
         Returns:
-            Dict with stats: feeds_checked, items_found, items_new, errors.
+            Dict with stats: feeds_checked, feeds_not_modified, items_found,
+            items_new, errors.
         """
         stats = {
             "feeds_checked": 0,
+            "feeds_not_modified": 0,
             "items_found": 0,
             "items_new": 0,
             "errors": 0,
@@ -121,98 +157,102 @@ class RSSService:
 
         logger.info(f"Checking {len(feeds)} due feeds")
 
-        for feed in feeds:
-            try:
-                feed_stats = await self._check_one_feed(feed)
-                stats["feeds_checked"] += 1
-                stats["items_found"] += feed_stats["items_found"]
-                stats["items_new"] += feed_stats["items_new"]
-            except Exception as e:
-                logger.error(f"Error checking feed {feed.name or '?'}: {e}")
-                stats["errors"] += 1
-                # Mark error on the feed record
-                await self._record_feed_error(feed, str(e))
+        concurrency = int(
+            await get_setting(self.db, "rss_fetch_concurrency", FETCH_CONCURRENCY)
+        )
+        per_host = int(
+            await get_setting(
+                self.db, "rss_fetch_per_host_limit", FETCH_PER_HOST_LIMIT
+            )
+        )
+        global_limit = asyncio.Semaphore(max(1, concurrency))
+        host_limits: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(max(1, per_host))
+        )
+
+        async def fetch(feed, url, etag, last_modified, session):
+            # Host slot first, so feeds queued behind a busy host don't hold
+            # global slots (or burn their request timeout) while waiting.
+            async with host_limits[_feed_host(url)], global_limit:
+                try:
+                    result = await fetch_single_feed(
+                        url,
+                        session=session,
+                        etag=etag,
+                        last_modified=last_modified,
+                    )
+                except Exception as e:
+                    result = FeedFetchResult(
+                        feed_url=url, success=False, error_message=str(e)
+                    )
+            return feed, result
+
+        connector = aiohttp.TCPConnector(limit=max(1, concurrency))
+        async with aiohttp.ClientSession(connector=connector) as session:
+            for next_done in asyncio.as_completed(
+                [
+                    # Read the columns up front: fetches run while earlier
+                    # results are being written through the same session.
+                    fetch(
+                        feed,
+                        feed.url,
+                        feed.http_etag,
+                        feed.http_last_modified,
+                        session,
+                    )
+                    for feed in feeds
+                ]
+            ):
+                feed, result = await next_done
+                try:
+                    feed_stats = await self._check_one_feed(feed, result)
+                    stats["feeds_checked"] += 1
+                    stats["items_found"] += feed_stats["items_found"]
+                    stats["items_new"] += feed_stats["items_new"]
+                    if result.not_modified:
+                        stats["feeds_not_modified"] += 1
+                except Exception as e:
+                    logger.error(f"Error checking feed {feed.name or '?'}: {e}")
+                    stats["errors"] += 1
+                    # Mark error on the feed record
+                    await self._record_feed_error(feed, str(e))
 
         logger.info(
-            f"Feed check complete: {stats['feeds_checked']} feeds, "
+            f"Feed check complete: {stats['feeds_checked']} feeds "
+            f"({stats['feeds_not_modified']} not modified), "
             f"{stats['items_found']} items found, {stats['items_new']} new, "
             f"{stats['errors']} errors"
         )
         return stats
 
     # -----------------------------------------------------------------------
-    # 2. _check_one_feed — fetch and store items from a single feed
+    # 2. _check_one_feed — store the fetched items of a single feed
     # -----------------------------------------------------------------------
 
-    async def _check_one_feed(self, feed) -> Dict[str, Any]:
+    async def _check_one_feed(self, feed, result: FeedFetchResult) -> Dict[str, Any]:
         """
-        Fetch a single feed and insert new items into ``rss_feed_items``.
+        Insert a fetched feed's items into ``rss_feed_items``.
 
-        Uses ``fetch_single_feed()`` from the existing RSS fetcher module.
-        Deduplicates via ``ON CONFLICT`` on ``(feed_id, url)`` unique index.
+        All items go in one multi-row ``INSERT ... ON CONFLICT`` on the
+        ``(feed_id, url)`` unique index.  A 304 Not Modified result skips the
+        insert and only reschedules the feed.  If the insert fails the error
+        is raised before the feed's ETag / Last-Modified are advanced.
 
         Args:
             feed: RssFeed ORM object.
+            result: The feed's ``fetch_single_feed()`` result.
 
         Returns:
             Dict with items_found, items_new counts.
         """
-        feed_id = str(feed.id)
-        feed_url = feed.url
-        feed_name = feed.name or feed_url
-
-        logger.debug(f"Checking feed: {feed_name} ({feed_url})")
-
-        result = await fetch_single_feed(feed_url)
+        feed_name = feed.name or feed.url
 
         if not result.success:
             await self._record_feed_error(feed, result.error_message or "Unknown error")
             return {"items_found": 0, "items_new": 0}
 
         items_found = len(result.articles)
-        items_new = 0
-
-        for article in result.articles:
-            try:
-                content_hash = _content_hash(article.title, article.url)
-
-                item_data = {
-                    "feed_id": feed.id,
-                    "url": article.url,
-                    "title": (article.title or "Untitled")[:500],
-                    "content": (article.content or "")[:10000],
-                    "author": (article.author or "")[:200] if article.author else None,
-                    "published_at": (
-                        article.published_at if article.published_at else None
-                    ),
-                    "content_hash": content_hash,
-                    "metadata_": {
-                        "tags": article.tags[:10] if article.tags else [],
-                        "source_name": article.source_name,
-                    },
-                }
-
-                # Upsert — the unique index on (feed_id, url) handles dedup
-                stmt = pg_insert(RssFeedItem).values(**item_data)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["feed_id", "url"],
-                    set_={
-                        "content": stmt.excluded.content,
-                        "content_hash": stmt.excluded.content_hash,
-                    },
-                )
-                stmt = stmt.returning(RssFeedItem.id, RssFeedItem.processed)
-                upsert_result = await self.db.execute(stmt)
-                row = upsert_result.fetchone()
-                await self.db.flush()
-
-                if row and row.processed is False:
-                    items_new += 1
-
-            except Exception as e:
-                logger.warning(
-                    f"Failed to insert item '{article.title[:50]}' from {feed_name}: {e}"
-                )
+        items_new = await self._upsert_items(feed, result.articles)
 
         # Update feed metadata
         now = datetime.now(timezone.utc)
@@ -229,6 +269,8 @@ class RSSService:
             "last_error": None,
             "updated_at": now,
             "articles_found_total": (feed.articles_found_total or 0) + items_found,
+            "http_etag": result.etag,
+            "http_last_modified": result.last_modified,
         }
 
         # Store feed-level metadata from the parsed feed
@@ -245,9 +287,58 @@ class RSSService:
         except Exception as e:
             logger.warning(f"Failed to update feed metadata for {feed_name}: {e}")
 
-        logger.info(f"Feed '{feed_name}': {items_found} items found, {items_new} new")
+        if result.not_modified:
+            logger.debug(f"Feed '{feed_name}': not modified")
+        else:
+            logger.info(
+                f"Feed '{feed_name}': {items_found} items found, {items_new} new"
+            )
         return {"items_found": items_found, "items_new": items_new}
 
+    async def _upsert_items(self, feed, articles) -> int:
+        """Upsert a feed's articles in one statement; returns unprocessed count."""
+        rows: Dict[str, Dict[str, Any]] = {}
+        for article in articles:
+            # ON CONFLICT DO UPDATE cannot touch the same row twice in one
+            # statement, so keep the first occurrence of each URL.
+            if article.url in rows:
+                continue
+            rows[article.url] = {
+                "feed_id": feed.id,
+                "url": article.url,
+                "title": (article.title or "Untitled")[:500],
+                "content": (article.content or "")[:10000],
+                "author": (article.author or "")[:200] if article.author else None,
+                "published_at": (
+                    article.published_at if article.published_at else None
+                ),
+                "content_hash": _content_hash(article.title, article.url),
+                "metadata_": {
+                    "tags": article.tags[:10] if article.tags else [],
+                    "source_name": article.source_name,
+                },
+            }
+        if not rows:
+            return 0
+
+        # Upsert — the unique index on (feed_id, url) handles dedup
+        stmt = pg_insert(RssFeedItem).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["feed_id", "url"],
+            set_={
+                "content": stmt.excluded.content,
+                "content_hash": stmt.excluded.content_hash,
+            },
+        )
+        stmt = stmt.returning(RssFeedItem.id, RssFeedItem.processed)
+        # A failed insert propagates so check_feeds records a feed error
+        # instead of storing the new validators: the next poll must
+        # re-download the items rather than get a 304.
+        async with self.db.begin_nested():
+            upsert_result = await self.db.execute(stmt)
+            returned = upsert_result.fetchall()
+        return sum(1 for row in returned if row.processed is False)
+
     # -----------------------------------------------------------------------
     # 3. process_new_items — triage and match unprocessed feed items
     # -----------------------------------------------------------------------
@@ -257,10 +348,14 @@ class RSSService:
         Fetch unprocessed feed items, triage for relevance, and match to
         existing signal cards.
 
-        Pipeline per item:
+        Items whose URL already exists as a card source (checked for the
+        whole batch in one query) are marked ``matched`` to that source.
+
+        Pipeline per remaining item:
           1. Crawl full article text via ``crawl_url()``
           2. Triage with ``ai_service.triage_source()``
-          3. If relevant: generate embedding and match to existing cards
+          3. If relevant: generate embedding (batched across the relevant
+             items of this call) and match to existing cards
           4. If matched: create a source record, update item with card_id/source_id
           5. If not matched but relevant: mark ``triage_result='pending'``
           6. If irrelevant: mark ``triage_result='irrelevant'``
@@ -300,15 +395,57 @@ class RSSService:
 
         logger.info(f"Processing {len(items)} unprocessed feed items")
 
+        # One round-trip for the whole batch: items whose URL is already a
+        # card source are linked to it without crawling or triaging again.
+        try:
+            existing_urls = await find_existing_source_urls(
+                self.db, [item.url for item in items]
+            )
+        except Exception as e:
+            logger.warning(f"Bulk URL pre-check failed: {e}")
+            existing_urls = {}
+
+        relevant: List[_TriagedItem] = []
         for item in items:
             try:
-                await self._process_one_item(item, stats)
+                existing = next(
+                    (
+                        row
+                        for row in existing_urls.get(
+                            normalize_source_url(item.url or ""), []
+                        )
+                        if row["card_id"]
+                    ),
+                    None,
+                )
+                if existing:
+                    await self._mark_processed(
+                        item.id,
+                        triage_result="matched",
+                        card_id=existing["card_id"],
+                        source_id=existing["id"],
+                    )
+                    await self._increment_feed_matched(item.feed_id)
+                    stats["items_processed"] += 1
+                    stats["items_matched"] += 1
+                    continue
+
+                triaged = await self._triage_one_item(item, stats)
+                if triaged is not None:
+                    relevant.append(triaged)
             except Exception as e:
-                logger.error(f"Error processing item '{(item.title or '?')[:50]}': {e}")
-                # Still mark as processed to avoid infinite retry loops
-                await self._mark_processed(item.id, triage_result="irrelevant")
-                stats["items_processed"] += 1
-                stats["items_irrelevant"] += 1
+                await self._mark_item_failed(item, stats, e)
+
+        # Step 3: embed every relevant item in batched requests
+        if relevant:
+            embeddings = await self.ai_service.generate_embeddings_batch(
+                [f"{t.title}\n\n{t.content[:6000]}" for t in relevant]
+            )
+            for triaged, embedding in zip(relevant, embeddings):
+                try:
+                    await self._match_item(triaged, embedding, stats)
+                except Exception as e:
+                    await self._mark_item_failed(triaged.item, stats, e)
 
         logger.info(
             f"Item processing complete: {stats['items_processed']} processed, "
@@ -317,10 +454,20 @@ class RSSService:
         )
         return stats
 
-    async def _process_one_item(self, item, stats: Dict[str, int]) -> None:
-        """Process a single feed item through triage and card matching."""
+    async def _mark_item_failed(
+        self, item, stats: Dict[str, int], error: Exception
+    ) -> None:
+        logger.error(f"Error processing item '{(item.title or '?')[:50]}': {error}")
+        # Still mark as processed to avoid infinite retry loops
+        await self._mark_processed(item.id, triage_result="irrelevant")
+        stats["items_processed"] += 1
+        stats["items_irrelevant"] += 1
+
+    async def _triage_one_item(
+        self, item, stats: Dict[str, int]
+    ) -> Optional[_TriagedItem]:
+        """Crawl and triage a feed item; return it if relevant, else mark it."""
         item_id = item.id
-        feed_id = item.feed_id
         title = item.title or "Untitled"
         url = item.url or ""
 
@@ -339,7 +486,7 @@ class RSSService:
             await self._mark_processed(item_id, triage_result="irrelevant")
             stats["items_processed"] += 1
             stats["items_irrelevant"] += 1
-            return
+            return None
 
         # Step 2: Triage for relevance
         triage = await self.ai_service.triage_source(title, content)
@@ -348,14 +495,26 @@ class RSSService:
             await self._mark_processed(item_id, triage_result="irrelevant")
             stats["items_processed"] += 1
             stats["items_irrelevant"] += 1
-            return
+            return None
 
-        # Step 3: Generate embedding for card matching
-        embed_text = f"{title}\n\n{content[:6000]}"
-        try:
-            embedding = await self.ai_service.generate_embedding(embed_text)
-        except Exception as e:
-            logger.warning(f"Embedding generation failed for '{title[:50]}': {e}")
+        return _TriagedItem(
+            item=item, title=title, url=url, content=content, triage=triage
+        )
+
+    async def _match_item(
+        self,
+        triaged: _TriagedItem,
+        embedding: Optional[List[float]],
+        stats: Dict[str, int],
+    ) -> None:
+        """Match a relevant, embedded feed item to a card or mark it pending."""
+        item = triaged.item
+        item_id = item.id
+        feed_id = item.feed_id
+        title = triaged.title
+
+        if embedding is None:
+            logger.warning(f"Embedding generation failed for '{title[:50]}'")
             # Mark as pending — signal agent can pick it up later
             await self._mark_processed(item_id, triage_result="pending")
             stats["items_processed"] += 1
@@ -370,9 +529,9 @@ class RSSService:
             source_id = await self._create_source_for_card(
                 card_id=matched_card_id,
                 title=title,
-                url=url,
-                content=content,
-                triage=triage,
+                url=triaged.url,
+                content=triaged.content,
+                triage=triaged.triage,
                 feed_name=await self._feed_name(item),
             )
             await self._mark_processed(
@@ -433,32 +592,22 @@ class RSSService:
 
     async def _python_card_search(self, embedding: List[float]) -> Optional[str]:
         """
-        Fallback: fetch card embeddings and compute cosine similarity in Python.
+        Fallback: exact cosine search over approved cards in the in-memory
+        card embedding matrix.
         """
-        from .discovery_service import cosine_similarity
-
         try:
-            result = await self.db.execute(
-                select(Card.id, Card.name, Card.embedding)
-                .where(Card.status == "approved")
-                .limit(200)
+            matches = await card_embedding_cache.search(
+                self.db, embedding, k=1, threshold=0.0, status="approved"
             )
-            cards = result.all()
         except Exception as e:
-            logger.error(f"Failed to fetch cards for Python fallback: {e}")
+            logger.error(f"Failed to search card embedding cache: {e}")
             return None
 
-        best_id: Optional[str] = None
-        best_sim = 0.0
+        if not matches:
+            return None
 
-        for card in cards:
-            card_emb = card.embedding
-            if not card_emb:
-                continue
-            sim = cosine_similarity(embedding, card_emb)
-            if sim > best_sim:
-                best_sim = sim
-                best_id = str(card.id)
+        best_id = matches[0]["id"]
+        best_sim = matches[0]["similarity"]
 
         if best_id and best_sim >= SIMILARITY_WEAK_THRESHOLD:
             logger.info(
@@ -631,7 +780,8 @@ class RSSService:
 
         # Perform initial check immediately
         try:
-            await self._check_one_feed(feed_obj)
+            result = await fetch_single_feed(feed_obj.url)
+            await self._check_one_feed(feed_obj, result)
         except Exception as e:
             logger.warning(f"Initial check failed for new feed '{name}': {e}")
 
@@ -24,6 +24,7 @@ from app.models.db.discovery import DiscoveryRun
 from app.models.db.research import ResearchTask
 from app.models.db.user import User
 from app.models.db.workstream import Workstream, WorkstreamScan
+from app.job_notify import notify_job
 
 logger = logging.getLogger(__name__)
 
@@ -227,6 +228,8 @@ async def run_nightly_scan():
                         f"Nightly scan: Failed to queue task for card {card.id}: {e}"
                     )
 
+            if tasks_queued:
+                await notify_job(db, "research")
             await db.commit()
 
         logger.info(f"Nightly scan complete: {tasks_queued} tasks queued")
@@ -280,6 +283,7 @@ async def run_weekly_discovery():
                 summary_report={"stage": "queued", "config": config.dict()},
             )
             db.add(new_run)
+            await notify_job(db, "discovery")
             await db.commit()
 
         logger.info(f"Weekly discovery run queued: {run_id}")
@@ -533,6 +537,7 @@ async def scan_grants():
                 },
             )
             db.add(new_run)
+            await notify_job(db, "discovery")
             await db.commit()
 
         logger.info(f"Grant scan discovery run queued: {run_id}")
@@ -0,0 +1,381 @@
+"""
+Shared cache of external search results (web, news, Grants.gov, SAM.gov, arXiv).
+
+Discovery runs, workstream scans, ``multi_source_search`` and the chat grant
+tools issue heavily overlapping queries against the same providers.
+:class:`SearchCache` sits in front of the lowest-level request functions:
+
+- ``search_provider.search_web`` / ``search_news`` / ``search_all``
+- ``grants_gov_fetcher._search_grants_gov``
+- ``sam_gov_fetcher._search_sam_gov`` (the API key is not part of the key)
+- the arXiv request in ``academic_fetcher.fetch_academic_papers``
+
+Entries are keyed by ``(provider, cache_key(query, **params))``.  The query
+is case-folded and whitespace-collapsed; every other request parameter
+(page size, offset, date window, backend) is part of the key, so different
+requests never share an entry.
+
+Freshness is per provider (``SEARCH_CACHE_TTLS``): news goes stale within
+minutes, Grants.gov and SAM.gov listings within hours.  A stale entry is
+still served for another ``ttl * SEARCH_CACHE_STALE_RATIO`` seconds while a
+single background request refreshes it (stale-while-revalidate); past that
+the caller waits for a fresh response.  Concurrent misses for the same key
+share one request, except inside :func:`bypass_inflight`, where a miss always
+issues its own (used by ``multi_source_search`` hedging, whose duplicate
+request would otherwise just join the one it is racing).
+
+Storage is a bounded in-process LRU (``SEARCH_CACHE_MAX_ENTRIES``) in front
+of an optional persistent tier, the ``search_result_cache`` table, which
+lets the API and worker processes share results and survive restarts.  The
+persistent tier is best-effort like ``llm_result_cache``: without a
+database, or on any database error, it is skipped.
+
+Empty or failed responses are never cached: the fetchers return ``{}`` /
+``[]`` for both, and a refresh that fails keeps the previous entry.
+
+Usage:
+    from app.search_cache import cache_key, search_cache
+
+    payload = await search_cache.fetch(
+        "grants_gov", cache_key(keyword, rows=25, offset=0), load
+    )
+    search_cache.stats()   # per-provider hit rates, for monitoring
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import app.database as database
+from app.models.db.analytics import CachedSearchResult
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1000"))
+SEARCH_CACHE_STALE_RATIO = float(os.getenv("SEARCH_CACHE_STALE_RATIO", "1.0"))
+SEARCH_CACHE_PERSIST = os.getenv("SEARCH_CACHE_PERSIST", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+SEARCH_CACHE_PRUNE_SECONDS = float(os.getenv("SEARCH_CACHE_PRUNE_SECONDS", "3600"))
+
+# Fresh lifetime per provider in seconds (SEARCH_CACHE_TTL_<PROVIDER>
+# overrides; 0 disables caching for that provider).
+SEARCH_CACHE_TTLS: Dict[str, float] = {
+    provider: float(os.getenv(f"SEARCH_CACHE_TTL_{provider.upper()}", default))
+    for provider, default in {
+        "news": "900",
+        "web": "3600",
+        "grants_gov": "21600",
+        "sam_gov": "43200",
+        "arxiv": "86400",
+    }.items()
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+EntryKey = Tuple[str, str]
+Loader = Callable[[], Awaitable[Any]]
+
+_bypass: ContextVar[bool] = ContextVar("search_cache_bypass_inflight", default=False)
+
+
+@contextmanager
+def bypass_inflight() -> Iterator[None]:
+    """Give cache misses inside the block their own request.
+
+    Cached entries are still served and the response is still stored; only
+    joining an in-flight request for the same key is skipped.
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def cache_key(query: str, **params: Any) -> str:
+    """Digest of the normalized query and every other request parameter."""
+    normalized = _WHITESPACE.sub(" ", (query or "").casefold()).strip()
+    payload = json.dumps({"query": normalized, **params}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SearchEntry:
+    """A cached provider response (JSON-compatible) and when it was fetched."""
+
+    value: Any
+    fetched_at: float  # epoch seconds
+
+
+class SearchCache:
+    """Per-provider TTL cache with stale-while-revalidate and a DB tier."""
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: Optional[int] = None,
+        stale_ratio: Optional[float] = None,
+        persist: Optional[bool] = None,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        prune_interval: Optional[float] = None,
+    ) -> None:
+        self.ttls = dict(SEARCH_CACHE_TTLS if ttls is None else ttls)
+        self.max_entries = (
+            max_entries if max_entries is not None else SEARCH_CACHE_MAX_ENTRIES
+        )
+        self.stale_ratio = (
+            stale_ratio if stale_ratio is not None else SEARCH_CACHE_STALE_RATIO
+        )
+        self.persist = SEARCH_CACHE_PERSIST if persist is None else persist
+        self.prune_interval = (
+            prune_interval
+            if prune_interval is not None
+            else SEARCH_CACHE_PRUNE_SECONDS
+        )
+        self._factory = session_factory
+        self._entries: "OrderedDict[EntryKey, SearchEntry]" = OrderedDict()
+        self._inflight: Dict[EntryKey, "asyncio.Future[Any]"] = {}
+        self._counts: Counter = Counter()
+        self._last_prune = time.monotonic()
+
+    @property
+    def factory(self) -> Optional[async_sessionmaker[AsyncSession]]:
+        if not self.persist:
+            return None
+        return self._factory or database.async_session_factory
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    async def fetch(
+        self,
+        provider: str,
+        key: str,
+        loader: Loader,
+        *,
+        cacheable: Callable[[Any], bool] = bool,
+    ) -> Any:
+        """
+        Cached response for ``(provider, key)``, calling *loader* when needed.
+
+        *loader* is a zero-argument coroutine function returning a
+        JSON-compatible value; results for which *cacheable* is false
+        (by default: empty ones) are returned but not stored.  Loader
+        exceptions propagate to the caller waiting on them.  Inside
+        :func:`bypass_inflight` a miss calls *loader* even when a request
+        for the key is already in flight.
+        """
+        ttl = self.ttls.get(provider, 0.0)
+        if self.max_entries <= 0 or ttl <= 0:
+            return await loader()
+
+        entry_key = (provider, key)
+        entry = self._entries.get(entry_key)
+        if entry is not None:
+            self._entries.move_to_end(entry_key)
+        else:
+            entry = await self._load(provider, key)
+            if entry is not None:
+                self._counts[(provider, "persistent_hit")] += 1
+                self._remember(entry_key, entry)
+
+        if entry is not None:
+            age = time.time() - entry.fetched_at
+            if age < ttl:
+                self._counts[(provider, "hit")] += 1
+                return entry.value
+            if age < ttl * (1 + self.stale_ratio):
+                self._counts[(provider, "stale")] += 1
+                self._revalidate(entry_key, loader, cacheable)
+                return entry.value
+            self._entries.pop(entry_key, None)
+
+        self._counts[(provider, "miss")] += 1
+        if _bypass.get():
+            return await self._refresh(entry_key, loader, cacheable)
+        return await asyncio.shield(self._single_flight(entry_key, loader, cacheable))
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def _single_flight(
+        self, entry_key: EntryKey, loader: Loader, cacheable: Callable[[Any], bool]
+    ) -> "asyncio.Future[Any]":
+        """The in-flight refresh for the key, starting one if needed."""
+        task = self._inflight.get(entry_key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._refresh(entry_key, loader, cacheable))
+            self._inflight[entry_key] = task
+            task.add_done_callback(lambda done: self._forget(entry_key, done))
+        return task
+
+    def _forget(self, entry_key: EntryKey, task: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(entry_key) is task:
+            del self._inflight[entry_key]
+
+    def _revalidate(
+        self, entry_key: EntryKey, loader: Loader, cacheable: Callable[[Any], bool]
+    ) -> None:
+        if entry_key in self._inflight:
+            return
+        task = self._single_flight(entry_key, loader, cacheable)
+        task.add_done_callback(self._log_background_failure)
+
+    @staticmethod
+    def _log_background_failure(task: "asyncio.Future[Any]") -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Search cache revalidation failed: %s", task.exception())
+
+    async def _refresh(
+        self, entry_key: EntryKey, loader: Loader, cacheable: Callable[[Any], bool]
+    ) -> Any:
+        value = await loader()
+        provider, key = entry_key
+        if not cacheable(value):
+            self._counts[(provider, "uncacheable")] += 1
+            return value
+        entry = SearchEntry(value=value, fetched_at=time.time())
+        self._remember(entry_key, entry)
+        await self._store(provider, key, entry)
+        return value
+
+    def _remember(self, entry_key: EntryKey, entry: SearchEntry) -> None:
+        self._entries[entry_key] = entry
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counts["evicted"] += 1
+
+    # ------------------------------------------------------------------
+    # Persistent tier
+    # ------------------------------------------------------------------
+
+    async def _load(self, provider: str, key: str) -> Optional[SearchEntry]:
+        factory = self.factory
+        if factory is None:
+            return None
+        try:
+            async with factory() as db:
+                row = (
+                    await db.execute(
+                        select(
+                            CachedSearchResult.payload, CachedSearchResult.fetched_at
+                        ).where(
+                            CachedSearchResult.provider == provider,
+                            CachedSearchResult.cache_key == key,
+                        )
+                    )
+                ).one_or_none()
+        except Exception as exc:
+            self._counts["persistent_error"] += 1
+            logger.warning("Search cache lookup failed (%s): %s", provider, exc)
+            return None
+        if row is None:
+            return None
+        return SearchEntry(value=row.payload, fetched_at=row.fetched_at.timestamp())
+
+    async def _store(self, provider: str, key: str, entry: SearchEntry) -> None:
+        factory = self.factory
+        if factory is None:
+            return
+        fetched_at = datetime.fromtimestamp(entry.fetched_at, tz=timezone.utc)
+        stmt = pg_insert(CachedSearchResult).values(
+            provider=provider,
+            cache_key=key,
+            payload=entry.value,
+            fetched_at=fetched_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["provider", "cache_key"],
+            set_={"payload": stmt.excluded.payload, "fetched_at": fetched_at},
+        )
+        try:
+            async with factory() as db:
+                await db.execute(stmt)
+                await db.commit()
+        except Exception as exc:
+            self._counts["persistent_error"] += 1
+            logger.warning("Search cache write failed (%s): %s", provider, exc)
+            return
+
+        if time.monotonic() - self._last_prune >= self.prune_interval:
+            self._last_prune = time.monotonic()
+            await self.prune()
+
+    async def prune(self) -> int:
+        """Delete persisted entries too old to be served, even stale."""
+        factory = self.factory
+        if factory is None or not self.ttls:
+            return 0
+        max_age = case(
+            {
+                provider: ttl * (1 + self.stale_ratio)
+                for provider, ttl in self.ttls.items()
+            },
+            value=CachedSearchResult.provider,
+            else_=0,
+        )
+        cutoff = func.extract("epoch", func.now() - CachedSearchResult.fetched_at)
+        try:
+            async with factory() as db:
+                result = await db.execute(
+                    CachedSearchResult.__table__.delete().where(cutoff > max_age)
+                )
+                await db.commit()
+        except Exception as exc:
+            logger.warning("Search cache prune failed: %s", exc)
+            return 0
+        removed = result.rowcount or 0
+        if removed:
+            logger.info("Pruned %d search cache entries", removed)
+        return removed
+
+    # ------------------------------------------------------------------
+    # Maintenance / stats
+    # ------------------------------------------------------------------
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and per-provider hit rates since process start."""
+        providers: Dict[str, Any] = {}
+        for provider in sorted(self.ttls):
+            counts = {
+                kind: self._counts[(provider, kind)]
+                for kind in ("hit", "stale", "miss", "persistent_hit", "uncacheable")
+            }
+            lookups = counts["hit"] + counts["stale"] + counts["miss"]
+            served = counts["hit"] + counts["stale"]
+            counts["hit_rate"] = round(served / lookups, 4) if lookups else 0.0
+            providers[provider] = counts
+        return {
+            "entries": len(self._entries),
+            "evicted": self._counts["evicted"],
+            "persistent_error": self._counts["persistent_error"],
+            "ttl_seconds": dict(self.ttls),
+            "providers": providers,
+        }
+
+
+# Shared per-process instance
+search_cache = SearchCache()
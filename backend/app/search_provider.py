@@ -16,14 +16,22 @@ When set to "auto" (default), the provider tries backends in order:
 The first available backend wins. If none are configured, search calls
 return empty results with a warning — the system degrades gracefully
 to RSS-only discovery.
+
+Results are served through the shared search cache (app/search_cache.py),
+keyed by backend, query and request parameters; news entries go stale
+sooner than web entries.  Backend requests are paced by the shared rate
+governor (app/rate_governor.py, provider "search").
 """
 
 import os
 import logging
 import asyncio
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import List, Optional
 
+from .rate_governor import QuotaExhausted, rate_governor
+from .search_cache import cache_key, search_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -286,6 +294,37 @@ _DISPATCH = {
 }
 
 
+async def _cached_search(
+    kind: str,
+    provider: str,
+    fn,
+    query: str,
+    num_results: int,
+    date_filter: Optional[str],
+    search_depth: str,
+) -> List[SearchResult]:
+    """Call a provider search function through the shared search cache."""
+
+    async def load() -> List[dict]:
+        try:
+            await rate_governor.acquire("search")
+        except QuotaExhausted as exc:
+            logger.warning("Search skipped: %s", exc)
+            return []
+        results = await fn(query, num_results, date_filter, search_depth=search_depth)
+        return [asdict(r) for r in results]
+
+    key = cache_key(
+        query,
+        backend=provider,
+        num_results=num_results,
+        date_filter=date_filter,
+        search_depth=search_depth,
+    )
+    payload = await search_cache.fetch(kind, key, load)
+    return [SearchResult(**item) for item in payload]
+
+
 # ---------------------------------------------------------------------------
 # Public API — drop-in replacement for serper_fetcher imports
 # ---------------------------------------------------------------------------
@@ -304,7 +343,9 @@ async def search_web(
         return []
 
     fn_web, _ = _DISPATCH[provider]
-    return await fn_web(query, num_results, date_filter, search_depth=search_depth)
+    return await _cached_search(
+        "web", provider, fn_web, query, num_results, date_filter, search_depth
+    )
 
 
 async def search_news(
@@ -320,7 +361,9 @@ async def search_news(
         return []
 
     _, fn_news = _DISPATCH[provider]
-    return await fn_news(query, num_results, date_filter, search_depth=search_depth)
+    return await _cached_search(
+        "news", provider, fn_news, query, num_results, date_filter, search_depth
+    )
 
 
 async def search_all(
@@ -343,14 +386,26 @@ async def search_all(
     for query in queries:
         if include_web:
             tasks.append(
-                fn_web(
-                    query, num_results_per_query, date_filter, search_depth=search_depth
+                _cached_search(
+                    "web",
+                    provider,
+                    fn_web,
+                    query,
+                    num_results_per_query,
+                    date_filter,
+                    search_depth,
                 )
             )
         if include_news:
             tasks.append(
-                fn_news(
-                    query, num_results_per_query, date_filter, search_depth=search_depth
+                _cached_search(
+                    "news",
+                    provider,
+                    fn_news,
+                    query,
+                    num_results_per_query,
+                    date_filter,
+                    search_depth,
                 )
             )
 
@@ -26,11 +26,11 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import select, text
+from sqlalchemy import select
 from sqlalchemy import update as sa_update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.helpers.db_utils import vector_search_cards
+from app.helpers.db_utils import store_card_embedding, vector_search_cards
 from app.models.db.card import Card
 from app.models.db.card_extras import CardTimeline
 from app.models.db.source import DiscoveredSource, SignalSource, Source
@@ -1475,13 +1475,7 @@ class SignalAgentService:
             ]
             if source_embeddings:
                 centroid = _compute_centroid(source_embeddings)
-                embedding_str = "[" + ",".join(str(v) for v in centroid) + "]"
-                await self.db.execute(
-                    text(
-                        "UPDATE cards SET embedding = CAST(:emb AS vector) WHERE id = :cid"
-                    ),
-                    {"emb": embedding_str, "cid": card_id},
-                )
+                await store_card_embedding(self.db, card_id, centroid)
                 await self.db.flush()
         except Exception as e:
             logger.warning(
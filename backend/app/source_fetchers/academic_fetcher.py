@@ -11,6 +11,8 @@ Features:
 - Support for date range filtering
 - Configurable result limits
 - Graceful error handling with retry logic
+- Feeds shared through the search cache (app/search_cache.py)
+- Requests paced by the shared rate governor (app/rate_governor.py)
 
 Usage:
     papers = await fetch_academic_papers(
@@ -29,6 +31,9 @@ from typing import List, Optional, Dict, Any
 import aiohttp
 import feedparser
 
+from ..rate_governor import QuotaExhausted, rate_governor, retry_after_seconds
+from ..search_cache import cache_key, search_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -226,6 +231,78 @@ def _parse_arxiv_entry(entry: Dict[str, Any]) -> Optional[AcademicPaper]:
 # ============================================================================
 
 
+async def _request_arxiv_feed(
+    url: str,
+    timeout: int,
+    retry_count: int,
+    retry_delay: float,
+) -> Optional[str]:
+    """
+    Fetch an arXiv API Atom feed with retry logic.
+
+    Failures are logged here rather than reported to the caller: the result
+    is shared through the search cache, so the request may be serving
+    another caller's fetch.
+
+    Returns:
+        The feed XML, or None on failure
+    """
+    current_delay = retry_delay
+    for attempt in range(retry_count):
+        try:
+            await rate_governor.acquire("arxiv")
+            async with aiohttp.ClientSession() as session:
+                async with session.get(
+                    url,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                    headers={"User-Agent": "GrantScope-App/1.0 (Research Pipeline)"},
+                ) as response:
+                    if response.status == 200:
+                        return await response.text()
+
+                    elif response.status == 503:
+                        # arXiv rate limiting: pause every arXiv caller; the
+                        # next acquire waits
+                        logger.warning(
+                            f"arXiv rate limit hit (attempt {attempt + 1}/{retry_count})"
+                        )
+                        rate_governor.throttle(
+                            "arxiv",
+                            retry_after_seconds(response.headers, current_delay),
+                        )
+                        current_delay *= 2
+
+                    else:
+                        error_msg = f"arXiv API error: status {response.status}"
+                        logger.error(error_msg)
+                        return None
+
+        except asyncio.TimeoutError:
+            error_msg = f"arXiv request timeout (attempt {attempt + 1}/{retry_count})"
+            logger.warning(error_msg)
+            if attempt < retry_count - 1:
+                await asyncio.sleep(current_delay)
+                current_delay *= 2
+
+        except aiohttp.ClientError as e:
+            error_msg = f"arXiv connection error: {str(e)[:100]}"
+            logger.warning(f"{error_msg} (attempt {attempt + 1}/{retry_count})")
+            if attempt < retry_count - 1:
+                await asyncio.sleep(current_delay)
+                current_delay *= 2
+
+        except QuotaExhausted as e:
+            logger.warning(f"arXiv fetch skipped: {e}")
+            return None
+
+        except Exception as e:
+            error_msg = f"arXiv fetch error: {str(e)[:100]}"
+            logger.error(error_msg, exc_info=True)
+            return None
+
+    return None
+
+
 async def fetch_academic_papers(
     query: str = "",
     categories: Optional[List[str]] = None,
@@ -283,88 +360,49 @@ async def fetch_academic_papers(
     )
     logger.debug(f"arXiv API URL: {url}")
 
-    # Fetch with retry logic
-    current_delay = retry_delay
-    for attempt in range(retry_count):
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=timeout),
-                    headers={"User-Agent": "GrantScope-App/1.0 (Research Pipeline)"},
-                ) as response:
-                    if response.status == 200:
-                        content = await response.text()
-
-                        # Parse Atom feed
-                        feed = feedparser.parse(content)
-
-                        # Check for feed parsing errors
-                        if feed.bozo:
-                            logger.warning(
-                                f"arXiv feed parsing warning: {feed.bozo_exception}"
-                            )
-                            errors.append(
-                                f"Feed parsing warning: {str(feed.bozo_exception)[:100]}"
-                            )
-
-                        # Extract total results from feed
-                        total_results = 0
-                        if hasattr(feed.feed, "opensearch_totalresults"):
-                            try:
-                                total_results = int(feed.feed.opensearch_totalresults)
-                            except (ValueError, TypeError):
-                                total_results = len(feed.entries)
-                        else:
-                            total_results = len(feed.entries)
-
-                        # Parse entries
-                        for entry in feed.entries:
-                            if paper := _parse_arxiv_entry(entry):
-                                papers.append(paper)
-
-                        logger.info(
-                            f"arXiv fetch successful: {len(papers)} papers from {total_results} total"
-                        )
-                        break
-
-                    elif response.status == 503:
-                        # arXiv rate limiting
-                        logger.warning(
-                            f"arXiv rate limit hit (attempt {attempt + 1}/{retry_count})"
-                        )
-                        errors.append(f"Rate limit hit on attempt {attempt + 1}")
-                        if attempt < retry_count - 1:
-                            await asyncio.sleep(current_delay)
-                            current_delay *= 2
-
-                    else:
-                        error_msg = f"arXiv API error: status {response.status}"
-                        logger.error(error_msg)
-                        errors.append(error_msg)
-                        break
-
-        except asyncio.TimeoutError:
-            error_msg = f"arXiv request timeout (attempt {attempt + 1}/{retry_count})"
-            logger.warning(error_msg)
-            errors.append(error_msg)
-            if attempt < retry_count - 1:
-                await asyncio.sleep(current_delay)
-                current_delay *= 2
+    # Fetch the Atom feed (shared through the search cache), then parse it
+    key = cache_key(
+        query,
+        categories=sorted(categories),
+        start=start,
+        max_results=max_results,
+        sort_by=sort_by,
+        sort_order=sort_order,
+    )
+    content = await search_cache.fetch(
+        "arxiv",
+        key,
+        lambda: _request_arxiv_feed(url, timeout, retry_count, retry_delay),
+    )
+    if content is None:
+        errors.append("arXiv fetch failed")
+
+    total_results = 0
+    if content:
+        feed = feedparser.parse(content)
+
+        # Check for feed parsing errors
+        if feed.bozo:
+            logger.warning(f"arXiv feed parsing warning: {feed.bozo_exception}")
+            errors.append(f"Feed parsing warning: {str(feed.bozo_exception)[:100]}")
+
+        # Extract total results from feed
+        if hasattr(feed.feed, "opensearch_totalresults"):
+            try:
+                total_results = int(feed.feed.opensearch_totalresults)
+            except (ValueError, TypeError):
+                total_results = len(feed.entries)
+        else:
+            total_results = len(feed.entries)
 
-        except aiohttp.ClientError as e:
-            error_msg = f"arXiv connection error: {str(e)[:100]}"
-            logger.warning(f"{error_msg} (attempt {attempt + 1}/{retry_count})")
-            errors.append(error_msg)
-            if attempt < retry_count - 1:
-                await asyncio.sleep(current_delay)
-                current_delay *= 2
+        # Parse entries
+        for entry in feed.entries:
+            if paper := _parse_arxiv_entry(entry):
+                papers.append(paper)
 
-        except Exception as e:
-            error_msg = f"arXiv fetch error: {str(e)[:100]}"
-            logger.error(error_msg, exc_info=True)
-            errors.append(error_msg)
-            break
+        logger.info(
+            f"arXiv fetch successful: {len(papers)} papers from {total_results} total"
+        )
 
     fetch_time = (datetime.now(timezone.utc) - start_time).total_seconds()
 
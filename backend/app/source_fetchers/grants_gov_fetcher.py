@@ -11,6 +11,8 @@ Features:
 - Pagination support (API returns max 25 per page)
 - Austin-relevance filtering by CFDA prefix, agency, and keywords
 - Graceful error handling with retry logic
+- Search responses shared through the search cache (app/search_cache.py)
+- Requests paced by the shared rate governor (app/rate_governor.py)
 - Structured grant metadata in RawSource content field
 
 Usage:
@@ -41,6 +43,9 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import aiohttp
 
+from ..rate_governor import QuotaExhausted, rate_governor, retry_after_seconds
+from ..search_cache import cache_key, search_cache
+
 if TYPE_CHECKING:
     from ..research_service import RawSource
 
@@ -402,12 +407,54 @@ def _is_austin_relevant(opp: GrantsGovOpportunity) -> bool:
 # ============================================================================
 
 
+def _new_session() -> aiohttp.ClientSession:
+    """Client session configured the way the Grants.gov API requires."""
+    # Grants.gov API requires an explicit SSL context; without it, Python's
+    # default aiohttp SSL handling causes the API to return empty results.
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+        connector=aiohttp.TCPConnector(ssl=ssl.create_default_context()),
+    )
+
+
 async def _search_grants_gov(
     session: aiohttp.ClientSession,
     keyword: str,
     rows: int = MAX_RESULTS_PER_PAGE,
     offset: int = 0,
     posted_only: bool = True,
+) -> Dict[str, Any]:
+    """
+    Search the Grants.gov API through the shared search cache.
+
+    Same arguments and return value as :func:`_request_grants_gov`.  A
+    background refresh of a stale entry may outlive *session*, in which
+    case it opens its own.
+    """
+
+    async def load() -> Dict[str, Any]:
+        if not session.closed:
+            return await _request_grants_gov(
+                session, keyword, rows, offset, posted_only
+            )
+        async with _new_session() as fresh:
+            return await _request_grants_gov(fresh, keyword, rows, offset, posted_only)
+
+    key = cache_key(
+        keyword,
+        rows=min(rows, MAX_RESULTS_PER_PAGE),
+        offset=offset,
+        posted_only=posted_only,
+    )
+    return await search_cache.fetch("grants_gov", key, load)
+
+
+async def _request_grants_gov(
+    session: aiohttp.ClientSession,
+    keyword: str,
+    rows: int = MAX_RESULTS_PER_PAGE,
+    offset: int = 0,
+    posted_only: bool = True,
 ) -> Dict[str, Any]:
     """
     Execute a single search request against the Grants.gov API.
@@ -438,6 +485,7 @@ async def _search_grants_gov(
 
     for attempt in range(MAX_RETRIES):
         try:
+            await rate_governor.acquire("grants_gov")
             async with session.post(
                 GRANTS_GOV_API_URL,
                 json=payload,
@@ -452,12 +500,15 @@ async def _search_grants_gov(
                     return data.get("data", data)
 
                 if response.status == 429:
-                    wait_time = RETRY_BASE_DELAY * (2**attempt)
+                    # Pause every Grants.gov caller; the next acquire waits
+                    wait_time = retry_after_seconds(
+                        response.headers, RETRY_BASE_DELAY * (2**attempt)
+                    )
                     logger.warning(
-                        f"Grants.gov rate limited, waiting {wait_time:.1f}s "
+                        f"Grants.gov rate limited, pausing {wait_time:.1f}s "
                         f"(attempt {attempt + 1}/{MAX_RETRIES})"
                     )
-                    await asyncio.sleep(wait_time)
+                    rate_governor.throttle("grants_gov", wait_time)
                     continue
 
                 if response.status >= 500:
@@ -490,6 +541,10 @@ async def _search_grants_gov(
             if attempt < MAX_RETRIES - 1:
                 await asyncio.sleep(RETRY_BASE_DELAY * (2**attempt))
 
+        except QuotaExhausted as exc:
+            logger.warning(f"Grants.gov search skipped: {exc}")
+            return {}
+
         except Exception as exc:
             logger.error(f"Unexpected error calling Grants.gov API: {exc}")
             return {}
@@ -533,13 +588,7 @@ async def fetch_grants_gov_opportunities(
     errors: List[str] = []
     total_api_results = 0
 
-    timeout = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
-    # Grants.gov API requires an explicit SSL context; without it, Python's
-    # default aiohttp SSL handling causes the API to return empty results.
-    ssl_ctx = ssl.create_default_context()
-    connector = aiohttp.TCPConnector(ssl=ssl_ctx)
-
-    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+    async with _new_session() as session:
         for topic in topics:
             if len(all_opportunities) >= max_results:
                 break
@@ -602,9 +651,6 @@ async def fetch_grants_gov_opportunities(
                 offset += len(opp_hits)
                 remaining = max_results - len(all_opportunities)
 
-                # Small delay between pages to be respectful
-                await asyncio.sleep(0.5)
-
     logger.info(
         f"Grants.gov fetch complete: {len(all_opportunities)} opportunities "
         f"(from {total_api_results} total API results, "
@@ -773,6 +819,7 @@ async def fetch_opportunity_details(opportunity_id: str) -> Optional[Dict[str, A
     async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
         for attempt in range(MAX_RETRIES):
             try:
+                await rate_governor.acquire("grants_gov")
                 async with session.post(
                     FETCH_OPPORTUNITY_URL,
                     json={"opportunityId": int(opportunity_id)},
@@ -801,11 +848,13 @@ async def fetch_opportunity_details(opportunity_id: str) -> Optional[Dict[str, A
                         return None
 
                     if response.status == 429:
-                        wait_time = RETRY_BASE_DELAY * (2**attempt)
+                        wait_time = retry_after_seconds(
+                            response.headers, RETRY_BASE_DELAY * (2**attempt)
+                        )
                         logger.warning(
-                            f"Grants.gov rate limited, waiting {wait_time:.1f}s"
+                            f"Grants.gov rate limited, pausing {wait_time:.1f}s"
                         )
-                        await asyncio.sleep(wait_time)
+                        rate_governor.throttle("grants_gov", wait_time)
                         continue
 
                     if response.status >= 500:
@@ -826,6 +875,9 @@ async def fetch_opportunity_details(opportunity_id: str) -> Optional[Dict[str, A
             except (ValueError, TypeError) as exc:
                 logger.error(f"Invalid opportunity ID '{opportunity_id}': {exc}")
                 return None
+            except QuotaExhausted as exc:
+                logger.warning(f"Grants.gov detail fetch skipped: {exc}")
+                return None
 
     logger.error(
         f"Failed to fetch opportunity details after {MAX_RETRIES} attempts "
@@ -63,6 +63,11 @@ class FeedFetchResult:
     error_message: Optional[str] = None
     feed_title: Optional[str] = None
     feed_link: Optional[str] = None
+    # Conditional GET: validators from the response, and whether the server
+    # answered 304 Not Modified (articles are then empty and nothing was parsed)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
 
 
 # ============================================================================
@@ -189,6 +194,8 @@ async def fetch_single_feed(
     session: Optional[aiohttp.ClientSession] = None,
     timeout: int = 30,
     max_articles: int = 50,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
 ) -> FeedFetchResult:
     """
     Fetch and parse a single RSS/Atom feed.
@@ -198,9 +205,13 @@ async def fetch_single_feed(
         session: Optional aiohttp session for connection reuse
         timeout: Request timeout in seconds
         max_articles: Maximum number of articles to return from this feed
+        etag: ETag from the previous fetch, sent as If-None-Match
+        last_modified: Last-Modified from the previous fetch, sent as
+            If-Modified-Since
 
     Returns:
-        FeedFetchResult with articles or error information
+        FeedFetchResult with articles or error information.  A 304 response
+        returns ``success=True, not_modified=True`` without parsing.
     """
     logger.debug(f"Fetching RSS feed: {feed_url}")
 
@@ -215,6 +226,10 @@ async def fetch_single_feed(
             "User-Agent": "GrantScope-ContentPipeline/1.0 (https://grantscope.app)",
             "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml, */*",
         }
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
 
         async with session.get(
             feed_url,
@@ -222,6 +237,18 @@ async def fetch_single_feed(
             timeout=aiohttp.ClientTimeout(total=timeout),
             allow_redirects=True,
         ) as response:
+            if response.status == 304:
+                logger.debug(f"Feed not modified: {feed_url}")
+                return FeedFetchResult(
+                    feed_url=feed_url,
+                    success=True,
+                    not_modified=True,
+                    etag=response.headers.get("ETag") or etag,
+                    last_modified=(
+                        response.headers.get("Last-Modified") or last_modified
+                    ),
+                )
+
             if response.status != 200:
                 error_msg = f"HTTP {response.status}: {response.reason}"
                 logger.warning(f"Feed fetch failed for {feed_url}: {error_msg}")
@@ -230,6 +257,8 @@ async def fetch_single_feed(
                 )
 
             content = await response.text()
+            response_etag = response.headers.get("ETag")
+            response_last_modified = response.headers.get("Last-Modified")
 
         # Parse feed with feedparser
         feed = feedparser.parse(content)
@@ -292,6 +321,8 @@ async def fetch_single_feed(
             articles=articles,
             feed_title=feed_title,
             feed_link=feed_link,
+            etag=response_etag,
+            last_modified=response_last_modified,
         )
 
     except asyncio.TimeoutError:
@@ -12,6 +12,10 @@ Features:
 - Pagination support for large result sets
 - Graceful error handling with retry logic (SAM.gov can be slow)
 - Date range filtering for recent opportunities
+- Search responses shared through the search cache (app/search_cache.py),
+  which stretches the API key's daily quota
+- Requests paced by the shared rate governor (app/rate_governor.py), which
+  also tracks the daily quota
 - Converts results to RawSource format for pipeline integration
 
 API Documentation:
@@ -46,6 +50,9 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import aiohttp
 
+from ..rate_governor import QuotaExhausted, rate_governor, retry_after_seconds
+from ..search_cache import cache_key, search_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -366,6 +373,47 @@ async def _search_sam_gov(
     posted_from: Optional[str] = None,
     posted_to: Optional[str] = None,
     ncode: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Search the SAM.gov Opportunities API through the shared search cache.
+
+    Same arguments and return value as :func:`_request_sam_gov`; the API key
+    is not part of the cache key.  A background refresh of a stale entry may
+    outlive *session*, in which case it opens its own.
+    """
+
+    filters: Dict[str, Any] = {
+        "offset": offset,
+        "ptype": ptype,
+        "posted_from": posted_from,
+        "posted_to": posted_to,
+        "ncode": ncode,
+    }
+
+    async def load() -> Dict[str, Any]:
+        if not session.closed:
+            return await _request_sam_gov(
+                session, keyword, limit, api_key=api_key, **filters
+            )
+        async with aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}) as fresh:
+            return await _request_sam_gov(
+                fresh, keyword, limit, api_key=api_key, **filters
+            )
+
+    key = cache_key(keyword, limit=min(limit, MAX_RESULTS_PER_PAGE), **filters)
+    return await search_cache.fetch("sam_gov", key, load)
+
+
+async def _request_sam_gov(
+    session: aiohttp.ClientSession,
+    keyword: str,
+    limit: int,
+    offset: int,
+    api_key: str,
+    ptype: Optional[str] = None,
+    posted_from: Optional[str] = None,
+    posted_to: Optional[str] = None,
+    ncode: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Execute a single search against the SAM.gov Opportunities API.
@@ -408,6 +456,7 @@ async def _search_sam_gov(
 
     for attempt in range(max_retries):
         try:
+            await rate_governor.acquire("sam_gov")
             async with session.get(
                 SAM_GOV_API_URL,
                 params=params,
@@ -418,13 +467,16 @@ async def _search_sam_gov(
                     return data
 
                 elif response.status == 429:
-                    # Rate limited
-                    wait_time = retry_delay * (2**attempt)
+                    # Rate limited: pause every SAM.gov caller; the next
+                    # acquire waits
+                    wait_time = retry_after_seconds(
+                        response.headers, retry_delay * (2**attempt)
+                    )
                     logger.warning(
                         f"SAM.gov rate limited (attempt {attempt + 1}/{max_retries}), "
-                        f"waiting {wait_time:.1f}s"
+                        f"pausing {wait_time:.1f}s"
                     )
-                    await asyncio.sleep(wait_time)
+                    rate_governor.throttle("sam_gov", wait_time)
 
                 elif response.status == 403:
                     logger.error(
@@ -466,6 +518,10 @@ async def _search_sam_gov(
             if attempt < max_retries - 1:
                 await asyncio.sleep(retry_delay)
 
+        except QuotaExhausted as e:
+            logger.warning(f"SAM.gov search skipped: {e}")
+            return {}
+
         except Exception as e:
             logger.error(f"Unexpected error calling SAM.gov API: {e}", exc_info=True)
             return {}
@@ -682,7 +738,7 @@ async def fetch_sam_gov_opportunities(
     headers = {"User-Agent": USER_AGENT}
 
     async with aiohttp.ClientSession(headers=headers) as session:
-        for i, topic in enumerate(topics):
+        for topic in topics:
             if len(all_opportunities) >= max_results:
                 break
 
@@ -752,10 +808,6 @@ async def fetch_sam_gov_opportunities(
                 logger.error(error_msg, exc_info=True)
                 errors.append(error_msg)
 
-            # Small delay between searches to be respectful of the API
-            if i < len(topics) - 1:
-                await asyncio.sleep(0.5)
-
     logger.info(
         f"SAM.gov fetch complete: {len(all_opportunities)} opportunities "
         f"from {len(topics)} topics ({len(errors)} errors)"
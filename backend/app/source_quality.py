@@ -51,6 +51,7 @@ from urllib.parse import urlparse
 
 from sqlalchemy import select, update as sa_update, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.models.db.source import Source
 from app.models.db.analytics import DomainReputation
@@ -558,7 +559,12 @@ async def compute_and_store_quality_score(
     """
     try:
         # Fetch the source record.
-        result = await db.execute(select(Source).where(Source.id == source_id).limit(1))
+        result = await db.execute(
+            select(Source)
+            .options(undefer(Source.full_text))
+            .where(Source.id == source_id)
+            .limit(1)
+        )
         source_obj = result.scalar_one_or_none()
         if not source_obj:
             logger.warning("Source not found for quality scoring: %s", source_id)
@@ -752,7 +758,10 @@ async def backfill_quality_scores(
         try:
             # Fetch a batch of unscored sources.
             result = await db.execute(
-                select(Source).where(Source.quality_score.is_(None)).limit(batch_size)
+                select(Source)
+                .options(undefer(Source.full_text))
+                .where(Source.quality_score.is_(None))
+                .limit(batch_size)
             )
             batch = result.scalars().all()
 
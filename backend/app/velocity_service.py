@@ -6,7 +6,8 @@ source additions over rolling time windows. Trends indicate whether a
 signal is accelerating, decelerating, stable, emerging, or stale.
 
 Algorithm:
-1. For each active card, count sources added in three windows:
+1. For all active cards at once (one grouped query), count sources added
+   in three windows:
    - Current week  (last 7 days)
    - Previous week (8-14 days ago)
    - Two weeks ago (15-28 days, averaged per week)
@@ -27,9 +28,11 @@ Usage:
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import select, update as sa_update, func, and_
+from sqlalchemy import Select, Update, and_, column, func, select, values
+from sqlalchemy import update as sa_update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.db.card import Card
@@ -37,6 +40,11 @@ from app.models.db.source import Source
 
 logger = logging.getLogger(__name__)
 
+# Cards per UPDATE ... FROM (VALUES ...) statement (3 bind params each)
+_UPDATE_BATCH_SIZE = 1000
+# Largest value cards.velocity_score (NUMERIC(5, 2)) can hold
+_MAX_SCORE = 999.99
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -47,9 +55,10 @@ async def calculate_velocity_trends(db: AsyncSession) -> Dict[str, Any]:
     """
     Calculate and update velocity trends for all active cards.
 
-    Queries source counts in rolling time windows for every active card,
-    determines trend classification, and writes the result back to the
-    cards table.
+    Counts sources in every rolling window for all active cards with one
+    grouped aggregate (``COUNT(*) FILTER (WHERE ...)``), classifies the
+    trends in Python, and writes them back with batched
+    ``UPDATE ... FROM (VALUES ...)`` statements.
 
     Args:
         db: SQLAlchemy async database session.
@@ -58,15 +67,9 @@ async def calculate_velocity_trends(db: AsyncSession) -> Dict[str, Any]:
         Summary dict with ``updated`` and ``total`` counts.
     """
     now = datetime.now(timezone.utc)
-    week_ago = now - timedelta(days=7)
-    two_weeks_ago = now - timedelta(days=14)
-    thirty_days_ago = now - timedelta(days=30)
 
-    # Fetch all active cards (only need id and created_at)
     try:
-        result = await db.execute(
-            select(Card.id, Card.created_at).where(Card.status == "active")
-        )
+        result = await db.execute(_window_counts(now).where(Card.status == "active"))
         cards_data = result.all()
     except Exception as exc:
         logger.error("Failed to fetch active cards for velocity calculation: %s", exc)
@@ -76,88 +79,34 @@ async def calculate_velocity_trends(db: AsyncSession) -> Dict[str, Any]:
         logger.info("No active cards found for velocity calculation")
         return {"updated": 0, "total": 0}
 
-    updated = 0
-
+    rows = []
     for card in cards_data:
-        card_id = card.id
-        card_created = card.created_at
+        trend = _classify_trend(
+            current_count=card.current_count,
+            prev_count=card.prev_count,
+            total_count=card.total_count,
+            recent_count=card.recent_count,
+            card_age_days=_card_age_days(card.created_at, now),
+        )
+        denominator = max(card.prev_count, 1)
+        score = round((card.current_count - card.prev_count) / denominator * 100, 2)
+        # Clamp to NUMERIC(5, 2): one out-of-range score would fail the batch
+        score = max(-_MAX_SCORE, min(_MAX_SCORE, score))
+        rows.append((card.id, trend, Decimal(str(score))))
 
+    updated = 0
+    for start in range(0, len(rows), _UPDATE_BATCH_SIZE):
+        batch = rows[start : start + _UPDATE_BATCH_SIZE]
         try:
-            # Count sources in each window using the ingested_at column
-            # (falls back gracefully since ingested_at defaults to NOW())
-
-            # Current week (last 7 days)
-            current_result = await db.execute(
-                select(func.count(Source.id)).where(
-                    and_(
-                        Source.card_id == card_id,
-                        Source.ingested_at >= week_ago,
-                    )
-                )
-            )
-            current_count = current_result.scalar() or 0
-
-            # Previous week (8-14 days ago)
-            prev_result = await db.execute(
-                select(func.count(Source.id)).where(
-                    and_(
-                        Source.card_id == card_id,
-                        Source.ingested_at >= two_weeks_ago,
-                        Source.ingested_at < week_ago,
-                    )
-                )
-            )
-            prev_count = prev_result.scalar() or 0
-
-            # Total sources for the card
-            total_result = await db.execute(
-                select(func.count(Source.id)).where(Source.card_id == card_id)
-            )
-            total_count = total_result.scalar() or 0
-
-            # Any sources in last 30 days
-            recent_result = await db.execute(
-                select(func.count(Source.id)).where(
-                    and_(
-                        Source.card_id == card_id,
-                        Source.ingested_at >= thirty_days_ago,
-                    )
-                )
-            )
-            recent_count = recent_result.scalar() or 0
-
-            # Determine card age in days
-            card_age_days = _card_age_days(card_created, now)
-
-            # Classify trend
-            trend = _classify_trend(
-                current_count=current_count,
-                prev_count=prev_count,
-                total_count=total_count,
-                recent_count=recent_count,
-                card_age_days=card_age_days,
-            )
-
-            # Calculate velocity score
-            denominator = max(prev_count, 1)
-            score = round((current_count - prev_count) / denominator * 100, 2)
-
-            # Persist to database
-            await db.execute(
-                sa_update(Card)
-                .where(Card.id == card_id)
-                .values(
-                    velocity_trend=trend,
-                    velocity_score=float(score),
-                    velocity_updated_at=now,
-                )
-            )
-            await db.flush()
-
-            updated += 1
-
+            # Savepoint per batch so one failure doesn't abort the transaction
+            async with db.begin_nested():
+                await db.execute(_bulk_update(batch, now))
+            updated += len(batch)
         except Exception as exc:
-            logger.warning("Failed to update velocity for card %s: %s", card_id, exc)
+            logger.warning(
+                "Failed to update velocity for %d cards: %s", len(batch), exc
+            )
+    await db.flush()
 
     logger.info("Velocity trends updated for %d / %d cards", updated, len(cards_data))
     return {"updated": updated, "total": len(cards_data)}
@@ -178,8 +127,6 @@ async def get_velocity_summary(
         or ``None`` if the card is not found.
     """
     now = datetime.now(timezone.utc)
-    week_ago = now - timedelta(days=7)
-    two_weeks_ago = now - timedelta(days=14)
 
     try:
         result = await db.execute(
@@ -199,26 +146,11 @@ async def get_velocity_summary(
 
     # Fetch window counts for the summary text
     try:
-        current_result = await db.execute(
-            select(func.count(Source.id)).where(
-                and_(
-                    Source.card_id == card_id,
-                    Source.ingested_at >= week_ago,
-                )
-            )
-        )
-        current_count = current_result.scalar() or 0
-
-        prev_result = await db.execute(
-            select(func.count(Source.id)).where(
-                and_(
-                    Source.card_id == card_id,
-                    Source.ingested_at >= two_weeks_ago,
-                    Source.ingested_at < week_ago,
-                )
-            )
-        )
-        prev_count = prev_result.scalar() or 0
+        counts = (
+            await db.execute(_window_counts(now).where(Card.id == card_id))
+        ).one_or_none()
+        current_count = counts.current_count if counts else 0
+        prev_count = counts.prev_count if counts else 0
     except Exception:
         current_count = 0
         prev_count = 0
@@ -243,6 +175,59 @@ async def get_velocity_summary(
 # ---------------------------------------------------------------------------
 
 
+def _window_counts(now: datetime) -> Select:
+    """
+    Per-card source counts for every velocity window in one grouped query.
+
+    Cards are left-joined to their sources so cards without any still get
+    a row of zeros; add a ``WHERE`` on ``Card`` to pick the cards.
+    """
+    week_ago = now - timedelta(days=7)
+    two_weeks_ago = now - timedelta(days=14)
+    thirty_days_ago = now - timedelta(days=30)
+    return (
+        select(
+            Card.id,
+            Card.created_at,
+            func.count(Source.id)
+            .filter(Source.ingested_at >= week_ago)
+            .label("current_count"),
+            func.count(Source.id)
+            .filter(
+                and_(Source.ingested_at >= two_weeks_ago, Source.ingested_at < week_ago)
+            )
+            .label("prev_count"),
+            func.count(Source.id).label("total_count"),
+            func.count(Source.id)
+            .filter(Source.ingested_at >= thirty_days_ago)
+            .label("recent_count"),
+        )
+        .select_from(Card)
+        .outerjoin(Source, Source.card_id == Card.id)
+        .group_by(Card.id)
+    )
+
+
+def _bulk_update(rows: List[Tuple[Any, str, Decimal]], now: datetime) -> Update:
+    """``UPDATE cards ... FROM (VALUES (id, trend, score), ...)`` for *rows*."""
+    batch = values(
+        column("id", Card.id.type),
+        column("trend", Card.velocity_trend.type),
+        column("score", Card.velocity_score.type),
+        name="velocity",
+    ).data(rows)
+    return (
+        sa_update(Card)
+        .where(Card.id == batch.c.id)
+        .values(
+            velocity_trend=batch.c.trend,
+            velocity_score=batch.c.score,
+            velocity_updated_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
 def _card_age_days(created_at, now: datetime) -> int:
     """Parse a card's created_at timestamp and return age in days."""
     try:
@@ -6,9 +6,26 @@ that must survive web restarts / scale-to-zero behaviors:
 - `research_tasks` (update, deep_research, workstream_analysis)
 - `executive_briefs` (pending -> generating -> completed/failed)
 - `discovery_runs` (queued via summary_report.stage)
+- `workstream_scans` (queued -> running -> completed/failed)
+- `export_jobs` (PDF / PPTX / DOCX exports, cached by content hash)
 - RSS feed monitoring (check feeds + triage new items every 30 min)
 - Scheduled discovery runs (configurable via discovery_schedule table)
 
+Each job type has its own consumer task(s), so a long discovery run no longer
+blocks briefs or research tasks queued behind it.  Concurrency per type is set
+with ``GRANTSCOPE_WORKER_CONCURRENCY_<TYPE>`` (RESEARCH, BRIEF, DISCOVERY,
+WORKSTREAM_SCAN, EXPORT, RSS, SCHEDULED_DISCOVERY; default 1 each).  Jobs are still
+claimed with an atomic ``UPDATE ... WHERE status = <queued>``; candidate rows
+are selected ``FOR UPDATE SKIP LOCKED`` so concurrent consumers pick different
+jobs instead of racing for the oldest one.
+
+Enqueuers send a Postgres NOTIFY (``app.job_notify``) and the worker LISTENs
+on a dedicated connection, so research / brief / discovery / workstream-scan
+/ export consumers wake as soon as a job is committed.  While the listener is
+connected, idle consumers only re-poll every
+``GRANTSCOPE_WORKER_SAFETY_POLL_SECONDS`` (default 60) as a safety net; if it
+is down they fall back to the exponential poll backoff.
+
 Run locally:
   cd backend
   python -m app.worker
@@ -20,32 +37,40 @@ Run on Railway as a separate service/process:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import os
 import signal
+import time
 import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
 
 from dotenv import load_dotenv
 from sqlalchemy import select, update as sa_update
 
 from app.brief_service import ExecutiveBriefService
-from app.database import async_session_factory
+from app.database import async_session_factory, engine
 from app.deps import openai_client
+from app.export_jobs import execute_export_job
+from app.job_notify import JobNotificationListener, notify_job
 from app.models.db.brief import ExecutiveBrief
 from app.models.db.discovery import DiscoveryRun, DiscoverySchedule
+from app.models.db.export import ExportJob
 from app.models.db.research import ResearchTask
 from app.models.db.user import User
 from app.models.db.workstream import WorkstreamScan
 from app.models.discovery_models import DiscoveryConfigRequest
 from app.models.research import ResearchTaskCreate
+from app.rate_governor import Priority, request_priority
 from app.routers.discovery import execute_discovery_run_background
 from app.routers.research import execute_research_task_background
 from app.routers.workstream_scans import execute_workstream_scan_background
 from app.scheduler import start_scheduler
 from app.taxonomy import VALID_PILLAR_CODES
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 import uvicorn
 
 
@@ -80,7 +105,72 @@ def _get_float_env(name: str, default: float) -> float:
         return default
 
 
+@dataclass
+class QueueStats:
+    """In-flight and latency counters for one job queue (served on /worker/health)."""
+
+    concurrency: int
+    in_flight: int = 0
+    completed: int = 0
+    failed: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_seconds: Optional[float] = None
+    last_finished_at: Optional[str] = None
+
+    def record(self, elapsed: float, ok: bool) -> None:
+        if ok:
+            self.completed += 1
+        else:
+            self.failed += 1
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+        self.last_seconds = elapsed
+        self.last_finished_at = datetime.now(timezone.utc).isoformat()
+
+    def to_dict(self) -> Dict[str, Any]:
+        finished = self.completed + self.failed
+        return {
+            "concurrency": self.concurrency,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_seconds": round(self.total_seconds / finished, 3) if finished else None,
+            "max_seconds": round(self.max_seconds, 3),
+            "last_seconds": (
+                round(self.last_seconds, 3) if self.last_seconds is not None else None
+            ),
+            "last_finished_at": self.last_finished_at,
+        }
+
+
+@dataclass
+class _JobSlot:
+    """Per-consumer marker set once a poll actually claims a job."""
+
+    stats: QueueStats
+    claimed_at: Optional[float] = None
+
+
+# The consumer task's current slot; _job_claimed() flips it from "polling"
+# to "running" so idle polls don't count as in-flight work.
+_current_slot: ContextVar[Optional[_JobSlot]] = ContextVar(
+    "grantscope_worker_slot", default=None
+)
+
+
 class GrantScopeWorker:
+    # Job type -> default consumer concurrency
+    QUEUE_TYPES: Dict[str, int] = {
+        "research": 1,
+        "brief": 1,
+        "discovery": 1,
+        "workstream_scan": 1,
+        "export": 1,
+        "rss": 1,
+        "scheduled_discovery": 1,
+    }
+
     def __init__(self) -> None:
         self.worker_id = os.getenv("GRANTSCOPE_WORKER_ID") or str(uuid.uuid4())
         self.poll_interval_seconds = _get_float_env(
@@ -98,6 +188,9 @@ class GrantScopeWorker:
         self.workstream_scan_timeout_seconds = _get_int_env(
             "GRANTSCOPE_WORKSTREAM_SCAN_TIMEOUT_SECONDS", 5 * 60
         )
+        self.export_timeout_seconds = _get_int_env(
+            "GRANTSCOPE_EXPORT_TIMEOUT_SECONDS", 15 * 60
+        )
         self.rss_check_interval_seconds = _get_int_env(
             "GRANTSCOPE_RSS_CHECK_INTERVAL_SECONDS", 30 * 60  # 30 minutes
         )
@@ -107,13 +200,63 @@ class GrantScopeWorker:
         self.enable_scheduler = _truthy(
             os.getenv("GRANTSCOPE_ENABLE_SCHEDULER", "false")
         )
+        self.drain_timeout_seconds = _get_float_env(
+            "GRANTSCOPE_WORKER_DRAIN_TIMEOUT_SECONDS", 300.0
+        )
+        self.safety_poll_seconds = _get_float_env(
+            "GRANTSCOPE_WORKER_SAFETY_POLL_SECONDS", 60.0
+        )
+        self.queue_stats: Dict[str, QueueStats] = {
+            name: QueueStats(
+                concurrency=max(
+                    0,
+                    _get_int_env(
+                        f"GRANTSCOPE_WORKER_CONCURRENCY_{name.upper()}", default
+                    ),
+                )
+            )
+            for name, default in self.QUEUE_TYPES.items()
+        }
         self._stop_event = asyncio.Event()
-        self._current_interval = self.poll_interval_seconds
+        self._listener = JobNotificationListener(engine)
         self._last_rss_check: Optional[datetime] = None
 
     def request_stop(self) -> None:
+        """Stop claiming new jobs; in-flight jobs drain before run() returns."""
         self._stop_event.set()
 
+    @property
+    def draining(self) -> bool:
+        return self._stop_event.is_set()
+
+    def health(self) -> Dict[str, Any]:
+        """Snapshot for the /worker/health endpoint."""
+        return {
+            "status": "draining" if self.draining else "ok",
+            "worker_id": self.worker_id,
+            "listening": self._listener.connected,
+            "notifications": self._listener.notifications,
+            "queues": {name: q.to_dict() for name, q in self.queue_stats.items()},
+        }
+
+    def _job_claimed(self) -> None:
+        """Mark the calling consumer's job as started (after a successful claim)."""
+        slot = _current_slot.get()
+        if slot is not None and slot.claimed_at is None:
+            slot.claimed_at = time.monotonic()
+            slot.stats.in_flight += 1
+
+    def _queue_handlers(self) -> Dict[str, Callable[[], Awaitable[bool]]]:
+        return {
+            "research": self._process_one_research_task,
+            "brief": self._process_one_brief,
+            "discovery": self._process_one_discovery_run,
+            "workstream_scan": self._process_one_workstream_scan,
+            "export": self._process_one_export_job,
+            "rss": self._check_rss_feeds,
+            "scheduled_discovery": self._run_scheduled_discovery,
+        }
+
     async def run(self) -> None:
         logger.info(
             "Worker starting",
@@ -122,6 +265,9 @@ class GrantScopeWorker:
                 "poll_interval_seconds": self.poll_interval_seconds,
                 "max_poll_interval_seconds": self.max_poll_interval_seconds,
                 "enable_scheduler": self.enable_scheduler,
+                "concurrency": {
+                    name: q.concurrency for name, q in self.queue_stats.items()
+                },
             },
         )
 
@@ -131,36 +277,111 @@ class GrantScopeWorker:
             except Exception as e:
                 logger.error(f"Failed to start scheduler in worker: {e}")
 
+        listener = asyncio.create_task(
+            self._listener.run(self._stop_event), name="worker-job-listener"
+        )
+        consumers: List[asyncio.Task] = []
+        for name, handler in self._queue_handlers().items():
+            for slot_index in range(self.queue_stats[name].concurrency):
+                consumers.append(
+                    asyncio.create_task(
+                        self._consume(name, handler),
+                        name=f"worker-{name}-{slot_index}",
+                    )
+                )
+
+        try:
+            await self._stop_event.wait()
+            in_flight = sum(q.in_flight for q in self.queue_stats.values())
+            logger.info(
+                "Worker draining",
+                extra={
+                    "worker_id": self.worker_id,
+                    "in_flight": in_flight,
+                    "drain_timeout_seconds": self.drain_timeout_seconds,
+                },
+            )
+            if consumers:
+                _, pending = await asyncio.wait(
+                    consumers, timeout=self.drain_timeout_seconds
+                )
+                if pending:
+                    logger.warning(
+                        "Drain timeout reached, cancelling in-flight jobs",
+                        extra={"worker_id": self.worker_id, "cancelled": len(pending)},
+                    )
+        finally:
+            for task in consumers:
+                task.cancel()
+            listener.cancel()
+            await asyncio.gather(listener, *consumers, return_exceptions=True)
+
+        logger.info("Worker stopping", extra={"worker_id": self.worker_id})
+
+    async def _consume(
+        self, queue: str, handler: Callable[[], Awaitable[bool]]
+    ) -> None:
+        """Poll one queue until stopped.
+
+        While idle the consumer sleeps until its NOTIFY wake event fires, or
+        for the safety-poll interval; without a live listener it backs off
+        exponentially between polls instead.
+        """
+        stats = self.queue_stats[queue]
+        wake = self._listener.wake_events.get(queue)
+        interval = self.poll_interval_seconds
+
         while not self._stop_event.is_set():
+            # Clear before polling so a NOTIFY that lands mid-poll still
+            # triggers another poll.
+            if wake is not None:
+                wake.clear()
+            slot = _JobSlot(stats)
+            token = _current_slot.set(slot)
             did_work = False
-
+            ok = True
             try:
-                did_work = await self._process_one_research_task() or did_work
-                did_work = await self._process_one_brief() or did_work
-                did_work = await self._process_one_discovery_run() or did_work
-                did_work = await self._process_one_workstream_scan() or did_work
-                did_work = await self._check_rss_feeds() or did_work
-                did_work = await self._run_scheduled_discovery() or did_work
+                # Jobs yield outbound API capacity to interactive requests
+                with request_priority(Priority.BATCH):
+                    did_work = await handler()
+            except asyncio.CancelledError:
+                ok = False
+                raise
             except Exception as e:
-                logger.exception(f"Worker loop error: {e}")
+                ok = False
+                logger.exception(f"Worker {queue} consumer error: {e}")
+            finally:
+                _current_slot.reset(token)
+                if slot.claimed_at is not None:
+                    stats.in_flight -= 1
+                    stats.record(time.monotonic() - slot.claimed_at, ok)
 
             if did_work:
-                self._current_interval = self.poll_interval_seconds
-            else:
-                try:
-                    await asyncio.wait_for(
-                        self._stop_event.wait(), timeout=self._current_interval
-                    )
-                except asyncio.TimeoutError:
-                    pass
-                # Backoff *after* sleeping so the first idle wait uses the
-                # base interval, not 2x.
-                self._current_interval = min(
-                    self._current_interval * 2,
-                    self.max_poll_interval_seconds,
-                )
-
-        logger.info("Worker stopping", extra={"worker_id": self.worker_id})
+                interval = self.poll_interval_seconds
+                continue
+
+            if wake is not None and self._listener.connected:
+                await self._wait_idle(wake, self.safety_poll_seconds)
+                interval = self.poll_interval_seconds
+                continue
+
+            await self._wait_idle(wake, interval)
+            # Backoff *after* sleeping so the first idle wait uses the
+            # base interval, not 2x.
+            interval = min(interval * 2, self.max_poll_interval_seconds)
+
+    async def _wait_idle(self, wake: Optional[asyncio.Event], timeout: float) -> None:
+        """Sleep up to ``timeout``, returning early on stop or a wakeup."""
+        waiters = [asyncio.create_task(self._stop_event.wait())]
+        if wake is not None:
+            waiters.append(asyncio.create_task(wake.wait()))
+        try:
+            await asyncio.wait(
+                waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
 
     async def _process_one_research_task(self) -> bool:
         if async_session_factory is None:
@@ -173,6 +394,7 @@ class GrantScopeWorker:
                 .where(ResearchTask.status == "queued")
                 .order_by(ResearchTask.created_at.asc())
                 .limit(1)
+                .with_for_update(skip_locked=True)
             )
             task = result.scalar_one_or_none()
             if not task:
@@ -201,6 +423,7 @@ class GrantScopeWorker:
 
             if not claimed:
                 return False
+            self._job_claimed()
 
             task_data = ResearchTaskCreate(
                 card_id=str(task.card_id) if task.card_id else None,
@@ -235,6 +458,7 @@ class GrantScopeWorker:
                 .where(ExecutiveBrief.status == "pending")
                 .order_by(ExecutiveBrief.created_at.asc())
                 .limit(1)
+                .with_for_update(skip_locked=True)
             )
             brief = result.scalar_one_or_none()
             if not brief:
@@ -255,6 +479,7 @@ class GrantScopeWorker:
 
             if not claimed:
                 return False
+            self._job_claimed()
 
             since_timestamp: Optional[str] = None
             sources_since_previous = brief.sources_since_previous or {}
@@ -320,6 +545,7 @@ class GrantScopeWorker:
                 )
                 .order_by(DiscoveryRun.started_at.asc())
                 .limit(1)
+                .with_for_update(skip_locked=True)
             )
             run = result.scalar_one_or_none()
             if not run:
@@ -354,6 +580,7 @@ class GrantScopeWorker:
 
             if not claimed:
                 return False
+            self._job_claimed()
 
             config_data = (
                 summary_report.get("config")
@@ -443,11 +670,6 @@ class GrantScopeWorker:
             logger.error("Database not configured — cannot process workstream scans")
             return False
 
-        scan = None
-        scan_id = None
-        scan_config = None
-        scan_workstream_id = None
-        scan_user_id = None
         try:
             async with async_session_factory() as db:
                 result = await db.execute(
@@ -455,35 +677,38 @@ class GrantScopeWorker:
                     .where(WorkstreamScan.status == "queued")
                     .order_by(WorkstreamScan.created_at.asc())
                     .limit(1)
+                    .with_for_update(skip_locked=True)
                 )
                 scan = result.scalar_one_or_none()
-                if scan:
-                    logger.info(f"Found queued workstream scan: {scan.id}")
-                    scan_id = str(scan.id)
-                    scan_config = scan.config
-                    scan_workstream_id = str(scan.workstream_id)
-                    scan_user_id = str(scan.user_id)
-        except Exception as e:
-            logger.error(f"Error querying workstream_scans: {e}")
-            return False
+                if not scan:
+                    return False
 
-        if not scan:
-            return False
+                logger.info(f"Found queued workstream scan: {scan.id}")
+                scan_id = str(scan.id)
+                scan_config = scan.config
+                scan_workstream_id = str(scan.workstream_id)
+                scan_user_id = str(scan.user_id)
 
-        # Claim the scan by setting status to running
-        async with async_session_factory() as db:
-            now = datetime.now(timezone.utc)
-            claim_result = await db.execute(
-                sa_update(WorkstreamScan)
-                .where(WorkstreamScan.id == scan.id, WorkstreamScan.status == "queued")
-                .values(status="running", started_at=now)
-                .returning(WorkstreamScan.id)
-            )
-            claimed = claim_result.scalar_one_or_none()
-            await db.commit()
+                # Claim the scan by setting status to running
+                now = datetime.now(timezone.utc)
+                claim_result = await db.execute(
+                    sa_update(WorkstreamScan)
+                    .where(
+                        WorkstreamScan.id == scan.id,
+                        WorkstreamScan.status == "queued",
+                    )
+                    .values(status="running", started_at=now)
+                    .returning(WorkstreamScan.id)
+                )
+                claimed = claim_result.scalar_one_or_none()
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Error claiming workstream scan: {e}")
+            return False
 
         if not claimed:
             return False
+        self._job_claimed()
 
         config = scan_config or {}
         # Parse config if it's a JSON string (Supabase behavior)
@@ -537,6 +762,90 @@ class GrantScopeWorker:
             raise
         return True
 
+    async def _process_one_export_job(self) -> bool:
+        """Process one queued export job."""
+        if async_session_factory is None:
+            logger.error("Database not configured — cannot process export jobs")
+            return False
+
+        try:
+            async with async_session_factory() as db:
+                result = await db.execute(
+                    select(ExportJob)
+                    .where(ExportJob.status == "queued")
+                    .order_by(ExportJob.created_at.asc())
+                    .limit(1)
+                    .with_for_update(skip_locked=True)
+                )
+                job = result.scalar_one_or_none()
+                if not job:
+                    return False
+
+                job_id = str(job.id)
+                job_kind = job.kind
+                job_format = job.format
+
+                # Claim the job by setting status to running
+                claim_result = await db.execute(
+                    sa_update(ExportJob)
+                    .where(ExportJob.id == job.id, ExportJob.status == "queued")
+                    .values(status="running", started_at=datetime.now(timezone.utc))
+                    .returning(ExportJob.id)
+                )
+                claimed = claim_result.scalar_one_or_none()
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Error claiming export job: {e}")
+            return False
+
+        if not claimed:
+            return False
+        self._job_claimed()
+
+        logger.info(
+            "Processing export job",
+            extra={
+                "worker_id": self.worker_id,
+                "export_job_id": job_id,
+                "kind": job_kind,
+                "format": job_format,
+            },
+        )
+
+        try:
+            await asyncio.wait_for(
+                execute_export_job(job_id), timeout=self.export_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            await self._fail_export_job(
+                job_id,
+                f"Export timed out after {self.export_timeout_seconds} seconds",
+            )
+        except asyncio.CancelledError:
+            await self._fail_export_job(job_id, "Export cancelled")
+            raise
+        except Exception as e:
+            logger.exception(f"Export job {job_id} failed: {e}")
+            if isinstance(e, HTTPException):
+                message = str(e.detail)
+            else:
+                message = str(e) or type(e).__name__
+            await self._fail_export_job(job_id, message)
+        return True
+
+    async def _fail_export_job(self, job_id: str, message: str) -> None:
+        async with async_session_factory() as db:
+            await db.execute(
+                sa_update(ExportJob)
+                .where(ExportJob.id == uuid.UUID(job_id))
+                .values(
+                    status="failed",
+                    completed_at=datetime.now(timezone.utc),
+                    error_message=message,
+                )
+            )
+            await db.commit()
+
     async def _check_rss_feeds(self) -> bool:
         """Check RSS feeds for new items and process them.
 
@@ -560,6 +869,7 @@ class GrantScopeWorker:
                 return False
 
         self._last_rss_check = now
+        self._job_claimed()
 
         try:
             from app.rss_service import RSSService
@@ -678,6 +988,7 @@ class GrantScopeWorker:
 
             if not claimed:
                 return False
+            self._job_claimed()
 
             logger.info(
                 "Scheduled discovery triggered",
@@ -774,6 +1085,7 @@ class GrantScopeWorker:
 
                     async with async_session_factory() as db:
                         db.add(new_run)
+                        await notify_job(db, "discovery")
                         await db.commit()
 
                     summary["discovery_run_ids"].append(run_id)
@@ -834,6 +1146,21 @@ class GrantScopeWorker:
             return False
 
 
+class _HealthServer(uvicorn.Server):
+    """uvicorn server that leaves SIGINT/SIGTERM to the worker.
+
+    uvicorn's own handlers would stop the server on the first signal, taking
+    ``/api/v1/worker/health`` down while jobs are still draining.
+    """
+
+    def install_signal_handlers(self) -> None:  # uvicorn < 0.29
+        pass
+
+    @contextlib.contextmanager
+    def capture_signals(self) -> Iterator[None]:  # uvicorn >= 0.29
+        yield
+
+
 async def _main() -> None:
     # Load environment variables (safe no-op in Railway where env is injected).
     load_dotenv(os.getenv("GRANTSCOPE_DOTENV_PATH", ".env"))
@@ -849,9 +1176,8 @@ async def _main() -> None:
     server: Optional[uvicorn.Server] = None
 
     def _request_stop() -> None:
+        # The health server stays up until the drain below finishes.
         worker.request_stop()
-        if server is not None:
-            server.should_exit = True
 
     loop = asyncio.get_running_loop()
     for sig in (signal.SIGINT, signal.SIGTERM):
@@ -871,27 +1197,36 @@ async def _main() -> None:
 
         @app.get("/api/v1/worker/health")
         async def worker_health() -> Dict[str, Any]:
-            return {"status": "ok", "worker_id": worker.worker_id}
+            return worker.health()
 
         config = uvicorn.Config(
             app, host="0.0.0.0", port=port, log_level="info", loop="asyncio"
         )
-        server = uvicorn.Server(config)
+        server = _HealthServer(config)
 
         server_task = asyncio.create_task(server.serve())
         worker_task = asyncio.create_task(worker.run())
 
-        done, pending = await asyncio.wait(
+        done, _ = await asyncio.wait(
             {server_task, worker_task},
             return_when=asyncio.FIRST_COMPLETED,
         )
-        for task in pending:
-            task.cancel()
+        # Let the worker drain in-flight jobs rather than cancelling them,
+        # then take the health server down.
+        worker.request_stop()
+        await asyncio.wait({worker_task})
+        server.should_exit = True
+        await asyncio.wait({server_task})
         for task in done:
             task.result()
     else:
         await worker.run()
 
+    from app.crawler import close_http_client, shutdown_extraction_pool
+
+    await close_http_client()
+    shutdown_extraction_pool()
+
 
 if __name__ == "__main__":
     asyncio.run(_main())
@@ -34,13 +34,18 @@ from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 import uuid
 
-from sqlalchemy import func, select, text
+from sqlalchemy import func, select
 from sqlalchemy import update as sa_update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 import openai
 
-from app.helpers.db_utils import vector_search_cards
+from app.helpers.db_utils import (
+    find_existing_source_urls,
+    normalize_source_url,
+    store_card_embedding,
+    vector_search_cards,
+)
 from app.models.db.card import Card, CardEmbedding
 from app.models.db.source import Source
 from app.models.db.workstream import WorkstreamCard, WorkstreamScan
@@ -1054,29 +1059,37 @@ Example: ["query 1", "query 2", ...]"""
         enrichments = []
         duplicate_count = 0
 
+        # Resolve every candidate URL in one round-trip.  A URL only counts as
+        # a duplicate if it is already linked to a card in THIS workstream
+        # (not globally across all cards).
+        existing_urls: Dict[str, List[Dict[str, Optional[str]]]] = {}
+        workstream_card_ids: set = set()
+        try:
+            existing_urls = await find_existing_source_urls(
+                self.db, [s.raw.url for s in sources]
+            )
+            linked_card_ids = {
+                row["card_id"]
+                for rows in existing_urls.values()
+                for row in rows
+                if row["card_id"]
+            }
+            if linked_card_ids:
+                ws_result = await self.db.execute(
+                    select(WorkstreamCard.card_id)
+                    .where(WorkstreamCard.workstream_id == config.workstream_id)
+                    .where(WorkstreamCard.card_id.in_(list(linked_card_ids)))
+                )
+                workstream_card_ids = {str(cid) for cid in ws_result.scalars().all()}
+        except Exception as e:
+            logger.warning(f"Dedup URL pre-check failed: {e}")
+
         for source in sources:
             try:
-                # Check URL -- only skip if this exact URL is already linked
-                # to a card in THIS workstream (not globally across all cards).
-                url_result = await self.db.execute(
-                    select(Source.id, Source.card_id).where(
-                        Source.url == source.raw.url
-                    )
-                )
-                url_rows = url_result.all()
-
-                if url_rows:
-                    # Check if any of these source cards are already in the workstream
-                    existing_card_ids = [str(r.card_id) for r in url_rows if r.card_id]
-                    if existing_card_ids:
-                        ws_result = await self.db.execute(
-                            select(WorkstreamCard.card_id)
-                            .where(WorkstreamCard.workstream_id == config.workstream_id)
-                            .where(WorkstreamCard.card_id.in_(existing_card_ids))
-                        )
-                        if ws_result.first():
-                            duplicate_count += 1
-                            continue
+                url_rows = existing_urls.get(normalize_source_url(source.raw.url), [])
+                if any(row["card_id"] in workstream_card_ids for row in url_rows):
+                    duplicate_count += 1
+                    continue
 
                 # Vector similarity check
                 if source.embedding:
@@ -1174,46 +1187,22 @@ Example: ["query 1", "query 2", ...]"""
             # and card_embeddings table (for consistency with other services)
             if source.embedding:
                 try:
-                    embedding_str = (
-                        "[" + ",".join(str(v) for v in source.embedding) + "]"
-                    )
-                    await self.db.execute(
-                        text(
-                            "UPDATE cards SET embedding = CAST(:emb AS vector) WHERE id = :cid"
-                        ),
-                        {"emb": embedding_str, "cid": card_id},
-                    )
+                    await store_card_embedding(self.db, card_id, source.embedding)
                     await self.db.flush()
                 except Exception as emb_err:
                     logger.warning(f"Failed to store embedding on card: {emb_err}")
 
                 try:
-                    stmt = (
-                        pg_insert(CardEmbedding)
-                        .values(
-                            card_id=card_id,
-                            created_at=now,
-                        )
-                        .on_conflict_do_update(
-                            index_elements=["card_id"],
-                            set_={"updated_at": now},
-                        )
+                    stmt = pg_insert(CardEmbedding).values(
+                        card_id=card_id,
+                        embedding=source.embedding,
+                        created_at=now,
                     )
-                    # Store embedding via raw SQL since CardEmbedding.embedding is NullType
-                    await self.db.execute(
-                        text(
-                            "INSERT INTO card_embeddings (card_id, embedding, created_at) "
-                            "VALUES (:card_id, CAST(:emb AS vector), :created_at) "
-                            "ON CONFLICT (card_id) DO UPDATE SET "
-                            "embedding = CAST(:emb AS vector), updated_at = :updated_at"
-                        ),
-                        {
-                            "card_id": card_id,
-                            "emb": embedding_str,
-                            "created_at": now,
-                            "updated_at": now,
-                        },
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=["card_id"],
+                        set_={"embedding": stmt.excluded.embedding, "updated_at": now},
                     )
+                    await self.db.execute(stmt)
                     await self.db.flush()
                 except Exception as emb_err:
                     logger.warning(f"Failed to store card_embedding: {emb_err}")
@@ -78,7 +78,7 @@ else:
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
-BATCH_SIZE = 10
+BATCH_SIZE = 100  # cards per embeddings request
 BATCH_DELAY_SECS = 1.5
 
 
@@ -95,6 +95,17 @@ async def generate_embedding(text: str) -> List[float]:
     return response.data[0].embedding
 
 
+async def generate_embeddings(texts: List[str]) -> List[List[float]]:
+    """Generate 1536-dim embeddings for several texts in a single request."""
+    truncated = [text[:8000] for text in texts]
+    response = await embedding_client.embeddings.create(
+        model=EMBEDDING_MODEL,
+        input=truncated,
+    )
+    # Each vector carries the index of its input; restore input order
+    return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+
 def compose_embedding_text(card: dict) -> str:
     """Build the text string to embed from a card's fields."""
     name = card.get("name") or ""
@@ -103,8 +114,8 @@ def compose_embedding_text(card: dict) -> str:
     return f"{name} {summary} {description}".strip()
 
 
-async def process_card(card: dict) -> bool:
-    """Generate an embedding for a single card and store it. Returns True on success."""
+async def process_card(card: dict, embedding: List[float] = None) -> bool:
+    """Generate (unless given) and store an embedding for a card. Returns True on success."""
     card_id = card["id"]
     text = compose_embedding_text(card)
 
@@ -113,7 +124,8 @@ async def process_card(card: dict) -> bool:
         return False
 
     try:
-        embedding = await generate_embedding(text)
+        if embedding is None:
+            embedding = await generate_embedding(text)
         supabase.table("cards").update({"embedding": embedding}).eq(
             "id", card_id
         ).execute()
@@ -123,6 +135,28 @@ async def process_card(card: dict) -> bool:
         return False
 
 
+async def embed_batch(batch: List[dict]) -> List[object]:
+    """Embed a batch of cards with one request, falling back to per-card calls."""
+    eligible = [card for card in batch if len(compose_embedding_text(card)) >= 10]
+    embeddings = {}
+    if eligible:
+        try:
+            vectors = await generate_embeddings(
+                [compose_embedding_text(card) for card in eligible]
+            )
+            embeddings = {card["id"]: vec for card, vec in zip(eligible, vectors)}
+        except Exception as exc:
+            # A single bad input fails the whole request; isolate it per card
+            logger.warning(
+                f"  Batch request failed ({exc}), retrying cards individually"
+            )
+
+    return await asyncio.gather(
+        *[process_card(card, embeddings.get(card["id"])) for card in batch],
+        return_exceptions=True,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Connection discovery (uses ConnectionService which needs AIService)
 # ---------------------------------------------------------------------------
@@ -240,10 +274,7 @@ async def main() -> None:
             f"(cards {batch_start + 1}-{batch_end} of {total})..."
         )
 
-        results = await asyncio.gather(
-            *[process_card(card) for card in batch],
-            return_exceptions=True,
-        )
+        results = await embed_batch(batch)
 
         for i, result in enumerate(results):
             card = batch[i]
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Card List Projection Micro-Benchmark
+
+Compares one 50-card page of ``GET /cards`` before and after the list-view
+projection in ``app.helpers.projection``:
+
+- before: ``select(Card)`` (every column, including ``embedding`` and
+  ``search_vector``) serialized with the per-column ``getattr`` /
+  ``isinstance`` loop of ``routers.cards._card_to_dict``
+- after: ``select(*card_list_projection().columns)`` serialized with
+  ``Projection.serialize``
+
+Reports approximate bytes fetched from Postgres, JSON response bytes, and
+serialization + JSON encoding time per page, on synthetic cards with
+realistic field sizes.  ORM hydration and network time are not included.
+
+Usage:
+    python -m scripts.bench_card_projection
+    python -m scripts.bench_card_projection --page-size 50 --repeat 500
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "bench")
+
+from app.helpers.projection import card_list_projection  # noqa: E402
+from app.models.db.card import Card  # noqa: E402
+from app.routers.cards import _card_to_dict  # noqa: E402
+
+WORDS = (
+    "grant municipal transit resilience broadband housing equity climate "
+    "workforce water infrastructure program federal eligibility funding "
+    "application community pilot digital public safety energy"
+).split()
+
+
+def _text(rng: random.Random, n_words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n_words))
+
+
+def make_card(rng: random.Random, dim: int = 1536) -> Dict[str, Any]:
+    """One card's column values, sized like production rows."""
+    now = datetime.now(timezone.utc)
+    values: Dict[str, Any] = {}
+    for col in Card.__table__.columns:
+        try:
+            python_type = col.type.python_type
+        except NotImplementedError:
+            python_type = None
+        if python_type is uuid.UUID:
+            value = uuid.uuid4()
+        elif python_type is datetime:
+            value = now - timedelta(days=rng.randint(0, 400))
+        elif python_type is date:
+            value = date.today()
+        elif python_type is Decimal:
+            value = Decimal(f"{rng.uniform(0, 9.99):.2f}")
+        elif python_type is int:
+            value = rng.randint(0, 100)
+        elif python_type is bool:
+            value = rng.random() < 0.5
+        elif python_type is list:
+            value = [rng.choice(WORDS) for _ in range(3)]
+        elif python_type is str:
+            value = _text(rng, 4)
+        else:
+            value = None
+        values[col.key] = value
+
+    values["summary"] = _text(rng, 60)
+    values["description"] = _text(rng, 500)
+    values["eligibility_text"] = _text(rng, 150)
+    values["match_requirement"] = _text(rng, 30)
+    values["review_notes"] = _text(rng, 40)
+    values["top25_relevance"] = [_text(rng, 3) for _ in range(3)]
+    values["discovery_metadata"] = {"query": _text(rng, 6), "scores_are_defaults": False}
+    values["quality_breakdown"] = {
+        f"factor_{i}": {"score": rng.randint(0, 25), "reason": _text(rng, 20)}
+        for i in range(5)
+    }
+    values["source_preferences"] = {
+        "enabled_categories": WORDS[:5],
+        "keywords": [_text(rng, 2) for _ in range(10)],
+    }
+    values["embedding"] = np.random.default_rng(rng.randint(0, 2**31)).standard_normal(
+        dim
+    ).astype(np.float32)
+    # tsvector text: 'word':1,5 ...
+    values["search_vector"] = " ".join(
+        f"'{w}':{','.join(str(rng.randint(1, 600)) for _ in range(4))}" for w in WORDS
+    )
+    return values
+
+
+def wire_bytes(value: Any) -> int:
+    """Approximate size of a value in Postgres' binary result format."""
+    if value is None:
+        return 0
+    if isinstance(value, np.ndarray):
+        return 4 + value.nbytes
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, (dict, list)):
+        return len(json.dumps(value))
+    if isinstance(value, uuid.UUID):
+        return 16
+    if isinstance(value, bool):
+        return 1
+    return 8
+
+
+def time_page(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    page = [make_card(rng) for _ in range(args.page_size)]
+
+    projection = card_list_projection()
+    orm_rows = [SimpleNamespace(**card) for card in page]
+    tuple_rows = [tuple(card[k] for k in projection.keys) for card in page]
+
+    before = [_card_to_dict(c) for c in orm_rows]
+    after = [projection.serialize(r) for r in tuple_rows]
+    for full, listed in zip(before, after):
+        assert {k: full[k] for k in listed} == listed
+
+    fetched_before = sum(wire_bytes(v) for card in page for v in card.values())
+    fetched_after = sum(wire_bytes(v) for row in tuple_rows for v in row)
+    json_before = len(json.dumps({"cards": before}))
+    json_after = len(json.dumps({"cards": after}))
+
+    ms_before = time_page(
+        lambda: json.dumps({"cards": [_card_to_dict(c) for c in orm_rows]}),
+        args.repeat,
+    )
+    ms_after = time_page(
+        lambda: json.dumps({"cards": [projection.serialize(r) for r in tuple_rows]}),
+        args.repeat,
+    )
+
+    print(f"{args.page_size}-card page, {len(projection.columns)} of "
+          f"{len(Card.__table__.columns)} columns in the list projection\n")
+    print(f"{'':<26} {'before':>10} {'after':>10} {'ratio':>7}")
+    print(f"{'fetched from DB (KB)':<26} {fetched_before / 1024:>10.1f} "
+          f"{fetched_after / 1024:>10.1f} {fetched_before / fetched_after:>6.1f}x")
+    print(f"{'JSON response (KB)':<26} {json_before / 1024:>10.1f} "
+          f"{json_after / 1024:>10.1f} {json_before / json_after:>6.1f}x")
+    print(f"{'serialize + dumps (ms)':<26} {ms_before:>10.2f} "
+          f"{ms_after:>10.2f} {ms_before / ms_after:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Concept Clustering Micro-Benchmark
+
+Compares the original nested-loop clustering from
+``DiscoveryService._cluster_similar_concepts`` (pure-Python
+``cosine_similarity`` / ``calculate_name_similarity`` per pair) against the
+vectorized ``greedy_similarity_clusters`` on synthetic new-concept
+candidates, and checks both produce identical clusters.
+
+Usage:
+    python -m scripts.bench_concept_clustering
+    python -m scripts.bench_concept_clustering --sizes 100 500 2000 --dim 1536
+    python -m scripts.bench_concept_clustering --skip-legacy-above 500
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "bench")
+
+from app.discovery_service import (  # noqa: E402
+    calculate_name_similarity,
+    cosine_similarity,
+    greedy_similarity_clusters,
+)
+
+EMBEDDING_CLUSTER_THRESHOLD = 0.80
+NAME_CLUSTER_THRESHOLD = 0.6
+
+TOPIC_WORDS = [
+    "smart", "city", "traffic", "ai", "drone", "delivery", "water", "grid",
+    "housing", "policy", "transit", "electric", "bus", "sensor", "network",
+    "climate", "resilience", "broadband", "equity", "permitting", "wildfire",
+    "microtransit", "heat", "mapping", "digital", "twin", "workforce", "grant",
+]
+
+
+def make_dataset(
+    n: int, dim: int = 1536, seed: int = 42
+) -> Tuple[List[str], List[Optional[List[float]]]]:
+    """
+    Synthetic candidates: ~n/4 topics, each with a centroid embedding and a
+    name vocabulary.  Members get noisy embeddings around their topic (some
+    above and some below the 0.80 cut) and overlapping names; a few have no
+    embedding or no name to exercise both tiers.
+    """
+    rng = random.Random(seed)
+    topics = []
+    for _ in range(max(1, n // 4)):
+        centroid = [rng.gauss(0, 1) for _ in range(dim)]
+        words = rng.sample(TOPIC_WORDS, 3)
+        topics.append((centroid, words))
+
+    names: List[str] = []
+    embeddings: List[Optional[List[float]]] = []
+    for _ in range(n):
+        centroid, words = rng.choice(topics)
+        noise = rng.choice([0.2, 0.5, 0.9])
+        vec = [c + rng.gauss(0, noise) for c in centroid]
+        k = rng.randint(1, 3)
+        name = " ".join(rng.sample(words, k)).title()
+        if rng.random() < 0.2:
+            name += " " + rng.choice(TOPIC_WORDS).title()
+        names.append("" if rng.random() < 0.05 else name)
+        embeddings.append(None if rng.random() < 0.1 else vec)
+    return names, embeddings
+
+
+def legacy_clusters(
+    names: List[str], embeddings: List[Optional[List[float]]]
+) -> List[List[int]]:
+    """The original O(n^2) pure-Python loop, on positions in priority order."""
+    clusters: List[List[int]] = []
+    used = set()
+    for i in range(len(names)):
+        if i in used:
+            continue
+        cluster = [i]
+        used.add(i)
+        source_name = names[i]
+        source_embedding = embeddings[i] if embeddings[i] else None
+        if not source_name and not source_embedding:
+            clusters.append(cluster)
+            continue
+        for j in range(len(names)):
+            if j in used:
+                continue
+            matched = False
+            other_embedding = embeddings[j] if embeddings[j] else None
+            if source_embedding and other_embedding:
+                sim = cosine_similarity(source_embedding, other_embedding)
+                if sim >= EMBEDDING_CLUSTER_THRESHOLD:
+                    matched = True
+            if not matched:
+                other_name = names[j]
+                if source_name and other_name:
+                    if (
+                        calculate_name_similarity(source_name, other_name)
+                        >= NAME_CLUSTER_THRESHOLD
+                    ):
+                        matched = True
+            if matched:
+                cluster.append(j)
+                used.add(j)
+        clusters.append(cluster)
+    return clusters
+
+
+def vectorized_clusters(
+    names: List[str], embeddings: List[Optional[List[float]]]
+) -> List[List[int]]:
+    return [
+        [pos for pos, _, _ in group]
+        for group in greedy_similarity_clusters(
+            names, embeddings, EMBEDDING_CLUSTER_THRESHOLD, NAME_CLUSTER_THRESHOLD
+        )
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument(
+        "--skip-legacy-above",
+        type=int,
+        default=None,
+        help="Skip the slow legacy loop for sizes above this",
+    )
+    args = parser.parse_args()
+
+    print(f"{'sources':>8} {'clusters':>9} {'legacy (s)':>11} {'numpy (s)':>10} {'speedup':>8}")
+    for n in args.sizes:
+        names, embeddings = make_dataset(n, dim=args.dim)
+
+        start = time.perf_counter()
+        new = vectorized_clusters(names, embeddings)
+        new_s = time.perf_counter() - start
+
+        if args.skip_legacy_above is not None and n > args.skip_legacy_above:
+            print(f"{n:>8} {len(new):>9} {'skipped':>11} {new_s:>10.3f} {'-':>8}")
+            continue
+
+        start = time.perf_counter()
+        old = legacy_clusters(names, embeddings)
+        old_s = time.perf_counter() - start
+
+        if old != new:
+            raise SystemExit(f"Cluster mismatch at n={n}")
+        print(f"{n:>8} {len(new):>9} {old_s:>11.3f} {new_s:>10.3f} {old_s / new_s:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
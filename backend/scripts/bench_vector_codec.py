@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+pgvector Codec Micro-Benchmark
+
+Client-side cost of moving embeddings between Python and Postgres, before
+and after the binary codec in ``app.helpers.vector_utils``:
+
+- text (before): query vectors bound as ``"[" + ",".join(str(v)) + "]"``,
+  results parsed from pgvector's text output
+- binary (after): ``encode_vector_binary`` / ``decode_vector_binary``
+  (float32 arrays <-> pgvector's binary wire format)
+
+Also reports bytes on the wire per vector.  Server-side ``vector_in`` /
+``vector_out`` text formatting is skipped by the binary path too but is not
+measured here.
+
+Usage:
+    python -m scripts.bench_vector_codec
+    python -m scripts.bench_vector_codec --dim 1536 --vectors 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.helpers.vector_utils import (  # noqa: E402
+    decode_vector_binary,
+    encode_vector_binary,
+    parse_embedding,
+)
+
+
+def text_encode(embedding: List[float]) -> str:
+    """The removed db_utils serializer."""
+    return "[" + ",".join(str(v) for v in embedding) + "]"
+
+
+def text_decode(value: str) -> List[float]:
+    """pgvector's own text parser (what a str result had to go through)."""
+    return [float(v) for v in value[1:-1].split(",")]
+
+
+def pg_text_output(vec: np.ndarray) -> str:
+    """What the server sends for a vector in text mode (shortest float4 repr)."""
+    return "[" + ",".join(repr(float(v)) for v in vec.astype(np.float32)) + "]"
+
+
+def time_per_vector(fn: Callable, items: list) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--vectors", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    arrays = [v for v in rng.standard_normal((args.vectors, args.dim)).astype(np.float32)]
+    # Embeddings arrive from the OpenAI client as Python float lists
+    lists = [a.astype(np.float64).tolist() for a in arrays]
+
+    text_in = [text_encode(e) for e in lists]
+    text_out = [pg_text_output(a) for a in arrays]
+    binary = [encode_vector_binary(a) for a in arrays]
+
+    for a, b in zip(arrays, binary):
+        assert np.array_equal(decode_vector_binary(b), a)
+
+    rows = [
+        ("encode text (list -> str)", time_per_vector(text_encode, lists)),
+        ("encode binary (list -> bytes)", time_per_vector(encode_vector_binary, lists)),
+        ("encode binary (float32 -> bytes)", time_per_vector(encode_vector_binary, arrays)),
+        ("decode text (str -> list)", time_per_vector(text_decode, text_out)),
+        ("decode text (str -> float32)", time_per_vector(parse_embedding, text_out)),
+        ("decode binary (bytes -> float32)", time_per_vector(decode_vector_binary, binary)),
+    ]
+
+    print(f"{args.vectors} vectors x {args.dim} dims\n")
+    print(f"{'operation':<34} {'us/vector':>10}")
+    for name, us in rows:
+        print(f"{name:<34} {us:>10.1f}")
+
+    print(f"\n{'payload':<34} {'bytes':>10}")
+    print(f"{'text bind':<34} {np.mean([len(t) for t in text_in]):>10.0f}")
+    print(f"{'text result':<34} {np.mean([len(t) for t in text_out]):>10.0f}")
+    print(f"{'binary':<34} {len(binary[0]):>10}")
+
+
+if __name__ == "__main__":
+    main()
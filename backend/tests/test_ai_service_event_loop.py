@@ -0,0 +1,100 @@
+"""
+Event-Loop Latency Regression Benchmark for AIService
+
+AIService is usually built with the *sync* Azure OpenAI client.  Its
+``async def`` methods must not block the event loop while an LLM request
+is in flight.  This benchmark keeps N slow (fake) LLM calls outstanding
+and measures how late a 10ms heartbeat task wakes up; the worst-case lag
+must stay flat instead of growing with N x call latency.
+
+Usage:
+    cd backend && pytest tests/test_ai_service_event_loop.py -v -s
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# openai_provider fails fast without Azure config; dummy values are enough
+# because the client below is a fake.
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+from app.ai_service import AIService  # noqa: E402
+
+CALL_LATENCY_SECONDS = 0.2
+HEARTBEAT_SECONDS = 0.01
+MAX_ACCEPTABLE_LAG_SECONDS = 0.1
+
+
+class SlowSyncCompletions:
+    """Blocking fake of client.chat.completions, like the real sync client."""
+
+    def create(self, **kwargs):
+        time.sleep(CALL_LATENCY_SECONDS)
+        content = json.dumps(
+            {
+                "is_relevant": True,
+                "confidence": 0.9,
+                "primary_pillar": "CH",
+                "reason": "fake",
+            }
+        )
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+
+
+def make_service() -> AIService:
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SlowSyncCompletions()))
+    return AIService(client, coalesce_window_ms=0)
+
+
+async def measure_max_lag(concurrent_calls: int) -> tuple:
+    """Run N triage calls alongside a heartbeat; return (max lag, elapsed)."""
+    service = make_service()
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal max_lag
+        while not done.is_set():
+            expected = time.perf_counter() + HEARTBEAT_SECONDS
+            await asyncio.sleep(HEARTBEAT_SECONDS)
+            max_lag = max(max_lag, time.perf_counter() - expected)
+
+    ticker = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(service.triage_source("title", "content") for _ in range(concurrent_calls))
+    )
+    elapsed = time.perf_counter() - start
+    done.set()
+    await ticker
+
+    assert all(r.is_relevant for r in results)
+    return max_lag, elapsed
+
+
+@pytest.mark.parametrize("concurrent_calls", [1, 4, 8])
+def test_event_loop_lag_stays_flat(concurrent_calls):
+    max_lag, elapsed = asyncio.run(measure_max_lag(concurrent_calls))
+    print(
+        f"\n{concurrent_calls} concurrent calls: "
+        f"max loop lag {max_lag * 1000:.1f}ms, wall {elapsed:.2f}s"
+    )
+    assert max_lag < MAX_ACCEPTABLE_LAG_SECONDS
+    # Calls overlap on the executor rather than running back-to-back
+    assert elapsed < CALL_LATENCY_SECONDS * concurrent_calls * 0.5 + 0.3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,259 @@
+"""
+Unit Tests for the Process-Level Card Embedding Cache
+
+Tests app.card_embedding_cache.CardEmbeddingCache without a database:
+- top_k matches brute-force cosine over every card (no 100-card cutoff)
+- status / review_status filters used by the discovery and RSS fallbacks
+- invalidate() updates cached rows in place and queues a re-read
+- the memory cap keeps the most recently updated rows on load, evicts the
+  least recently used card for new ones, and freed rows are reused
+- a wrong-dimension row is skipped and logged once, without forcing reloads
+
+Usage:
+    cd backend && pytest tests/test_card_embedding_cache.py -v
+"""
+
+import asyncio
+import os
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+from app.card_embedding_cache import CardEmbeddingCache  # noqa: E402
+from app.discovery_service import cosine_similarity  # noqa: E402
+
+DIM = 16
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def make_rows(n: int, seed: int = 3):
+    rng = random.Random(seed)
+    return [
+        SimpleNamespace(
+            id=uuid.UUID(int=i + 1),
+            name=f"Card {i}",
+            summary=f"Summary {i}",
+            status="approved" if i % 3 else "active",
+            review_status="rejected" if i % 7 == 0 else "active",
+            updated_at=BASE_TIME + timedelta(minutes=i),
+            # Alternate pgvector text form and plain lists
+            embedding=(
+                "[" + ",".join(str(rng.uniform(-1, 1)) for _ in range(DIM)) + "]"
+                if i % 2
+                else [rng.uniform(-1, 1) for _ in range(DIM)]
+            ),
+        )
+        for i in range(n)
+    ]
+
+
+def as_list(embedding):
+    if isinstance(embedding, str):
+        return [float(v) for v in embedding.strip("[]").split(",")]
+    return embedding
+
+
+def make_cache(rows, **kwargs) -> CardEmbeddingCache:
+    cache = CardEmbeddingCache(**kwargs)
+    cache._apply_rows(rows)
+    return cache
+
+
+# ============================================================================
+# FAKES
+# ============================================================================
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+    def scalar(self):
+        return len(self._rows)
+
+
+class FakeSession:
+    """Returns the same card rows for every query; counts executions."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = 0
+
+    async def execute(self, stmt):
+        self.executed += 1
+        return FakeResult(self.rows)
+
+
+# ============================================================================
+# top_k
+# ============================================================================
+
+class TestTopK:
+    @pytest.mark.parametrize("k,threshold", [(1, 0.0), (5, 0.1), (500, -1.0)])
+    def test_matches_brute_force_over_whole_corpus(self, k, threshold):
+        rows = make_rows(300)
+        cache = make_cache(rows)
+        rng = random.Random(k)
+
+        for _ in range(20):
+            query = [rng.uniform(-1, 1) for _ in range(DIM)]
+            got = cache.top_k(query, k=k, threshold=threshold)
+            scored = sorted(
+                ((cosine_similarity(query, as_list(r.embedding)), str(r.id)) for r in rows),
+                reverse=True,
+            )
+            expected = [(s, cid) for s, cid in scored if s > threshold][:k]
+            assert [m["id"] for m in got] == [cid for _, cid in expected]
+            for match, (sim, _) in zip(got, expected):
+                assert match["similarity"] == pytest.approx(sim, abs=1e-5)
+
+    def test_filters(self):
+        rows = make_rows(100)
+        cache = make_cache(rows)
+        query = as_list(rows[14].embedding)  # rejected + active card
+
+        by_id = {str(r.id): r for r in rows}
+        for m in cache.top_k(query, k=100, threshold=-1.0, exclude_rejected=True):
+            assert by_id[m["id"]].review_status != "rejected"
+        for m in cache.top_k(query, k=100, threshold=-1.0, status="approved"):
+            assert by_id[m["id"]].status == "approved"
+
+    def test_bad_query(self):
+        cache = make_cache(make_rows(10))
+        assert cache.top_k(None, k=3) == []
+        assert cache.top_k([1.0, 2.0], k=3) == []
+        assert CardEmbeddingCache().top_k([1.0] * DIM, k=3) == []
+
+
+# ============================================================================
+# Updates, invalidation and memory cap
+# ============================================================================
+
+class TestUpdates:
+    def test_null_embedding_removes_card(self):
+        rows = make_rows(10)
+        cache = make_cache(rows)
+        cache._apply_rows([SimpleNamespace(**{**vars(rows[1]), "embedding": None})])
+        assert cache.size == 9
+        query = as_list(rows[1].embedding)
+        assert str(rows[1].id) not in [m["id"] for m in cache.top_k(query, k=10)]
+
+    def test_invalidate_updates_row_in_place(self):
+        rows = make_rows(10)
+        cache = make_cache(rows)
+        card_id = str(rows[2].id)
+        new_vec = [0.0] * DIM
+        new_vec[0] = 1.0
+
+        cache.invalidate(card_id, new_vec)
+
+        top = cache.top_k(new_vec, k=1)
+        assert top[0]["id"] == card_id
+        assert top[0]["similarity"] == pytest.approx(1.0)
+        assert card_id in cache._dirty_ids
+
+    def test_memory_cap_keeps_newest_rows_on_load(self):
+        rows = make_rows(50)
+        # The full load reads newest first
+        db = FakeSession(rows[::-1])
+        cache = CardEmbeddingCache(max_bytes=20 * DIM * 4)
+        asyncio.run(cache.refresh(db))
+        assert cache.size == 20
+        assert cache._truncated
+        assert cache.nbytes <= 20 * DIM * 4
+        assert set(cache._slots) == {str(r.id) for r in rows[30:]}
+
+    def test_new_card_at_cap_evicts_least_recently_used(self):
+        rows = make_rows(21)
+        cache = make_cache(rows[:20], max_bytes=20 * DIM * 4)
+        # A search hit makes rows[0] recent, so rows[1] is now the oldest
+        assert cache.top_k(as_list(rows[0].embedding), k=1)[0]["id"] == str(rows[0].id)
+
+        cache._apply_rows([rows[20]])
+
+        assert cache.size == 20
+        assert str(rows[20].id) in cache._slots
+        assert str(rows[0].id) in cache._slots
+        assert str(rows[1].id) not in cache._slots
+        top = cache.top_k(as_list(rows[20].embedding), k=1)
+        assert top[0]["id"] == str(rows[20].id)
+
+    def test_freed_rows_are_reused(self):
+        rows = make_rows(11)
+        cache = make_cache(rows[:10])
+        allocated = len(cache._ids)
+        cache._apply_rows([SimpleNamespace(**{**vars(rows[4]), "embedding": None})])
+        cache._apply_rows([rows[10]])
+        assert len(cache._ids) == allocated
+        assert cache._slots[str(rows[10].id)] == 4
+        assert cache.size == 10
+
+    def test_wrong_dimension_skipped_without_reload(self, caplog):
+        rows = make_rows(10)
+        bad = SimpleNamespace(**{**vars(rows[9]), "embedding": [0.5] * (DIM + 1)})
+        db = FakeSession([bad] + rows[:9])
+        cache = CardEmbeddingCache(refresh_interval=3600)
+
+        async def run():
+            await cache.refresh(db)
+            for _ in range(2):
+                cache.invalidate(str(bad.id))
+                await cache.refresh(db)
+
+        with caplog.at_level("WARNING", logger="app.card_embedding_cache"):
+            asyncio.run(run())
+        # full load, then two incremental selects + count checks; no reloads
+        assert db.executed == 5
+        assert cache.size == 9
+        assert str(bad.id) not in cache._slots
+        assert sum("dimensions" in r.getMessage() for r in caplog.records) == 1
+
+
+# ============================================================================
+# Refresh
+# ============================================================================
+
+class TestRefresh:
+    def test_loads_once_then_respects_interval(self):
+        rows = make_rows(20)
+        db = FakeSession(rows)
+        cache = CardEmbeddingCache(refresh_interval=3600)
+
+        async def run():
+            await cache.search(db, as_list(rows[0].embedding), k=1)
+            await cache.search(db, as_list(rows[0].embedding), k=1)
+
+        asyncio.run(run())
+        assert db.executed == 1
+        assert cache.size == 20
+
+    def test_dirty_id_triggers_incremental_refresh(self):
+        rows = make_rows(20)
+        db = FakeSession(rows)
+        cache = CardEmbeddingCache(refresh_interval=3600)
+
+        async def run():
+            await cache.refresh(db)
+            cache.invalidate(str(rows[3].id))
+            await cache.refresh(db)
+
+        asyncio.run(run())
+        # full load, then incremental select + count check
+        assert db.executed == 3
+        assert not cache._dirty_ids
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,226 @@
+"""
+Unit Tests for the Discovery CardMatchIndex
+
+Checks that the vectorized index makes the same decisions as the per-source
+logic it replaces:
+- first_name_match == first card scoring >= threshold with calculate_name_similarity
+- top_matches == brute-force cosine, strict > threshold, best first
+- url_exists only reports URLs already stored
+- find_existing_source_urls resolves a batch in one normalized query
+
+Usage:
+    cd backend && pytest tests/test_card_match_index.py -v
+"""
+
+import asyncio
+import os
+import random
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# discovery_service imports ai_service, which needs Azure config at import
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+from app.card_match_index import CardMatchIndex  # noqa: E402
+from app.helpers.db_utils import (  # noqa: E402
+    SOURCE_URL_NORM_SQL,
+    find_existing_source_urls,
+)
+from app.discovery_service import (  # noqa: E402
+    calculate_name_similarity,
+    cosine_similarity,
+)
+
+
+WORDS = [
+    "smart", "city", "traffic", "ai", "drone", "delivery", "water", "grid",
+    "housing", "policy", "transit", "electric", "bus", "sensor", "network",
+]
+
+
+def random_name(rng: random.Random) -> str:
+    name = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4)))
+    return name.title() + rng.choice(["", "!", " (pilot)", "-2"])
+
+
+def make_cards(n: int, dim: int = 8, seed: int = 7):
+    rng = random.Random(seed)
+    cards = []
+    for i in range(n):
+        embedding = [rng.uniform(-1, 1) for _ in range(dim)]
+        cards.append(
+            {
+                "id": f"card-{i}",
+                "name": random_name(rng),
+                "summary": f"summary {i}",
+                # Mix of pgvector text form, lists and missing embeddings
+                "embedding": (
+                    None
+                    if i % 11 == 0
+                    else "[" + ",".join(str(v) for v in embedding) + "]"
+                    if i % 2
+                    else embedding
+                ),
+            }
+        )
+    return cards
+
+
+def as_list(embedding):
+    if isinstance(embedding, str):
+        return [float(v) for v in embedding.strip("[]").split(",")]
+    return embedding
+
+
+# ============================================================================
+# Name matching
+# ============================================================================
+
+class TestFirstNameMatch:
+    @pytest.mark.parametrize("threshold", [0.3, 0.5, 0.8, 1.0])
+    def test_matches_linear_scan(self, threshold):
+        cards = make_cards(200)
+        index = CardMatchIndex(cards)
+        rng = random.Random(threshold)
+
+        for _ in range(200):
+            query = random_name(rng)
+            expected = next(
+                (
+                    c for c in cards
+                    if c["name"]
+                    and calculate_name_similarity(query, c["name"]) >= threshold
+                ),
+                None,
+            )
+            got = index.first_name_match(query, threshold)
+            if expected is None:
+                assert got is None
+            else:
+                assert got["id"] == expected["id"]
+                assert got["similarity"] == calculate_name_similarity(
+                    query, expected["name"]
+                )
+
+    def test_containment_without_shared_word(self):
+        index = CardMatchIndex([{"id": "a", "name": "Microtransit", "embedding": None}])
+        match = index.first_name_match("microtransits", 0.8)
+        assert match is not None and match["id"] == "a"
+
+    def test_empty_name_never_matches(self):
+        index = CardMatchIndex(make_cards(10))
+        assert index.first_name_match("", 0.0) is None
+
+
+# ============================================================================
+# Vector matching
+# ============================================================================
+
+class TestTopMatches:
+    @pytest.mark.parametrize("k,threshold", [(3, 0.2), (5, -1.0), (50, 0.5)])
+    def test_matches_brute_force(self, k, threshold):
+        cards = make_cards(120)
+        index = CardMatchIndex(cards)
+        rng = random.Random(k)
+        queries = [[rng.uniform(-1, 1) for _ in range(8)] for _ in range(40)]
+
+        results = index.top_matches(queries, k=k, threshold=threshold)
+
+        for query, got in zip(queries, results):
+            scored = sorted(
+                (
+                    (cosine_similarity(query, as_list(c["embedding"])), c["id"])
+                    for c in cards
+                    if c["embedding"] is not None
+                ),
+                reverse=True,
+            )
+            expected = [(sim, cid) for sim, cid in scored if sim > threshold][:k]
+            assert [m["id"] for m in got] == [cid for _, cid in expected]
+            for match, (sim, _) in zip(got, expected):
+                assert match["similarity"] == pytest.approx(sim, abs=1e-5)
+
+    def test_missing_or_mismatched_query_gets_no_matches(self):
+        index = CardMatchIndex(make_cards(20))
+        results = index.top_matches([None, [1.0, 2.0]], k=3, threshold=0.0)
+        assert results == [[], []]
+
+    def test_no_card_embeddings(self):
+        index = CardMatchIndex([{"id": "a", "name": "x", "embedding": None}])
+        assert index.top_matches([[1.0] * 8], k=3, threshold=0.0) == [[]]
+
+
+# ============================================================================
+# URL lookups
+# ============================================================================
+
+class TestUrlExists:
+    def test_only_known_urls(self):
+        index = CardMatchIndex([], existing_urls={"https://a.example/1"})
+        assert index.url_exists("https://a.example/1")
+        assert not index.url_exists("https://a.example/2")
+        assert not index.url_exists(None)
+
+    def test_normalized_match(self):
+        index = CardMatchIndex([], existing_urls={"https://a.example/1"})
+        assert index.url_exists("HTTPS://A.example/1#section")
+
+
+class FakeUrlSession:
+    """Answers the bulk URL query from an in-memory sources table."""
+
+    def __init__(self, sources):
+        self.sources = sources
+        self.calls = []
+
+    async def execute(self, sql, params):
+        self.calls.append((str(sql), params))
+        rows = [
+            {"id": sid, "card_id": cid, "norm_url": norm}
+            for sid, cid, norm in self.sources
+            if norm in params["urls"]
+        ]
+        return SimpleNamespace(mappings=lambda: SimpleNamespace(all=lambda: rows))
+
+
+class TestFindExistingSourceUrls:
+    def test_single_query_for_batch(self):
+        db = FakeUrlSession(
+            [("s1", "c1", "https://a.example/1"), ("s2", None, "https://b.example")]
+        )
+        urls = ["https://a.example/1/", "https://B.example#x", "https://c.example", None]
+
+        existing = asyncio.run(find_existing_source_urls(db, urls))
+
+        assert len(db.calls) == 1
+        assert "= ANY(:urls)" in db.calls[0][0]
+        assert existing == {
+            "https://a.example/1": [{"id": "s1", "card_id": "c1"}],
+            "https://b.example": [{"id": "s2", "card_id": None}],
+        }
+
+    def test_no_urls_no_query(self):
+        db = FakeUrlSession([])
+        assert asyncio.run(find_existing_source_urls(db, [None, ""])) == {}
+        assert db.calls == []
+
+    def test_migration_indexes_same_expression(self):
+        migration = os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "alembic",
+            "versions",
+            "20260221_000020_source_url_hash_index.py",
+        )
+        with open(migration) as f:
+            assert f"(({SOURCE_URL_NORM_SQL}))" in f.read()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,335 @@
+"""
+Unit Tests for Keyset Pagination of GET /cards
+
+Covers app.helpers.card_pagination and its use by the cards router (no
+database):
+- cursors round-trip every sort column and reject foreign / garbage input
+- keyset predicates honour direction and the NULLS LAST tail
+- the count cache is keyed by normalized filters and expires
+- count=approximate trusts the planner estimate only for large results
+- GET /cards returns next_cursor, pages without OFFSET and counts once
+
+Usage:
+    cd backend && pytest tests/test_card_pagination.py -v
+"""
+
+import asyncio
+import json
+import os
+import sys
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.helpers.card_pagination as card_pagination  # noqa: E402
+from app.helpers.card_pagination import (  # noqa: E402
+    APPROX_EXACT_BELOW,
+    CountCache,
+    CursorError,
+    card_count_cache,
+    count_cards,
+    decode_cursor,
+    encode_cursor,
+    filter_key,
+    keyset_after,
+    sort_column,
+)
+from app.helpers.projection import card_list_projection  # noqa: E402
+from app.models.db.card import Card  # noqa: E402
+from app.routers import cards as cards_router  # noqa: E402
+
+
+def compile_sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture(autouse=True)
+def fresh_counts():
+    card_count_cache.clear()
+    yield
+    card_count_cache.clear()
+
+
+# ============================================================================
+# Cursors
+# ============================================================================
+
+class TestCursor:
+    @pytest.mark.parametrize(
+        "sort_by,value",
+        [
+            (None, datetime(2026, 2, 1, 9, 30, tzinfo=timezone.utc)),
+            ("name", "Transit Grant"),
+            ("funding_amount_max", Decimal("250000.00")),
+            ("signal_quality_score", 87),
+            ("deadline", None),
+        ],
+    )
+    def test_round_trip(self, sort_by, value):
+        card_id = uuid.uuid4()
+        cursor = encode_cursor(sort_by, True, value, card_id)
+        assert "=" not in cursor
+        assert decode_cursor(cursor, sort_by, True) == (value, card_id)
+
+    def test_unknown_sort_falls_back_to_created_at(self):
+        cursor = encode_cursor("bogus", False, None, uuid.uuid4())
+        decode_cursor(cursor, None, False)
+        assert sort_column("bogus") is Card.created_at
+
+    def test_rejects_other_sort(self):
+        cursor = encode_cursor("name", True, "a", uuid.uuid4())
+        with pytest.raises(CursorError):
+            decode_cursor(cursor, "name", False)
+        with pytest.raises(CursorError):
+            decode_cursor(cursor, "deadline", True)
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-a-cursor",
+            "e30",  # {}
+            encode_cursor("signal_quality_score", True, "high", uuid.uuid4()),
+        ],
+    )
+    def test_rejects_garbage(self, cursor):
+        with pytest.raises(CursorError):
+            decode_cursor(cursor, "signal_quality_score", True)
+
+
+class TestKeysetPredicate:
+    def test_descending(self):
+        sql = compile_sql(
+            keyset_after(Card.created_at, False, datetime.now(timezone.utc), uuid.uuid4())
+        )
+        assert "(cards.created_at, cards.id) <" in sql
+        assert "OR cards.created_at IS NULL" in sql
+
+    def test_ascending(self):
+        sql = compile_sql(keyset_after(Card.name, True, "m", uuid.uuid4()))
+        assert "(cards.name, cards.id) >" in sql
+
+    def test_null_tail_pages_by_id(self):
+        sql = compile_sql(keyset_after(Card.deadline, False, None, uuid.uuid4()))
+        assert "cards.deadline IS NULL AND cards.id <" in sql
+
+
+# ============================================================================
+# Counts
+# ============================================================================
+
+class TestCountCache:
+    def test_filter_key_is_normalized(self):
+        a = filter_key(pillar_ids=["b", "a"], search=None, horizon="H1")
+        b = filter_key(horizon="H1", pillar_ids=["a", "b"], following_user=None)
+        assert a == b
+        assert hash(a) == hash(b)
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(card_pagination.time, "monotonic", lambda: now[0])
+        cache = CountCache(ttl=30)
+        cache.set("k", 5, False)
+        now[0] += 29
+        assert cache.get("k") == (5, False)
+        now[0] += 2
+        assert cache.get("k") is None
+
+    def test_evicts_oldest(self):
+        cache = CountCache(max_entries=2)
+        cache.set("a", 1, False)
+        cache.set("b", 2, False)
+        cache.set("c", 3, False)
+        assert cache.get("a") is None
+        assert cache.get("c") == (3, False)
+
+
+class _Savepoint:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class CountDB:
+    """Returns `exact` for count(*) and `estimate` from EXPLAIN."""
+
+    def __init__(self, exact=0, estimate=0):
+        self.exact = exact
+        self.estimate = estimate
+        self.counts = 0
+        self.explains = []
+
+    def begin_nested(self):
+        return _Savepoint()
+
+    async def execute(self, stmt):
+        self.counts += 1
+        return SimpleNamespace(scalar=lambda: self.exact)
+
+    async def connection(self):
+        db = self
+
+        class Conn:
+            dialect = postgresql.dialect()
+
+            async def exec_driver_sql(self, sql):
+                db.explains.append(sql)
+                plan = [{"Plan": {"Plan Rows": db.estimate}}]
+                return SimpleNamespace(scalar=lambda: json.dumps(plan))
+
+        return Conn()
+
+
+BASE = select(Card.id, Card.name).where(Card.status == "active")
+
+
+class TestCountCards:
+    def test_exact_is_cached_per_filter_set(self):
+        db = CountDB(exact=42)
+        key = filter_key(status="active")
+        assert asyncio.run(count_cards(db, BASE, key)) == (42, False)
+        assert asyncio.run(count_cards(db, BASE, key)) == (42, False)
+        assert db.counts == 1
+        asyncio.run(count_cards(db, BASE, filter_key(status="draft")))
+        assert db.counts == 2
+
+    def test_none_skips_count(self):
+        db = CountDB(exact=42)
+        assert asyncio.run(count_cards(db, BASE, (), "none")) == (None, False)
+        assert db.counts == 0
+
+    def test_approximate_large_uses_estimate(self):
+        db = CountDB(exact=1, estimate=APPROX_EXACT_BELOW * 5)
+        result = asyncio.run(count_cards(db, BASE, (), "approximate"))
+        assert result == (APPROX_EXACT_BELOW * 5, True)
+        assert db.counts == 0
+        assert db.explains[0].startswith("EXPLAIN (FORMAT JSON) SELECT cards.id")
+        assert "'active'" in db.explains[0]
+
+    def test_approximate_small_counts_exactly(self):
+        db = CountDB(exact=12, estimate=15)
+        assert asyncio.run(count_cards(db, BASE, (), "approximate")) == (12, False)
+        assert db.counts == 1
+
+
+# ============================================================================
+# GET /cards
+# ============================================================================
+
+class PageDB:
+    """count(*) -> `total`; page queries -> successive slices of `pages`."""
+
+    def __init__(self, total, pages):
+        self.total = total
+        self.pages = list(pages)
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        if "count(*)" in compile_sql(stmt):
+            return SimpleNamespace(scalar=lambda: self.total)
+        rows = self.pages.pop(0)
+        return SimpleNamespace(all=lambda: rows)
+
+
+class Row(tuple):
+    """Result row of the list projection (tuple with a ``_mapping``)."""
+
+    @property
+    def _mapping(self):
+        return dict(zip(card_list_projection().keys, self))
+
+
+def make_rows(n):
+    projection = card_list_projection()
+    rows = []
+    for i in range(n):
+        values = {k: None for k in projection.keys}
+        values["id"] = uuid.uuid4()
+        values["created_at"] = datetime(2026, 2, 1, tzinfo=timezone.utc).replace(
+            hour=23 - i
+        )
+        rows.append(Row(values[k] for k in projection.keys))
+    return rows
+
+
+def get_cards(db, **params):
+    defaults = {
+        name: None
+        for name in (
+            "pillar_id", "stage_id", "horizon", "pipeline_status", "search",
+            "grant_type", "category_id", "created_after", "created_before",
+            "updated_after", "updated_before", "deadline_after", "deadline_before",
+            "impact_min", "relevance_min", "novelty_min", "funding_min",
+            "funding_max", "sort_by", "sort_asc", "slug", "status", "include",
+            "cursor",
+        )
+    }
+    defaults.update(
+        limit=2, offset=0, following_only=False, count="exact", request=None
+    )
+    defaults.update(params)
+    return asyncio.run(cards_router.get_cards(db=db, **defaults))
+
+
+class TestGetCardsKeyset:
+    def test_cursor_pages(self):
+        rows = make_rows(5)
+        db = PageDB(total=5, pages=[rows[:3], rows[2:5], rows[4:5]])
+
+        first = get_cards(db)
+        assert [c["id"] for c in first["cards"]] == [str(r[0]) for r in rows[:2]]
+        assert first["has_more"] is True
+        assert first["total_count"] == 5
+        assert first["total_count_approximate"] is False
+        assert decode_cursor(first["next_cursor"], None, False) == (
+            rows[1]._mapping["created_at"],
+            rows[1]._mapping["id"],
+        )
+
+        second = get_cards(db, cursor=first["next_cursor"], offset=40)
+        page_sql = compile_sql(db.statements[-1])
+        assert "(cards.created_at, cards.id) <" in page_sql
+        assert "OFFSET" not in page_sql
+        assert "ORDER BY cards.created_at DESC NULLS LAST, cards.id DESC" in page_sql
+        assert second["has_more"] is True
+
+        third = get_cards(db, cursor=second["next_cursor"])
+        assert third["has_more"] is False
+        assert third["next_cursor"] is None
+
+        # Count ran once; later pages reused the cached total.
+        counts = [s for s in db.statements if "count(*)" in compile_sql(s)]
+        assert len(counts) == 1
+
+    def test_offset_mode_still_supported(self):
+        db = PageDB(total=5, pages=[make_rows(2)])
+        page = get_cards(db, offset=3, count="none")
+        assert page["total_count"] is None
+        assert page["has_more"] is False
+        assert "OFFSET" in compile_sql(db.statements[-1])
+
+    def test_bad_cursor_and_count_are_rejected(self):
+        with pytest.raises(HTTPException) as exc:
+            get_cards(PageDB(0, []), cursor="garbage")
+        assert exc.value.status_code == 400
+        with pytest.raises(HTTPException) as exc:
+            get_cards(PageDB(0, []), count="sometimes")
+        assert exc.value.status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
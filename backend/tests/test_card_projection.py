@@ -0,0 +1,262 @@
+"""
+Unit Tests for Card List Projections
+
+Covers app.helpers.projection and its use by the cards router (no database):
+- heavy Card / Source columns are deferred from select(Card) / select(Source)
+- list projections leave out vectors and opt-in text / JSON fields
+- Projection.serialize matches the old per-column _card_to_dict output
+- GET /cards selects only the projected columns and validates ?include=
+
+Usage:
+    cd backend && pytest tests/test_card_projection.py -v
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+from app.helpers.card_pagination import card_count_cache  # noqa: E402
+from app.helpers.projection import (  # noqa: E402
+    CARD_OPTIONAL_FIELDS,
+    Projection,
+    card_detail_projection,
+    card_list_projection,
+    parse_include,
+)
+from app.models.db.card import Card  # noqa: E402
+from app.models.db.source import Source  # noqa: E402
+from app.routers import cards as cards_router  # noqa: E402
+
+
+def compile_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def selected_columns(stmt) -> set:
+    return {c.key for c in stmt.selected_columns}
+
+
+# ============================================================================
+# Deferred columns
+# ============================================================================
+
+class TestDeferredColumns:
+    def test_card_select_skips_vectors(self):
+        columns = selected_columns(select(Card))
+        sql = compile_sql(select(Card))
+        assert "cards.embedding" not in sql
+        assert "cards.search_vector" not in sql
+        assert "description" in columns  # other columns still load
+
+    def test_source_select_skips_heavy_columns(self):
+        sql = compile_sql(select(Source))
+        for name in ("full_text", "embedding", "search_vector"):
+            assert f"sources.{name}" not in sql
+        assert "sources.ai_summary" in sql
+
+    def test_explicit_column_select_still_works(self):
+        sql = compile_sql(select(Card.id, Card.embedding))
+        assert "cards.embedding" in sql
+
+
+# ============================================================================
+# Projections
+# ============================================================================
+
+class TestProjection:
+    def test_list_projection_columns(self):
+        keys = set(card_list_projection().keys)
+        assert {"id", "name", "summary", "top25_relevance", "deadline"} <= keys
+        assert not keys & {"embedding", "search_vector"}
+        assert not keys & CARD_OPTIONAL_FIELDS
+
+    def test_include_adds_optional_fields(self):
+        keys = set(card_list_projection({"description"}).keys)
+        assert "description" in keys
+        assert "eligibility_text" not in keys
+
+    def test_detail_projection_has_everything_but_vectors(self):
+        keys = set(card_detail_projection().keys)
+        expected = {c.key for c in Card.__table__.columns} - {
+            "embedding",
+            "search_vector",
+        }
+        assert keys == expected
+
+    def test_projections_are_cached(self):
+        assert card_list_projection(["description"]) is card_list_projection(
+            {"description"}
+        )
+
+    def test_parse_include(self):
+        assert parse_include(None) == frozenset()
+        assert parse_include(" description, review_notes ,") == {
+            "description",
+            "review_notes",
+        }
+        with pytest.raises(ValueError, match="embedding"):
+            parse_include("description,embedding")
+
+    def test_serialize_converts_types(self):
+        card_id = uuid.uuid4()
+        created = datetime(2026, 2, 1, 12, 30, tzinfo=timezone.utc)
+        projection = Projection(
+            (
+                Card.id,
+                Card.created_at,
+                Card.deep_research_reset_date,
+                Card.impact_score,
+                Card.anchors,
+                Card.discovery_metadata,
+                Card.deadline,
+            )
+        )
+        row = (
+            card_id,
+            created,
+            date(2026, 2, 3),
+            Decimal("4.50"),
+            ["a"],
+            {"k": 1},
+            None,
+        )
+        assert projection.serialize(row) == {
+            "id": str(card_id),
+            "created_at": "2026-02-01T12:30:00+00:00",
+            "deep_research_reset_date": "2026-02-03",
+            "impact_score": 4.5,
+            "anchors": ["a"],
+            "discovery_metadata": {"k": 1},
+            "deadline": None,
+        }
+
+    def test_serialize_matches_card_to_dict(self):
+        values = {c.key: None for c in Card.__table__.columns}
+        values.update(
+            id=uuid.uuid4(),
+            name="Transit grant",
+            created_at=datetime(2026, 1, 5, tzinfo=timezone.utc),
+            deep_research_reset_date=date(2026, 1, 6),
+            velocity_score=Decimal("12.25"),
+            follower_count=3,
+            pillars=["MC"],
+            quality_breakdown={"x": 1},
+        )
+        projection = card_detail_projection()
+        row = tuple(values[k] for k in projection.keys)
+
+        assert projection.serialize(row) == cards_router._card_to_dict(
+            SimpleNamespace(**values)
+        )
+
+
+# ============================================================================
+# GET /cards
+# ============================================================================
+
+class FakeResult:
+    def __init__(self, rows=None, scalar=0):
+        self._rows = rows or []
+        self._scalar = scalar
+
+    def scalar(self):
+        return self._scalar
+
+    def all(self):
+        return self._rows
+
+
+class FakeDB:
+    """Answers the count query, then returns `rows` for the page query."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        if len(self.statements) == 1:
+            return FakeResult(scalar=len(self.rows))
+        return FakeResult(rows=self.rows)
+
+
+def get_cards(db, **params):
+    defaults = {
+        name: None
+        for name in (
+            "pillar_id", "stage_id", "horizon", "pipeline_status", "search",
+            "grant_type", "category_id", "created_after", "created_before",
+            "updated_after", "updated_before", "deadline_after", "deadline_before",
+            "impact_min", "relevance_min", "novelty_min", "funding_min",
+            "funding_max", "sort_by", "sort_asc", "slug", "status", "include",
+            "cursor",
+        )
+    }
+    defaults.update(
+        limit=50, offset=0, following_only=False, count="exact", request=None
+    )
+    defaults.update(params)
+    return asyncio.run(cards_router.get_cards(db=db, **defaults))
+
+
+@pytest.fixture
+def fresh_counts():
+    card_count_cache.clear()
+    yield
+    card_count_cache.clear()
+
+
+@pytest.mark.usefixtures("fresh_counts")
+class TestGetCards:
+    def test_list_selects_projection_only(self):
+        projection = card_list_projection()
+        card_id = uuid.uuid4()
+        row = tuple(card_id if k == "id" else None for k in projection.keys)
+        db = FakeDB([row])
+
+        response = get_cards(db)
+
+        page_stmt = db.statements[1]
+        assert selected_columns(page_stmt) == set(projection.keys)
+        assert "cards.description" not in compile_sql(page_stmt)
+        assert response["total_count"] == 1
+        assert response["cards"][0]["id"] == str(card_id)
+        assert "description" not in response["cards"][0]
+
+    def test_include_opts_in(self):
+        db = FakeDB([])
+        get_cards(db, include="description,quality_breakdown")
+        columns = selected_columns(db.statements[1])
+        assert {"description", "quality_breakdown"} <= columns
+        assert "eligibility_text" not in columns
+
+    def test_slug_lookup_returns_detail_fields(self):
+        db = FakeDB([])
+        get_cards(db, slug="transit-grant")
+        assert selected_columns(db.statements[1]) == set(
+            card_detail_projection().keys
+        )
+
+    def test_unknown_include_is_rejected(self):
+        with pytest.raises(HTTPException) as exc:
+            get_cards(FakeDB([]), include="embedding")
+        assert exc.value.status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,232 @@
+"""
+Unit Tests for the SQL-backed /cards/search
+
+Covers app.helpers.search_utils.build_card_search and the search endpoint
+(no database):
+- SearchFilters become WHERE clauses (inclusive UTC days, score bounds)
+- filter / text / vector modes pick the right predicate and ordering
+- the endpoint pages with LIMIT / OFFSET and counts the filtered query
+- a failing vector query falls back to full-text search
+
+Usage:
+    cd backend && pytest tests/test_card_search_sql.py -v
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+from app.helpers.card_pagination import card_count_cache  # noqa: E402
+from app.helpers.search_utils import (  # noqa: E402
+    build_card_search,
+    search_filter_clauses,
+)
+from app.models.db.card import Card  # noqa: E402
+from app.models.search import AdvancedSearchRequest, SearchFilters  # noqa: E402
+from app.routers import cards as cards_router  # noqa: E402
+
+
+def compile_sql(stmt):
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+@pytest.fixture(autouse=True)
+def fresh_counts():
+    card_count_cache.clear()
+    yield
+    card_count_cache.clear()
+
+
+# ============================================================================
+# Query builder
+# ============================================================================
+
+class TestFilterClauses:
+    def test_no_filters(self):
+        assert search_filter_clauses(None) == []
+        assert search_filter_clauses(SearchFilters(horizon="ALL")) == []
+
+    def test_filters_become_where_clauses(self):
+        filters = SearchFilters(
+            pillar_ids=["MC", "HS"],
+            stage_ids=["3"],
+            horizon="H2",
+            status="active",
+            date_range={"start": date(2026, 1, 1), "end": date(2026, 1, 31)},
+            score_thresholds={
+                "impact_score": {"min": 50},
+                "risk_score": {"max": 20},
+            },
+        )
+        stmt, _ = build_card_search([Card.id], filters)
+        sql, params = compile_sql(stmt)
+
+        assert "cards.pillar_id IN" in sql
+        assert "cards.stage_id IN" in sql
+        assert "cards.horizon =" in sql
+        assert "cards.status =" in sql
+        assert "cards.impact_score >=" in sql
+        assert "cards.risk_score <=" in sql
+        assert "cards.novelty_score" not in sql
+        # End date is inclusive: everything before the following midnight.
+        bounds = sorted(
+            v for k, v in params.items() if k.startswith("created_at")
+        )
+        assert [b.isoformat() for b in bounds] == [
+            "2026-01-01T00:00:00+00:00",
+            "2026-02-01T00:00:00+00:00",
+        ]
+
+
+class TestSearchModes:
+    def test_filter_mode_orders_newest_first(self):
+        stmt, mode = build_card_search([Card.id])
+        sql, _ = compile_sql(stmt)
+        assert mode == "filter"
+        assert "NULL AS search_relevance" in sql
+        assert "ORDER BY cards.created_at DESC NULLS LAST, cards.id DESC" in sql
+
+    def test_text_mode_uses_tsvector(self):
+        stmt, mode = build_card_search([Card.id], query="transit grants")
+        sql, params = compile_sql(stmt)
+        assert mode == "text"
+        assert "cards.search_vector @@ websearch_to_tsquery(" in sql
+        assert "ts_rank_cd(cards.search_vector" in sql
+        assert "ILIKE" not in sql.upper()
+        assert "transit grants" in params.values()
+
+    def test_vector_mode_orders_by_distance(self):
+        stmt, mode = build_card_search(
+            [Card.id], query="transit", query_embedding=[0.1, 0.2, 0.3]
+        )
+        sql, params = compile_sql(stmt)
+        assert mode == "vector"
+        assert "cards.embedding IS NOT NULL" in sql
+        assert "(cards.embedding <=> %(embedding_1)s) <" in sql
+        assert sql.rstrip().endswith(
+            "ORDER BY (cards.embedding <=> %(embedding_1)s) ASC, cards.id"
+        )
+        assert 0.5 in params.values()  # 1 - default threshold
+
+
+# ============================================================================
+# POST /cards/search
+# ============================================================================
+
+class _Savepoint:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class SearchDB:
+    """count(*) -> `total`; the page query -> `rows`, or raises `fail_on`."""
+
+    def __init__(self, total, rows, fail_on=None):
+        self.total = total
+        self.rows = rows
+        self.fail_on = fail_on
+        self.statements = []
+
+    def begin_nested(self):
+        return _Savepoint()
+
+    async def execute(self, stmt):
+        sql, _ = compile_sql(stmt)
+        self.statements.append(sql)
+        if self.fail_on and self.fail_on in sql:
+            raise RuntimeError("operator does not exist: vector <=> vector")
+        if "count(*)" in sql:
+            return SimpleNamespace(scalar=lambda: self.total)
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+def make_row(name, relevance):
+    values = {k: None for k in cards_router._SEARCH_PROJECTION.keys}
+    values.update(id=uuid.uuid4(), name=name, slug=name.lower(), summary="transit")
+    return tuple(values[k] for k in cards_router._SEARCH_PROJECTION.keys) + (
+        relevance,
+    )
+
+
+@pytest.fixture
+def embeddings(monkeypatch):
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[0.1, 0.2, 0.3])])
+
+    monkeypatch.setattr(
+        cards_router,
+        "azure_openai_embedding_client",
+        SimpleNamespace(embeddings=SimpleNamespace(create=create)),
+    )
+    monkeypatch.setattr(cards_router, "get_embedding_deployment", lambda: "embed")
+    return calls
+
+
+def search(db, **body):
+    request = AdvancedSearchRequest(**body)
+    return asyncio.run(cards_router.search_cards(request=request, db=db))
+
+
+class TestSearchEndpoint:
+    def test_pages_and_counts_in_sql(self):
+        db = SearchDB(total=250, rows=[make_row("Transit", 0.42)])
+        response = search(
+            db,
+            query="transit",
+            use_vector_search=False,
+            filters={"pillar_ids": ["MC"]},
+            limit=20,
+            offset=200,
+        )
+
+        assert response.search_type == "text"
+        assert response.total_count == 250
+        assert response.results[0].search_relevance == pytest.approx(0.42)
+        count_sql, page_sql = db.statements
+        assert "count(*)" in count_sql and "cards.pillar_id IN" in count_sql
+        assert "LIMIT %(param_1)s::INTEGER OFFSET %(param_2)s::INTEGER" in page_sql
+        assert "cards.pillar_id IN" in page_sql
+
+    def test_filter_only(self):
+        db = SearchDB(total=1, rows=[make_row("Transit", None)])
+        response = search(db, filters={"horizon": "H1"})
+        assert response.search_type == "filter"
+        assert response.results[0].search_relevance is None
+        assert response.results[0].match_highlights is None
+
+    def test_vector_search(self, embeddings):
+        db = SearchDB(total=3, rows=[make_row("Transit", 0.91)])
+        response = search(db, query="transit")
+        assert response.search_type == "vector"
+        assert embeddings[0]["input"] == "transit"
+        assert "<=>" in db.statements[-1]
+
+    def test_vector_failure_falls_back_to_text(self, embeddings):
+        db = SearchDB(total=4, rows=[make_row("Transit", 0.3)], fail_on="<=>")
+        response = search(db, query="transit")
+        assert response.search_type == "text"
+        assert response.total_count == 4
+        assert "@@ websearch_to_tsquery" in db.statements[-1]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
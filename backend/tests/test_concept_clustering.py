@@ -0,0 +1,101 @@
+"""
+Unit Tests for Vectorized Concept Clustering
+
+greedy_similarity_clusters (used by DiscoveryService._cluster_similar_concepts)
+must produce exactly the clusters of the original nested loop over
+cosine_similarity / calculate_name_similarity, whatever the seed block size.
+
+Usage:
+    cd backend && pytest tests/test_concept_clustering.py -v
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.discovery_service as discovery_service  # noqa: E402
+from app.discovery_service import greedy_similarity_clusters  # noqa: E402
+from scripts.bench_concept_clustering import (  # noqa: E402
+    EMBEDDING_CLUSTER_THRESHOLD,
+    NAME_CLUSTER_THRESHOLD,
+    legacy_clusters,
+    make_dataset,
+    vectorized_clusters,
+)
+
+
+class TestMatchesLegacyLoop:
+    @pytest.mark.parametrize("n,seed", [(20, 1), (80, 2), (200, 3)])
+    def test_synthetic_candidates(self, n, seed):
+        names, embeddings = make_dataset(n, dim=32, seed=seed)
+        assert vectorized_clusters(names, embeddings) == legacy_clusters(
+            names, embeddings
+        )
+
+    @pytest.mark.parametrize("block_rows", [1, 7, 64])
+    def test_small_seed_blocks(self, monkeypatch, block_rows):
+        monkeypatch.setattr(discovery_service, "CLUSTER_BLOCK_ROWS", block_rows)
+        names, embeddings = make_dataset(150, dim=16, seed=4)
+        assert vectorized_clusters(names, embeddings) == legacy_clusters(
+            names, embeddings
+        )
+
+    def test_edge_cases(self):
+        names = [
+            "!!!",                 # normalizes to "" ...
+            "???",                 # ... and equals another empty name
+            "Microtransit",        # containment without a shared word
+            "microtransits",
+            "AB CD",               # same words, containment ratio wins
+            "ab cd ab cd ab cd",
+            "",                    # no name, no embedding -> singleton
+            "Solo",
+            "Odd Dim A",
+            "Odd Dim B",
+        ]
+        embeddings = [
+            None,
+            None,
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [0.0, 0.0, 0.0],       # zero vector never matches
+            [0.0, 0.0, 0.0],
+            None,
+            [1.0, 0.0, 0.0],       # matches "Microtransit"'s embedding
+            [1.0, 1.0],            # minority dimension still compared
+            [1.0, 0.9],
+        ]
+        assert vectorized_clusters(names, embeddings) == legacy_clusters(
+            names, embeddings
+        )
+
+
+class TestClusterDetails:
+    def test_reasons_and_scores(self):
+        clusters = greedy_similarity_clusters(
+            ["Smart Grid", "Smart Grid Pilot", "Water"],
+            [[1.0, 0.0], [0.0, 1.0], [0.99, 0.01]],
+            EMBEDDING_CLUSTER_THRESHOLD,
+            NAME_CLUSTER_THRESHOLD,
+        )
+        assert len(clusters) == 1
+        seed, by_name, by_embedding = clusters[0]
+        assert seed == (0, "seed", 1.0)
+        assert by_name[:2] == (1, "name")
+        assert by_name[2] == pytest.approx(10 / 16)
+        assert by_embedding[:2] == (2, "embedding")
+        assert by_embedding[2] > 0.99
+
+    def test_empty(self):
+        assert greedy_similarity_clusters([], [], 0.8, 0.6) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
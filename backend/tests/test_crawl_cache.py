@@ -0,0 +1,260 @@
+"""
+Unit Tests for the Shared Crawler Client and Crawl Cache
+
+Covers app.crawler (against httpx.MockTransport) and app.crawl_cache:
+- one GET per crawl; PDFs are detected from the response, not a HEAD
+- the pooled client is shared per event loop and recreated after close
+- a fresh cache entry skips the network entirely
+- a stale entry is revalidated with If-None-Match / If-Modified-Since and a
+  304 or an identical body reuses the cached extraction
+- failures are not cached; the directory is a size-bounded LRU
+
+Usage:
+    cd backend && pytest tests/test_crawl_cache.py -v
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.crawler as crawler  # noqa: E402
+from app.crawl_cache import CrawlCache, cache_key  # noqa: E402
+from app.crawler import CrawlResult, crawl_url  # noqa: E402
+
+URL = "https://news.example.gov/grants/transit"
+
+def page(topic):
+    """A unique article (trafilatura de-duplicates text it has already seen)."""
+    return (
+        f"<html><head><title>{topic} Grant</title></head><body><article>"
+        + "".join(
+            f"<p>The federal {topic} program awards competitive grants to cities "
+            f"for planning, construction and community outreach, round {i}.</p>"
+            for i in range(12)
+        )
+        + "</article></body></html>"
+    )
+
+
+def ok_result(url=URL, text="cached article text"):
+    return CrawlResult(
+        url=url,
+        title="Transit Grant",
+        markdown=text,
+        raw_html=None,
+        content_type="text/html",
+        status_code=200,
+        success=True,
+        error=None,
+        source_engine="trafilatura",
+    )
+
+
+class Server:
+    """MockTransport handler that records requests."""
+
+    def __init__(self, responder):
+        self.responder = responder
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        return self.responder(request)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = CrawlCache(directory=str(tmp_path / "crawl"), max_bytes=10_000_000)
+    monkeypatch.setattr(crawler, "crawl_cache", cache)
+    return cache
+
+
+def serve(monkeypatch, responder):
+    server = Server(responder)
+
+    def client():
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(server),
+            headers=crawler._DEFAULT_HEADERS,
+            follow_redirects=True,
+        )
+
+    monkeypatch.setattr(crawler, "get_http_client", client)
+    return server
+
+
+def count_calls(monkeypatch, name):
+    calls = []
+    original = getattr(crawler, name)
+
+    async def wrapper(*args, **kwargs):
+        calls.append(args)
+        return await original(*args, **kwargs)
+
+    monkeypatch.setattr(crawler, name, wrapper)
+    return calls
+
+
+# ============================================================================
+# Fetching
+# ============================================================================
+
+class TestFetch:
+    def test_single_get_per_crawl(self, cache, monkeypatch):
+        server = serve(
+            monkeypatch,
+            lambda r: httpx.Response(
+                200, text=page("transit"), headers={"content-type": "text/html"}
+            ),
+        )
+        result = asyncio.run(crawl_url(URL))
+        assert result.success
+        assert "federal transit program" in result.markdown
+        assert [r.method for r in server.requests] == ["GET"]
+
+    def test_pdf_sniffed_from_get_response(self, cache, monkeypatch):
+        server = serve(
+            monkeypatch,
+            lambda r: httpx.Response(
+                200, content=b"%PDF-1.7 ...", headers={"content-type": "application/pdf"}
+            ),
+        )
+        seen = []
+
+        async def fake_pdf(url, pdf_bytes, status_code, content_type):
+            seen.append(pdf_bytes)
+            return ok_result(url, "pdf text")
+
+        monkeypatch.setattr(crawler, "_extract_pdf", fake_pdf)
+        result = asyncio.run(crawl_url("https://example.gov/download?id=7"))
+        assert result.markdown == "pdf text"
+        assert seen == [b"%PDF-1.7 ..."]
+        assert [r.method for r in server.requests] == ["GET"]
+
+    def test_client_is_shared_per_loop(self):
+        async def scenario():
+            first = crawler.get_http_client()
+            assert crawler.get_http_client() is first
+            await crawler.close_http_client()
+            second = crawler.get_http_client()
+            assert second is not first and not second.is_closed
+            await crawler.close_http_client()
+            return first
+
+        first = asyncio.run(scenario())
+        assert first.is_closed
+
+
+# ============================================================================
+# Crawl cache
+# ============================================================================
+
+class TestCrawlCaching:
+    def test_fresh_entry_skips_network(self, cache, monkeypatch):
+        server = serve(
+            monkeypatch,
+            lambda r: httpx.Response(200, text=page("housing"), headers={"etag": '"v1"'}),
+        )
+        first = asyncio.run(crawl_url(URL))
+        second = asyncio.run(crawl_url(URL))
+        assert len(server.requests) == 1
+        assert second.markdown == first.markdown
+        assert second.extracted_at == first.extracted_at
+
+    def test_stale_entry_revalidates_with_304(self, cache, monkeypatch):
+        asyncio.run(
+            cache.put(URL, ok_result(), etag='"v1"', last_modified="Mon, 02 Feb 2026 10:00:00 GMT")
+        )
+        cache.ttl = 0
+        server = serve(monkeypatch, lambda r: httpx.Response(304))
+        extractions = count_calls(monkeypatch, "_extract_html")
+
+        result = asyncio.run(crawl_url(URL))
+
+        assert result.markdown == "cached article text"
+        assert extractions == []
+        request = server.requests[0]
+        assert request.headers["if-none-match"] == '"v1"'
+        assert request.headers["if-modified-since"] == "Mon, 02 Feb 2026 10:00:00 GMT"
+        # Revalidation refreshed the entry.
+        cache.ttl = 3600
+        assert asyncio.run(cache.get(URL)).is_fresh()
+
+    def test_identical_body_skips_extraction(self, cache, monkeypatch):
+        body = page("broadband")
+        serve(monkeypatch, lambda r: httpx.Response(200, text=body))
+        extractions = count_calls(monkeypatch, "_extract_html")
+        asyncio.run(crawl_url(URL))
+        cache.ttl = 0
+        asyncio.run(crawl_url(URL))
+        assert len(extractions) == 1
+
+    def test_changed_body_is_extracted_again(self, cache, monkeypatch):
+        bodies = iter([page("water"), page("wildfire")])
+        serve(monkeypatch, lambda r: httpx.Response(200, text=next(bodies)))
+        asyncio.run(crawl_url(URL))
+        cache.ttl = 0
+        result = asyncio.run(crawl_url(URL))
+        assert "wildfire" in result.markdown
+
+    def test_failures_are_not_cached(self, cache, monkeypatch):
+        monkeypatch.setattr(crawler, "_MAX_RETRY_ATTEMPTS", 1)
+        server = serve(monkeypatch, lambda r: httpx.Response(404))
+        assert not asyncio.run(crawl_url(URL)).success
+        assert not asyncio.run(crawl_url(URL)).success
+        assert len(server.requests) == 2
+        assert asyncio.run(cache.get(URL)) is None
+
+
+class TestCrawlCacheStore:
+    def test_round_trip(self, tmp_path):
+        cache = CrawlCache(directory=str(tmp_path))
+        asyncio.run(cache.put(URL, ok_result(), etag='"e"', content_hash="abc"))
+        entry = asyncio.run(cache.get(URL + "#section"))
+        assert entry.result.markdown == "cached article text"
+        assert entry.conditional_headers() == {"If-None-Match": '"e"'}
+        assert entry.content_hash == "abc"
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        probe = CrawlCache(directory=str(tmp_path / "probe"))
+        asyncio.run(probe.put("https://a.gov", ok_result("https://a.gov")))
+        entry_size = os.path.getsize(probe._path(cache_key("https://a.gov")))
+
+        cache = CrawlCache(directory=str(tmp_path / "lru"), max_bytes=entry_size * 2 + 10)
+        asyncio.run(cache.put("https://a.gov", ok_result("https://a.gov")))
+        time.sleep(0.01)
+        asyncio.run(cache.put("https://b.gov", ok_result("https://b.gov")))
+        time.sleep(0.01)
+        assert asyncio.run(cache.get("https://a.gov")) is not None  # a is now newest
+        time.sleep(0.01)
+        asyncio.run(cache.put("https://c.gov", ok_result("https://c.gov")))
+
+        assert asyncio.run(cache.get("https://b.gov")) is None
+        assert asyncio.run(cache.get("https://a.gov")) is not None
+        assert asyncio.run(cache.get("https://c.gov")) is not None
+
+    def test_index_rebuilt_from_disk(self, tmp_path):
+        asyncio.run(CrawlCache(directory=str(tmp_path)).put(URL, ok_result()))
+        reopened = CrawlCache(directory=str(tmp_path))
+        assert asyncio.run(reopened.get(URL)).result.markdown == "cached article text"
+        assert reopened._size == os.path.getsize(reopened._path(cache_key(URL)))
+
+    def test_disabled(self, tmp_path):
+        cache = CrawlCache(directory=str(tmp_path / "off"), max_bytes=0)
+        asyncio.run(cache.put(URL, ok_result()))
+        assert asyncio.run(cache.get(URL)) is None
+        assert not os.path.exists(tmp_path / "off")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
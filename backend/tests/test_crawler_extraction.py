@@ -0,0 +1,154 @@
+"""
+Unit Tests for the Crawler Extraction Pool
+
+Covers app.crawler._run_extraction in thread and process modes:
+- process-mode extraction returns the same result as the thread pool
+- raw body bytes are decoded with the response charset in the worker
+- the per-task time limit interrupts a runaway extractor
+- a broken process pool is discarded so the next task gets a fresh one
+- a wedged worker past the backstop timeout is killed and its pool replaced
+
+Usage:
+    cd backend && pytest tests/test_crawler_extraction.py -v
+"""
+
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.crawler as crawler  # noqa: E402
+
+
+def article(topic: str, charset: str = "utf-8") -> bytes:
+    html = (
+        f"<html><head><meta charset='{charset}'><title>{topic}</title></head>"
+        "<body><article>"
+        + "".join(
+            f"<p>The {topic} initiative funds café kiosks, libraries and "
+            f"neighbourhood centres across the city, phase {i}.</p>"
+            for i in range(10)
+        )
+        + "</article></body></html>"
+    )
+    return html.encode(charset)
+
+
+@pytest.fixture
+def process_mode(monkeypatch):
+    monkeypatch.setattr(crawler, "CRAWLER_EXTRACT_MODE", "process")
+    monkeypatch.setattr(crawler, "CRAWLER_EXTRACT_WORKERS", 1)
+    yield
+    crawler.shutdown_extraction_pool()
+
+
+class TestExtractionBackends:
+    def test_process_matches_thread(self, process_mode):
+        from trafilatura.meta import reset_caches
+
+        body = article("reading room")
+        in_process = asyncio.run(
+            crawler._run_extraction(crawler._trafilatura_extract_sync, body, "utf-8")
+        )
+        crawler.CRAWLER_EXTRACT_MODE = "thread"
+        reset_caches()  # trafilatura would de-duplicate the second pass
+        in_thread = asyncio.run(
+            crawler._run_extraction(crawler._trafilatura_extract_sync, body, "utf-8")
+        )
+        assert in_process == in_thread
+        assert "reading room initiative" in in_process[0]
+
+    def test_html_result_shape(self, process_mode):
+        result = asyncio.run(
+            crawler._extract_html(
+                "https://example.gov/a", article("makerspace"), "utf-8", 200, "text/html"
+            )
+        )
+        assert result.success
+        assert result.source_engine == "trafilatura"
+        assert result.title == "makerspace"
+        assert result.word_count > 50
+
+    def test_body_decoded_with_response_charset(self):
+        text, _, _ = crawler._trafilatura_extract_sync(
+            article("kiosk", "iso-8859-1"), "iso-8859-1"
+        )
+        assert "café" in text
+
+
+class TestLimits:
+    def test_time_limit_interrupts_task(self):
+        start = time.monotonic()
+        with pytest.raises(crawler.ExtractionTimeout):
+            crawler._call_with_time_limit(time.sleep, 0.2, 5)
+        assert time.monotonic() - start < 2
+
+    def test_no_limit_when_zero(self):
+        assert crawler._call_with_time_limit(sum, 0, [1, 2]) == 3
+
+    def test_broken_pool_is_replaced(self, process_mode, monkeypatch):
+        class DeadPool:
+            def submit(self, *args, **kwargs):
+                raise BrokenProcessPool("worker killed")
+
+            def shutdown(self, *args, **kwargs):
+                pass
+
+        dead = DeadPool()
+        monkeypatch.setattr(crawler, "_process_pool", dead)
+        with pytest.raises(BrokenProcessPool):
+            asyncio.run(crawler._run_extraction(sum, [1]))
+        assert crawler._process_pool is None
+
+    def test_wedged_worker_is_killed_and_pool_replaced(self, process_mode, monkeypatch):
+        class Worker:
+            killed = False
+
+            def kill(self):
+                self.killed = True
+
+        class WedgedPool:
+            def __init__(self):
+                self._processes = {1: Worker()}
+                self.shut_down = False
+
+            def submit(self, *args, **kwargs):
+                return Future()  # never completes
+
+            def shutdown(self, *args, **kwargs):
+                self.shut_down = True
+
+        wedged = WedgedPool()
+        monkeypatch.setattr(crawler, "_process_pool", wedged)
+        monkeypatch.setattr(crawler, "CRAWLER_EXTRACT_TIMEOUT", 0.05)
+        monkeypatch.setattr(crawler, "_EXTRACT_TIMEOUT_GRACE", 0.05)
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(crawler._run_extraction(sum, [1]))
+        assert wedged._processes[1].killed
+        assert wedged.shut_down
+        assert crawler._process_pool is None
+
+    def test_extraction_error_becomes_failed_result(self, monkeypatch):
+        async def explode(fn, *args):
+            raise crawler.ExtractionTimeout("extraction exceeded 60s")
+
+        monkeypatch.setattr(crawler, "_run_extraction", explode)
+        result = asyncio.run(
+            crawler._extract_html("https://example.gov/b", b"<html/>", None, 200, "text/html")
+        )
+        assert not result.success
+        assert "exceeded 60s" in result.error
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
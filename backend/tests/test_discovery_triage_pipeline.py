@@ -0,0 +1,257 @@
+"""
+Unit Tests for the Concurrent Discovery Triage Pipeline
+
+Covers DiscoveryService._run_triage_pipeline (fake AI service, fake session;
+no network or database):
+- outcomes come back in input order whatever order sources finish in
+- at most DISCOVERY_TRIAGE_CONCURRENCY sources are in flight; a malformed
+  value falls back to the default
+- discovered_sources statuses are written as one bulk UPDATE per stage
+  (triage, analysis, error) after every source has finished
+- per-stage call counts / latency in ProcessingTimeMetrics
+
+Usage:
+    cd backend && pytest tests/test_discovery_triage_pipeline.py -v
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.discovery_service as discovery_service  # noqa: E402
+from app.ai_service import TriageResult  # noqa: E402
+from app.discovery_service import (  # noqa: E402
+    DiscoveryService,
+    ProcessingTimeMetrics,
+    get_discovery_defaults,
+)
+from app.models.db.source import DiscoveredSource  # noqa: E402
+from app.research_service import RawSource  # noqa: E402
+
+
+# ============================================================================
+# FAKES
+# ============================================================================
+
+class FakeAI:
+    """Triage / analysis with per-title delays; tracks peak concurrency."""
+
+    def __init__(self, delays=None, fail_analysis=(), fail_embedding=()):
+        self.delays = delays or {}
+        self.fail_analysis = set(fail_analysis)
+        self.fail_embedding = set(fail_embedding)
+        self.in_flight = 0
+        self.peak = 0
+        self.embedding_batches = []
+
+    async def _work(self, title):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(title, 0.001))
+        finally:
+            self.in_flight -= 1
+
+    async def triage_source(self, title, content):
+        await self._work(title)
+        return TriageResult(
+            is_relevant="irrelevant" not in title,
+            confidence=0.9,
+            primary_pillar="MC",
+            reason="test",
+        )
+
+    async def analyze_source(self, title, content, source_name, published_at):
+        await self._work(title)
+        if title in self.fail_analysis:
+            raise RuntimeError("analysis exploded")
+        return SimpleNamespace(summary=f"{title} summary")
+
+    async def generate_embeddings_batch(self, texts):
+        self.embedding_batches.append(list(texts))
+        return [
+            None if any(t.startswith(bad) for bad in self.fail_embedding) else [1.0]
+            for t in texts
+        ]
+
+
+class FakeDB:
+    """Records executed statements with their bulk parameter lists."""
+
+    def __init__(self):
+        self.executed = []
+
+    async def execute(self, stmt, params=None):
+        self.executed.append((stmt, params))
+        return SimpleNamespace()
+
+    async def flush(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def quiet_reputation(monkeypatch):
+    rep = discovery_service.domain_reputation_service
+
+    async def no_reputation(db, url):
+        return None
+
+    async def record(db, domain, passed):
+        pass
+
+    monkeypatch.setattr(rep, "get_reputation", no_reputation)
+    monkeypatch.setattr(rep, "get_confidence_adjustment", lambda r: 0.0)
+    monkeypatch.setattr(rep, "record_triage_result", record)
+    monkeypatch.setattr(
+        DiscoveryService,
+        "_analysis_values",
+        staticmethod(lambda analysis: {"processing_status": "analyzed"}),
+    )
+
+
+def make_service(ai):
+    service = DiscoveryService.__new__(DiscoveryService)
+    service.db = FakeDB()
+    service.ai_service = ai
+    return service
+
+
+def make_sources(titles):
+    return [
+        RawSource(
+            url=f"https://news.example/{i}",
+            title=title,
+            content=f"{title} content",
+            source_name="news",
+            discovered_source_id=str(uuid.uuid4()),
+        )
+        for i, title in enumerate(titles)
+    ]
+
+
+def run_pipeline(service, sources, concurrency=None, metrics=None):
+    return asyncio.run(
+        service._run_triage_pipeline(sources, concurrency, metrics)
+    )
+
+
+# ============================================================================
+# Ordering and concurrency
+# ============================================================================
+
+class TestPipelineOrdering:
+    def test_outcomes_in_input_order(self):
+        titles = ["a", "b", "c", "d"]
+        # Later sources finish first
+        ai = FakeAI(delays={"a": 0.04, "b": 0.03, "c": 0.02, "d": 0.01})
+        sources = make_sources(titles)
+        outcomes = run_pipeline(make_service(ai), sources, concurrency=4)
+        assert [o.source for o in outcomes] == sources
+        assert [o.analysis.summary for o in outcomes] == [
+            f"{t} summary" for t in titles
+        ]
+        assert ai.embedding_batches == [[f"{t} {t} summary" for t in titles]]
+
+
+class TestPipelineConcurrency:
+    def test_env_bound_respected(self, monkeypatch):
+        monkeypatch.setenv("DISCOVERY_TRIAGE_CONCURRENCY", "3")
+        ai = FakeAI(delays={t: 0.01 for t in "abcdefgh"})
+        metrics = ProcessingTimeMetrics()
+        run_pipeline(make_service(ai), make_sources(list("abcdefgh")), metrics=metrics)
+        assert ai.peak == 3
+        assert metrics.triage_concurrency == 3
+
+    def test_serial_when_concurrency_one(self):
+        ai = FakeAI()
+        run_pipeline(make_service(ai), make_sources(list("abcd")), concurrency=1)
+        assert ai.peak == 1
+
+    def test_malformed_env_falls_back_to_default(self, monkeypatch):
+        monkeypatch.setenv("DISCOVERY_TRIAGE_CONCURRENCY", "eight")
+        assert get_discovery_defaults()["triage_concurrency"] == 8
+        monkeypatch.setenv("DISCOVERY_TRIAGE_CONCURRENCY", "0")
+        assert get_discovery_defaults()["triage_concurrency"] == 1
+
+
+# ============================================================================
+# Status flush
+# ============================================================================
+
+class TestStatusFlush:
+    def test_one_bulk_update_per_stage(self):
+        ai = FakeAI(fail_analysis={"broken"}, fail_embedding={"no-vector"})
+        service = make_service(ai)
+        sources = make_sources(["good", "irrelevant", "broken", "no-vector"])
+        outcomes = run_pipeline(service, sources, concurrency=2)
+        ids = [uuid.UUID(s.discovered_source_id) for s in sources]
+
+        assert len(service.db.executed) == 3
+        for stmt, _ in service.db.executed:
+            assert stmt.is_dml and stmt.table.name == DiscoveredSource.__tablename__
+
+        (_, triage), (_, analysis), (_, errors) = service.db.executed
+        assert [row["id"] for row in triage] == ids
+        assert [row["processing_status"] for row in triage] == [
+            "triaged", "filtered_triage", "triaged", "triaged",
+        ]
+        assert [row["id"] for row in analysis] == [ids[0], ids[3]]
+        assert [row["id"] for row in errors] == [ids[2], ids[3]]
+        assert errors[0]["error_message"] == "analysis exploded"
+        assert all(row["processing_status"] == "error" for row in errors)
+
+        assert outcomes[0].embedding == [1.0] and not outcomes[0].error
+        assert outcomes[3].embedding is None and outcomes[3].error
+
+    def test_sources_without_ids_not_written(self):
+        service = make_service(FakeAI())
+        sources = make_sources(["a"])
+        sources[0].discovered_source_id = None
+        run_pipeline(service, sources)
+        assert service.db.executed == []
+
+
+# ============================================================================
+# Metrics
+# ============================================================================
+
+class TestStageMetrics:
+    def test_stage_counts_and_latency(self):
+        ai = FakeAI(delays={"a": 0.01, "b": 0.01, "irrelevant": 0.01})
+        sources = make_sources(["a", "b", "irrelevant"])
+        sources.append(
+            RawSource(url="https://x.example", title="url only", content="",
+                      source_name="x")
+        )
+        metrics = ProcessingTimeMetrics()
+        run_pipeline(make_service(ai), sources, concurrency=4, metrics=metrics)
+
+        # The content-less source is auto-passed without a triage call
+        assert metrics.triage_calls == 3
+        assert metrics.analysis_calls == 3
+        assert metrics.embedding_calls == 3
+        assert metrics.triage_call_seconds >= 0.03
+        assert metrics.analysis_call_seconds > 0
+        assert len(ai.embedding_batches) == 1
+
+    def test_throughput_uses_wall_clock(self):
+        metrics = ProcessingTimeMetrics(triage_seconds=2.0)
+        metrics.record_stage("triage", 1.0)
+        metrics.record_stage("embedding", 0.5, count=4)
+        assert metrics.stage_throughput() == {
+            "triage": 0.5, "analysis": 0.0, "embedding": 2.0,
+        }
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
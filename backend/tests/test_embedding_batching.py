@@ -0,0 +1,280 @@
+"""
+Unit Tests for Batched Embedding Generation
+
+Tests the embedding batching helpers in app.ai_service:
+- plan_embedding_batches: request packing under input/token budgets
+- EmbeddingCoalescer: micro-batching of concurrent single-text callers
+- AIService.generate_embeddings_batch: input ordering and per-item isolation
+- callers: RSS item processing embeds relevant items in one batch; the
+  recovery backfill uses the embedding client
+
+Usage:
+    cd backend && pytest tests/test_embedding_batching.py -v
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# openai_provider fails fast without Azure config; dummy values are enough
+# because no test below talks to the network.
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.recovery_service as recovery_service  # noqa: E402
+import app.rss_service as rss_service  # noqa: E402
+from app.ai_service import (  # noqa: E402
+    AIService,
+    EmbeddingCoalescer,
+    TriageResult,
+    plan_embedding_batches,
+)
+from app.rss_service import RSSService  # noqa: E402
+
+
+# ============================================================================
+# FAKES
+# ============================================================================
+
+class FakeEmbeddings:
+    """Stands in for client.embeddings; records every request."""
+
+    def __init__(self, fail_on: str = None):
+        self.requests: List[List[str]] = []
+        self.fail_on = fail_on
+
+    def create(self, model, input, timeout=None):
+        inputs = [input] if isinstance(input, str) else list(input)
+        self.requests.append(inputs)
+        if self.fail_on is not None and self.fail_on in inputs:
+            raise ValueError(f"bad input: {self.fail_on}")
+        # Return data out of order to prove callers sort by index
+        data = [
+            SimpleNamespace(index=i, embedding=[float(len(text)), float(i)])
+            for i, text in enumerate(inputs)
+        ]
+        return SimpleNamespace(data=list(reversed(data)))
+
+
+def make_service(fail_on: str = None) -> AIService:
+    embeddings = FakeEmbeddings(fail_on=fail_on)
+    client = SimpleNamespace(embeddings=embeddings)
+    return AIService(client, coalesce_window_ms=0)
+
+
+# ============================================================================
+# plan_embedding_batches
+# ============================================================================
+
+class TestPlanEmbeddingBatches:
+    def test_respects_max_inputs(self):
+        batches = plan_embedding_batches(["a"] * 5, max_inputs=2, token_budget=10_000)
+        assert batches == [[0, 1], [2, 3], [4]]
+
+    def test_respects_token_budget(self):
+        texts = ["x" * 40, "x" * 40, "x" * 40]  # ~11 tokens each
+        batches = plan_embedding_batches(texts, max_inputs=100, token_budget=25)
+        assert batches == [[0, 1], [2]]
+
+    def test_oversized_text_gets_own_batch(self):
+        texts = ["short", "x" * 4000, "short"]
+        batches = plan_embedding_batches(texts, max_inputs=100, token_budget=50)
+        assert batches == [[0], [1], [2]]
+
+    def test_empty_input(self):
+        assert plan_embedding_batches([]) == []
+
+
+# ============================================================================
+# AIService.generate_embeddings_batch
+# ============================================================================
+
+class TestGenerateEmbeddingsBatch:
+    def test_single_request_in_input_order(self):
+        service = make_service()
+        texts = ["a", "bb", "ccc"]
+        vectors = asyncio.run(service.generate_embeddings_batch(texts))
+        assert [v[0] for v in vectors] == [1.0, 2.0, 3.0]
+        assert len(service.client.embeddings.requests) == 1
+
+    def test_empty_text_is_none_and_not_sent(self):
+        service = make_service()
+        vectors = asyncio.run(service.generate_embeddings_batch(["a", "", "ccc"]))
+        assert vectors[1] is None
+        assert vectors[0] is not None and vectors[2] is not None
+        assert service.client.embeddings.requests == [["a", "ccc"]]
+
+    def test_bad_item_is_isolated(self):
+        service = make_service(fail_on="bad")
+        vectors = asyncio.run(service.generate_embeddings_batch(["a", "bad", "ccc"]))
+        assert vectors[0] == [1.0, 0.0]
+        assert vectors[1] is None
+        assert vectors[2] == [3.0, 0.0]
+
+
+# ============================================================================
+# EmbeddingCoalescer
+# ============================================================================
+
+class TestEmbeddingCoalescer:
+    def test_concurrent_callers_share_one_batch(self):
+        calls: List[List[str]] = []
+
+        async def embed_batch(texts):
+            calls.append(list(texts))
+            return [[float(len(t))] for t in texts]
+
+        async def run():
+            coalescer = EmbeddingCoalescer(embed_batch, window_ms=5)
+            return await asyncio.gather(*(coalescer.embed(t) for t in ["a", "bb", "ccc"]))
+
+        results = asyncio.run(run())
+        assert results == [[1.0], [2.0], [3.0]]
+        assert calls == [["a", "bb", "ccc"]]
+
+    def test_full_batch_dispatches_immediately(self):
+        calls: List[List[str]] = []
+
+        async def embed_batch(texts):
+            calls.append(list(texts))
+            return [[0.0] for _ in texts]
+
+        async def run():
+            coalescer = EmbeddingCoalescer(embed_batch, window_ms=10_000, max_batch=2)
+            return await asyncio.wait_for(
+                asyncio.gather(coalescer.embed("a"), coalescer.embed("b")), timeout=1
+            )
+
+        asyncio.run(run())
+        assert calls == [["a", "b"]]
+
+    def test_item_failure_only_raises_for_that_caller(self):
+        async def embed_batch(texts):
+            return [ValueError("boom") if t == "bad" else [1.0] for t in texts]
+
+        async def run():
+            coalescer = EmbeddingCoalescer(embed_batch, window_ms=1)
+            return await asyncio.gather(
+                coalescer.embed("ok"), coalescer.embed("bad"), return_exceptions=True
+            )
+
+        ok, bad = asyncio.run(run())
+        assert ok == [1.0]
+        assert isinstance(bad, ValueError)
+
+
+# ============================================================================
+# Callers
+# ============================================================================
+
+class FakeRssAI:
+    """Triage passes unless the title says otherwise; records batch calls."""
+
+    def __init__(self, fail_on: str = None):
+        self.batches: List[List[str]] = []
+        self.fail_on = fail_on
+
+    async def triage_source(self, title, content):
+        return TriageResult(
+            is_relevant="irrelevant" not in title,
+            confidence=0.9,
+            primary_pillar=None,
+            reason="test",
+        )
+
+    async def generate_embeddings_batch(self, texts):
+        self.batches.append(list(texts))
+        return [
+            None if self.fail_on and self.fail_on in t else [1.0, 0.0] for t in texts
+        ]
+
+
+def run_rss_items(monkeypatch, titles, ai):
+    items = [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            feed_id=uuid.uuid4(),
+            title=title,
+            url="",
+            content=f"{title} body",
+        )
+        for title in titles
+    ]
+
+    class Result:
+        def scalars(self):
+            return SimpleNamespace(all=lambda: items)
+
+    class DB:
+        async def execute(self, stmt):
+            return Result()
+
+    async def no_existing(db, urls):
+        return {}
+
+    monkeypatch.setattr(rss_service, "find_existing_source_urls", no_existing)
+    service = RSSService(DB(), ai)
+    marked = {}
+
+    async def mark(item_id, triage_result, card_id=None, source_id=None):
+        marked[item_id] = triage_result
+
+    async def no_match(embedding):
+        return None
+
+    monkeypatch.setattr(service, "_mark_processed", mark)
+    monkeypatch.setattr(service, "_find_matching_card", no_match)
+    stats = asyncio.run(service.process_new_items())
+    return items, marked, stats
+
+
+class TestEmbeddingCallers:
+    def test_rss_relevant_items_share_one_batch(self, monkeypatch):
+        ai = FakeRssAI()
+        items, marked, stats = run_rss_items(
+            monkeypatch, ["Transit grant", "irrelevant item", "Water grant"], ai
+        )
+        assert ai.batches == [
+            ["Transit grant\n\nTransit grant body", "Water grant\n\nWater grant body"]
+        ]
+        assert [marked[i.id] for i in items] == ["pending", "irrelevant", "pending"]
+        assert stats["items_processed"] == 3
+
+    def test_rss_failed_embedding_marks_only_that_item_pending(self, monkeypatch):
+        ai = FakeRssAI(fail_on="Water")
+        items, marked, stats = run_rss_items(
+            monkeypatch, ["Transit grant", "Water grant"], ai
+        )
+        assert len(ai.batches) == 1
+        assert [marked[i.id] for i in items] == ["pending", "pending"]
+        assert stats["items_pending"] == 2
+
+    def test_recovery_backfill_uses_embedding_client(self, monkeypatch):
+        embeddings = FakeEmbeddings()
+        monkeypatch.setattr(
+            recovery_service,
+            "azure_openai_async_embedding_client",
+            SimpleNamespace(embeddings=embeddings),
+        )
+        processed = [
+            SimpleNamespace(
+                raw=SimpleNamespace(title="Title", url="u"),
+                analysis=SimpleNamespace(summary="summary"),
+                embedding=None,
+            )
+        ]
+        asyncio.run(recovery_service._fill_missing_embeddings(processed))
+        assert embeddings.requests == [["Title summary"]]
+        assert processed[0].embedding == [13.0, 0.0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
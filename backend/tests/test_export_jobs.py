@@ -0,0 +1,364 @@
+"""
+Unit Tests for Background Export Jobs
+
+Covers app.export_jobs (fake session, fake renderers; no database):
+- content_hash: stable across key order, changes with format, options,
+  row versions and the artifact version
+- enqueue_export: existing artifact completes at once, in-flight duplicate
+  is reused, otherwise a queued job is added and the worker notified
+- execute_export_job: renders and stores only when the artifact is missing
+- artifact helpers: temp files are removed, download headers, SQL shape,
+  enqueue hits bump last_accessed_at so pruning keeps them
+- worker registration of the ``export`` queue; a failed render marks the
+  job failed (keeping HTTPException detail) without stalling the consumer
+
+Usage:
+    cd backend && pytest tests/test_export_jobs.py -v
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.export_jobs as export_jobs  # noqa: E402
+from app.export_jobs import (  # noqa: E402
+    EXPORT_KINDS,
+    ExportArtifact,
+    ExportKind,
+    artifact_from_file,
+    artifact_response,
+    content_hash,
+    enqueue_export,
+    execute_export_job,
+    store_artifact,
+)
+from app.job_notify import NOTIFY_QUEUES  # noqa: E402
+from app.models.db.export import ExportJob  # noqa: E402
+
+USER_ID = str(uuid.uuid4())
+CARD_ID = str(uuid.uuid4())
+VERSIONS = {"card": "2026-02-01T00:00:00+00:00", "research": []}
+
+
+def sql(stmt):
+    return str(stmt.compile(dialect=asyncpg.dialect()))
+
+
+class Result:
+    def __init__(self, value=None):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class FakeSession:
+    """Records added objects and executed statements."""
+
+    def __init__(self, results=(), jobs=None):
+        self.results = list(results)
+        self.jobs = jobs or {}
+        self.added = []
+        self.statements = []
+        self.commits = 0
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def flush(self):
+        pass
+
+    async def get(self, model, key):
+        return self.jobs.get(key)
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return self.results.pop(0) if self.results else Result()
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class Renderer:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, db, fmt, params):
+        self.calls.append((fmt, params))
+        return ExportArtifact("card.pdf", "application/pdf", b"%PDF-1.4")
+
+
+@pytest.fixture
+def fake_kind(monkeypatch):
+    """Replace the card kind with fixed versions and a counting renderer."""
+    renderer = Renderer()
+
+    async def versions(db, params):
+        return VERSIONS
+
+    monkeypatch.setitem(
+        EXPORT_KINDS, "card", ExportKind(("pdf", "pptx", "csv"), versions, renderer)
+    )
+    return renderer
+
+
+@pytest.fixture
+def notified(monkeypatch):
+    queues = []
+
+    async def fake_notify(db, queue):
+        queues.append(queue)
+
+    monkeypatch.setattr(export_jobs, "notify_job", fake_notify)
+    return queues
+
+
+def set_artifact_exists(monkeypatch, exists):
+    async def fake_exists(db, digest):
+        return exists
+
+    monkeypatch.setattr(export_jobs, "touch_artifact", fake_exists)
+
+
+# ============================================================================
+# Content hash
+# ============================================================================
+
+class TestContentHash:
+    def test_stable_across_key_order(self):
+        a = content_hash("card", "pdf", {"card_id": CARD_ID, "include_charts": True}, VERSIONS)
+        b = content_hash("card", "pdf", {"include_charts": True, "card_id": CARD_ID}, VERSIONS)
+        assert a == b
+        assert len(a) == 64
+
+    def test_inputs_change_hash(self):
+        params = {"card_id": CARD_ID, "include_charts": True}
+        base = content_hash("card", "pdf", params, VERSIONS)
+        assert base != content_hash("card", "pptx", params, VERSIONS)
+        assert base != content_hash(
+            "card", "pdf", {**params, "include_charts": False}, VERSIONS
+        )
+        assert base != content_hash(
+            "card", "pdf", params, {**VERSIONS, "card": "2026-02-02T00:00:00+00:00"}
+        )
+
+    def test_artifact_version_changes_hash(self, monkeypatch):
+        params = {"card_id": CARD_ID}
+        base = content_hash("card", "pdf", params, VERSIONS)
+        monkeypatch.setattr(export_jobs, "EXPORT_ARTIFACT_VERSION", "2")
+        assert base != content_hash("card", "pdf", params, VERSIONS)
+
+
+# ============================================================================
+# Enqueue
+# ============================================================================
+
+class TestEnqueueExport:
+    def test_existing_artifact_completes_immediately(self, monkeypatch, fake_kind, notified):
+        set_artifact_exists(monkeypatch, True)
+        db = FakeSession()
+        job = asyncio.run(enqueue_export(db, USER_ID, "card", "pdf", {"card_id": CARD_ID}))
+        assert job.status == "completed"
+        assert job.started_at is None
+        assert job.completed_at is not None
+        assert db.added == [job]
+        assert notified == []
+
+    def test_in_flight_duplicate_reused(self, monkeypatch, fake_kind, notified):
+        set_artifact_exists(monkeypatch, False)
+        pending = ExportJob(id=uuid.uuid4(), status="running")
+        db = FakeSession(results=[Result(pending)])
+        job = asyncio.run(enqueue_export(db, USER_ID, "card", "pdf", {"card_id": CARD_ID}))
+        assert job is pending
+        assert db.added == []
+        assert notified == []
+        lookup = sql(db.statements[0])
+        assert "export_jobs.content_hash" in lookup
+        assert "export_jobs.status IN" in lookup
+
+    def test_new_job_queued_and_notified(self, monkeypatch, fake_kind, notified):
+        set_artifact_exists(monkeypatch, False)
+        db = FakeSession()
+        params = {"card_id": CARD_ID, "include_charts": False}
+        job = asyncio.run(enqueue_export(db, USER_ID, "card", "csv", params))
+        assert job.status == "queued"
+        assert job.content_hash == content_hash("card", "csv", params, VERSIONS)
+        assert job.user_id == uuid.UUID(USER_ID)
+        assert db.added == [job]
+        assert notified == ["export"]
+        assert fake_kind.calls == []
+
+
+# ============================================================================
+# Execute
+# ============================================================================
+
+class TestExecuteExportJob:
+    def run_job(self, monkeypatch, exists):
+        job = ExportJob(
+            id=uuid.uuid4(),
+            kind="card",
+            format="pdf",
+            params={"card_id": CARD_ID},
+            content_hash="abc",
+            status="running",
+        )
+        db = FakeSession(jobs={job.id: job})
+        stored = []
+
+        async def fake_store(session, digest, artifact):
+            stored.append((digest, artifact))
+
+        set_artifact_exists(monkeypatch, exists)
+        monkeypatch.setattr(export_jobs, "store_artifact", fake_store)
+        monkeypatch.setattr(export_jobs.database, "async_session_factory", lambda: db)
+        asyncio.run(execute_export_job(str(job.id)))
+        return db, stored
+
+    def test_renders_and_stores_missing_artifact(self, monkeypatch, fake_kind):
+        db, stored = self.run_job(monkeypatch, exists=False)
+        assert fake_kind.calls == [("pdf", {"card_id": CARD_ID})]
+        assert [digest for digest, _ in stored] == ["abc"]
+        assert db.commits == 1
+        assert db.statements[-1].compile().params["status"] == "completed"
+
+    def test_existing_artifact_skips_render(self, monkeypatch, fake_kind):
+        db, stored = self.run_job(monkeypatch, exists=True)
+        assert fake_kind.calls == []
+        assert stored == []
+        assert db.statements[-1].compile().params["status"] == "completed"
+
+
+# ============================================================================
+# Artifacts
+# ============================================================================
+
+class TestArtifacts:
+    def test_artifact_from_file_removes_temp_file(self, tmp_path):
+        path = tmp_path / "export.pdf"
+        path.write_bytes(b"%PDF")
+        artifact = artifact_from_file(str(path), "Card.pdf", "application/pdf")
+        assert artifact.data == b"%PDF"
+        assert not path.exists()
+
+    def test_response_headers(self):
+        response = artifact_response(
+            ExportArtifact("Transit_Brief.pdf", "application/pdf", b"%PDF")
+        )
+        assert response.body == b"%PDF"
+        assert response.media_type == "application/pdf"
+        assert (
+            response.headers["content-disposition"]
+            == 'attachment; filename="Transit_Brief.pdf"'
+        )
+
+    def test_response_non_ascii_filename(self):
+        response = artifact_response(
+            ExportArtifact("Movilidad Año.docx", "application/octet-stream", b"x")
+        )
+        disposition = response.headers["content-disposition"]
+        assert disposition.startswith("attachment; filename*=utf-8''")
+        assert "Movilidad%20A%C3%B1o.docx" in disposition
+
+    def test_touch_bumps_last_accessed(self):
+        db = FakeSession(results=[Result("abc")])
+        assert asyncio.run(export_jobs.touch_artifact(db, "abc")) is True
+        statement = sql(db.statements[0])
+        assert statement.startswith("UPDATE export_artifacts SET last_accessed_at=now()")
+        assert "RETURNING export_artifacts.content_hash" in statement
+
+    def test_touch_missing_artifact(self):
+        assert asyncio.run(export_jobs.touch_artifact(FakeSession(), "abc")) is False
+
+    def test_store_is_insert_do_nothing(self):
+        db = FakeSession()
+        asyncio.run(
+            store_artifact(db, "abc", ExportArtifact("a.pdf", "application/pdf", b"12"))
+        )
+        compiled = db.statements[0].compile(dialect=asyncpg.dialect())
+        assert "ON CONFLICT (content_hash) DO NOTHING" in str(compiled)
+        assert compiled.params["size_bytes"] == 2
+
+
+# ============================================================================
+# Worker
+# ============================================================================
+
+class TestWorkerQueue:
+    def test_export_queue_registered(self):
+        from app.worker import GrantScopeWorker
+
+        assert "export" in GrantScopeWorker.QUEUE_TYPES
+        assert "export" in NOTIFY_QUEUES
+
+    def test_kinds_cover_router_formats(self):
+        assert set(EXPORT_KINDS) == {
+            "card", "workstream", "brief", "portfolio", "application", "budget", "proposal",
+        }
+        assert EXPORT_KINDS["proposal"].formats == ("docx",)
+
+
+class TestWorkerFailures:
+    def run_failing_job(self, monkeypatch, error):
+        import app.worker as worker_module
+        from app.worker import GrantScopeWorker
+
+        job = ExportJob(id=uuid.uuid4(), kind="card", format="pdf", status="queued")
+        session = FakeSession([Result(job), Result(job.id)])
+        failures = []
+
+        async def render(job_id):
+            raise error
+
+        async def fail(self, job_id, message):
+            failures.append((job_id, message))
+
+        monkeypatch.setattr(worker_module, "async_session_factory", lambda: session)
+        monkeypatch.setattr(worker_module, "execute_export_job", render)
+        monkeypatch.setattr(GrantScopeWorker, "_fail_export_job", fail)
+        worker = GrantScopeWorker()
+        processed = asyncio.run(worker._process_one_export_job())
+        return processed, failures, str(job.id)
+
+    def test_failed_render_marks_job_and_keeps_consuming(self, monkeypatch):
+        processed, failures, job_id = self.run_failing_job(
+            monkeypatch, RuntimeError("renderer crashed")
+        )
+        assert processed is True
+        assert failures == [(job_id, "renderer crashed")]
+
+    def test_http_exception_detail_is_stored(self, monkeypatch):
+        from fastapi import HTTPException
+
+        processed, failures, _ = self.run_failing_job(
+            monkeypatch, HTTPException(status_code=404, detail="Card not found")
+        )
+        assert processed is True
+        assert failures[0][1] == "Card not found"
+
+    def test_cancellation_propagates(self, monkeypatch):
+        with pytest.raises(asyncio.CancelledError):
+            self.run_failing_job(monkeypatch, asyncio.CancelledError())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
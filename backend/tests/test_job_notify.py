@@ -0,0 +1,285 @@
+"""
+Unit Tests for LISTEN/NOTIFY Job Wakeups
+
+Covers app.job_notify and its use by GrantScopeWorker (no database):
+- notify_job issues pg_notify in a savepoint and never raises
+- notifications set the wake event for their queue
+- the listener re-LISTENs after its connection drops
+- an idle consumer picks up a notified job immediately instead of waiting
+  out its poll interval
+
+Usage:
+    cd backend && pytest tests/test_job_notify.py -v
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+from app.job_notify import (  # noqa: E402
+    JOB_CHANNEL,
+    JobNotificationListener,
+    notify_job,
+)
+from app.worker import GrantScopeWorker  # noqa: E402
+
+
+# ============================================================================
+# Fakes
+# ============================================================================
+
+class FakeSavepoint:
+    def __init__(self, session):
+        self.session = session
+
+    async def __aenter__(self):
+        self.session.savepoints += 1
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.savepoints = 0
+        self.calls = []
+
+    def begin_nested(self):
+        return FakeSavepoint(self)
+
+    async def execute(self, sql, params):
+        if self.fail:
+            raise RuntimeError("boom")
+        self.calls.append((str(sql), params))
+
+
+class FakeDriver:
+    """Stands in for the asyncpg connection behind a pooled SQLAlchemy one."""
+
+    def __init__(self):
+        self.listeners = {}
+        self.on_terminate = None
+        self.closed = False
+
+    def add_termination_listener(self, callback):
+        self.on_terminate = callback
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    async def remove_listener(self, channel, callback):
+        self.listeners.pop(channel, None)
+
+    def is_closed(self):
+        return self.closed
+
+    def notify(self, payload):
+        self.listeners[JOB_CHANNEL](self, 1, JOB_CHANNEL, payload)
+
+    def terminate(self):
+        self.closed = True
+        self.on_terminate(self)
+
+
+class FakeConnection:
+    def __init__(self, driver):
+        self.driver = driver
+        self.invalidated = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get_raw_connection(self):
+        return type("Raw", (), {"driver_connection": self.driver})()
+
+    async def invalidate(self):
+        self.invalidated = True
+
+
+class FakeEngine:
+    def __init__(self):
+        self.connections = []
+
+    def connect(self):
+        conn = FakeConnection(FakeDriver())
+        self.connections.append(conn)
+        return conn
+
+
+async def wait_until(predicate, timeout=1.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "condition not reached"
+        await asyncio.sleep(0.005)
+
+
+# ============================================================================
+# notify_job
+# ============================================================================
+
+class TestNotifyJob:
+    def test_pg_notify_in_savepoint(self):
+        db = FakeSession()
+        asyncio.run(notify_job(db, "brief"))
+        assert db.savepoints == 1
+        sql, params = db.calls[0]
+        assert "pg_notify(:channel, :queue)" in sql
+        assert params == {"channel": JOB_CHANNEL, "queue": "brief"}
+
+    def test_failure_is_swallowed(self):
+        asyncio.run(notify_job(FakeSession(fail=True), "research"))
+
+
+# ============================================================================
+# JobNotificationListener
+# ============================================================================
+
+class TestListener:
+    def test_payload_sets_matching_event(self):
+        listener = JobNotificationListener(None)
+        listener._on_notify(None, 1, JOB_CHANNEL, "brief")
+        assert listener.wake_events["brief"].is_set()
+        assert not listener.wake_events["research"].is_set()
+        assert listener.notifications == 1
+
+    def test_unknown_payload_wakes_all(self):
+        listener = JobNotificationListener(None)
+        listener._on_notify(None, 1, JOB_CHANNEL, "")
+        assert all(e.is_set() for e in listener.wake_events.values())
+
+    def test_reconnects_after_connection_loss(self):
+        async def run():
+            engine = FakeEngine()
+            listener = JobNotificationListener(engine, max_reconnect_seconds=0.01)
+            stop = asyncio.Event()
+            task = asyncio.create_task(listener.run(stop))
+
+            await wait_until(lambda: listener.connected)
+            first = engine.connections[0]
+            first.driver.terminate()
+            await wait_until(lambda: len(engine.connections) == 2)
+            await wait_until(lambda: listener.connected)
+
+            for event in listener.wake_events.values():
+                event.clear()
+            engine.connections[1].driver.notify("discovery")
+            assert listener.wake_events["discovery"].is_set()
+
+            stop.set()
+            await asyncio.wait_for(task, timeout=1)
+            return engine, listener
+
+        engine, listener = asyncio.run(run())
+        assert engine.connections[0].invalidated
+        assert not engine.connections[1].invalidated
+        assert engine.connections[1].driver.listeners == {}
+        assert not listener.connected
+
+
+# ============================================================================
+# Worker wakeups
+# ============================================================================
+
+class LateJobQueue:
+    """Idle until `available` is bumped, then claims one job per poll."""
+
+    def __init__(self, worker: GrantScopeWorker):
+        self.worker = worker
+        self.available = 0
+        self.polls = 0
+        self.done_at = []
+
+    async def __call__(self) -> bool:
+        self.polls += 1
+        if not self.available:
+            return False
+        self.available -= 1
+        self.worker._job_claimed()
+        self.done_at.append(asyncio.get_running_loop().time())
+        return True
+
+
+def make_worker(monkeypatch) -> GrantScopeWorker:
+    # Slow polling: only a wakeup can get the job picked up within the test.
+    monkeypatch.setenv("GRANTSCOPE_WORKER_POLL_INTERVAL_SECONDS", "10")
+    monkeypatch.setenv("GRANTSCOPE_WORKER_MAX_POLL_INTERVAL_SECONDS", "10")
+    monkeypatch.setenv("GRANTSCOPE_WORKER_SAFETY_POLL_SECONDS", "10")
+    for name in GrantScopeWorker.QUEUE_TYPES:
+        monkeypatch.setenv(
+            f"GRANTSCOPE_WORKER_CONCURRENCY_{name.upper()}",
+            "1" if name == "brief" else "0",
+        )
+    worker = GrantScopeWorker()
+    worker._listener.engine = FakeEngine()
+    return worker
+
+
+class TestWorkerWakeups:
+    def test_notification_wakes_idle_consumer(self, monkeypatch):
+        async def run():
+            worker = make_worker(monkeypatch)
+            briefs = LateJobQueue(worker)
+            worker._queue_handlers = lambda: {"brief": briefs}
+
+            task = asyncio.create_task(worker.run())
+            await wait_until(lambda: worker._listener.connected)
+            await wait_until(lambda: briefs.polls >= 1)
+            await asyncio.sleep(0.02)
+            polls_before = briefs.polls
+
+            briefs.available = 1
+            sent = asyncio.get_running_loop().time()
+            driver = worker._listener.engine.connections[0].driver
+            driver.notify("brief")
+            await wait_until(lambda: briefs.done_at, timeout=0.5)
+
+            health = worker.health()
+            worker.request_stop()
+            await asyncio.wait_for(task, timeout=1)
+            return briefs, polls_before, sent, health
+
+        briefs, polls_before, sent, health = asyncio.run(run())
+        assert briefs.done_at[0] - sent < 0.1
+        assert polls_before <= 3  # idle consumer is not spinning
+        assert health["listening"] is True
+        assert health["notifications"] == 1
+
+    def test_other_queue_notification_does_not_wake(self, monkeypatch):
+        async def run():
+            worker = make_worker(monkeypatch)
+            briefs = LateJobQueue(worker)
+            worker._queue_handlers = lambda: {"brief": briefs}
+
+            task = asyncio.create_task(worker.run())
+            await wait_until(lambda: worker._listener.connected)
+            await asyncio.sleep(0.05)
+            polls_before = briefs.polls
+
+            driver = worker._listener.engine.connections[0].driver
+            driver.notify("research")
+            await asyncio.sleep(0.05)
+            polls_after = briefs.polls
+
+            worker.request_stop()
+            await asyncio.wait_for(task, timeout=1)
+            return polls_before, polls_after
+
+        polls_before, polls_after = asyncio.run(run())
+        assert polls_after == polls_before
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,255 @@
+"""
+Unit Tests for the Persistent LLM Result Cache
+
+Covers app.llm_result_cache and its use by AIService (fake session, fake
+LLM client):
+- keys: normalized content hash, prompt-template versioning
+- lookups are one primary-key UPDATE ... RETURNING that bumps hit stats
+- writes upsert; TTL and size-based pruning run on an interval
+- database errors and a missing database degrade to cache misses
+- triage_source / analyze_source skip the LLM on a hit and never store
+  unparseable responses
+
+Usage:
+    cd backend && pytest tests/test_llm_result_cache.py -v
+"""
+
+import asyncio
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.ai_service as ai_service  # noqa: E402
+from app.ai_service import AIService  # noqa: E402
+from app.llm_result_cache import (  # noqa: E402
+    LLMResultCache,
+    content_hash,
+    prompt_version,
+)
+
+
+def sql(stmt):
+    return str(stmt.compile(dialect=asyncpg.dialect()))
+
+
+class Result:
+    def __init__(self, value=None, rowcount=0):
+        self.value = value
+        self.rowcount = rowcount
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class Database:
+    """Session factory whose sessions record statements."""
+
+    def __init__(self, returning=None, fail=False):
+        self.returning = returning
+        self.fail = fail
+        self.statements = []
+        self.commits = 0
+
+    def __call__(self):
+        database = self
+
+        class Session:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def execute(self, stmt, params=None):
+                if database.fail:
+                    raise ConnectionError("database unavailable")
+                database.statements.append(stmt)
+                return Result(database.returning, rowcount=2)
+
+            async def commit(self):
+                database.commits += 1
+
+        return Session()
+
+
+class MemoryCache:
+    """In-memory stand-in for llm_result_cache."""
+
+    def __init__(self):
+        self.entries = {}
+
+    async def get(self, operation, version, model, key):
+        return self.entries.get((operation, version, model, key))
+
+    async def put(self, operation, version, model, key, result):
+        self.entries[(operation, version, model, key)] = result
+
+
+class FakeCompletions:
+    def __init__(self, content):
+        self.content = content
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=self.content))]
+        )
+
+
+def make_service(content):
+    completions = FakeCompletions(content)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    service = AIService(client, coalesce_window_ms=0)
+    service._client_is_async = True
+    return service, completions
+
+
+TRIAGE_JSON = json.dumps(
+    {"is_relevant": True, "confidence": 0.9, "primary_pillar": "CH", "reason": "grant"}
+)
+ANALYSIS_JSON = json.dumps(
+    {"summary": "A transit grant.", "pillars": ["MC"], "credibility": 7, "entities": []}
+)
+
+
+@pytest.fixture
+def memo(monkeypatch):
+    cache = MemoryCache()
+    monkeypatch.setattr(ai_service, "llm_result_cache", cache)
+    return cache
+
+
+# ============================================================================
+# Keys
+# ============================================================================
+
+class TestKeys:
+    def test_content_hash_normalizes_whitespace_and_unicode(self):
+        assert content_hash("Café  grant", "line one\n\nline two ") == content_hash(
+            "Café grant", "line one line two"
+        )
+
+    def test_content_hash_is_order_and_field_sensitive(self):
+        assert content_hash("a", "b") != content_hash("b", "a")
+        assert content_hash("t", "c", "2026-01-01") != content_hash("t", "c", "2026-01-02")
+
+    def test_prompt_version_tracks_template_and_params(self):
+        base = prompt_version("Triage {title}", max_tokens=200)
+        assert base == prompt_version("Triage {title}", max_tokens=200)
+        assert base != prompt_version("Triage: {title}", max_tokens=200)
+        assert base != prompt_version("Triage {title}", max_tokens=300)
+
+
+# ============================================================================
+# LLMResultCache
+# ============================================================================
+
+class TestLLMResultCache:
+    def test_hit_is_one_update_returning(self):
+        db = Database(returning={"is_relevant": True})
+        cache = LLMResultCache(session_factory=db, enabled=True)
+        assert asyncio.run(cache.get("triage", "v1", "mini", "abc")) == {"is_relevant": True}
+        assert len(db.statements) == 1
+        statement = sql(db.statements[0])
+        assert statement.startswith("UPDATE llm_result_cache SET")
+        assert "hit_count=(llm_result_cache.hit_count + $1::INTEGER)" in statement
+        assert "llm_result_cache.created_at > " in statement
+        assert "RETURNING llm_result_cache.result" in statement
+        assert cache.stats()["triage"]["hit"] == 1
+
+    def test_put_upserts(self):
+        db = Database()
+        cache = LLMResultCache(session_factory=db, enabled=True)
+        asyncio.run(cache.put("analysis", "v1", "gpt", "abc", {"summary": "x"}))
+        statement = sql(db.statements[0])
+        assert "INSERT INTO llm_result_cache" in statement
+        assert "ON CONFLICT (operation, prompt_version, model, content_hash) DO UPDATE" in statement
+        assert cache.stats()["analysis"]["store"] == 1
+
+    def test_prune_runs_on_interval(self):
+        db = Database()
+        cache = LLMResultCache(session_factory=db, enabled=True, prune_interval=0)
+        asyncio.run(cache.put("triage", "v1", "mini", "abc", {"reason": "x"}))
+        statements = [sql(s) if hasattr(s, "compile") else str(s) for s in db.statements]
+        assert len(statements) == 3
+        assert statements[1].startswith("DELETE FROM llm_result_cache WHERE llm_result_cache.created_at <=")
+        assert "SUM(size_bytes) OVER" in statements[2]
+
+    def test_database_error_is_a_miss(self):
+        cache = LLMResultCache(session_factory=Database(fail=True), enabled=True)
+        assert asyncio.run(cache.get("triage", "v1", "mini", "abc")) is None
+        asyncio.run(cache.put("triage", "v1", "mini", "abc", {}))
+        assert cache.stats()["triage"]["error"] == 2
+
+    def test_disabled(self):
+        db = Database(returning={"x": 1})
+        cache = LLMResultCache(session_factory=db, enabled=False)
+        assert asyncio.run(cache.get("triage", "v1", "mini", "abc")) is None
+        assert db.statements == []
+
+
+# ============================================================================
+# AIService
+# ============================================================================
+
+class TestAIServiceMemo:
+    def test_repeat_triage_skips_llm(self, memo):
+        service, completions = make_service(TRIAGE_JSON)
+        first = asyncio.run(service.triage_source("Transit grant", "Funding for buses."))
+        second = asyncio.run(service.triage_source("Transit grant", "Funding  for buses.\n"))
+        assert first == second
+        assert first.is_relevant and first.primary_pillar == "CH"
+        assert completions.calls == 1
+
+    def test_unparseable_triage_not_cached(self, memo):
+        service, completions = make_service("not json")
+        result = asyncio.run(service.triage_source("t", "c"))
+        asyncio.run(service.triage_source("t", "c"))
+        assert result.reason == "Parse error"
+        assert completions.calls == 2
+        assert memo.entries == {}
+
+    def test_analysis_key_ignores_published_at(self, memo):
+        service, completions = make_service(ANALYSIS_JSON)
+        first = asyncio.run(
+            service.analyze_source("t", "c", "City News", "2026-01-01T09:00:00+00:00")
+        )
+        again = asyncio.run(
+            service.analyze_source("t", "c", "City News", "2026-01-01T09:00:07+00:00")
+        )
+        assert completions.calls == 1
+        assert len(memo.entries) == 1
+        assert again == first
+        assert first.credibility == 5.0  # clamped on every build, cached or not
+        assert not first.scores_are_defaults
+
+    def test_analysis_key_includes_source_and_content(self, memo):
+        service, completions = make_service(ANALYSIS_JSON)
+        asyncio.run(service.analyze_source("t", "c", "City News", "2026-01-01"))
+        asyncio.run(service.analyze_source("t", "c", "Wire", "2026-01-01"))
+        asyncio.run(service.analyze_source("t", "c2", "City News", "2026-01-01"))
+        assert completions.calls == 3
+
+    def test_triage_and_analysis_namespaces(self, memo):
+        service, _ = make_service(TRIAGE_JSON)
+        asyncio.run(service.triage_source("t", "c"))
+        (operation, version, model, _key), = memo.entries
+        assert operation == "triage"
+        assert version == ai_service.TRIAGE_PROMPT_VERSION
+        assert version != ai_service.ANALYSIS_PROMPT_VERSION
+        assert model == ai_service.get_chat_mini_deployment()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,190 @@
+"""
+Unit Tests for Per-Source Deadlines in Multi-Source Search
+
+Covers app.multi_source_search.search_all_sources (fake source wrappers):
+- a hung source only costs its own timeout; results from the sources that
+  finished in time are still fused with RRF
+- every per-source timeout is capped by the overall deadline
+- hedged retries: the duplicate request wins for a slow source (also through
+  the search cache's single-flight), losers are cancelled, and SAM.gov is
+  never hedged by default
+- per-source latency histograms and timeout counters
+
+Usage:
+    cd backend && pytest tests/test_multi_source_search.py -v
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.multi_source_search as mss  # noqa: E402
+from app.multi_source_search import MultiSourceResult, search_all_sources  # noqa: E402
+from app.search_cache import SearchCache, cache_key  # noqa: E402
+
+LABELS = ["grants_gov", "sam_gov", "web", "news", "government", "academic"]
+
+
+def result(label, i=0):
+    return MultiSourceResult(
+        title=f"{label} {i}",
+        url=f"https://{label}.example/{i}",
+        snippet="",
+        source_type=label,
+    )
+
+
+class Sources:
+    """Replaces every _search_* wrapper with a scripted fake."""
+
+    def __init__(self, monkeypatch, delays):
+        self.calls = {label: 0 for label in LABELS}
+        self.cancelled = {label: 0 for label in LABELS}
+        for label in LABELS:
+            monkeypatch.setattr(mss, f"_search_{label}", self._fake(label, delays))
+        monkeypatch.setattr(mss, "_latency", {})
+
+    def _fake(self, label, delays):
+        async def search(query, max_results):
+            self.calls[label] += 1
+            attempt = self.calls[label]
+            delay = delays.get(label, 0.0)
+            if isinstance(delay, list):
+                delay = delay[attempt - 1]
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.cancelled[label] += 1
+                raise
+            return [result(label, attempt)]
+
+        return search
+
+
+def run(**kwargs):
+    kwargs.setdefault("include_academic", True)
+    started = time.monotonic()
+    merged = asyncio.run(search_all_sources("transit grants", **kwargs))
+    return merged, time.monotonic() - started
+
+
+# ============================================================================
+# Deadlines and partial results
+# ============================================================================
+
+class TestDeadlines:
+    def test_hung_source_does_not_discard_others(self, monkeypatch):
+        sources = Sources(monkeypatch, {"sam_gov": 60.0})
+        merged, elapsed = run(source_timeouts={"sam_gov": 0.2}, hedge_after=0)
+
+        assert elapsed < 1.0
+        assert {r.source_type for r in merged} == set(LABELS) - {"sam_gov"}
+        # Still fused: grant sources outrank news / academic by weight
+        assert merged[0].source_type == "grants_gov"
+        assert all(r.rrf_score > 0 for r in merged)
+        assert sources.cancelled["sam_gov"] == 1
+
+    def test_overall_deadline_caps_source_timeouts(self, monkeypatch):
+        Sources(monkeypatch, {"government": 60.0, "academic": 60.0})
+        merged, elapsed = run(deadline=0.2, hedge_after=0)
+        assert elapsed < 1.0
+        assert len(merged) == 4
+
+    def test_failing_source_is_empty(self, monkeypatch):
+        Sources(monkeypatch, {})
+
+        async def broken(query, max_results):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(mss, "_search_web", broken)
+        merged, _ = run(hedge_after=0)
+        assert "web" not in {r.source_type for r in merged}
+        assert len(merged) == 5
+
+
+# ============================================================================
+# Hedged retries
+# ============================================================================
+
+class TestHedging:
+    def test_hedge_wins_for_slow_source(self, monkeypatch):
+        sources = Sources(monkeypatch, {"web": [60.0, 0.0]})
+        merged, elapsed = run(hedge_after=0.1)
+
+        assert elapsed < 1.0
+        web = [r for r in merged if r.source_type == "web"]
+        assert [r.title for r in web] == ["web 2"]
+        assert sources.calls["web"] == 2
+        assert sources.cancelled["web"] == 1
+        stats = mss.source_latency_stats()["web"]
+        assert stats["hedged"] == 1 and stats["hedge_wins"] == 1
+        # Fast sources are never duplicated
+        assert sources.calls["grants_gov"] == 1
+
+    def test_hedge_bypasses_cache_single_flight(self, monkeypatch):
+        sources = Sources(monkeypatch, {})
+        cache = SearchCache(ttls={"web": 3600.0}, persist=False)
+        delays = [60.0, 0.0]
+
+        async def load():
+            sources.calls["web"] += 1
+            await asyncio.sleep(delays[sources.calls["web"] - 1])
+            return [sources.calls["web"]]
+
+        async def cached_web(query, max_results):
+            attempt = await cache.fetch("web", cache_key(query), load)
+            return [result("web", attempt[0])]
+
+        monkeypatch.setattr(mss, "_search_web", cached_web)
+        merged, elapsed = run(hedge_after=0.1)
+
+        assert elapsed < 1.0
+        assert [r.title for r in merged if r.source_type == "web"] == ["web 2"]
+        assert sources.calls["web"] == 2
+        assert mss.source_latency_stats()["web"]["hedge_wins"] == 1
+
+    def test_sam_gov_not_hedged(self, monkeypatch):
+        sources = Sources(monkeypatch, {"sam_gov": 0.3})
+        merged, _ = run(hedge_after=0.1)
+        assert sources.calls["sam_gov"] == 1
+        assert "sam_gov" in {r.source_type for r in merged}
+
+    def test_hedging_disabled(self, monkeypatch):
+        sources = Sources(monkeypatch, {"web": 0.3})
+        run(hedge_after=0)
+        assert sources.calls["web"] == 1
+
+
+# ============================================================================
+# Latency stats
+# ============================================================================
+
+class TestLatencyStats:
+    def test_histogram_and_timeouts(self, monkeypatch):
+        Sources(monkeypatch, {"news": 60.0})
+        run(source_timeouts={"news": 0.1}, hedge_after=0)
+        run(source_timeouts={"news": 0.1}, hedge_after=0)
+
+        stats = mss.source_latency_stats()
+        assert stats["news"]["calls"] == 2
+        assert stats["news"]["timeouts"] == 2
+        assert stats["news"]["avg_seconds"] is None
+        assert sum(stats["news"]["histogram"].values()) == 0
+
+        grants = stats["grants_gov"]
+        assert grants["calls"] == 2 and grants["timeouts"] == 0
+        assert grants["histogram"]["le_0.5s"] == 2
+        assert list(grants["histogram"])[-1] == "gt_20s"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
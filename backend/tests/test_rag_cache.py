@@ -0,0 +1,213 @@
+"""
+Unit Tests for the RAG Query Cache
+
+Covers app.rag_cache.RAGQueryCache and its use by RAGEngine (no model calls):
+- exact hits on normalized query text, per scope / scope_id
+- near-duplicate hits by query-embedding similarity within a scope
+- rerank scores keyed by the candidate-list fingerprint
+- TTL expiry, LRU eviction and card invalidation
+- hit-rate stats
+- RAGEngine skips expansion / embedding / rerank calls on repeats and
+  never caches a failed call
+
+Usage:
+    cd backend && pytest tests/test_rag_cache.py -v
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.rag_engine as rag_engine  # noqa: E402
+from app.rag_cache import RAGQueryCache, normalize_query  # noqa: E402
+from app.rag_engine import RAGEngine  # noqa: E402
+
+EV = [1.0, 0.0, 0.0, 0.0]
+EV_NEAR = [0.99, 0.1, 0.0, 0.0]  # cosine ~0.995
+PARKS = [0.0, 1.0, 0.0, 0.0]
+
+
+# ============================================================================
+# RAGQueryCache
+# ============================================================================
+
+class TestExactLookups:
+    def test_normalized_query_hits(self):
+        cache = RAGQueryCache()
+        cache.put_expansion("global", None, "EV charger grants?", ["EV charger grants?", "ev funding"])
+        assert normalize_query("  ev   Charger GRANTS ") == "ev charger grants"
+        assert cache.get_expansion("global", None, "ev charger grants") == ["ev funding"]
+
+    def test_keyed_by_scope(self):
+        cache = RAGQueryCache()
+        cache.put_expansion("signal", "card-1", "deadline", ["due date"])
+        assert cache.get_expansion("signal", "card-2", "deadline") is None
+        assert cache.get_expansion("global", None, "deadline") is None
+        assert cache.get_expansion("signal", "card-1", "deadline") == ["due date"]
+
+    def test_embeddings_shared_across_scopes(self):
+        cache = RAGQueryCache()
+        cache.put_embedding("EV grants", EV)
+        assert cache.get_embedding("ev grants.") == EV
+
+
+class TestSimilarLookups:
+    def test_near_duplicate_in_same_scope(self):
+        cache = RAGQueryCache(similarity=0.95)
+        cache.put_expansion("global", None, "EV charger grants", ["ev funding"], EV)
+        assert cache.get_expansion("global", None, "grants for EV chargers", EV_NEAR) == ["ev funding"]
+        assert cache.get_expansion("global", None, "parks", PARKS) is None
+        assert cache.get_expansion("workstream", "ws-1", "grants for EV chargers", EV_NEAR) is None
+
+    def test_rerank_requires_same_candidates(self):
+        cache = RAGQueryCache()
+        cache.put_rerank("global", None, "EV grants", "fp-a", {0: 9.0, 1: 2.0}, EV)
+        assert cache.get_rerank("global", None, "EV grants", "fp-a") == {0: 9.0, 1: 2.0}
+        assert cache.get_rerank("global", None, "EV grants", "fp-b") is None
+        assert cache.get_rerank("global", None, "EV charger grants", "fp-a", EV_NEAR) == {0: 9.0, 1: 2.0}
+
+
+class TestFreshness:
+    def test_ttl_expiry(self):
+        cache = RAGQueryCache(ttl=0.0001)
+        cache.put_expansion("global", None, "q", ["v"])
+        cache.put_embedding("q", EV)
+        asyncio.run(asyncio.sleep(0.01))
+        # ttl > 0 keeps the cache enabled; entries are simply stale
+        assert cache.get_expansion("global", None, "q") is None
+        assert cache.get_embedding("q") is None
+
+    def test_lru_eviction(self):
+        cache = RAGQueryCache(max_entries=2)
+        cache.put_expansion("global", None, "a", ["a1"])
+        cache.put_expansion("global", None, "b", ["b1"])
+        cache.get_expansion("global", None, "a")  # a is now most recent
+        cache.put_expansion("global", None, "c", ["c1"])
+        assert cache.get_expansion("global", None, "b") is None
+        assert cache.get_expansion("global", None, "a") == ["a1"]
+        assert cache.stats()["evicted"] == 1
+
+    def test_invalidate_card(self):
+        cache = RAGQueryCache()
+        cache.put_expansion("signal", "card-1", "eligibility", ["who can apply"])
+        cache.put_rerank("global", None, "transit", "fp", {0: 8.0}, card_ids=["card-1"])
+        cache.put_rerank("global", None, "parks", "fp", {0: 8.0}, card_ids=["card-2"])
+        cache.invalidate("card-1")
+        assert cache.get_expansion("signal", "card-1", "eligibility") is None
+        assert cache.get_rerank("global", None, "transit", "fp") is None
+        assert cache.get_rerank("global", None, "parks", "fp") == {0: 8.0}
+
+    def test_disabled(self):
+        cache = RAGQueryCache(max_entries=0)
+        cache.put_expansion("global", None, "q", ["v"])
+        cache.put_embedding("q", EV)
+        assert cache.get_expansion("global", None, "q") is None
+        assert cache.get_embedding("q") is None
+
+
+class TestStats:
+    def test_hit_rates(self):
+        cache = RAGQueryCache()
+        cache.get_expansion("global", None, "q")
+        cache.put_expansion("global", None, "q", ["v"], EV)
+        cache.get_expansion("global", None, "q")
+        cache.get_expansion("global", None, "q2", EV_NEAR)
+        cache.get_expansion("global", None, "q3", count_miss=False)
+        stats = cache.stats()
+        assert stats["expansion"] == {"exact": 1, "similar": 1, "miss": 1, "hit_rate": 0.6667}
+        assert stats["entries"] == 1
+        assert stats["rerank"]["hit_rate"] == 0.0
+
+
+# ============================================================================
+# RAGEngine integration
+# ============================================================================
+
+class ModelCalls:
+    def __init__(self, monkeypatch, engine, embeddings=None, expansion_fails=False):
+        self.expand, self.embed, self.score = [], [], []
+        embeddings = embeddings or {}
+
+        async def expand(query):
+            self.expand.append(query)
+            await asyncio.sleep(0.01)
+            return [query] if expansion_fails else [query, f"{query} funding"]
+
+        async def embed(text):
+            self.embed.append(text)
+            return embeddings.get(text, EV)
+
+        async def score(query, numbered):
+            self.score.append(query)
+            return {0: 2.0, 1: 9.0}
+
+        monkeypatch.setattr(engine, "_expand_query", expand)
+        monkeypatch.setattr(engine, "_generate_embedding", embed)
+        monkeypatch.setattr(engine, "_score_candidates", score)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(rag_engine, "rag_query_cache", RAGQueryCache())
+    return RAGEngine(db=None)
+
+
+CARDS = [
+    {"id": "c1", "name": "Transit grant", "summary": "Buses"},
+    {"id": "c2", "name": "EV grant", "summary": "Chargers"},
+]
+
+
+class TestEngineCaching:
+    def test_repeat_question_skips_model_calls(self, engine, monkeypatch):
+        calls = ModelCalls(monkeypatch, engine)
+        first = asyncio.run(engine._expand_and_embed("EV grants?", "global", None))
+        second = asyncio.run(engine._expand_and_embed("ev grants", "global", None))
+        assert first == (["EV grants?", "EV grants? funding"], EV)
+        assert second == (["ev grants", "EV grants? funding"], EV)
+        assert len(calls.expand) == 1
+        assert len(calls.embed) == 1
+
+    def test_near_duplicate_cancels_expansion(self, engine, monkeypatch):
+        calls = ModelCalls(
+            monkeypatch, engine, embeddings={"EV grants": EV, "grants for EVs": EV_NEAR}
+        )
+        asyncio.run(engine._expand_and_embed("EV grants", "global", None))
+        expanded, embedding = asyncio.run(
+            engine._expand_and_embed("grants for EVs", "global", None)
+        )
+        assert expanded == ["grants for EVs", "EV grants funding"]
+        assert embedding == EV_NEAR
+        assert calls.embed == ["EV grants", "grants for EVs"]
+        stats = rag_engine.rag_query_cache.stats()
+        assert stats["expansion"]["similar"] == 1
+
+    def test_failed_expansion_not_cached(self, engine, monkeypatch):
+        calls = ModelCalls(monkeypatch, engine, expansion_fails=True)
+        asyncio.run(engine._expand_and_embed("q", "global", None))
+        asyncio.run(engine._expand_and_embed("q", "global", None))
+        assert len(calls.expand) == 2
+
+    def test_rerank_cached_per_candidate_list(self, engine, monkeypatch):
+        calls = ModelCalls(monkeypatch, engine)
+        ranked, _ = asyncio.run(engine._rerank_results("EV", CARDS, [], "global", None, EV))
+        again, _ = asyncio.run(engine._rerank_results("EV", CARDS, [], "global", None, EV))
+        assert [c["id"] for c in ranked] == ["c2", "c1"]
+        assert again == ranked
+        assert len(calls.score) == 1
+
+        edited = [CARDS[0], {**CARDS[1], "summary": "Chargers and buses"}]
+        asyncio.run(engine._rerank_results("EV", edited, [], "global", None, EV))
+        assert len(calls.score) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
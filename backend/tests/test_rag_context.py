@@ -0,0 +1,175 @@
+"""
+Unit Tests for RAG Context Assembly Under Budget
+
+Covers lazy source content in app.rag_engine / app.helpers.db_utils:
+- hybrid_search_sources and the signal source enrichment no longer select
+  full_text, only a has_full_text flag
+- full_text slices are fetched with left() only for sources that fit the
+  remaining budget, highest-ranked first
+- placeholder lines without budget or text are dropped
+- the assembled context stays within max_context_chars
+
+Usage:
+    cd backend && pytest tests/test_rag_context.py -v
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+from app.helpers.db_utils import hybrid_search_sources  # noqa: E402
+from app.helpers.session_fanout import SessionFanout  # noqa: E402
+from app.rag_engine import RAGEngine  # noqa: E402
+
+CARD_ID = str(uuid.uuid4())
+SOURCE_IDS = [str(uuid.uuid4()) for _ in range(4)]
+
+
+class Result:
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+
+    def all(self):
+        return self.rows
+
+    def mappings(self):
+        return self
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        return Result()
+
+
+def sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def source(i, **extra):
+    return {
+        "id": SOURCE_IDS[i],
+        "card_id": CARD_ID,
+        "title": f"Source {i}",
+        "ai_summary": f"Summary {i}",
+        "has_full_text": True,
+        **extra,
+    }
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    rag = RAGEngine(db=None)
+    fetched = []
+
+    async def fake_fetch(limits):
+        fetched.append(dict(limits))
+        return {sid: "x" * 10_000 for sid in limits if sid != SOURCE_IDS[1]}
+
+    monkeypatch.setattr(rag, "_fetch_source_text", fake_fetch)
+    return rag, fetched
+
+
+# ============================================================================
+# Retrieval queries
+# ============================================================================
+
+class TestRetrievalSkipsFullText:
+    def test_hybrid_search_sources_selects_flag(self):
+        db = RecordingSession()
+        asyncio.run(hybrid_search_sources(db, "transit", [0.1] * 4))
+        text = db.statements[0].text
+        assert "s.full_text IS NOT NULL AS has_full_text" in text
+        assert "s.published_date, s.full_text," not in text
+
+    def test_hybrid_search_sources_opt_in(self):
+        db = RecordingSession()
+        asyncio.run(hybrid_search_sources(db, "transit", [0.1] * 4, include_full_text=True))
+        assert "s.published_date, s.full_text," in db.statements[0].text
+
+    def test_signal_sources_select_flag(self):
+        db = RecordingSession()
+        rag = RAGEngine(db)
+        rag._fanout = SessionFanout(db, max_sessions=0)  # reads go to db
+        asyncio.run(rag._enrich_signal(CARD_ID, {"cards": [], "sources": []}))
+        source_sql = next(sql(s) for s in db.statements if "FROM sources" in sql(s))
+        assert "sources.full_text IS NOT NULL AS has_full_text" in source_sql
+        assert "sources.full_text," not in source_sql
+
+    def test_slice_query_truncates_server_side(self):
+        db = RecordingSession()
+        rag = RAGEngine(db)
+        rag._fanout = SessionFanout(db, max_sessions=0)
+        asyncio.run(rag._fetch_source_text({SOURCE_IDS[0]: 5000, SOURCE_IDS[1]: 800}))
+        compiled = sql(db.statements[0])
+        assert "left(sources.full_text, CASE sources.id WHEN" in compiled
+        assert "sources.full_text IS NOT NULL" in compiled
+
+
+# ============================================================================
+# Budgeted assembly
+# ============================================================================
+
+class TestBudgetedAssembly:
+    def test_top_sources_get_content_within_budget(self, engine):
+        rag, fetched = engine
+        cards = [{"id": CARD_ID, "name": "Transit", "summary": "Buses", "slug": "transit"}]
+        sources = [source(i) for i in range(4)]
+
+        text, metadata = asyncio.run(
+            rag._assemble_context("global", None, cards, sources, {}, [], 7000)
+        )
+
+        limits = fetched[0]
+        assert limits[SOURCE_IDS[0]] == 5000
+        assert 200 <= limits[SOURCE_IDS[1]] < 5000
+        assert SOURCE_IDS[2] not in limits and SOURCE_IDS[3] not in limits
+        assert len(text) <= 7000
+        assert "\x00" not in text
+        assert "Content: " + "x" * 5000 in text
+        # Source 1 had no text and sources 2-3 no budget: no Content lines
+        assert text.count("Content:") == 1
+        assert metadata["source_count"] == 4
+
+    def test_no_fetch_without_placeholders(self, engine):
+        rag, fetched = engine
+        sources = [source(0, has_full_text=False)]
+        text, _ = asyncio.run(rag._assemble_context("global", None, [], sources, {}, [], 5000))
+        assert fetched == []
+        assert "Source 0" in text
+
+    def test_inline_full_text_still_supported(self, engine):
+        rag, fetched = engine
+        sources = [source(0, has_full_text=None, full_text="inline body")]
+        text, _ = asyncio.run(rag._assemble_context("global", None, [], sources, {}, [], 5000))
+        assert "inline body" in text
+        assert fetched == []
+
+    def test_signal_enrichment_sources(self, engine):
+        rag, fetched = engine
+        enrichment = {
+            "primary_card": {"name": "Transit", "slug": "transit"},
+            "all_sources": [source(2), source(3, has_full_text=False)],
+        }
+        text, _ = asyncio.run(
+            rag._assemble_context("signal", CARD_ID, [], [], enrichment, [], 10_000)
+        )
+        assert fetched == [{SOURCE_IDS[2]: 3000}]
+        assert "Content: " + "x" * 3000 in text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
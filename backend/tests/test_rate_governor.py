@@ -0,0 +1,226 @@
+"""
+Unit Tests for the Outbound API Rate Governor
+
+Covers app.rate_governor and its use by the SAM.gov fetcher (no network):
+- token buckets: burst, then paced at the refill rate
+- priority classes: interactive waiters are served before queued batch work
+- daily quotas with a reserve batch work cannot touch, UTC-day rollover
+- throttle feedback pauses the whole bucket (Retry-After honoured)
+- cancelled waiters leave the backlog; budget / backlog stats
+- a SAM.gov 429 pauses the bucket instead of sleeping per call site
+
+Usage:
+    cd backend && pytest tests/test_rate_governor.py -v
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.rate_governor as rate_governor_module  # noqa: E402
+import app.source_fetchers.sam_gov_fetcher as sam_gov_fetcher  # noqa: E402
+from app.rate_governor import (  # noqa: E402
+    Priority,
+    ProviderLimit,
+    QuotaExhausted,
+    RateGovernor,
+    request_priority,
+    retry_after_seconds,
+)
+
+
+def governor(**limits):
+    return RateGovernor({name: ProviderLimit(*args) for name, args in limits.items()})
+
+
+# ============================================================================
+# Token buckets
+# ============================================================================
+
+class TestBuckets:
+    def test_burst_then_paced(self):
+        gov = governor(api=(20.0, 2.0))
+
+        async def scenario():
+            started = time.monotonic()
+            for _ in range(4):
+                await gov.acquire("api")
+            return time.monotonic() - started
+
+        elapsed = asyncio.run(scenario())
+        assert 0.08 <= elapsed < 0.5  # two burst tokens, two at 20/s
+        assert gov.stats()["api"]["granted"] == 4
+
+    def test_unknown_provider_passes(self):
+        assert asyncio.run(governor().acquire("anything")) == 0.0
+
+    def test_throttle_pauses_bucket(self):
+        gov = governor(api=(100.0, 5.0))
+
+        async def scenario():
+            await gov.acquire("api")
+            gov.throttle("api", 0.1)
+            started = time.monotonic()
+            await gov.acquire("api")
+            return time.monotonic() - started
+
+        assert asyncio.run(scenario()) >= 0.09
+        assert gov.stats()["api"]["throttled"] == 1
+
+    def test_cancelled_waiter_leaves_backlog(self):
+        gov = governor(api=(0.5, 1.0))
+
+        async def scenario():
+            await gov.acquire("api")
+            waiter = asyncio.ensure_future(gov.acquire("api", Priority.BATCH))
+            await asyncio.sleep(0.01)
+            backlog = gov.stats()["api"]["backlog"]
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+            return backlog
+
+        backlog = asyncio.run(scenario())
+        assert backlog == {"interactive": 0, "normal": 0, "batch": 1}
+        assert gov.stats()["api"]["backlog"]["batch"] == 0
+
+
+# ============================================================================
+# Priority classes
+# ============================================================================
+
+class TestPriority:
+    def test_interactive_preempts_batch_backlog(self):
+        gov = governor(api=(50.0, 1.0))
+        order = []
+
+        async def call(name, priority):
+            await gov.acquire("api", priority)
+            order.append(name)
+
+        async def scenario():
+            await gov.acquire("api")  # drain the burst
+            batch = [asyncio.ensure_future(call(f"batch{i}", Priority.BATCH)) for i in range(3)]
+            await asyncio.sleep(0.005)
+            with request_priority(Priority.INTERACTIVE):
+                chat = asyncio.ensure_future(call("chat", None))
+            await asyncio.gather(*batch, chat)
+
+        asyncio.run(scenario())
+        assert order.index("chat") <= 1
+        assert order[-1].startswith("batch")
+
+    def test_context_priority_default(self):
+        assert rate_governor_module.current_priority() == Priority.NORMAL
+        with request_priority(Priority.BATCH):
+            assert rate_governor_module.current_priority() == Priority.BATCH
+        assert rate_governor_module.current_priority() == Priority.NORMAL
+
+
+# ============================================================================
+# Daily quotas
+# ============================================================================
+
+class TestQuota:
+    def test_reserve_kept_for_interactive(self, monkeypatch):
+        monkeypatch.setattr(rate_governor_module, "RATE_LIMIT_QUOTA_RESERVE", 0.25)
+        gov = governor(sam=(1000.0, 10.0, 4))
+
+        async def scenario():
+            for _ in range(3):
+                await gov.acquire("sam", Priority.BATCH)
+            with pytest.raises(QuotaExhausted):
+                await gov.acquire("sam", Priority.BATCH)  # 1 left = the reserve
+            await gov.acquire("sam", Priority.INTERACTIVE)
+            with pytest.raises(QuotaExhausted):
+                await gov.acquire("sam", Priority.INTERACTIVE)
+
+        asyncio.run(scenario())
+        stats = gov.stats()["sam"]
+        assert stats["used_today"] == 4 and stats["remaining_today"] == 0
+        assert stats["rejected"] == 2
+
+    def test_quota_resets_each_utc_day(self):
+        gov = governor(sam=(1000.0, 10.0, 1))
+        asyncio.run(gov.acquire("sam", Priority.INTERACTIVE))
+        gov._buckets["sam"].day = "2000-01-01"
+        asyncio.run(gov.acquire("sam", Priority.INTERACTIVE))
+        assert gov.stats()["sam"]["used_today"] == 1
+
+    def test_retry_after_header(self):
+        assert retry_after_seconds({"Retry-After": "7"}, 1.0) == 7.0
+        assert retry_after_seconds({"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}, 1.0) == 1.0
+        assert retry_after_seconds({}, 2.5) == 2.5
+
+
+# ============================================================================
+# SAM.gov integration
+# ============================================================================
+
+class FakeResponse:
+    def __init__(self, status, headers=None, body=None):
+        self.status = status
+        self.headers = headers or {}
+        self.body = body or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self):
+        return self.body
+
+    async def text(self):
+        return ""
+
+
+class FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+        self.closed = False
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+class TestSamGov:
+    def test_429_pauses_shared_bucket(self, monkeypatch):
+        gov = governor(sam_gov=(100.0, 5.0, 1000))
+        monkeypatch.setattr(sam_gov_fetcher, "rate_governor", gov)
+        session = FakeSession(
+            FakeResponse(429, {"Retry-After": "0.1"}),
+            FakeResponse(200, body={"opportunitiesData": []}),
+        )
+
+        started = time.monotonic()
+        data = asyncio.run(sam_gov_fetcher._request_sam_gov(session, "transit", 10, 0, "key"))
+        elapsed = time.monotonic() - started
+
+        assert data == {"opportunitiesData": []}
+        assert session.calls == 2
+        assert 0.09 <= elapsed < 1.0  # waited on the bucket, not 2s of backoff
+        stats = gov.stats()["sam_gov"]
+        assert stats["throttled"] == 1 and stats["used_today"] == 2
+
+    def test_quota_exhausted_returns_empty(self, monkeypatch):
+        gov = governor(sam_gov=(100.0, 5.0, 0))
+        monkeypatch.setattr(sam_gov_fetcher, "rate_governor", gov)
+        session = FakeSession()
+        assert asyncio.run(sam_gov_fetcher._request_sam_gov(session, "transit", 10, 0, "key")) == {}
+        assert session.calls == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,285 @@
+"""
+Unit Tests for Concurrent RSS Feed Polling
+
+Covers RSSService.check_feeds and the conditional GET in fetch_single_feed:
+- stored ETag / Last-Modified are replayed and a 304 skips parsing
+- due feeds are fetched concurrently within the global and per-host limits
+- each feed's items go in as one multi-row INSERT ... ON CONFLICT
+- a 304 only reschedules the feed; failures are still recorded
+- a failed insert is recorded as a feed error without advancing the
+  stored validators
+
+Usage:
+    cd backend && pytest tests/test_rss_polling.py -v
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from sqlalchemy.dialects import postgresql
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.rss_service as rss_service  # noqa: E402
+from app.rss_service import RSSService  # noqa: E402
+from app.source_fetchers.rss_fetcher import (  # noqa: E402
+    FeedFetchResult,
+    FetchedArticle,
+    fetch_single_feed,
+)
+
+RSS_BODY = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Gov Feed</title><link>https://gov.example</link>
+<item><title>Budget vote</title><link>https://gov.example/a</link>
+<description>Council approved it.</description></item>
+</channel></rss>"""
+
+
+# ============================================================================
+# Conditional GET
+# ============================================================================
+
+class TestConditionalGet:
+    def test_etag_round_trip(self):
+        seen = []
+
+        async def handler(request):
+            seen.append(
+                (
+                    request.headers.get("If-None-Match"),
+                    request.headers.get("If-Modified-Since"),
+                )
+            )
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            return web.Response(
+                text=RSS_BODY,
+                content_type="application/rss+xml",
+                headers={
+                    "ETag": '"v1"',
+                    "Last-Modified": "Mon, 02 Feb 2026 10:00:00 GMT",
+                },
+            )
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/feed", handler)
+            async with TestServer(app) as server:
+                url = str(server.make_url("/feed"))
+                first = await fetch_single_feed(url)
+                second = await fetch_single_feed(
+                    url, etag=first.etag, last_modified=first.last_modified
+                )
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first.success and not first.not_modified
+        assert [a.url for a in first.articles] == ["https://gov.example/a"]
+        assert first.etag == '"v1"'
+        assert first.last_modified == "Mon, 02 Feb 2026 10:00:00 GMT"
+
+        assert second.success and second.not_modified
+        assert second.articles == []
+        assert second.etag == '"v1"'
+        assert seen == [
+            (None, None),
+            ('"v1"', "Mon, 02 Feb 2026 10:00:00 GMT"),
+        ]
+
+
+# ============================================================================
+# check_feeds
+# ============================================================================
+
+class _Savepoint:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeDB:
+    """Serves the due-feeds query and records inserts / updates."""
+
+    def __init__(self, feeds, fail_inserts=False):
+        self.feeds = feeds
+        self.fail_inserts = fail_inserts
+        self.inserts = []
+        self.updates = []
+
+    def begin_nested(self):
+        return _Savepoint()
+
+    async def flush(self):
+        pass
+
+    async def execute(self, stmt, params=None):
+        kind = stmt.__visit_name__
+        if kind == "select":
+            return SimpleNamespace(
+                scalars=lambda: SimpleNamespace(all=lambda: list(self.feeds))
+            )
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        if kind == "insert":
+            urls = [v for k, v in compiled.params.items() if k.startswith("url_m")]
+            self.inserts.append(urls)
+            if self.fail_inserts:
+                raise ConnectionError("insert failed")
+            rows = [SimpleNamespace(id=uuid.uuid4(), processed=False) for _ in urls]
+            return SimpleNamespace(fetchall=lambda: rows)
+        if kind == "update":
+            self.updates.append(compiled.params)
+        return SimpleNamespace()
+
+
+def make_feed(name, url, etag=None):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        name=name,
+        url=url,
+        status="active",
+        error_count=0,
+        check_interval_hours=6,
+        articles_found_total=0,
+        http_etag=etag,
+        http_last_modified=None,
+    )
+
+
+def article(url):
+    return FetchedArticle(url=url, title=url, content="body", source_name="feed")
+
+
+class FakeFetcher:
+    """Stands in for fetch_single_feed, tracking concurrency per host."""
+
+    def __init__(self, seconds=0.05):
+        self.seconds = seconds
+        self.calls = {}
+        self.running = 0
+        self.peak = 0
+        self.host_running = defaultdict(int)
+        self.host_peak = defaultdict(int)
+
+    async def __call__(self, url, session=None, etag=None, last_modified=None):
+        host = rss_service._feed_host(url)
+        self.calls[url] = etag
+        self.running += 1
+        self.host_running[host] += 1
+        self.peak = max(self.peak, self.running)
+        self.host_peak[host] = max(self.host_peak[host], self.host_running[host])
+        try:
+            await asyncio.sleep(self.seconds)
+        finally:
+            self.running -= 1
+            self.host_running[host] -= 1
+
+        if url.endswith("/broken"):
+            return FeedFetchResult(feed_url=url, success=False, error_message="HTTP 500")
+        if etag:
+            return FeedFetchResult(
+                feed_url=url, success=True, not_modified=True, etag=etag
+            )
+        return FeedFetchResult(
+            feed_url=url,
+            success=True,
+            articles=[article(f"{url}/1"), article(f"{url}/2"), article(f"{url}/1")],
+            etag='"new"',
+        )
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    values = {"rss_fetch_concurrency": 4, "rss_fetch_per_host_limit": 2}
+
+    async def fake_get_setting(db, key, default=None):
+        return values.get(key, default)
+
+    monkeypatch.setattr(rss_service, "get_setting", fake_get_setting)
+    return values
+
+
+def run_check(monkeypatch, feeds, fetcher, fail_inserts=False):
+    monkeypatch.setattr(rss_service, "fetch_single_feed", fetcher)
+    db = FakeDB(feeds, fail_inserts=fail_inserts)
+    service = RSSService(db, ai_service=None)
+    stats = asyncio.run(service.check_feeds())
+    return db, stats
+
+
+class TestCheckFeeds:
+    def test_concurrent_within_limits(self, monkeypatch, settings):
+        feeds = [make_feed(f"f{i}", f"https://host{i % 3}.example/f{i}") for i in range(12)]
+        fetcher = FakeFetcher()
+
+        db, stats = run_check(monkeypatch, feeds, fetcher)
+
+        assert stats["feeds_checked"] == 12
+        assert fetcher.peak == 4
+        assert max(fetcher.host_peak.values()) == 2
+
+    def test_single_host_is_throttled(self, monkeypatch, settings):
+        feeds = [make_feed(f"f{i}", f"https://one.example/f{i}") for i in range(6)]
+        fetcher = FakeFetcher()
+
+        run_check(monkeypatch, feeds, fetcher)
+
+        assert fetcher.host_peak["one.example"] == 2
+
+    def test_one_insert_per_feed_and_304_skips(self, monkeypatch, settings):
+        changed = make_feed("changed", "https://a.example/changed")
+        unchanged = make_feed("unchanged", "https://b.example/same", etag='"old"')
+        broken = make_feed("broken", "https://c.example/broken")
+        fetcher = FakeFetcher(seconds=0)
+
+        db, stats = run_check(monkeypatch, [changed, unchanged, broken], fetcher)
+
+        assert fetcher.calls == {
+            "https://a.example/changed": None,
+            "https://b.example/same": '"old"',
+            "https://c.example/broken": None,
+        }
+        # One statement for the changed feed, duplicate URL collapsed
+        assert db.inserts == [
+            ["https://a.example/changed/1", "https://a.example/changed/2"]
+        ]
+        assert stats == {
+            "feeds_checked": 3,
+            "feeds_not_modified": 1,
+            "items_found": 3,
+            "items_new": 2,
+            "errors": 0,
+        }
+        etags = [u["http_etag"] for u in db.updates if "http_etag" in u]
+        assert sorted(etags) == ['"new"', '"old"']
+        assert any(u.get("last_error") == "HTTP 500" for u in db.updates)
+
+    def test_failed_insert_keeps_validators(self, monkeypatch, settings):
+        feed = make_feed("changed", "https://a.example/changed")
+
+        db, stats = run_check(
+            monkeypatch, [feed], FakeFetcher(seconds=0), fail_inserts=True
+        )
+
+        assert len(db.inserts) == 1
+        assert stats["errors"] == 1
+        assert stats["items_new"] == 0
+        assert not any("http_etag" in u for u in db.updates)
+        assert any(u.get("last_error") == "insert failed" for u in db.updates)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,332 @@
+"""
+Unit Tests for the Shared Search Result Cache
+
+Covers app.search_cache.SearchCache and its use by the search provider and
+fetchers (fake loaders, fake session; no network):
+- keys: normalized query plus every request parameter
+- per-provider TTLs, stale-while-revalidate, expiry past the stale window
+- concurrent misses share one request; empty / failed responses are not
+  cached and a failed refresh keeps the previous entry
+- bounded LRU, optional persistent tier (read-through, upsert, errors)
+- search_provider.search_web and SAM.gov (API key not in the key) go
+  through the cache
+
+Usage:
+    cd backend && pytest tests/test_search_cache.py -v
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.search_provider as search_provider  # noqa: E402
+import app.source_fetchers.sam_gov_fetcher as sam_gov_fetcher  # noqa: E402
+from app.search_cache import SearchCache, bypass_inflight, cache_key  # noqa: E402
+from app.search_provider import SearchResult  # noqa: E402
+
+TTLS = {"news": 60.0, "grants_gov": 3600.0}
+
+
+class Loader:
+    """Counts calls; returns scripted values (optionally after a delay)."""
+
+    def __init__(self, *values, delay=0.0):
+        self.values = list(values)
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        value = self.values[min(self.calls, len(self.values)) - 1]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+def age(cache, provider, key, seconds):
+    """Pretend the cached entry was fetched *seconds* ago."""
+    cache._entries[(provider, key)].fetched_at = time.time() - seconds
+
+
+def memory_cache(**kwargs):
+    return SearchCache(ttls=TTLS, persist=False, **kwargs)
+
+
+# ============================================================================
+# Keys
+# ============================================================================
+
+class TestCacheKey:
+    def test_query_normalized(self):
+        assert cache_key("  Transit   GRANTS ", rows=25) == cache_key("transit grants", rows=25)
+
+    def test_params_distinguish(self):
+        base = cache_key("transit", rows=25, offset=0)
+        assert base != cache_key("transit", rows=25, offset=25)
+        assert base != cache_key("transit", rows=10, offset=0)
+        assert base == cache_key("transit", offset=0, rows=25)
+
+
+# ============================================================================
+# Freshness
+# ============================================================================
+
+class TestFreshness:
+    def test_fresh_hit_skips_loader(self):
+        cache = memory_cache()
+        load = Loader({"oppHits": [1]})
+        first = asyncio.run(cache.fetch("grants_gov", "k", load))
+        second = asyncio.run(cache.fetch("grants_gov", "k", load))
+        assert first == second == {"oppHits": [1]}
+        assert load.calls == 1
+        assert cache.stats()["providers"]["grants_gov"]["hit_rate"] == 0.5
+
+    def test_per_provider_ttl(self):
+        cache = memory_cache()
+        asyncio.run(cache.fetch("news", "k", Loader(["n1"])))
+        asyncio.run(cache.fetch("grants_gov", "k", Loader({"g": 1})))
+        age(cache, "news", "k", 300)
+        age(cache, "grants_gov", "k", 300)
+        grants = Loader({"g": 2})
+        assert asyncio.run(cache.fetch("grants_gov", "k", grants)) == {"g": 1}
+        assert grants.calls == 0
+        assert cache.stats()["providers"]["news"]["hit"] == 0
+
+    def test_stale_served_while_revalidating(self):
+        cache = memory_cache()
+
+        async def scenario():
+            await cache.fetch("news", "k", Loader(["old"]))
+            age(cache, "news", "k", 90)  # past ttl (60), inside stale window
+            refresh = Loader(["new"], delay=0.01)
+            served = await asyncio.gather(
+                cache.fetch("news", "k", refresh), cache.fetch("news", "k", refresh)
+            )
+            await asyncio.sleep(0.05)
+            return served, refresh, await cache.fetch("news", "k", Loader(["unused"]))
+
+        served, refresh, after = asyncio.run(scenario())
+        assert served == [["old"], ["old"]]
+        assert refresh.calls == 1
+        assert after == ["new"]
+        assert cache.stats()["providers"]["news"]["stale"] == 2
+
+    def test_expired_past_stale_window_waits(self):
+        cache = memory_cache()
+        asyncio.run(cache.fetch("news", "k", Loader(["old"])))
+        age(cache, "news", "k", 500)
+        assert asyncio.run(cache.fetch("news", "k", Loader(["new"]))) == ["new"]
+
+    def test_failed_refresh_keeps_entry(self):
+        cache = memory_cache()
+
+        async def scenario():
+            await cache.fetch("news", "k", Loader(["old"]))
+            age(cache, "news", "k", 90)
+            await cache.fetch("news", "k", Loader([]))  # empty = failed fetch
+            await cache.fetch("news", "k", Loader(RuntimeError("down")))
+            await asyncio.sleep(0.01)
+
+        asyncio.run(scenario())
+        assert cache._entries[("news", "k")].value == ["old"]
+        assert cache.stats()["providers"]["news"]["uncacheable"] == 1
+
+
+# ============================================================================
+# Misses
+# ============================================================================
+
+class TestMisses:
+    def test_concurrent_misses_share_request(self):
+        cache = memory_cache()
+        load = Loader({"oppHits": [1]}, delay=0.01)
+
+        async def scenario():
+            return await asyncio.gather(*(cache.fetch("grants_gov", "k", load) for _ in range(5)))
+
+        assert asyncio.run(scenario()) == [{"oppHits": [1]}] * 5
+        assert load.calls == 1
+
+    def test_bypass_inflight_issues_own_request(self):
+        cache = memory_cache()
+        load = Loader({"oppHits": [1]}, delay=0.01)
+
+        async def bypassed():
+            with bypass_inflight():
+                return await cache.fetch("grants_gov", "k", load)
+
+        async def scenario():
+            first = asyncio.ensure_future(cache.fetch("grants_gov", "k", load))
+            await asyncio.sleep(0)
+            await asyncio.gather(first, bypassed())
+            assert load.calls == 2
+            # Cached entries are still served inside the block
+            await bypassed()
+
+        asyncio.run(scenario())
+        assert load.calls == 2
+        assert not cache._inflight
+
+    def test_empty_not_cached(self):
+        cache = memory_cache()
+        load = Loader({})
+        asyncio.run(cache.fetch("grants_gov", "k", load))
+        asyncio.run(cache.fetch("grants_gov", "k", load))
+        assert load.calls == 2
+
+    def test_loader_error_propagates(self):
+        cache = memory_cache()
+        with pytest.raises(RuntimeError):
+            asyncio.run(cache.fetch("grants_gov", "k", Loader(RuntimeError("boom"))))
+        assert cache._inflight == {}
+
+    def test_unknown_provider_and_disabled_bypass(self):
+        load = Loader(["x"])
+        asyncio.run(memory_cache().fetch("web", "k", load))
+        asyncio.run(memory_cache(max_entries=0).fetch("news", "k", load))
+        assert load.calls == 2
+
+    def test_lru_eviction(self):
+        cache = memory_cache(max_entries=2)
+        for key in ("a", "b"):
+            asyncio.run(cache.fetch("grants_gov", key, Loader({key: 1})))
+        asyncio.run(cache.fetch("grants_gov", "a", Loader({"a": 2})))  # a most recent
+        asyncio.run(cache.fetch("grants_gov", "c", Loader({"c": 1})))
+        assert set(k for _, k in cache._entries) == {"a", "c"}
+        assert cache.stats()["evicted"] == 1
+
+
+# ============================================================================
+# Persistent tier
+# ============================================================================
+
+class Database:
+    """Session factory whose sessions record statements."""
+
+    def __init__(self, row=None, fail=False):
+        self.row = row
+        self.fail = fail
+        self.statements = []
+
+    def __call__(self):
+        database = self
+
+        class Session:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def execute(self, stmt, params=None):
+                if database.fail:
+                    raise ConnectionError("database unavailable")
+                database.statements.append(stmt)
+                return SimpleNamespace(one_or_none=lambda: database.row, rowcount=0)
+
+            async def commit(self):
+                pass
+
+        return Session()
+
+
+def sql(stmt):
+    return str(stmt.compile(dialect=asyncpg.dialect()))
+
+
+class TestPersistentTier:
+    def test_read_through(self):
+        row = SimpleNamespace(payload={"oppHits": [7]}, fetched_at=datetime.now(timezone.utc))
+        db = Database(row=row)
+        cache = SearchCache(ttls=TTLS, persist=True, session_factory=db)
+        load = Loader({"oppHits": [1]})
+        assert asyncio.run(cache.fetch("grants_gov", "k", load)) == {"oppHits": [7]}
+        assert load.calls == 0
+        assert "FROM search_result_cache" in sql(db.statements[0])
+        assert cache.stats()["providers"]["grants_gov"]["persistent_hit"] == 1
+        # Now in memory: no second database read
+        asyncio.run(cache.fetch("grants_gov", "k", load))
+        assert len(db.statements) == 1
+
+    def test_write_upserts_and_prunes(self):
+        db = Database()
+        cache = SearchCache(ttls=TTLS, persist=True, session_factory=db, prune_interval=0)
+        asyncio.run(cache.fetch("news", "k", Loader(["n"])))
+        statements = [sql(s) for s in db.statements]
+        assert len(statements) == 3  # lookup, upsert, prune
+        assert "ON CONFLICT (provider, cache_key) DO UPDATE" in statements[1]
+        assert statements[2].startswith("DELETE FROM search_result_cache")
+
+    def test_database_errors_fall_through(self):
+        cache = SearchCache(ttls=TTLS, persist=True, session_factory=Database(fail=True))
+        assert asyncio.run(cache.fetch("news", "k", Loader(["n"]))) == ["n"]
+        assert cache.stats()["persistent_error"] == 2
+
+
+# ============================================================================
+# Callers
+# ============================================================================
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = memory_cache()
+    cache.ttls.update(web=60.0, sam_gov=60.0)
+    monkeypatch.setattr(search_provider, "search_cache", cache)
+    monkeypatch.setattr(sam_gov_fetcher, "search_cache", cache)
+    return cache
+
+
+class TestCallers:
+    def test_search_web_round_trips_results(self, cache, monkeypatch):
+        calls = []
+
+        async def fake_web(query, num_results, date_filter, search_depth="basic"):
+            calls.append(query)
+            return [SearchResult(title="T", url="https://a.example", snippet="s", provider="fake")]
+
+        monkeypatch.setattr(search_provider, "get_active_provider", lambda: "fake")
+        monkeypatch.setitem(search_provider._DISPATCH, "fake", (fake_web, None))
+
+        first = asyncio.run(search_provider.search_web("EV grants", 5))
+        second = asyncio.run(search_provider.search_web("ev  grants", 5))
+        asyncio.run(search_provider.search_web("ev grants", 10))
+        assert first == second
+        assert isinstance(second[0], SearchResult)
+        assert len(calls) == 2
+
+    def test_sam_gov_key_excludes_api_key(self, cache, monkeypatch):
+        calls = []
+
+        async def fake_request(session, keyword, limit, **kwargs):
+            calls.append(kwargs["api_key"])
+            return {"opportunitiesData": [{"noticeId": "1"}]}
+
+        monkeypatch.setattr(sam_gov_fetcher, "_request_sam_gov", fake_request)
+        session = SimpleNamespace(closed=False)
+        for api_key in ("key-a", "key-b"):
+            asyncio.run(
+                sam_gov_fetcher._search_sam_gov(
+                    session, "transit", 50, 0, api_key, posted_from="01/01/2026"
+                )
+            )
+        assert calls == ["key-a"]
+        asyncio.run(sam_gov_fetcher._search_sam_gov(session, "transit", 50, 0, "key-a"))
+        assert len(calls) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
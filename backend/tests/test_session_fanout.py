@@ -0,0 +1,226 @@
+"""
+Unit Tests for Per-Request Session Fan-Out
+
+Covers app.helpers.session_fanout.SessionFanout and its use by RAGEngine
+(fake session factory, no database):
+- concurrent borrows get distinct read-only sessions and really overlap
+- the per-request cap bounds how many sessions are open at once
+- sessions are rolled back and closed after use, even on error
+- without a session factory, borrows share the request session serially
+- RAGEngine search and signal enrichment fan out instead of sharing self.db
+
+Usage:
+    cd backend && pytest tests/test_session_fanout.py -v
+"""
+
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.rag_engine as rag_engine  # noqa: E402
+from app.helpers.session_fanout import SessionFanout  # noqa: E402
+from app.rag_engine import RAGEngine  # noqa: E402
+
+QUERY_SECONDS = 0.05
+
+
+class FakeResult:
+    def all(self):
+        return []
+
+    def scalar_one_or_none(self):
+        return None
+
+    def one_or_none(self):
+        return None
+
+
+class FakeSession:
+    """Session whose execute() takes QUERY_SECONDS and tracks overlap."""
+
+    def __init__(self, tracker):
+        self.tracker = tracker
+        self.options = None
+        self.rolled_back = False
+        self.closed = False
+
+    async def connection(self, execution_options=None):
+        self.options = execution_options
+
+    async def execute(self, stmt, params=None):
+        if self.tracker.busy.get(id(self)):
+            raise RuntimeError("concurrent operations on one session")
+        self.tracker.busy[id(self)] = True
+        self.tracker.active += 1
+        self.tracker.peak = max(self.tracker.peak, self.tracker.active)
+        try:
+            await asyncio.sleep(QUERY_SECONDS)
+        finally:
+            self.tracker.active -= 1
+            self.tracker.busy[id(self)] = False
+        return FakeResult()
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+class Factory:
+    """Stands in for async_session_factory."""
+
+    def __init__(self):
+        self.sessions = []
+        self.active = 0
+        self.peak = 0
+        self.busy = {}
+
+    def __call__(self):
+        factory = self
+
+        class _Ctx:
+            async def __aenter__(self):
+                session = FakeSession(factory)
+                factory.sessions.append(session)
+                return session
+
+            async def __aexit__(self, *exc):
+                factory.sessions[-1].closed = True
+                return False
+
+        return _Ctx()
+
+
+async def one_query(session):
+    await session.execute("SELECT 1")
+    return session
+
+
+# ============================================================================
+# SessionFanout
+# ============================================================================
+
+class TestSessionFanout:
+    def test_borrows_overlap_on_separate_sessions(self):
+        factory = Factory()
+        fanout = SessionFanout(object(), max_sessions=4, session_factory=factory)
+
+        async def scenario():
+            start = time.perf_counter()
+            sessions = await asyncio.gather(*(fanout.run(one_query) for _ in range(4)))
+            return sessions, time.perf_counter() - start
+
+        sessions, elapsed = asyncio.run(scenario())
+        assert len({id(s) for s in sessions}) == 4
+        assert factory.peak == 4
+        assert elapsed < QUERY_SECONDS * 3
+        for session in factory.sessions:
+            assert session.options == {"postgresql_readonly": True}
+            assert session.rolled_back
+
+    def test_cap_limits_open_sessions(self):
+        factory = Factory()
+        fanout = SessionFanout(object(), max_sessions=2, session_factory=factory)
+
+        async def scenario():
+            await asyncio.gather(*(fanout.run(one_query) for _ in range(6)))
+
+        asyncio.run(scenario())
+        assert factory.peak == 2
+        assert len(factory.sessions) == 6
+
+    def test_rolls_back_on_error(self):
+        factory = Factory()
+        fanout = SessionFanout(object(), session_factory=factory)
+
+        async def boom(session):
+            raise ValueError("bad query")
+
+        with pytest.raises(ValueError):
+            asyncio.run(fanout.run(boom))
+        assert factory.sessions[0].rolled_back
+
+    def test_without_factory_shares_request_session_serially(self, monkeypatch):
+        import app.database as database
+
+        monkeypatch.setattr(database, "async_session_factory", None)
+        tracker = Factory()
+        request_db = FakeSession(tracker)
+        fanout = SessionFanout(request_db)
+
+        async def scenario():
+            return await asyncio.gather(*(fanout.run(one_query) for _ in range(3)))
+
+        sessions = asyncio.run(scenario())
+        assert all(s is request_db for s in sessions)
+        assert tracker.peak == 1
+
+
+# ============================================================================
+# RAGEngine
+# ============================================================================
+
+@pytest.fixture
+def engine():
+    factory = Factory()
+    request_db = SimpleNamespace(
+        execute=lambda *a, **k: pytest.fail("request session used for fan-out read")
+    )
+    rag = RAGEngine(request_db)
+    rag._fanout = SessionFanout(request_db, max_sessions=4, session_factory=factory)
+    return rag, factory
+
+
+class TestRAGEngineFanout:
+    def test_hybrid_search_uses_one_session_each(self, engine, monkeypatch):
+        rag, factory = engine
+        used = []
+
+        async def fake_search(db, **kwargs):
+            used.append(db)
+            await db.execute("SELECT")
+            return [{"id": "x"}]
+
+        monkeypatch.setattr(rag_engine, "hybrid_search_cards", fake_search)
+        monkeypatch.setattr(rag_engine, "hybrid_search_sources", fake_search)
+
+        results = asyncio.run(
+            rag._hybrid_search("transit", ["transit"], [0.1] * 4, "global", None)
+        )
+        assert results == {"cards": [{"id": "x"}], "sources": [{"id": "x"}]}
+        assert used[0] is not used[1]
+        assert factory.peak == 2
+
+    def test_signal_enrichment_runs_in_parallel(self, engine):
+        rag, factory = engine
+
+        start = time.perf_counter()
+        enrichment = asyncio.run(
+            rag._enrich_signal("card-1", {"cards": [], "sources": []})
+        )
+        elapsed = time.perf_counter() - start
+
+        assert factory.peak == 4
+        assert elapsed < QUERY_SECONDS * 3  # ~max, not sum, of four queries
+        assert enrichment["all_sources"] == []
+        assert enrichment["timeline"] == []
+        assert enrichment["research_tasks"] == []
+
+    def test_workstream_enrichment(self, engine):
+        rag, factory = engine
+        rag._ws_card_ids_cache["ws-1"] = ["card-1"]
+        enrichment = asyncio.run(rag._enrich_workstream("ws-1"))
+        assert enrichment["workstream_cards"] == []
+        assert factory.peak == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,176 @@
+"""
+Unit Tests for the Binary pgvector Codec
+
+Covers app.helpers.vector_utils and the Vector column type (no database):
+- embeddings round-trip through pgvector's binary format as float32 arrays
+- malformed wire values and non-1-D inputs are rejected
+- the codec is registered from whichever schema holds the extension
+- Vector columns bind/return float32 arrays and compile pgvector operators
+
+Usage:
+    cd backend && pytest tests/test_vector_codec.py -v
+"""
+
+import asyncio
+import os
+import struct
+import sys
+
+import numpy as np
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, select
+from sqlalchemy.dialects import postgresql
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+from app.helpers.vector_utils import (  # noqa: E402
+    decode_vector_binary,
+    encode_vector_binary,
+    register_vector_codec,
+    to_float32,
+)
+from app.models.db.base import Vector  # noqa: E402
+
+
+# ============================================================================
+# Wire format
+# ============================================================================
+
+class TestBinaryFormat:
+    def test_layout_matches_pgvector(self):
+        data = encode_vector_binary([1.0, -2.5, 0.25])
+        # uint16 dim, uint16 unused, then big-endian float4s
+        assert data == struct.pack(">HHfff", 3, 0, 1.0, -2.5, 0.25)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            [0.1, 0.2, 0.3],
+            np.array([0.1, 0.2, 0.3]),
+            np.array([0.1, 0.2, 0.3], dtype=np.float32),
+            "[0.1,0.2,0.3]",
+        ],
+    )
+    def test_round_trip(self, value):
+        decoded = decode_vector_binary(encode_vector_binary(value))
+        assert decoded.dtype == np.float32
+        np.testing.assert_array_equal(
+            decoded, np.array([0.1, 0.2, 0.3], dtype=np.float32)
+        )
+
+    def test_full_size_embedding(self):
+        vec = np.random.default_rng(0).standard_normal(1536).astype(np.float32)
+        data = encode_vector_binary(vec)
+        assert len(data) == 4 + 4 * 1536
+        np.testing.assert_array_equal(decode_vector_binary(data), vec)
+
+    def test_decoded_array_is_writable(self):
+        decoded = decode_vector_binary(encode_vector_binary([1.0, 2.0]))
+        decoded[0] = 5.0  # not a read-only view over the wire buffer
+
+    @pytest.mark.parametrize("value", [[], None, [[1.0, 2.0], [3.0, 4.0]]])
+    def test_encode_rejects_bad_input(self, value):
+        with pytest.raises(ValueError):
+            encode_vector_binary(value)
+
+    def test_decode_rejects_truncated_value(self):
+        data = encode_vector_binary([1.0, 2.0, 3.0])
+        with pytest.raises(ValueError):
+            decode_vector_binary(data[:-4])
+
+    def test_decode_rejects_nonzero_unused_field(self):
+        with pytest.raises(ValueError):
+            decode_vector_binary(struct.pack(">HHf", 1, 1, 1.0))
+
+    def test_to_float32_passes_arrays_through(self):
+        vec = np.ones(4, dtype=np.float32)
+        assert to_float32(vec) is vec
+        assert to_float32(None) is None
+
+
+# ============================================================================
+# Codec registration
+# ============================================================================
+
+class FakeAsyncpgConnection:
+    def __init__(self, vector_schema):
+        self.vector_schema = vector_schema
+        self.attempts = []
+        self.registered = None
+
+    async def set_type_codec(self, typename, *, schema, encoder, decoder, format):
+        self.attempts.append(schema)
+        if schema != self.vector_schema:
+            raise ValueError(f"unknown type: {schema}.{typename}")
+        self.registered = (typename, encoder, decoder, format)
+
+
+class TestRegisterCodec:
+    def test_public_schema(self):
+        conn = FakeAsyncpgConnection("public")
+        assert asyncio.run(register_vector_codec(conn)) is True
+        assert conn.attempts == ["public"]
+        assert conn.registered == (
+            "vector", encode_vector_binary, decode_vector_binary, "binary"
+        )
+
+    def test_falls_back_to_extensions_schema(self):
+        conn = FakeAsyncpgConnection("extensions")
+        assert asyncio.run(register_vector_codec(conn)) is True
+        assert conn.attempts == ["public", "extensions"]
+
+    def test_missing_extension_keeps_text(self):
+        conn = FakeAsyncpgConnection(None)
+        assert asyncio.run(register_vector_codec(conn)) is False
+        assert conn.registered is None
+
+
+# ============================================================================
+# Vector column type
+# ============================================================================
+
+items = Table(
+    "items",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("embedding", Vector(3)),
+)
+
+
+class TestVectorType:
+    def test_col_spec(self):
+        assert Vector(1536).get_col_spec() == "VECTOR(1536)"
+        assert Vector().get_col_spec() == "VECTOR"
+
+    def test_processors(self):
+        dialect = postgresql.dialect()
+        bind = Vector(3).bind_processor(dialect)
+        result = Vector(3).result_processor(dialect, None)
+
+        bound = bind([1, 2, 3])
+        assert isinstance(bound, np.ndarray) and bound.dtype == np.float32
+        assert bind(None) is None
+
+        assert result(None) is None
+        np.testing.assert_array_equal(result("[1,2,3]"), [1.0, 2.0, 3.0])
+        arr = np.ones(3, dtype=np.float32)
+        assert result(arr) is arr
+
+    def test_distance_operators(self):
+        query = np.zeros(3, dtype=np.float32)
+        stmt = select(items.c.id).order_by(
+            items.c.embedding.cosine_distance(query)
+        )
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "items.embedding <=> %(embedding_1)s" in sql
+
+        stmt = select(items.c.embedding.l2_distance(query))
+        assert "<->" in str(stmt.compile(dialect=postgresql.dialect()))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,191 @@
+"""
+Unit Tests for Set-Based Velocity Trend Calculation
+
+Covers app.velocity_service.calculate_velocity_trends (fake session):
+- one grouped COUNT(*) FILTER aggregate over active cards and sources
+- trends classified in bulk and written with UPDATE ... FROM (VALUES ...)
+  in batches, one statement per batch
+- scores clamped to the NUMERIC(5, 2) column range
+- a failed batch (rolled back to its savepoint) does not stop the others
+- get_velocity_summary reads both window counts in one query
+
+Usage:
+    cd backend && pytest tests/test_velocity_trends.py -v
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+import app.velocity_service as velocity_service  # noqa: E402
+from app.velocity_service import calculate_velocity_trends  # noqa: E402
+
+NOW = datetime.now(timezone.utc)
+
+
+def card(current=0, prev=0, total=10, recent=1, age_days=90):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        created_at=NOW - timedelta(days=age_days),
+        current_count=current,
+        prev_count=prev,
+        total_count=total,
+        recent_count=recent,
+    )
+
+
+class Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def one_or_none(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeSession:
+    def __init__(self, rows, fail_update=None):
+        self.rows = rows
+        self.fail_update = fail_update
+        self.statements = []
+        self.savepoints = 0
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        if stmt.is_select:
+            return Result(self.rows)
+        if self.fail_update is not None and len(self.statements) - 1 == self.fail_update:
+            raise RuntimeError("deadlock detected")
+        return Result([])
+
+    async def flush(self):
+        pass
+
+    def begin_nested(self):
+        session = self
+
+        class Savepoint:
+            async def __aenter__(self):
+                session.savepoints += 1
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Savepoint()
+
+    def updates(self):
+        return [s for s in self.statements if not s.is_select]
+
+
+def sql(stmt):
+    return str(stmt.compile(dialect=asyncpg.dialect()))
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Rows passed to each bulk UPDATE, in order."""
+    seen = []
+    original = velocity_service._bulk_update
+
+    def spy(rows, now):
+        seen.append(list(rows))
+        return original(rows, now)
+
+    monkeypatch.setattr(velocity_service, "_bulk_update", spy)
+    return seen
+
+
+class TestCalculateVelocityTrends:
+    def test_single_aggregate_and_batched_update(self, monkeypatch, batches):
+        monkeypatch.setattr(velocity_service, "_UPDATE_BATCH_SIZE", 2)
+        rows = [
+            card(current=3, prev=1),  # accelerating
+            card(current=0, prev=4),  # decelerating
+            card(total=2, age_days=5),  # emerging
+        ]
+        db = FakeSession(rows)
+
+        result = asyncio.run(calculate_velocity_trends(db))
+
+        assert result == {"updated": 3, "total": 3}
+        selects = [s for s in db.statements if s.is_select]
+        assert len(selects) == 1
+        select_sql = sql(selects[0])
+        assert select_sql.count("FILTER (WHERE") == 3
+        assert "LEFT OUTER JOIN sources" in select_sql
+        assert "GROUP BY cards.id" in select_sql
+
+        updates = db.updates()
+        assert len(updates) == 2
+        update_sql = sql(updates[0])
+        assert "FROM (VALUES" in update_sql
+        assert "WHERE cards.id = velocity.id" in update_sql
+
+        assert [len(b) for b in batches] == [2, 1]
+        values = batches[0] + batches[1]
+        assert [(r[1], r[2]) for r in values] == [
+            ("accelerating", Decimal("200.0")),
+            ("decelerating", Decimal("-100.0")),
+            ("emerging", Decimal("0.0")),
+        ]
+        assert [r[0] for r in values] == [c.id for c in rows]
+
+    def test_score_clamped_to_column_range(self, batches):
+        db = FakeSession([card(current=40, prev=0)])
+        asyncio.run(calculate_velocity_trends(db))
+        assert batches[0][0][2] == Decimal("999.99")
+
+    def test_failed_batch_is_skipped(self, monkeypatch):
+        monkeypatch.setattr(velocity_service, "_UPDATE_BATCH_SIZE", 1)
+        db = FakeSession([card(), card(), card()], fail_update=2)
+        result = asyncio.run(calculate_velocity_trends(db))
+        assert result == {"updated": 2, "total": 3}
+        assert db.savepoints == 3
+
+    def test_no_active_cards(self):
+        db = FakeSession([])
+        assert asyncio.run(calculate_velocity_trends(db)) == {"updated": 0, "total": 0}
+        assert db.updates() == []
+
+
+class TestVelocitySummary:
+    def test_counts_in_one_query(self):
+        card_row = SimpleNamespace(
+            id=uuid.uuid4(),
+            velocity_trend="accelerating",
+            velocity_score=Decimal("200"),
+            velocity_updated_at=NOW,
+        )
+
+        class SummarySession(FakeSession):
+            async def execute(self, stmt, params=None):
+                self.statements.append(stmt)
+                if len(self.statements) == 1:
+                    return Result([card_row])
+                return Result([card(current=3, prev=1)])
+
+        db = SummarySession([])
+        summary = asyncio.run(velocity_service.get_velocity_summary(str(card_row.id), db))
+        assert len(db.statements) == 2
+        assert summary["current_week_sources"] == 3
+        assert summary["prev_week_sources"] == 1
+        assert summary["summary"].startswith("3 new sources this week vs 1 source")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,169 @@
+"""
+Unit Tests for the Multi-Queue Worker
+
+Exercises GrantScopeWorker's per-queue consumers with fake job handlers (no
+database):
+- a long job on one queue does not block other queues
+- GRANTSCOPE_WORKER_CONCURRENCY_<TYPE> sets consumers per queue
+- request_stop() drains in-flight jobs before run() returns
+- in-flight / latency counters reported by health()
+
+Usage:
+    cd backend && pytest tests/test_worker_concurrency.py -v
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_KEY", "test-key")
+
+from app.worker import GrantScopeWorker  # noqa: E402
+
+
+class FakeQueue:
+    """Handler that claims queued jobs one at a time and runs each for `seconds`."""
+
+    def __init__(self, worker: GrantScopeWorker, jobs: int, seconds: float):
+        self.worker = worker
+        self.remaining = jobs
+        self.seconds = seconds
+        self.started = []
+        self.finished = []
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self) -> bool:
+        if self.remaining == 0:
+            return False
+        self.remaining -= 1
+        self.worker._job_claimed()
+        self.started.append(asyncio.get_running_loop().time())
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.seconds)
+        finally:
+            self.running -= 1
+        self.finished.append(asyncio.get_running_loop().time())
+        return True
+
+
+def make_worker(monkeypatch, **concurrency) -> GrantScopeWorker:
+    monkeypatch.setenv("GRANTSCOPE_WORKER_POLL_INTERVAL_SECONDS", "0.01")
+    monkeypatch.setenv("GRANTSCOPE_WORKER_MAX_POLL_INTERVAL_SECONDS", "0.02")
+    for name in GrantScopeWorker.QUEUE_TYPES:
+        monkeypatch.setenv(
+            f"GRANTSCOPE_WORKER_CONCURRENCY_{name.upper()}",
+            str(concurrency.get(name, 0)),
+        )
+    return GrantScopeWorker()
+
+
+def install(worker: GrantScopeWorker, queues) -> None:
+    worker._queue_handlers = lambda: queues
+
+
+class TestMultiQueueWorker:
+    def test_long_job_does_not_block_other_queues(self, monkeypatch):
+        async def run():
+            worker = make_worker(monkeypatch, discovery=1, brief=1)
+            discovery = FakeQueue(worker, jobs=1, seconds=0.5)
+            briefs = FakeQueue(worker, jobs=3, seconds=0.01)
+            install(worker, {"discovery": discovery, "brief": briefs})
+
+            task = asyncio.create_task(worker.run())
+            await asyncio.sleep(0.2)
+            assert len(briefs.finished) == 3
+            assert discovery.finished == []  # still running
+            worker.request_stop()
+            await task
+            return discovery
+
+        discovery = asyncio.run(run())
+        assert len(discovery.finished) == 1
+
+    def test_concurrency_per_queue(self, monkeypatch):
+        async def run():
+            worker = make_worker(monkeypatch, research=3)
+            research = FakeQueue(worker, jobs=6, seconds=0.05)
+            install(worker, {"research": research})
+
+            task = asyncio.create_task(worker.run())
+            while len(research.finished) < 6:
+                await asyncio.sleep(0.01)
+            worker.request_stop()
+            await task
+            return worker, research
+
+        worker, research = asyncio.run(run())
+        assert worker.queue_stats["research"].concurrency == 3
+        assert research.peak == 3
+
+    def test_drain_waits_for_in_flight_jobs(self, monkeypatch):
+        async def run():
+            worker = make_worker(monkeypatch, discovery=1)
+            discovery = FakeQueue(worker, jobs=1, seconds=0.2)
+            install(worker, {"discovery": discovery})
+
+            task = asyncio.create_task(worker.run())
+            await asyncio.sleep(0.05)
+            assert worker.health()["queues"]["discovery"]["in_flight"] == 1
+            worker.request_stop()
+            assert worker.health()["status"] == "draining"
+            await task
+            return worker, discovery
+
+        worker, discovery = asyncio.run(run())
+        assert len(discovery.finished) == 1
+        assert worker.health()["queues"]["discovery"]["in_flight"] == 0
+
+    def test_drain_timeout_cancels_stragglers(self, monkeypatch):
+        monkeypatch.setenv("GRANTSCOPE_WORKER_DRAIN_TIMEOUT_SECONDS", "0.05")
+
+        async def run():
+            worker = make_worker(monkeypatch, discovery=1)
+            discovery = FakeQueue(worker, jobs=1, seconds=10)
+            install(worker, {"discovery": discovery})
+
+            task = asyncio.create_task(worker.run())
+            await asyncio.sleep(0.05)
+            worker.request_stop()
+            await asyncio.wait_for(task, timeout=1)
+            return worker, discovery
+
+        worker, discovery = asyncio.run(run())
+        assert discovery.finished == []
+        stats = worker.health()["queues"]["discovery"]
+        assert stats["in_flight"] == 0
+        assert stats["failed"] == 1
+
+    def test_latency_counters(self, monkeypatch):
+        async def run():
+            worker = make_worker(monkeypatch, brief=1)
+            briefs = FakeQueue(worker, jobs=2, seconds=0.05)
+            install(worker, {"brief": briefs})
+
+            task = asyncio.create_task(worker.run())
+            while len(briefs.finished) < 2:
+                await asyncio.sleep(0.01)
+            worker.request_stop()
+            await task
+            return worker.health()["queues"]["brief"]
+
+        stats = asyncio.run(run())
+        assert stats["completed"] == 2
+        assert stats["failed"] == 0
+        assert stats["avg_seconds"] == pytest.approx(0.05, abs=0.04)
+        assert stats["max_seconds"] >= stats["avg_seconds"]
+        assert stats["last_finished_at"] is not None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])